@@ -36,6 +36,11 @@ class Lexer:
         while lexer.lex().kind is not MLIRTokenKind.EOF:
             pass
 
+    def time_constant_1000_lex_all(self) -> None:
+        """Time lexing constant folding for 1000 items into token arrays."""
+        lexer_input = Input(Lexer.WORKLOAD_CONSTANT_1000, "constant_1000")
+        MLIRLexer(lexer_input).lex_all()
+
     def ignore_time_dense_attr(self) -> None:
         """Time lexing a 1024x1024xi8 dense attribute."""
         lexer_input = Input(Lexer.WORKLOAD_LARGE_DENSE_ATTR, "dense_attr")
@@ -60,6 +65,7 @@ if __name__ == "__main__":
             "Lexer.empty_program": Benchmark(LEXER.time_empty_program),
             "Lexer.constant_100": Benchmark(LEXER.time_constant_100),
             "Lexer.constant_1000": Benchmark(LEXER.time_constant_1000),
+            "Lexer.constant_1000_lex_all": Benchmark(LEXER.time_constant_1000_lex_all),
             "Lexer.dense_attr": Benchmark(LEXER.ignore_time_dense_attr),
             "Lexer.dense_attr_hex": Benchmark(LEXER.ignore_time_dense_attr_hex),
         }
@@ -18,6 +18,8 @@ class Verifier:
 
     WORKLOAD_CONSTANT_100 = WorkloadBuilder.constant_folding_module(100)
     WORKLOAD_CONSTANT_1000 = WorkloadBuilder.constant_folding_module(1000)
+    WORKLOAD_CONSTANT_10000 = WorkloadBuilder.constant_folding_module(10000)
+    WORKLOAD_CONSTANT_100000 = WorkloadBuilder.constant_folding_module(100000)
     WORKLOAD_LARGE_DENSE_ATTR = WorkloadBuilder.large_dense_attr_module()
 
     def time_constant_100(self) -> None:
@@ -28,6 +30,14 @@ class Verifier:
         """Time verifying constant folding for 1000 items."""
         Verifier.WORKLOAD_CONSTANT_1000.verify()
 
+    def time_constant_10000(self) -> None:
+        """Time verifying constant folding for 10000 items."""
+        Verifier.WORKLOAD_CONSTANT_10000.verify()
+
+    def time_constant_100000(self) -> None:
+        """Time verifying constant folding for 100000 items."""
+        Verifier.WORKLOAD_CONSTANT_100000.verify()
+
     def time_dense_attr_hex(self) -> None:
         """Time verifying a 1024x1024xi8 dense attribute given as a hex string."""
         Verifier.WORKLOAD_LARGE_DENSE_ATTR.verify()
@@ -41,6 +51,8 @@ if __name__ == "__main__":
         {
             "Verifier.constant_100": Benchmark(VERIFIER.time_constant_100),
             "Verifier.constant_1000": Benchmark(VERIFIER.time_constant_1000),
+            "Verifier.constant_10000": Benchmark(VERIFIER.time_constant_10000),
+            "Verifier.constant_100000": Benchmark(VERIFIER.time_constant_100000),
             "Verifier.dense_attr_hex": Benchmark(VERIFIER.time_dense_attr_hex),
         }
     )
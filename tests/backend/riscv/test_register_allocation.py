@@ -4,15 +4,20 @@ import pytest
 from typing_extensions import Self
 
 from xdsl.backend.register_allocatable import RegisterConstraints
+from xdsl.backend.register_stack import OutOfRegisters
 from xdsl.backend.riscv.register_allocation import (
+    RegisterAllocatorLinearScan,
     RegisterAllocatorLivenessBlockNaive,
     reg_types_by_name,
 )
 from xdsl.backend.riscv.register_stack import RiscvRegisterStack
-from xdsl.dialects import riscv
+from xdsl.context import Context
+from xdsl.dialects import riscv, riscv_func
+from xdsl.dialects.builtin import Builtin
 from xdsl.dialects.test import TestOp
 from xdsl.ir import SSAValue
 from xdsl.irdl import IRDLOperation, irdl_op_definition, operand_def, result_def
+from xdsl.parser import Parser
 from xdsl.utils.exceptions import DiagnosticException
 
 
@@ -139,3 +144,63 @@ def test_count_reg_types():
         "riscv.reg": {"a0", "a1"},
         "riscv.freg": {"fa0"},
     }
+
+
+SPILL_PROGRAM = """
+riscv_func.func @main() -> !riscv.reg<a0> {
+  %0 = riscv.li 1 : !riscv.reg
+  %1 = riscv.li 2 : !riscv.reg
+  %2 = riscv.li 3 : !riscv.reg
+  %3 = riscv.add %1, %2 : (!riscv.reg, !riscv.reg) -> !riscv.reg
+  %4 = riscv.add %3, %0 : (!riscv.reg, !riscv.reg) -> !riscv.reg
+  %5 = riscv.add %4, %0 : (!riscv.reg, !riscv.reg) -> !riscv.reg<a0>
+  riscv_func.return %5 : !riscv.reg<a0>
+}
+"""
+
+SPILLED_PROGRAM = """
+riscv_func.func @main() -> !riscv.reg<a0> attributes {riscv.stack_spill_size = 8 : i32} {
+  %0 = riscv.li 1 : !riscv.reg<t1>
+  %sp0 = riscv.get_register : !riscv.reg<sp>
+  riscv.sw %sp0, %0, 0 : (!riscv.reg<sp>, !riscv.reg<t1>) -> ()
+  %1 = riscv.li 2 : !riscv.reg<t1>
+  %2 = riscv.li 3 : !riscv.reg<t0>
+  %3 = riscv.add %1, %2 : (!riscv.reg<t1>, !riscv.reg<t0>) -> !riscv.reg<t0>
+  %sp1 = riscv.get_register : !riscv.reg<sp>
+  %4 = riscv.lw %sp1, 0 : (!riscv.reg<sp>) -> !riscv.reg<t1>
+  %5 = riscv.add %3, %4 : (!riscv.reg<t0>, !riscv.reg<t1>) -> !riscv.reg<t1>
+  %sp2 = riscv.get_register : !riscv.reg<sp>
+  %6 = riscv.lw %sp2, 0 : (!riscv.reg<sp>) -> !riscv.reg<t0>
+  %7 = riscv.add %5, %6 : (!riscv.reg<t1>, !riscv.reg<t0>) -> !riscv.reg<a0>
+  riscv_func.return %7 : !riscv.reg<a0>
+}
+"""
+
+
+def _parse_func(program: str) -> riscv_func.FuncOp:
+    ctx = Context()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(riscv.RISCV)
+    ctx.load_dialect(riscv_func.RISCV_Func)
+    (func,) = Parser(ctx, program).parse_module().ops
+    assert isinstance(func, riscv_func.FuncOp)
+    func.detach()
+    return func
+
+
+def test_linear_scan_spill():
+    func = _parse_func(SPILL_PROGRAM)
+    # Three values are live when computing %3, with only two registers
+    available_registers = RiscvRegisterStack.get(
+        (riscv.Registers.T0, riscv.Registers.T1)
+    )
+    RegisterAllocatorLinearScan(available_registers).allocate_func(func)
+
+    func.verify()
+    assert func.is_structurally_equivalent(_parse_func(SPILLED_PROGRAM))
+
+    # Spilling cannot help when the operands of a single operation do not fit
+    func = _parse_func(SPILL_PROGRAM)
+    available_registers = RiscvRegisterStack.get((riscv.Registers.T0,))
+    with pytest.raises(OutOfRegisters):
+        RegisterAllocatorLinearScan(available_registers).allocate_func(func)
@@ -1,9 +1,9 @@
 from ordered_set import OrderedSet
 
-from xdsl.backend.register_allocator import live_ins_per_block
+from xdsl.backend.register_allocator import live_ins_per_block, live_ins_per_region
 from xdsl.builder import ImplicitBuilder
 from xdsl.dialects.builtin import i32
-from xdsl.dialects.test import TestOp
+from xdsl.dialects.test import TestOp, TestTermOp
 from xdsl.ir import Block, Region, SSAValue
 
 
@@ -78,3 +78,35 @@ def test_live_ins():
             outer_region.block: reference_live_ins[outer_region.block],
         }
     )
+
+
+def test_live_ins_cfg():
+    entry = Block(arg_types=(i32,))
+    loop = Block(arg_types=(i32,))
+    end = Block()
+    region = Region((entry, loop, end))
+
+    with ImplicitBuilder(entry) as (a,):
+        (b,) = TestOp(result_types=(i32,)).results
+        (c,) = TestOp(result_types=(i32,)).results
+        TestTermOp(operands=(b,), successors=(loop,))
+    with ImplicitBuilder(loop) as (d,):
+        (e,) = TestOp(operands=(d, c), result_types=(i32,)).results
+        TestTermOp(operands=(e,), successors=(loop, end))
+    with ImplicitBuilder(end):
+        TestOp(operands=(a, e))
+
+    # a is live through the loop block, as it is used after exiting the loop
+    assert live_ins_per_region(region) == {
+        entry: OrderedSet([]),
+        loop: OrderedSet([c, a]),
+        end: OrderedSet([a, e]),
+    }
+    # Only the uses are considered when analysing a block on its own
+    assert live_ins_per_block(loop) == {loop: OrderedSet([c])}
+
+    # Values defined in the blocks of a nested region are not live-ins of the parent
+    outer = Region(Block())
+    with ImplicitBuilder(outer):
+        TestOp(regions=(region,))
+    assert live_ins_per_block(outer.block)[outer.block] == OrderedSet([])
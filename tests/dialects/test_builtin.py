@@ -6,6 +6,7 @@ from io import StringIO
 import pytest
 from typing_extensions import TypeVar
 
+from xdsl.context import Context
 from xdsl.dialects.arith import ConstantOp
 from xdsl.dialects.builtin import (
     DYNAMIC_INDEX,
@@ -63,6 +64,7 @@ from xdsl.irdl import (
     eq,
     irdl_attr_definition,
 )
+from xdsl.parser import Parser
 from xdsl.printer import Printer
 from xdsl.utils.exceptions import VerifyException
 
@@ -431,6 +433,21 @@ def test_DenseIntOrFPElementsAttr_splat():
     assert tuple(attr_float.get_values()) == (4.5, 4.5, 4.5, 4.5)
     assert attr_float.is_splat()
 
+    assert not DenseIntOrFPElementsAttr.from_list(
+        TensorType(i64, [3]), [4, 4, 5]
+    ).is_splat()
+
+
+def test_DenseIntOrFPElementsAttr_hex_roundtrip():
+    values = list(range(200))
+    attr = DenseIntOrFPElementsAttr.from_list(TensorType(i32, [200]), values)
+    printed = str(attr)
+    assert printed.startswith('dense<"0x000000000100000002000000')
+    parsed = Parser(Context(), printed).parse_attribute()
+    assert isinstance(parsed, DenseIntOrFPElementsAttr)
+    assert parsed == attr
+    assert tuple(parsed.get_values()) == tuple(values)
+
 
 def test_DenseIntOrFPElementsAttr_initialization():
     # legal zero-rank tensor
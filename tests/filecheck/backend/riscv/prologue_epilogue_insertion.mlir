@@ -90,3 +90,39 @@ riscv_func.func @simplefp(%0 : !riscv.freg<fa0>, %1 : !riscv.freg<fa1>) -> !risc
   // CHECK-SAME: !riscv.freg<fa0>
   riscv_func.return %5 : !riscv.freg<fa0>
 }
+
+// The registers are saved above the values spilled by the register allocator
+// CHECK: func @spilled
+riscv_func.func @spilled() attributes {riscv.stack_spill_size = 8 : i32} {
+  // CHECK-NEXT: get_register
+  // CHECK-SAME: : !riscv.reg<sp>
+  // CHECK-NEXT: addi %{{.*}}, -12
+  // CHECK-SAME: (!riscv.reg<sp>) -> !riscv.reg<sp>
+  // CHECK-NEXT: get_register
+  // CHECK-SAME: : !riscv.reg<s1>
+  // CHECK-NEXT: sw %{{.*}}, %{{.*}}, 8
+  // CHECK-SAME: (!riscv.reg<sp>, !riscv.reg<s1>) -> ()
+  %0 = riscv.li 1 : !riscv.reg<s1>
+  %sp = riscv.get_register : !riscv.reg<sp>
+  riscv.sw %sp, %0, 0 : (!riscv.reg<sp>, !riscv.reg<s1>) -> ()
+  %1 = riscv.lw %sp, 0 : (!riscv.reg<sp>) -> !riscv.reg<t0>
+
+  // CHECK: lw %{{.*}}, 8
+  // CHECK-SAME: (!riscv.reg<sp>) -> !riscv.reg<s1>
+  // CHECK-NEXT: addi %{{.*}}, 12
+  // CHECK-SAME: (!riscv.reg<sp>) -> !riscv.reg<sp>
+  // CHECK-NEXT: return
+  riscv_func.return
+}
+
+// CHECK: func @spilled_only
+riscv_func.func @spilled_only() attributes {riscv.stack_spill_size = 16 : i32} {
+  // CHECK-NEXT: get_register
+  // CHECK-SAME: : !riscv.reg<sp>
+  // CHECK-NEXT: addi %{{.*}}, -16
+  // CHECK-SAME: (!riscv.reg<sp>) -> !riscv.reg<sp>
+  // CHECK-NEXT: addi %{{.*}}, 16
+  // CHECK-SAME: (!riscv.reg<sp>) -> !riscv.reg<sp>
+  // CHECK-NEXT: return
+  riscv_func.return
+}
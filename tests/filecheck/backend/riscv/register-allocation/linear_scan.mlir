@@ -0,0 +1,57 @@
+// RUN: xdsl-opt -p "riscv-allocate-registers{allocation_strategy=LinearScan}" %s | filecheck %s
+
+riscv_func.func @external() -> ()
+
+riscv_func.func @main() {
+  %zero = riscv.li 0 : !riscv.reg
+  %0 = riscv.li 6 : !riscv.reg
+  %1 = riscv.li 5 : !riscv.reg<s0>
+  %2 = riscv.fcvt.s.w %0 : (!riscv.reg) -> !riscv.freg
+  %3 = riscv.fcvt.s.w %1 : (!riscv.reg<s0>) -> !riscv.freg
+  %4 = riscv.fadd.s %2, %3 : (!riscv.freg, !riscv.freg) -> !riscv.freg
+  %5 = riscv.add %0, %1 : (!riscv.reg, !riscv.reg<s0>) -> !riscv.reg
+
+  riscv_scf.for %6 : !riscv.reg = %0 to %1 step %5 {
+  }
+
+  %7 = riscv_scf.for %8 : !riscv.reg = %0 to  %1 step %5 iter_args(%9 = %5) -> (!riscv.reg) {
+    %10 = riscv.mv %9 : (!riscv.reg) -> !riscv.reg
+    riscv_scf.yield %10 : !riscv.reg
+  }
+
+  %11 = riscv_snitch.frep_outer %0 iter_args(%12 = %4) -> (!riscv.freg) {
+    %13 = riscv.fmv.s %12 : (!riscv.freg) -> !riscv.freg
+    riscv_snitch.frep_yield %13 : !riscv.freg
+  }
+
+  %zero_0 = riscv.li 0 : !riscv.reg
+  %zero_1 = riscv.li 0 : !riscv.reg<a0>
+
+  riscv_func.return
+}
+
+// CHECK:       builtin.module {
+// CHECK-NEXT:    riscv_func.func @external() -> ()
+// CHECK-NEXT:    riscv_func.func @main() {
+// CHECK-NEXT:      %zero = riscv.li 0 : !riscv.reg<zero>
+// CHECK-NEXT:      %0 = riscv.li 6 : !riscv.reg<t0>
+// CHECK-NEXT:      %1 = riscv.li 5 : !riscv.reg<s0>
+// CHECK-NEXT:      %2 = riscv.fcvt.s.w %0 : (!riscv.reg<t0>) -> !riscv.freg<ft0>
+// CHECK-NEXT:      %3 = riscv.fcvt.s.w %1 : (!riscv.reg<s0>) -> !riscv.freg<ft1>
+// CHECK-NEXT:      %4 = riscv.fadd.s %2, %3 : (!riscv.freg<ft0>, !riscv.freg<ft1>) -> !riscv.freg<ft1>
+// CHECK-NEXT:      %5 = riscv.add %0, %1 : (!riscv.reg<t0>, !riscv.reg<s0>) -> !riscv.reg<t1>
+// CHECK-NEXT:      riscv_scf.for %6 : !riscv.reg<t2>  = %0 to %1 step %5 {
+// CHECK-NEXT:      }
+// CHECK-NEXT:      %7 = riscv_scf.for %8 : !riscv.reg<t2>  = %0 to %1 step %5 iter_args(%9 = %5) -> (!riscv.reg<t1>) {
+// CHECK-NEXT:        %10 = riscv.mv %9 : (!riscv.reg<t1>) -> !riscv.reg<t1>
+// CHECK-NEXT:        riscv_scf.yield %10 : !riscv.reg<t1>
+// CHECK-NEXT:      }
+// CHECK-NEXT:      %11 = riscv_snitch.frep_outer %0 iter_args(%12 = %4) -> (!riscv.freg<ft1>) {
+// CHECK-NEXT:        %13 = riscv.fmv.s %12 : (!riscv.freg<ft1>) -> !riscv.freg<ft1>
+// CHECK-NEXT:        riscv_snitch.frep_yield %13 : !riscv.freg<ft1>
+// CHECK-NEXT:      }
+// CHECK-NEXT:      %zero_1 = riscv.li 0 : !riscv.reg<zero>
+// CHECK-NEXT:      %zero_2 = riscv.li 0 : !riscv.reg<a0>
+// CHECK-NEXT:      riscv_func.return
+// CHECK-NEXT:    }
+// CHECK-NEXT:  }
@@ -159,10 +159,10 @@ func.func @cond_br_same_successor_insert_select(
 /// branches with the same condition.
 // CHECK:      func.func @cond_br_from_cond_br_with_same_condition(%cond : i1) {
 // CHECK-NEXT:   cf.cond_br %cond, ^bb0, ^bb1
-// CHECK-NEXT: ^bb0:
-// CHECK-NEXT:   func.return
 // CHECK-NEXT: ^bb1:
 // CHECK-NEXT:   "test.termop"() : () -> ()
+// CHECK-NEXT: ^bb0:
+// CHECK-NEXT:   func.return
 // CHECK-NEXT: }
 func.func @cond_br_from_cond_br_with_same_condition(%cond : i1) {
   cf.cond_br %cond, ^bb1, ^bb2
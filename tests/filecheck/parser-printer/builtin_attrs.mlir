@@ -1,4 +1,5 @@
 // RUN: xdsl-opt %s | xdsl-opt --print-op-generic | filecheck %s
+// RUN: xdsl-opt %s -t bytecode | xdsl-opt -f bytecode | xdsl-opt --print-op-generic | filecheck %s
 
 "builtin.module"() ({
   "func.func"() ({
@@ -1,4 +1,5 @@
 // RUN: xdsl-opt %s --allow-unregistered-dialect | filecheck %s
+// RUN: xdsl-opt %s --allow-unregistered-dialect -t bytecode | xdsl-opt -f bytecode --allow-unregistered-dialect | filecheck %s
 
 builtin.module {
 
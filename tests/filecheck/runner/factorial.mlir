@@ -1,4 +1,5 @@
 // RUN: xdsl-run %s | filecheck %s
+// RUN: xdsl-run --compiled %s | filecheck %s
 
 builtin.module {
 
@@ -1,5 +1,6 @@
 // RUN: xdsl-run --verbose %s | filecheck %s
 // RUN: xdsl-run --verbose --symbol="sum_to" --args="6" %s | filecheck %s --check-prefix=CHECK-ARGS
+// RUN: xdsl-run --compiled --verbose --symbol="sum_to" --args="6" %s | filecheck %s --check-prefix=CHECK-ARGS
 
 builtin.module {
   func.func @sum_to(%0 : !riscv.reg) -> !riscv.reg {
@@ -1,4 +1,5 @@
 // RUN: xdsl-opt %s -p apply-pdl-interp | filecheck %s
+// RUN: xdsl-opt %s -p "apply-pdl-interp{compiled=true}" | filecheck %s
 
 
 // CHECK:       func.func @impl() -> i32 {
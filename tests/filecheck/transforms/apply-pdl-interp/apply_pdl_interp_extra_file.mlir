@@ -1,4 +1,5 @@
 // RUN: xdsl-opt %s -p 'apply-pdl-interp{pdl_interp_file="%p/extra_file.mlir"}' | filecheck %s
+// RUN: xdsl-opt %s -p 'apply-pdl-interp{pdl_interp_file="%p/extra_file.mlir" compiled=true}' | filecheck %s
 
 
 // CHECK:       func.func @impl() -> i32 {
@@ -1,4 +1,5 @@
 // RUN: xdsl-opt %s -p apply-pdl-interp | filecheck %s
+// RUN: xdsl-opt %s -p "apply-pdl-interp{compiled=true}" | filecheck %s
 
 // CHECK: %a = arith.constant 3 : i32
 // CHECK-NEXT: %b = arith.constant 5 : i32
@@ -135,11 +135,7 @@ func.func @different_ops() -> (i32, i32) {
 // CHECK-NEXT:      func.return
 // CHECK-NEXT:    }
 
-// This would be checking that the constant in the second block is cse'd with the first one
-// MLIR has the notion of SSACFG regions (those) and graph regions.
-// This works on SSACFG regions only - at least in MLIR implementation.
-// We do not have this Region Kind disctinction; so everything here works on the pessimistic
-// Graph Rewgion assumption.
+/// Check that operation definitions are propagated down the dominance tree.
 
 // CHECK-LABEL: @down_propagate()
 func.func @down_propagate() -> i32 {
@@ -157,10 +153,35 @@ func.func @down_propagate() -> i32 {
 // CHECK-NEXT:      %1 = arith.constant true
 // CHECK-NEXT:      cf.cond_br %1, ^bb0, ^bb1(%0 : i32)
 // CHECK-NEXT:    ^bb0:
-// CHECK-NEXT:      %2 = arith.constant 1 : i32
-// CHECK-NEXT:      cf.br ^bb1(%2 : i32)
-// CHECK-NEXT:    ^bb1(%3 : i32):
-// CHECK-NEXT:      func.return %3 : i32
+// CHECK-NEXT:      cf.br ^bb1(%0 : i32)
+// CHECK-NEXT:    ^bb1(%2 : i32):
+// CHECK-NEXT:      func.return %2 : i32
+// CHECK-NEXT:    }
+
+/// Check that operation definitions are not propagated to blocks they do not dominate.
+// CHECK-LABEL: @sibling_propagate
+func.func @sibling_propagate(%cond : i1) -> i32 {
+    cf.cond_br %cond, ^bb1, ^bb2
+  ^bb1:
+    %0 = arith.constant 1 : i32
+    %1 = arith.constant 1 : i32
+    cf.br ^bb3(%1 : i32)
+  ^bb2:
+    %2 = arith.constant 1 : i32
+    cf.br ^bb3(%2 : i32)
+  ^bb3(%3 : i32):
+    func.return %3 : i32
+  }
+
+// CHECK:           cf.cond_br %cond, ^bb0, ^bb1
+// CHECK-NEXT:    ^bb0:
+// CHECK-NEXT:      %0 = arith.constant 1 : i32
+// CHECK-NEXT:      cf.br ^bb2(%0 : i32)
+// CHECK-NEXT:    ^bb1:
+// CHECK-NEXT:      %1 = arith.constant 1 : i32
+// CHECK-NEXT:      cf.br ^bb2(%1 : i32)
+// CHECK-NEXT:    ^bb2(%2 : i32):
+// CHECK-NEXT:      func.return %2 : i32
 // CHECK-NEXT:    }
 
 /// Check that operation definitions are NOT propagated up the dominance tree.
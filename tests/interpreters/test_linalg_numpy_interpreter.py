@@ -0,0 +1,201 @@
+import random
+from collections.abc import Sequence
+
+import pytest
+
+from xdsl.builder import ImplicitBuilder
+from xdsl.dialects import arith, linalg
+from xdsl.dialects.builtin import (
+    AffineMapAttr,
+    DenseIntOrFPElementsAttr,
+    MemRefType,
+    ModuleOp,
+    TensorType,
+    f32,
+    f64,
+    i32,
+    i64,
+)
+from xdsl.interpreter import Interpreter
+from xdsl.interpreters.arith import ArithFunctions
+from xdsl.interpreters.linalg import LinalgFunctions
+from xdsl.interpreters.shaped_array import ShapedArray
+from xdsl.interpreters.utils.ptr import TypedPtr
+from xdsl.ir import Block, Operation, Region
+from xdsl.ir.affine import AffineMap
+from xdsl.utils.test_value import create_ssa_value
+
+pytest.importorskip("numpy", reason="numpy is an optional dependency")
+
+from xdsl.interpreters.linalg_numpy import NumPyLinalgFunctions  # noqa: E402
+
+
+def _random_array(shape: Sequence[int], seed: int) -> ShapedArray[float]:
+    rng = random.Random(seed)
+    size = 1
+    for dim in shape:
+        size *= dim
+    return ShapedArray(
+        TypedPtr.new_float32([rng.uniform(-10, 10) for _ in range(size)]), list(shape)
+    )
+
+
+def _run_both(op: Operation, args: Sequence[ShapedArray[float]]) -> None:
+    """
+    Runs `op` with both the scalar and the NumPy implementations, on copies of `args`,
+    and checks that they compute the same values.
+    """
+    results: list[tuple[ShapedArray[float], ...]] = []
+    for functions in (LinalgFunctions(), NumPyLinalgFunctions()):
+        interpreter = Interpreter(ModuleOp([]))
+        interpreter.register_implementations(ArithFunctions())
+        interpreter.register_implementations(functions)
+        copies = tuple(arg.copy() for arg in args)
+        interpreter.run_op(op, copies)
+        results.append(copies)
+    assert results[0] == results[1]
+
+
+def test_as_ndarray():
+    array = ShapedArray(TypedPtr.new_float32([1.0, 2.0, 3.0, 4.0, 5.0, 6.0]), [2, 3])
+    view = array.as_ndarray()
+    assert view.shape == (2, 3)
+    assert view[1, 0] == 4.0
+
+    view[1, 2] = 9.0
+    assert array.load((1, 2)) == 9.0
+
+
+def test_numpy_matmul():
+    op = linalg.MatmulOp(
+        (
+            create_ssa_value(MemRefType(f32, [4, 7])),
+            create_ssa_value(MemRefType(f32, [7, 4])),
+        ),
+        (create_ssa_value(MemRefType(f32, [4, 4])),),
+    )
+    zeros = ShapedArray(TypedPtr.new_float32([0.0] * 16), [4, 4])
+    _run_both(op, (_random_array([4, 7], 0), _random_array([7, 4], 1), zeros))
+
+
+def test_numpy_elementwise():
+    shape = [3, 5]
+    zeros = ShapedArray(TypedPtr.new_float32([0.0] * 15), shape)
+    operands = (
+        create_ssa_value(MemRefType(f32, shape)),
+        create_ssa_value(MemRefType(f32, shape)),
+    )
+    outputs = (create_ssa_value(MemRefType(f32, shape)),)
+    lhs, rhs = _random_array(shape, 2), _random_array(shape, 3)
+
+    _run_both(linalg.AddOp(operands, outputs), (lhs, rhs, zeros))
+    _run_both(linalg.MulOp(operands, outputs), (lhs, rhs, zeros))
+    _run_both(
+        linalg.FillOp((create_ssa_value(f32),), outputs),
+        (ShapedArray(TypedPtr.new_float32([2.5]), [1]), zeros),
+    )
+    _run_both(
+        linalg.TransposeOp(
+            operands[0],
+            create_ssa_value(MemRefType(f32, shape[::-1])),
+            DenseIntOrFPElementsAttr.from_list(TensorType(i64, [2]), [1, 0]),
+        ),
+        (lhs, ShapedArray(TypedPtr.new_float32([0.0] * 15), shape[::-1])),
+    )
+
+
+@pytest.mark.parametrize("stride", [1, 2])
+def test_numpy_conv_and_pooling(stride: int):
+    strides = DenseIntOrFPElementsAttr.from_list(TensorType(i64, [2]), [stride])
+    dilations = DenseIntOrFPElementsAttr.from_list(TensorType(i64, [2]), [1])
+    out_dim = 4 // stride
+    out_shape = [1, 1, out_dim, out_dim]
+
+    conv = linalg.Conv2DNchwFchwOp(
+        (
+            create_ssa_value(MemRefType(f32, [1, 1, 6, 6])),
+            create_ssa_value(MemRefType(f32, [1, 1, 3, 3])),
+        ),
+        (create_ssa_value(MemRefType(f32, out_shape)),),
+        (),
+        {"dilations": dilations, "strides": strides},
+    )
+    zeros = ShapedArray(TypedPtr.new_float32([0.0] * out_dim * out_dim), out_shape)
+    _run_both(
+        conv, (_random_array([1, 1, 6, 6], 4), _random_array([1, 1, 3, 3], 5), zeros)
+    )
+
+    pooling = linalg.PoolingNchwMaxOp(
+        (
+            create_ssa_value(MemRefType(f32, [1, 1, 6, 6])),
+            create_ssa_value(MemRefType(f32, [3, 3])),
+        ),
+        (create_ssa_value(MemRefType(f32, out_shape)),),
+        (),
+        {"dilations": dilations, "strides": strides},
+    )
+    _run_both(
+        pooling, (_random_array([1, 1, 6, 6], 6), _random_array([3, 3], 7), zeros)
+    )
+
+
+def test_numpy_generic_matmul():
+    op = linalg.GenericOp(
+        (
+            create_ssa_value(MemRefType(f32, [3, 5])),
+            create_ssa_value(MemRefType(f64, [5, 4])),
+        ),
+        (create_ssa_value(MemRefType(f32, [3, 4])),),
+        Region(Block(arg_types=(f32, f64, f32))),
+        (
+            AffineMapAttr(AffineMap.from_callable(lambda i, j, k: (i, k))),
+            AffineMapAttr(AffineMap.from_callable(lambda i, j, k: (k, j))),
+            AffineMapAttr(AffineMap.from_callable(lambda i, j, k: (i, j))),
+        ),
+        (
+            linalg.IteratorTypeAttr.parallel(),
+            linalg.IteratorTypeAttr.parallel(),
+            linalg.IteratorTypeAttr.reduction(),
+        ),
+    )
+    with ImplicitBuilder(op.body) as (lhs, rhs, acc):
+        product = arith.MulfOp(lhs, rhs).result
+        linalg.YieldOp(arith.AddfOp(product, acc).result)
+
+    rhs = ShapedArray(TypedPtr.new_float64(_random_array([5, 4], 9).data), [5, 4])
+    _run_both(op, (_random_array([3, 5], 8), rhs, _random_array([3, 4], 10)))
+
+
+def test_numpy_generic_fallback():
+    # Integer bodies are run one element at a time
+    op = linalg.GenericOp(
+        (
+            create_ssa_value(MemRefType(i32, [3])),
+            create_ssa_value(MemRefType(i32, [3])),
+        ),
+        (create_ssa_value(MemRefType(i32, [])),),
+        Region(Block(arg_types=(i32, i32, i32))),
+        (
+            AffineMapAttr(AffineMap.identity(1)),
+            AffineMapAttr(AffineMap.identity(1)),
+            AffineMapAttr(AffineMap.from_callable(lambda d0: ())),
+        ),
+        (linalg.IteratorTypeAttr.reduction(),),
+    )
+    with ImplicitBuilder(op.body) as (lhs, rhs, acc):
+        product = arith.MuliOp(lhs, rhs).result
+        linalg.YieldOp(arith.AddiOp(product, acc).result)
+
+    interpreter = Interpreter(ModuleOp([]))
+    interpreter.register_implementations(ArithFunctions())
+    interpreter.register_implementations(NumPyLinalgFunctions())
+    c = ShapedArray(TypedPtr.new_int32([0]), [])
+    interpreter.run_op(
+        op,
+        (
+            ShapedArray(TypedPtr.new_int32([1, 2, 3]), [3]),
+            ShapedArray(TypedPtr.new_int32([4, 5, 6]), [3]),
+            c,
+        ),
+    )
+    assert c.data == [32]
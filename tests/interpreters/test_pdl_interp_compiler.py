@@ -0,0 +1,239 @@
+import pytest
+
+from xdsl.context import Context
+from xdsl.dialects import arith, func, pdl, pdl_interp, test
+from xdsl.dialects.builtin import Builtin, ModuleOp, StringAttr, UnregisteredOp, i32
+from xdsl.interpreters.pdl_interp_compiler import PDLInterpCompiler
+from xdsl.ir import Attribute, Block, Operation, SSAValue
+from xdsl.parser import Parser
+from xdsl.pattern_rewriter import PatternRewriter, PatternRewriteWalker
+from xdsl.transforms.apply_pdl_interp import (
+    ApplyPDLInterpPass,
+    CompiledPDLInterpRewritePattern,
+)
+from xdsl.utils.exceptions import InterpretationError
+
+PAYLOAD = """
+func.func @impl(%x : i32) -> (i32, i32) {
+  %0 = arith.constant 0 : i32
+  %1 = arith.constant 1 : i32
+  %2 = arith.addi %x, %0 : i32
+  %3 = arith.muli %2, %1 : i32
+  %4 = arith.subi %3, %0 : i32
+  func.return %3, %4 : i32, i32
+}
+"""
+
+MATCHER = """
+pdl_interp.func @matcher(%root : !pdl.operation) {
+  pdl_interp.switch_operation_name of %root to ["arith.addi", "arith.muli", "arith.subi"](^bb0, ^bb1, ^bb0) -> ^end
+^end:
+  pdl_interp.finalize
+^bb0:
+  %0 = pdl_interp.get_operand 1 of %root
+  %1 = pdl_interp.get_defining_op of %0 : !pdl.value
+  pdl_interp.is_not_null %1 : !pdl.operation -> ^bb2, ^end
+^bb1:
+  %2 = pdl_interp.get_operand 1 of %root
+  %3 = pdl_interp.get_defining_op of %2 : !pdl.value
+  pdl_interp.is_not_null %3 : !pdl.operation -> ^bb3, ^end
+^bb2:
+  pdl_interp.check_operation_name of %1 is "arith.constant" -> ^bb4, ^end
+^bb3:
+  pdl_interp.check_operation_name of %3 is "arith.constant" -> ^bb5, ^end
+^bb4:
+  %4 = pdl_interp.get_attribute "value" of %1
+  pdl_interp.switch_attribute %4 to [0 : i32](^bb6) -> ^end
+^bb5:
+  %5 = pdl_interp.get_attribute "value" of %3
+  pdl_interp.check_attribute %5 is 1 : i32 -> ^bb6, ^end
+^bb6:
+  %7 = pdl_interp.get_operand 0 of %root
+  pdl_interp.check_operand_count of %root is at_least 2 -> ^bb7, ^end
+^bb7:
+  pdl_interp.check_result_count of %root is 1 -> ^bb8, ^end
+^bb8:
+  %8 = pdl_interp.get_value_type of %7 : !pdl.type
+  pdl_interp.check_type %8 is i32 -> ^bb9, ^end
+^bb9:
+  pdl_interp.record_match @rewriters::@forward(%7, %root : !pdl.value, !pdl.operation) : benefit(1), loc([%root]) -> ^end
+}
+module @rewriters {
+  pdl_interp.func @forward(%value : !pdl.value, %root : !pdl.operation) {
+    pdl_interp.replace %root with (%value : !pdl.value)
+    pdl_interp.finalize
+  }
+}
+"""
+
+
+def _context() -> Context:
+    ctx = Context()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(arith.Arith)
+    ctx.load_dialect(func.Func)
+    ctx.load_dialect(pdl.PDL)
+    ctx.load_dialect(pdl_interp.PDLInterp)
+    ctx.load_dialect(test.Test)
+    return ctx
+
+
+def test_compiled_matcher():
+    ctx = _context()
+    payload = Parser(ctx, PAYLOAD).parse_module()
+    patterns = Parser(ctx, MATCHER).parse_module()
+    matcher = next(
+        op
+        for op in patterns.walk()
+        if isinstance(op, pdl_interp.FuncOp) and op.sym_name.data == "matcher"
+    )
+
+    compiler = PDLInterpCompiler(ctx)
+    compiled = compiler.compile(matcher)
+    assert compiler.compile(matcher) is compiled
+
+    PatternRewriteWalker(CompiledPDLInterpRewritePattern(compiled)).rewrite_module(
+        payload
+    )
+
+    expected = Parser(
+        ctx,
+        """
+        func.func @impl(%x : i32) -> (i32, i32) {
+          %0 = arith.constant 0 : i32
+          %1 = arith.constant 1 : i32
+          func.return %x, %x : i32, i32
+        }
+        """,
+    ).parse_module()
+    assert payload.is_structurally_equivalent(expected)
+
+
+def test_compiled_pass_matches_interpreter():
+    ctx = _context()
+    source = PAYLOAD + MATCHER
+
+    interpreted = Parser(ctx, source).parse_module()
+    ApplyPDLInterpPass().apply(ctx, interpreted)
+    compiled = Parser(ctx, source).parse_module()
+    ApplyPDLInterpPass(compiled=True).apply(ctx, compiled)
+
+    assert compiled.is_structurally_equivalent(interpreted)
+
+
+def test_compile_errors():
+    ctx = _context()
+    op = pdl_interp.FuncOp("matcher", ((pdl.OperationType(),), ()))
+    block = op.body.blocks[0]
+    block.add_op(test.TestOp())
+    block.add_op(pdl_interp.FinalizeOp())
+    with pytest.raises(
+        InterpretationError,
+        match="Cannot compile operation test.op in a pdl_interp function",
+    ):
+        PDLInterpCompiler(ctx).compile(op)
+
+    empty = pdl_interp.FuncOp("matcher", ((pdl.OperationType(),), ()))
+    dest = Block()
+    empty.body.add_block(dest)
+    empty.body.blocks[0].add_op(
+        pdl_interp.CheckOperationNameOp(
+            "test.op", empty.body.blocks[0].args[0], dest, dest
+        )
+    )
+    with pytest.raises(InterpretationError, match="Expected a terminated block"):
+        PDLInterpCompiler(ctx).compile(empty)
+
+
+def test_apply_constraint():
+    ctx = _context()
+    op = pdl_interp.FuncOp("matcher", ((pdl.OperationType(),), ()))
+    entry = op.body.blocks[0]
+    true_dest = Block([pdl_interp.FinalizeOp()])
+    false_dest = Block([pdl_interp.FinalizeOp()])
+    op.body.add_block(true_dest)
+    op.body.add_block(false_dest)
+    constraint = pdl_interp.ApplyConstraintOp(
+        "has_name", (entry.args[0],), true_dest, false_dest, (pdl.AttributeType(),)
+    )
+    entry.add_op(constraint)
+
+    names: list[str] = []
+
+    def has_name(root: Operation) -> tuple[bool, tuple[Attribute]]:
+        names.append(root.name)
+        return root.name == "test.op", (StringAttr(root.name),)
+
+    compiler = PDLInterpCompiler(ctx, {"has_name": has_name})
+    compiled = compiler.compile(op)
+
+    root = test.TestOp()
+    ModuleOp([root])
+    compiled(PatternRewriter(root), (root,))
+    assert names == ["test.op"]
+
+    # Unknown constraints are only reported when they are applied
+    compiled = PDLInterpCompiler(ctx).compile(op)
+    with pytest.raises(
+        InterpretationError, match="Unknown constraint function: has_name"
+    ):
+        compiled(PatternRewriter(root), (root,))
+
+
+@pytest.mark.parametrize("single", [False, True])
+def test_get_result_group(single: bool):
+    ctx = _context()
+    result_type = pdl.ValueType() if single else pdl.RangeType(pdl.ValueType())
+    recorded: list[object] = []
+
+    def record(value: object) -> tuple[bool, tuple[Attribute]]:
+        recorded.append(value)
+        return True, (StringAttr("recorded"),)
+
+    def get_result_group(root: Operation, index: int) -> object:
+        op = pdl_interp.FuncOp("matcher", ((pdl.OperationType(),), ()))
+        entry = op.body.blocks[0]
+        dest = Block([pdl_interp.FinalizeOp()])
+        op.body.add_block(dest)
+        get_results = pdl_interp.GetResultsOp(index, entry.args[0], result_type)
+        entry.add_ops(
+            (
+                get_results,
+                pdl_interp.ApplyConstraintOp(
+                    "record",
+                    (get_results.value,),
+                    dest,
+                    dest,
+                    (pdl.AttributeType(),),
+                ),
+            )
+        )
+        compiled = PDLInterpCompiler(ctx, {"record": record}).compile(op)
+        compiled(PatternRewriter(root), (root,))
+        return recorded.pop()
+
+    def group(*values: SSAValue) -> object:
+        if single:
+            return values[0] if len(values) == 1 else None
+        return values
+
+    # A variadic result definition is a single group
+    variadic = test.TestOp(result_types=(i32, i32))
+    ModuleOp([variadic])
+    assert get_result_group(variadic, 0) == group(*variadic.results)
+    assert get_result_group(variadic, 1) is None
+
+    # Each result definition is a group
+    extended = arith.AddUIExtendedOp(variadic.results[0], variadic.results[1])
+    ModuleOp([extended])
+    assert get_result_group(extended, 0) == group(extended.sum)
+    assert get_result_group(extended, 1) == group(extended.overflow)
+    assert get_result_group(extended, 2) is None
+
+    # Each result of an unregistered operation is a group
+    unregistered = UnregisteredOp.with_name("test.unregistered")(
+        result_types=(i32, i32)
+    )
+    ModuleOp([unregistered])
+    assert get_result_group(unregistered, 1) == group(unregistered.results[1])
+    assert get_result_group(unregistered, 2) is None
@@ -1,4 +1,19 @@
-from xdsl.dialects.builtin import ArrayAttr, IntAttr, StringAttr
+from xdsl.context import Context
+from xdsl.dialects.builtin import (
+    ArrayAttr,
+    Builtin,
+    DictionaryAttr,
+    FloatAttr,
+    FloatData,
+    IntAttr,
+    IntegerType,
+    Signedness,
+    SignednessAttr,
+    StringAttr,
+    f32,
+)
+from xdsl.ir import get_attribute_uniquer, uniqued_attributes
+from xdsl.parser import Parser
 
 
 def test_data_get():
@@ -20,3 +35,51 @@ def test_data_get():
     a_attr = ArrayAttr(a)
     assert ArrayAttr.get(a) == a_attr
     assert ArrayAttr.get(a_attr) == a_attr
+
+
+def test_attribute_uniquing_new():
+    with uniqued_attributes() as uniquer:
+        i32 = IntegerType.new(
+            (IntAttr.new(32), SignednessAttr.new(Signedness.SIGNLESS))
+        )
+        assert i32 is IntegerType.new(
+            (IntAttr.new(32), SignednessAttr.new(Signedness.SIGNLESS))
+        )
+        assert i32 == IntegerType(32)
+        assert i32 is not IntegerType(32)
+        assert i32 in uniquer
+        assert IntegerType(32) not in uniquer
+        assert uniquer.unique(IntegerType(32)) is i32
+
+        assert StringAttr.new("foo") is StringAttr.new("foo")
+        assert StringAttr.new("foo") is not StringAttr.new("bar")
+
+        arr = ArrayAttr.new((IntAttr(1), IntAttr(2)))
+        assert arr is ArrayAttr.new((IntAttr(1), IntAttr(2)))
+        assert arr.data[0] is IntAttr.new(1)
+
+    assert get_attribute_uniquer() is None
+    assert StringAttr.new("foo") is not StringAttr.new("foo")
+
+
+def test_attribute_uniquing_keeps_distinct_values():
+    with uniqued_attributes():
+        assert FloatData.new(0.0) is not FloatData.new(-0.0)
+        assert FloatAttr.new((FloatData(0.0), f32)) is not FloatAttr.new(
+            (FloatData(-0.0), f32)
+        )
+        assert IntAttr.new(1) is not IntAttr.new(True)
+
+
+def test_attribute_uniquing_parser():
+    ctx = Context()
+    ctx.load_dialect(Builtin)
+    with uniqued_attributes() as uniquer:
+        first = Parser(ctx, "tensor<2xi32>").parse_type()
+        second = Parser(ctx, "tensor<2xi32>").parse_type()
+        assert first is second
+        assert first in uniquer
+
+        attr = Parser(ctx, '{a = "foo", b = 1 : i32}').parse_attribute()
+        assert isinstance(attr, DictionaryAttr)
+        assert attr.data["a"] is StringAttr.new("foo")
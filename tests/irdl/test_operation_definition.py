@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from typing import Annotated, ClassVar, Generic
 
 import pytest
@@ -17,7 +18,7 @@ from xdsl.dialects.builtin import (
     i64,
 )
 from xdsl.dialects.test import TestType
-from xdsl.ir import Block, Region
+from xdsl.ir import Attribute, Block, Region
 from xdsl.irdl import (
     AnyAttr,
     AnyInt,
@@ -1007,3 +1008,66 @@ def test_generic_accessors():
     assert parsed.attributes.get("opt_attr") is None
 
     assert parsed.opt_attr.value.data
+
+
+@irdl_op_definition
+class SpecialisedVerifierOp(IRDLOperation):
+    name = "test.specialised_verifier"
+
+    lhs = operand_def(i32)
+    rhs = operand_def(IntegerType | IndexType)
+    res = result_def(IntegerType)
+    body = region_def("single_block", entry_args=RangeOf(base(IndexType)))
+    prop = prop_def(StringAttr)
+    opt_attr = opt_attr_def(BoolAttr)
+
+    traits = traits_def(NoTerminator())
+
+
+@pytest.mark.parametrize(
+    "operand_types, result_types, arg_types, properties, attributes",
+    [
+        ((i32, i32), (i64,), (IndexType(),), {"prop": StringAttr("a")}, {}),
+        ((i32, IndexType()), (i32,), (), {"prop": StringAttr("a")}, {}),
+        ((i64, i32), (i64,), (), {"prop": StringAttr("a")}, {}),
+        ((i32, TestType("t")), (i64,), (), {"prop": StringAttr("a")}, {}),
+        ((i32,), (i64,), (), {"prop": StringAttr("a")}, {}),
+        ((i32, i32), (IndexType(),), (), {"prop": StringAttr("a")}, {}),
+        ((i32, i32), (i64,), (i32,), {"prop": StringAttr("a")}, {}),
+        ((i32, i32), (i64,), (), {}, {}),
+        ((i32, i32), (i64,), (), {"prop": IntAttr(1)}, {}),
+        ((i32, i32), (i64,), (), {"prop": StringAttr("a"), "x": IntAttr(1)}, {}),
+        (
+            (i32, i32),
+            (i64,),
+            (),
+            {"prop": StringAttr("a")},
+            {"opt_attr": BoolAttr.from_bool(True)},
+        ),
+        ((i32, i32), (i64,), (), {"prop": StringAttr("a")}, {"opt_attr": i32}),
+    ],
+)
+def test_specialised_verifier(
+    operand_types: tuple[Attribute, ...],
+    result_types: tuple[Attribute, ...],
+    arg_types: tuple[Attribute, ...],
+    properties: dict[str, Attribute],
+    attributes: dict[str, Attribute],
+):
+    """Check that the specialised verifier agrees with the generic one."""
+    op = SpecialisedVerifierOp.create(
+        operands=[create_ssa_value(t) for t in operand_types],
+        result_types=result_types,
+        regions=[Region(Block(arg_types=arg_types))],
+        properties=properties,
+        attributes=attributes,
+    )
+    op_def = SpecialisedVerifierOp.get_irdl_definition()
+
+    try:
+        op_def.verify_generic(op)
+    except VerifyException as e:
+        with pytest.raises(VerifyException, match=re.escape(str(e))):
+            op_def.verify(op)
+    else:
+        op_def.verify(op)
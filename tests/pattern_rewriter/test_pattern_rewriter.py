@@ -354,6 +354,47 @@ def test_greedy_rewrite_pattern_applier():
     )
 
 
+def test_greedy_rewrite_pattern_applier_op_type_index():
+    """Test that GreedyRewritePatternApplier only tries patterns matching the op type."""
+
+    tried: list[str] = []
+
+    class ConstantRewrite(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: ConstantOp, rewriter: PatternRewriter):
+            tried.append("constant")
+
+    class BinaryRewrite(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: AddiOp | MuliOp, rewriter: PatternRewriter):
+            tried.append("binary")
+
+    class AnyRewrite(RewritePattern):
+        def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter):
+            tried.append("any")
+
+    assert ConstantRewrite().matched_op_types() == (ConstantOp,)
+    assert BinaryRewrite().matched_op_types() == (AddiOp, MuliOp)
+    assert AnyRewrite().matched_op_types() is None
+
+    applier = GreedyRewritePatternApplier(
+        [ConstantRewrite(), AnyRewrite(), BinaryRewrite()]
+    )
+    assert applier.matched_op_types() is None
+    assert GreedyRewritePatternApplier(
+        [ConstantRewrite(), BinaryRewrite()]
+    ).matched_op_types() == (ConstantOp, AddiOp, MuliOp)
+
+    cst = ConstantOp.from_int_and_width(42, i32)
+    add = AddiOp(cst, cst)
+    Block([cst, add])
+    applier.match_and_rewrite(cst, PatternRewriter(cst))
+    assert tried == ["constant", "any"]
+    tried.clear()
+    applier.match_and_rewrite(add, PatternRewriter(add))
+    assert tried == ["any", "binary"]
+
+
 def test_insert_op_before_matched_op():
     """Test rewrites where operations are inserted before the matched operation."""
 
@@ -1885,3 +1926,150 @@ def test_pattern_rewriter_notify_op_modified():
         PatternRewriteWalker(Rewrite(), apply_recursively=True),
         op_modified=3,
     )
+
+
+class IncrementConstantUpTo10(RewritePattern):
+    @op_type_rewrite_pattern
+    def match_and_rewrite(self, op: ConstantOp, rewriter: PatternRewriter):
+        value = op.value
+        assert isinstance(value, IntegerAttr)
+        if value.value.data < 10:
+            rewriter.replace_matched_op(
+                ConstantOp.from_int_and_width(value.value.data + 1, 32)
+            )
+
+
+WORKLIST_PROG = """
+"builtin.module"() ({
+  %0 = "arith.constant"() <{value = 7 : i32}> : () -> i32
+  %1 = "arith.constant"() <{value = 8 : i32}> : () -> i32
+  %2 = "arith.addi"(%0, %1) <{overflowFlags = #arith.overflow<none>}> : (i32, i32) -> i32
+}) : () -> ()"""
+
+
+@pytest.mark.parametrize(
+    "worklist_driven, rounds",
+    [(False, 2), (True, 1)],
+)
+def test_worklist_driven_rewrite(worklist_driven: bool, rounds: int):
+    """Test that worklist-driven rewrites do not walk the IR again."""
+
+    expected = """"builtin.module"() ({
+  %0 = "arith.constant"() <{value = 10 : i32}> : () -> i32
+  %1 = "arith.constant"() <{value = 10 : i32}> : () -> i32
+  %2 = "arith.addi"(%0, %1) <{overflowFlags = #arith.overflow<none>}> : (i32, i32) -> i32
+}) : () -> ()"""
+
+    walker = PatternRewriteWalker(
+        IncrementConstantUpTo10(), worklist_driven=worklist_driven
+    )
+    rewrite_and_compare(
+        WORKLIST_PROG,
+        expected,
+        walker,
+        op_inserted=5,
+        op_removed=5,
+        op_modified=5,
+        op_replaced=5,
+    )
+    assert walker.num_rounds == rounds
+    assert walker.num_rewrites == 5
+
+
+def test_worklist_driven_successor_predecessors():
+    """
+    Test that the branches to the successors of an erased operation are rewritten
+    again, as their successors lost a predecessor.
+    """
+
+    prog = """"builtin.module"() ({
+  "test.op"() ({
+    "test.termop"() [^bb0] : () -> ()
+  ^bb1:
+    "test.termop"() [^bb0] {dead} : () -> ()
+  ^bb0:
+    "test.termop"() : () -> ()
+  }) : () -> ()
+}) : () -> ()"""
+
+    expected = """"builtin.module"() ({
+  "test.op"() ({
+    "test.termop"() [^bb0] {single_pred} : () -> ()
+  ^bb1:
+    "test.termop"() : () -> ()
+  ^bb0:
+    "test.termop"() : () -> ()
+  }) : () -> ()
+}) : () -> ()"""
+
+    class RemoveDeadBranch(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: test.TestTermOp, rewriter: PatternRewriter):
+            if "dead" in op.attributes:
+                rewriter.replace_matched_op(test.TestTermOp())
+
+    class MarkSinglePredecessor(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: test.TestTermOp, rewriter: PatternRewriter):
+            if (
+                "single_pred" not in op.attributes
+                and len(op.successors) == 1
+                and len(op.successors[0].predecessors()) == 1
+            ):
+                op.attributes["single_pred"] = UnitAttr()
+                rewriter.notify_op_modified(op)
+
+    walker = PatternRewriteWalker(
+        GreedyRewritePatternApplier([RemoveDeadBranch(), MarkSinglePredecessor()]),
+        worklist_driven=True,
+    )
+    rewrite_and_compare(
+        prog,
+        expected,
+        walker,
+        op_inserted=1,
+        op_removed=1,
+        op_modified=1,
+        op_replaced=1,
+    )
+    assert walker.num_rounds == 1
+
+
+def test_rewrite_budget():
+    """Test that the walker stops when its budget is exhausted."""
+
+    expected = """"builtin.module"() ({
+  %0 = "arith.constant"() <{value = 9 : i32}> : () -> i32
+  %1 = "arith.constant"() <{value = 8 : i32}> : () -> i32
+  %2 = "arith.addi"(%0, %1) <{overflowFlags = #arith.overflow<none>}> : (i32, i32) -> i32
+}) : () -> ()"""
+
+    walker = PatternRewriteWalker(
+        IncrementConstantUpTo10(), worklist_driven=True, max_rewrites=2
+    )
+    rewrite_and_compare(
+        WORKLIST_PROG,
+        expected,
+        walker,
+        op_inserted=2,
+        op_removed=2,
+        op_modified=2,
+        op_replaced=2,
+    )
+    assert walker.num_rounds == 1
+    assert walker.num_rewrites == 2
+
+    # The last round, that only checks that the IR is not rewritten anymore, is not
+    # run
+    walker = PatternRewriteWalker(IncrementConstantUpTo10(), max_iterations=1)
+    rewrite_and_compare(
+        WORKLIST_PROG,
+        expected.replace("9 : i32", "10 : i32").replace("8 : i32", "10 : i32"),
+        walker,
+        op_inserted=5,
+        op_removed=5,
+        op_modified=5,
+        op_replaced=5,
+    )
+    assert walker.num_rounds == 1
+    assert walker.num_rewrites == 5
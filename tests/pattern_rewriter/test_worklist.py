@@ -69,3 +69,22 @@ def test_worklist_remove():
     assert worklist.is_empty()
     assert worklist.pop() is None
     assert worklist.is_empty()
+
+
+def test_worklist_clear():
+    """Test clear operation."""
+    op1 = test.TestOp()
+    op2 = test.TestOp()
+
+    worklist = Worklist()
+    worklist.push(op1)
+    worklist.push(op2)
+    worklist.remove(op1)
+
+    worklist.clear()
+    assert worklist.is_empty()
+    assert worklist.pop() is None
+
+    worklist.push(op1)
+    assert worklist.pop() is op1
+    assert worklist.is_empty()
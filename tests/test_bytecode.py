@@ -0,0 +1,146 @@
+from io import BytesIO, StringIO
+
+import pytest
+
+from xdsl.bytecode import MAGIC, BytecodeReader, read_bytecode, write_bytecode
+from xdsl.context import Context
+from xdsl.dialects import arith, builtin, cf, func, test
+from xdsl.dialects.builtin import ModuleOp, i32
+from xdsl.ir import Block, Operation, Region
+from xdsl.parser import Parser
+from xdsl.printer import Printer
+
+PROGRAM = """
+func.func @f(%a: i32, %b: memref<4xf32>) -> i32 attributes {llvm.emit_c_interface} {
+  %c = arith.constant 3 : i32
+  %x = arith.addi %a, %c : i32
+  cf.br ^bb1(%x : i32)
+^bb1(%y: i32):
+  %z = "test.op"(%y) : (i32) -> i32
+  %q = "test.op"() ({
+    "test.termop"(%z) : (i32) -> ()
+  }) : () -> i32
+  func.return %q : i32
+}
+func.func private @g()
+func.func @h() {
+  %0 = "unregistered.def"() <{prop = [1 : i64, "a"]}> : () -> f64
+  "unregistered.op"(%0) {attr = dense<[1, 2]> : tensor<2xi32>} : (f64) -> ()
+  func.return
+}
+"""
+
+
+def _context() -> Context:
+    ctx = Context(allow_unregistered=True)
+    ctx.load_dialect(builtin.Builtin)
+    ctx.load_dialect(arith.Arith)
+    ctx.load_dialect(cf.Cf)
+    ctx.load_dialect(func.Func)
+    ctx.load_dialect(test.Test)
+    return ctx
+
+
+def _to_bytecode(op: Operation) -> bytes:
+    stream = BytesIO()
+    write_bytecode(op, stream)
+    return stream.getvalue()
+
+
+def _print(op: Operation) -> str:
+    stream = StringIO()
+    Printer(stream).print_op(op)
+    return stream.getvalue()
+
+
+def test_roundtrip():
+    ctx = _context()
+    module = Parser(ctx, PROGRAM).parse_module()
+    data = _to_bytecode(module)
+    assert data.startswith(MAGIC)
+
+    result = read_bytecode(ctx, data)
+    assert isinstance(result, ModuleOp)
+    result.verify()
+    assert result.is_structurally_equivalent(module)
+    # Value names are preserved
+    assert _print(result) == _print(module)
+
+
+FLOATS_PROGRAM = """
+%0 = arith.constant 0.0 : f32
+%1 = arith.constant -0.0 : f32
+%2 = arith.constant 0x7FC00000 : f32
+%3 = arith.constant 0x7FC00001 : f32
+%4 = arith.constant 0xFFC00000 : f32
+%5 = arith.constant 0x7FF0000000000001 : f64
+%6 = arith.constant 0x7FF8000000000000 : f64
+"""
+
+
+def test_roundtrip_floats():
+    # Floats that compare equal, or NaNs with different payloads, are written as
+    # separate attributes
+    ctx = _context()
+    module = Parser(ctx, FLOATS_PROGRAM).parse_module()
+
+    result = read_bytecode(ctx, _to_bytecode(module))
+    assert _print(result) == _print(module)
+    assert "-0.000000e+00" in _print(result)
+    assert "0x7fc00001" in _print(result)
+
+
+def test_lazy_loading():
+    ctx = _context()
+    module = Parser(ctx, PROGRAM).parse_module()
+    reader = BytecodeReader(ctx, _to_bytecode(module), lazy=True)
+    result = reader.read()
+    assert isinstance(result, ModuleOp)
+
+    f, g, h = result.ops
+    assert isinstance(f, func.FuncOp)
+    assert isinstance(h, func.FuncOp)
+    assert not f.body.blocks
+    assert not reader.is_materialized(f)
+    assert reader.is_materialized(g)
+
+    reader.materialize(f)
+    assert reader.is_materialized(f)
+    assert len(f.body.blocks) == 2
+    assert not h.body.blocks
+
+    reader.materialize_all()
+    assert reader.is_materialized(h)
+    assert result.is_structurally_equivalent(module)
+
+
+def test_forward_references():
+    # A graph region, where values are used before they are defined
+    ctx = _context()
+    block = Block()
+    first = test.TestOp(result_types=(i32,))
+    second = test.TestOp((first.res[0],), (i32,))
+    first.operands = (second.res[0],)
+    block.add_ops((first, second))
+    module = ModuleOp(Region(block))
+
+    result = read_bytecode(ctx, _to_bytecode(module))
+    assert _print(result) == _print(module)
+
+
+def test_errors():
+    ctx = _context()
+    with pytest.raises(ValueError, match="Input is not in the xDSL bytecode format"):
+        read_bytecode(ctx, b"builtin.module {}")
+
+    data = _to_bytecode(ModuleOp([]))
+    with pytest.raises(ValueError, match="Unexpected end of bytecode"):
+        read_bytecode(ctx, data[:-1])
+    with pytest.raises(ValueError, match="Unexpected data after the top-level"):
+        read_bytecode(ctx, data + b"\0")
+
+    # Values may not be used across regions isolated from above
+    outer = test.TestOp(result_types=(i32,))
+    inner = func.FuncOp("f", ((), ()), Region(Block([test.TestOp((outer.res[0],))])))
+    with pytest.raises(ValueError, match="not defined in the enclosing region"):
+        _to_bytecode(ModuleOp([outer, inner]))
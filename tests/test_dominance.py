@@ -1,8 +1,11 @@
+import random
+
 import pytest
 
 from xdsl.context import Context
-from xdsl.dialects import get_all_dialects
-from xdsl.irdl.dominance import strictly_dominates
+from xdsl.dialects import get_all_dialects, test
+from xdsl.ir import Block, Region
+from xdsl.irdl.dominance import DominanceInfo, PostDominanceInfo, strictly_dominates
 from xdsl.parser import Parser
 
 ctx = Context()
@@ -65,3 +68,123 @@ def test_region_strictly_dominates_block(a: int, b: int, expected: bool):
     Test in-region block dominance.
     """
     assert strictly_dominates(blocks[a - 1], blocks[b - 1]) == expected
+
+
+def test_dominator_tree():
+    info = DominanceInfo(op.regions[0])
+    expected_idoms = {1: None, 2: 1, 3: 2, 4: 2, 5: 2, 6: 2}
+    for block, idom in expected_idoms.items():
+        assert info.immediate_dominator(blocks[block - 1]) == (
+            None if idom is None else blocks[idom - 1]
+        )
+    assert set(info.children(blocks[1])) == {blocks[i - 1] for i in (3, 4, 5, 6)}
+    assert all(info.is_reachable(block) for block in blocks)
+    assert info.nearest_common_dominator(blocks[2], blocks[3]) is blocks[1]
+    assert info.nearest_common_dominator(blocks[4], blocks[4]) is blocks[4]
+
+
+@pytest.mark.parametrize(
+    ("block", "frontier"),
+    [(1, set[int]()), (2, {2}), (3, {5}), (4, {5}), (5, {2}), (6, set[int]())],
+)
+def test_dominance_frontier(block: int, frontier: set[int]):
+    info = DominanceInfo(op.regions[0])
+    assert info.dominance_frontier(blocks[block - 1]) == {
+        blocks[i - 1] for i in frontier
+    }
+
+
+def test_post_dominator_tree():
+    info = PostDominanceInfo(op.regions[0])
+    expected_ipdoms = {1: 2, 2: 6, 3: 5, 4: 5, 5: 2, 6: None}
+    for block, ipdom in expected_ipdoms.items():
+        assert info.immediate_dominator(blocks[block - 1]) == (
+            None if ipdom is None else blocks[ipdom - 1]
+        )
+    assert info.post_dominates(blocks[5], blocks[0])
+    assert info.strictly_post_dominates(blocks[1], blocks[2])
+    assert not info.post_dominates(blocks[2], blocks[4])
+
+
+def test_unreachable_blocks():
+    region = Region([Block() for _ in range(4)])
+    b0, b1, b2, b3 = region.blocks
+    b0.add_op(test.TestTermOp(successors=[b1]))
+    b1.add_op(test.TestTermOp())
+    # b2 and b3 are unreachable, b2 branches to b3 and b1
+    b2.add_op(test.TestTermOp(successors=[b3, b1]))
+    b3.add_op(test.TestTermOp())
+
+    info = DominanceInfo(region)
+    assert info.dominates(b0, b1)
+    assert not info.is_reachable(b2)
+    assert info.dominates(b2, b3)
+    assert not info.dominates(b0, b2)
+    assert not info.dominates(b0, b3)
+    assert info.immediate_dominator(b2) is None
+
+
+def _get_idoms(info: DominanceInfo, region: Region) -> list[Block | None]:
+    return [info.immediate_dominator(block) for block in region.blocks]
+
+
+def _add_edge(src: Block, dst: Block):
+    terminator = src.last_op
+    assert terminator is not None
+    successors = (*terminator.successors, dst)
+    src.erase_op(terminator)
+    src.add_op(test.TestTermOp(successors=successors))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_incremental_edge_insertion(seed: int):
+    rng = random.Random(seed)
+    num_blocks = 12
+    region = Region([Block() for _ in range(num_blocks)])
+    region_blocks = list(region.blocks)
+    for block in region_blocks:
+        block.add_op(test.TestTermOp())
+    for block in region_blocks[:-1]:
+        _add_edge(block, rng.choice(region_blocks[1:]))
+
+    dom = DominanceInfo(region)
+    post_dom = PostDominanceInfo(region)
+    for _ in range(15):
+        src = rng.choice(region_blocks)
+        dst = rng.choice(region_blocks[1:])
+        _add_edge(src, dst)
+        dom.insert_edge(src, dst)
+        post_dom.insert_edge(src, dst)
+
+        expected_dom = DominanceInfo(region)
+        expected_post_dom = PostDominanceInfo(region)
+        assert _get_idoms(dom, region) == _get_idoms(expected_dom, region)
+        assert _get_idoms(post_dom, region) == _get_idoms(expected_post_dom, region)
+        for a in region_blocks:
+            for b in region_blocks:
+                assert dom.dominates(a, b) == expected_dom.dominates(a, b)
+                assert post_dom.dominates(a, b) == expected_post_dom.dominates(a, b)
+
+
+def test_split_block():
+    region = Region([Block() for _ in range(3)])
+    b0, b1, b2 = region.blocks
+    b0.add_ops([test.TestOp(), test.TestTermOp(successors=[b1, b2])])
+    b1.add_op(test.TestTermOp(successors=[b2]))
+    b2.add_op(test.TestTermOp())
+
+    dom = DominanceInfo(region)
+    post_dom = PostDominanceInfo(region)
+
+    first_op = b0.first_op
+    assert first_op is not None
+    assert first_op.next_op is not None
+    new_block = b0.split_before(first_op.next_op)
+    b0.add_op(test.TestTermOp(successors=[new_block]))
+    dom.split_block(b0, new_block)
+    post_dom.split_block(b0, new_block)
+
+    assert _get_idoms(dom, region) == _get_idoms(DominanceInfo(region), region)
+    assert _get_idoms(post_dom, region) == _get_idoms(PostDominanceInfo(region), region)
+    assert dom.immediate_dominator(b1) is new_block
+    assert post_dom.immediate_dominator(b0) is new_block
@@ -4,7 +4,8 @@ from typing import Any
 
 import pytest
 
-from xdsl.dialects import builtin, func, test
+from xdsl.context import Context
+from xdsl.dialects import arith, builtin, cf, func, scf, test
 from xdsl.dialects.builtin import (
     IndexType,
     IntegerAttr,
@@ -24,8 +25,13 @@ from xdsl.interpreter import (
     impl_external,
     register_impls,
 )
+from xdsl.interpreters.arith import ArithFunctions
 from xdsl.interpreters.builtin import BuiltinFunctions
-from xdsl.ir import Attribute, Operation
+from xdsl.interpreters.cf import CfFunctions
+from xdsl.interpreters.func import FuncFunctions
+from xdsl.interpreters.scf import ScfFunctions
+from xdsl.ir import Attribute, Block, Operation, Region
+from xdsl.parser import Parser
 from xdsl.utils.exceptions import InterpretationError
 from xdsl.utils.test_value import create_ssa_value
 
@@ -304,3 +310,73 @@ def test_error_message():
 -----------------------------
 """
     ]
+
+
+COMPILED_PROGRAM = """
+func.func @sum_to(%n : index) -> index {
+  %c0 = arith.constant 0 : index
+  %c1 = arith.constant 1 : index
+  %sum = scf.for %i = %c0 to %n step %c1 iter_args(%acc = %c0) -> (index) {
+    %next = arith.addi %acc, %i : index
+    scf.yield %next : index
+  }
+  cf.br ^loop(%sum, %c0 : index, index)
+^loop(%total : index, %j : index):
+  %done = arith.cmpi eq, %j, %n : index
+  cf.cond_br %done, ^exit, ^body
+^body:
+  %total_next = arith.addi %total, %c1 : index
+  %j_next = arith.addi %j, %c1 : index
+  cf.br ^loop(%total_next, %j_next : index, index)
+^exit:
+  func.return %total : index
+}
+"""
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_compiled_regions(compiled: bool):
+    ctx = Context()
+    for dialect in (builtin.Builtin, arith.Arith, cf.Cf, func.Func, scf.Scf):
+        ctx.load_dialect(dialect)
+    module = Parser(ctx, COMPILED_PROGRAM).parse_module()
+
+    interpreter = Interpreter(module, compiled=compiled)
+    for functions in (ArithFunctions(), CfFunctions(), FuncFunctions(), ScfFunctions()):
+        interpreter.register_implementations(functions)
+
+    assert interpreter.call_op("sum_to", (4,)) == (10,)
+    assert interpreter.call_op("sum_to", (5,)) == (15,)
+    # Both the function body and the loop body are compiled once
+    assert len(interpreter._compiled_regions) == (2 if compiled else 0)  # pyright: ignore[reportPrivateUsage]
+
+
+def test_compiled_region_errors():
+    @dataclass
+    @register_impls
+    class TestFunctions(InterpreterFunctions):
+        @impl(test.TestOp)
+        def run_test(
+            self, interpreter: Interpreter, op: test.TestOp, args: PythonValues
+        ) -> PythonValues:
+            return (1, 2)
+
+    interpreter = Interpreter(ModuleOp([]), compiled=True)
+    interpreter.register_implementations(TestFunctions())
+
+    region = Region(Block([test.TestOp(result_types=(i32,))]))
+    with pytest.raises(
+        InterpretationError,
+        match=re.escape(
+            "Number of operation results (1) doesn't match the number of "
+            "implementation results (2)."
+        ),
+    ):
+        interpreter.run_ssacfg_region(region, ())
+
+    region = Region(Block([func.ReturnOp()]))
+    with pytest.raises(
+        InterpretationError,
+        match="Could not find interpretation function for op func.return",
+    ):
+        interpreter.run_ssacfg_region(region, ())
@@ -1041,6 +1041,50 @@ def test_same_block():
     assert not op1.is_before_in_block(op1)
 
 
+def test_op_order_after_modifications():
+    ops = [test.TestOp() for _ in range(4)]
+    block = Block(ops)
+
+    def check_order():
+        block_ops = list(block.ops)
+        for i, op in enumerate(block_ops):
+            assert block.get_operation_index(op) == i
+            for j, other in enumerate(block_ops):
+                assert op.is_before_in_block(other) == (i < j)
+
+    check_order()
+
+    # Repeatedly insert between the same two operations, until the block has to
+    # be renumbered
+    for _ in range(10):
+        block.insert_op_after(test.TestOp(), ops[0])
+        check_order()
+
+    block.insert_op_before(test.TestOp(), ops[0])
+    check_order()
+    block.add_op(test.TestOp())
+    check_order()
+
+    block.detach_op(ops[2])
+    check_order()
+    block.insert_op_before(ops[2], ops[1])
+    check_order()
+
+
+def test_op_order_split_block():
+    ops = [test.TestOp() for _ in range(4)]
+    block = Block(ops)
+    Region(block)
+
+    assert ops[0].is_before_in_block(ops[3])
+    new_block = block.split_before(ops[2])
+    assert not ops[0].is_before_in_block(ops[3])
+    assert ops[2].is_before_in_block(ops[3])
+    assert block.get_operation_index(ops[1]) == 1
+    assert new_block.get_operation_index(ops[2]) == 0
+    assert new_block.get_operation_index(ops[3]) == 1
+
+
 def test_different_blocks():
     op1 = test.TestOp()
     op2 = test.TestOp()
@@ -270,3 +270,50 @@ def test_get_start_of_line(
     input = Input(START_END_LINE_CONTENT, "<>")
     assert input.get_start_of_line(pos) == expected_start
     assert input.get_end_of_line(pos) == expected_end
+
+
+LEX_ALL_CONTENT = """\
+// A comment
+"test.op"(%0, %arg1) <{prop = #test.attr<"str\\n">}> ({
+^bb0(%x : !test.type):
+  %1 = arith.constant 0x1f : i32 // trailing comment
+  %2 = arith.constant -3.5e+2 : f32
+  "test.op"() {a = [1, 2, ...], b = @sym, c = @"quoted", d = "\\ff"} : () -> ()
+}) : (i32, i32) -> (tensor<4x?xf32>)
+{-# dialect_resources: {} #-}
+"""
+
+
+def test_lex_all():
+    file = Input(LEX_ALL_CONTENT, "<unknown>")
+    tokens = MLIRLexer(file).lex_all()
+
+    lexer = MLIRLexer(file)
+    expected: list[MLIRToken] = []
+    while (token := lexer.lex()).kind is not MLIRTokenKind.EOF:
+        expected.append(token)
+    expected.append(token)
+
+    assert len(tokens) == len(expected)
+    for i, token in enumerate(expected):
+        assert tokens.kinds[i] == token.kind
+        assert tokens.starts[i] == token.span.start
+        assert tokens.ends[i] == token.span.end
+        assert tokens.token(i).text == token.text
+
+
+def test_lex_matches_char_by_char():
+    """Check that the regex-based lexing returns the same tokens as the fallback."""
+    file = Input(LEX_ALL_CONTENT, "<unknown>")
+    lexer = MLIRLexer(file)
+    fallback = MLIRLexer(file)
+    while True:
+        token = lexer.lex()
+        expected = fallback._lex_char_by_char()  # pyright: ignore[reportPrivateUsage]
+        assert (token.kind, token.span.start, token.span.end) == (
+            expected.kind,
+            expected.span.start,
+            expected.span.end,
+        )
+        if token.kind is MLIRTokenKind.EOF:
+            break
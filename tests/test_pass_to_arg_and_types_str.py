@@ -65,7 +65,7 @@ class SimplePass(ModulePass):
                 PassOptionInfo("nullable_str", "str|None"),
                 PassOptionInfo(
                     "literal",
-                    "typing.Literal['yes', 'no', 'maybe']",
+                    "Literal['yes', 'no', 'maybe']",
                     "no",
                 ),
                 PassOptionInfo("optional_bool", "bool", "false"),
@@ -0,0 +1,330 @@
+from dataclasses import dataclass
+
+import pytest
+
+from xdsl.backend.riscv.lowering.convert_scf_to_riscv_scf import ConvertScfToRiscvPass
+from xdsl.context import Context
+from xdsl.dialects import arith, cf, func, test
+from xdsl.dialects.builtin import Builtin, ModuleOp
+from xdsl.ir import Operation, Region
+from xdsl.irdl.dominance import DominanceInfo
+from xdsl.parser import Parser
+from xdsl.passes import (
+    AnalysisManager,
+    FusedPatternRewritePass,
+    ModulePass,
+    NestedPassPipeline,
+    PassPipeline,
+    PatternRewritePass,
+    PreservedAnalyses,
+)
+from xdsl.pattern_rewriter import (
+    PatternRewriter,
+    RewritePattern,
+    op_type_rewrite_pattern,
+)
+from xdsl.transforms import get_all_passes
+from xdsl.transforms.canonicalize import CanonicalizePass
+from xdsl.transforms.common_subexpression_elimination import (
+    CommonSubexpressionElimination,
+)
+from xdsl.transforms.loop_invariant_code_motion import LoopInvariantCodeMotionPass
+from xdsl.transforms.reconcile_unrealized_casts import ReconcileUnrealizedCastsPass
+
+
+@dataclass
+class CountOps:
+    """A test analysis counting the operations nested in an operation."""
+
+    count: int
+
+    def __init__(self, op: Operation):
+        self.count = sum(1 for _ in op.walk())
+
+
+@dataclass
+class OtherAnalysis:
+    op: Operation
+
+
+def test_analysis_manager_caching():
+    module = ModuleOp([test.TestOp()])
+    analyses = AnalysisManager()
+
+    assert analyses.get_cached_analysis(CountOps, module) is None
+    count = analyses.get_analysis(CountOps, module)
+    assert count.count == 2
+    assert analyses.get_analysis(CountOps, module) is count
+    assert analyses.get_cached_analysis(CountOps, module) is count
+    other = analyses.get_analysis(OtherAnalysis, module)
+    assert len(analyses) == 2
+
+    analyses.invalidate(PreservedAnalyses.all())
+    assert len(analyses) == 2
+
+    analyses.invalidate(PreservedAnalyses(frozenset((OtherAnalysis,))))
+    assert analyses.get_cached_analysis(CountOps, module) is None
+    assert analyses.get_cached_analysis(OtherAnalysis, module) is other
+
+    analyses.invalidate(PreservedAnalyses.none())
+    assert len(analyses) == 0
+
+
+@dataclass(frozen=True)
+class AddOpPass(ModulePass):
+    name = "test-add-op"
+
+    preserved_analyses = (OtherAnalysis,)
+
+    def apply(self, ctx: Context, op: ModuleOp) -> None:
+        op.body.block.add_op(test.TestOp())
+
+
+@dataclass(frozen=True)
+class RecordCountPass(ModulePass):
+    name = "test-record-count"
+
+    counts: list[CountOps]
+
+    def apply(self, ctx: Context, op: ModuleOp) -> None:
+        self.apply_with_analyses(ctx, op, AnalysisManager())
+
+    def apply_with_analyses(
+        self, ctx: Context, op: ModuleOp, analyses: AnalysisManager
+    ) -> PreservedAnalyses:
+        self.counts.append(analyses.get_analysis(CountOps, op))
+        return PreservedAnalyses.all()
+
+
+def test_pass_pipeline_analyses():
+    module = ModuleOp([])
+    counts: list[CountOps] = []
+    analyses = AnalysisManager()
+    record = RecordCountPass(counts)
+
+    PassPipeline((record, record, AddOpPass(), record)).apply(
+        Context(), module, analyses
+    )
+
+    assert [count.count for count in counts] == [1, 1, 2]
+    # The analysis is shared until a pass invalidates it
+    assert counts[0] is counts[1]
+    assert counts[1] is not counts[2]
+    assert analyses.get_cached_analysis(CountOps, module) is counts[2]
+
+
+NESTED_PROGRAM = """
+builtin.module {
+  func.func @f() -> i32 {
+    %0 = arith.constant 1 : i32
+    %1 = arith.constant 1 : i32
+    %2 = arith.addi %0, %1 : i32
+    func.return %2 : i32
+  }
+  "test.op"() : () -> ()
+  func.func @g() -> i32 {
+    %0 = arith.constant 2 : i32
+    %1 = arith.constant 2 : i32
+    %2 = arith.muli %0, %1 : i32
+    func.return %2 : i32
+  }
+}
+"""
+
+
+@dataclass(frozen=True)
+class AddTestOpPass(ModulePass):
+    name = "test-add-test-op"
+
+    def apply(self, ctx: Context, op: ModuleOp) -> None:
+        op.body.block.add_op(test.TestOp())
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_nested_pass_pipeline(num_workers: int):
+    ctx = Context()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(arith.Arith)
+    ctx.load_dialect(func.Func)
+    ctx.load_dialect(test.Test)
+    module = Parser(ctx, NESTED_PROGRAM).parse_module()
+    expected = Parser(ctx, NESTED_PROGRAM).parse_module()
+
+    PassPipeline((CommonSubexpressionElimination(),)).apply(ctx, expected)
+    # Passes applied to each function see a module containing only that function,
+    # and the operations they add are spliced in after it.
+    for f in list(expected.ops):
+        if isinstance(f, func.FuncOp):
+            expected.body.block.insert_op_after(test.TestOp(), f)
+
+    NestedPassPipeline(
+        (CommonSubexpressionElimination(), AddTestOpPass()),
+        op_name="func.func",
+        num_workers=num_workers,
+    ).apply(ctx, module)
+
+    module.verify()
+    assert module.is_structurally_equivalent(expected)
+
+
+def test_nested_pass_pipeline_ops():
+    ctx = Context()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(arith.Arith)
+    ctx.load_dialect(func.Func)
+    ctx.load_dialect(test.Test)
+    module = Parser(ctx, NESTED_PROGRAM).parse_module()
+    f, _, g = module.ops
+
+    assert NestedPassPipeline(()).nested_ops(module) == [f, g]
+    assert NestedPassPipeline((), op_name="func.func").nested_ops(module) == [f, g]
+    assert NestedPassPipeline((), op_name="test.op").nested_ops(module) == []
+
+
+MULTI_BLOCK_PROGRAM = """
+func.func @f(%cond : i1, %x : i32) -> i32 {
+  %0 = arith.constant 1 : i32
+  cf.cond_br %cond, ^bb1, ^bb2
+^bb1:
+  %1 = arith.constant 1 : i32
+  %2 = arith.addi %x, %1 : i32
+  func.return %2 : i32
+^bb2:
+  func.return %0 : i32
+}
+"""
+
+
+def test_dominance_preserved_across_passes(monkeypatch: pytest.MonkeyPatch):
+    ctx = Context()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(arith.Arith)
+    ctx.load_dialect(cf.Cf)
+    ctx.load_dialect(func.Func)
+    module = Parser(ctx, MULTI_BLOCK_PROGRAM).parse_module()
+
+    regions: list[Region] = []
+    init = DominanceInfo.__init__
+
+    def record_init(self: DominanceInfo, region: Region):
+        regions.append(region)
+        init(self, region)
+
+    monkeypatch.setattr(DominanceInfo, "__init__", record_init)
+
+    cse = CommonSubexpressionElimination()
+    PassPipeline(
+        (cse, LoopInvariantCodeMotionPass(), cse, CanonicalizePass(), cse)
+    ).apply(ctx, module)
+
+    # CSE and LICM preserve the dominance of the function body, unlike
+    # canonicalization
+    f = module.ops.first
+    assert isinstance(f, func.FuncOp)
+    assert len(f.body.blocks) == 3
+    assert regions == [f.body, f.body]
+
+    # The constant of the second block is replaced by the one of the entry block
+    assert sum(isinstance(op, arith.ConstantOp) for op in module.walk()) == 1
+
+
+class MuliToAddi(RewritePattern):
+    @op_type_rewrite_pattern
+    def match_and_rewrite(self, op: arith.MuliOp, rewriter: PatternRewriter):
+        rewriter.replace_matched_op(arith.AddiOp(op.lhs, op.rhs))
+
+
+class AddiToSubi(RewritePattern):
+    @op_type_rewrite_pattern
+    def match_and_rewrite(self, op: arith.AddiOp, rewriter: PatternRewriter):
+        rewriter.replace_matched_op(arith.SubiOp(op.lhs, op.rhs))
+
+
+@dataclass(frozen=True)
+class MuliToAddiPass(PatternRewritePass):
+    name = "test-muli-to-addi"
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return MuliToAddi()
+
+
+@dataclass(frozen=True)
+class AddiToSubiPass(PatternRewritePass):
+    name = "test-addi-to-subi"
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return AddiToSubi()
+
+
+@dataclass(frozen=True)
+class ReverseAddiToSubiPass(AddiToSubiPass):
+    name = "test-reverse-addi-to-subi"
+
+    walk_reverse = True
+
+
+FUSED_PROGRAM = """
+func.func @f(%a: i32, %b: i32) -> i32 {
+  %c = arith.muli %a, %b : i32
+  %d = arith.addi %c, %a : i32
+  %e = arith.muli %d, %d : i32
+  func.return %e : i32
+}
+"""
+
+
+def test_fused_pattern_rewrite_pass():
+    ctx = Context()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(arith.Arith)
+    ctx.load_dialect(func.Func)
+    module = Parser(ctx, FUSED_PROGRAM).parse_module()
+    expected = Parser(ctx, FUSED_PROGRAM).parse_module()
+
+    passes = (MuliToAddiPass(), AddiToSubiPass(), CanonicalizePass())
+    PassPipeline(passes).apply(ctx, expected)
+    FusedPatternRewritePass(passes).apply(ctx, module)
+
+    module.verify()
+    assert not any(isinstance(op, arith.AddiOp | arith.MuliOp) for op in module.walk())
+    assert module.is_structurally_equivalent(expected)
+
+
+def test_fuse_pattern_passes():
+    muli_to_addi = MuliToAddiPass()
+    addi_to_subi = AddiToSubiPass()
+    reverse = ReverseAddiToSubiPass()
+    cse = CommonSubexpressionElimination()
+
+    pipeline = PassPipeline(
+        (muli_to_addi, addi_to_subi, cse, muli_to_addi, reverse, reverse, cse)
+    ).fuse_pattern_passes()
+    assert pipeline.passes == (
+        FusedPatternRewritePass((muli_to_addi, addi_to_subi)),
+        cse,
+        muli_to_addi,
+        FusedPatternRewritePass((reverse, reverse)),
+        cse,
+    )
+
+    with pytest.raises(ValueError, match="Cannot fuse pass"):
+        FusedPatternRewritePass((muli_to_addi, reverse))
+
+
+def test_fuse_lowering_passes():
+    spec = (
+        "convert-func-to-riscv-func,convert-arith-to-riscv,"
+        "convert-scf-to-riscv-scf,reconcile-unrealized-casts"
+    )
+    pipeline = PassPipeline.parse_spec(get_all_passes(), spec).fuse_pattern_passes()
+    fused, scf_to_riscv, reconcile = pipeline.passes
+    assert isinstance(fused, FusedPatternRewritePass)
+    assert isinstance(scf_to_riscv, ConvertScfToRiscvPass)
+    assert isinstance(reconcile, ReconcileUnrealizedCastsPass)
+
+    # The fused passes print as the pipeline they replace
+    assert str(fused) == "convert-func-to-riscv-func,convert-arith-to-riscv"
+    assert str(fused.pipeline_pass_spec()) == (
+        'fused-patterns{passes="convert-func-to-riscv-func","convert-arith-to-riscv"}'
+    )
+    assert ",".join(str(p) for p in pipeline.passes) == spec
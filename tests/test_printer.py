@@ -1198,3 +1198,38 @@ def assert_print_op(
 
     printer.print_op(operation)
     assert file.getvalue().strip() == expected.strip()
+
+
+class _FlushRecordingStream(StringIO):
+    """A stream recording its contents every time it is flushed."""
+
+    def __init__(self):
+        super().__init__()
+        self.flushed: list[str] = []
+
+    def flush(self) -> None:
+        self.flushed.append(self.getvalue())
+
+
+def test_flush_top_level_ops():
+    inner = test.TestOp(regions=[Region(Block([test.TestOp()]))])
+    module = ModuleOp([inner, test.TestOp()])
+
+    stream = _FlushRecordingStream()
+    Printer(stream).print_op(module)
+    assert stream.flushed == []
+
+    stream = _FlushRecordingStream()
+    Printer(stream, flush_top_level_ops=True).print_op(module)
+    # Only the operations nested directly in the module are flush points
+    assert stream.flushed == [
+        """builtin.module {
+  "test.op"() ({
+    "test.op"() : () -> ()
+  }) : () -> ()""",
+        """builtin.module {
+  "test.op"() ({
+    "test.op"() : () -> ()
+  }) : () -> ()
+  "test.op"() : () -> ()""",
+    ]
@@ -2,7 +2,7 @@
 Test type_repr, which is the function used to print type hints.
 """
 
-from typing import Any
+from typing import Any, Literal, Optional, Union
 
 import pytest
 
@@ -27,6 +27,10 @@ class A:
         (list[A] | int, "list[A]|int"),
         (None, "None"),
         (int | None, "int|None"),
+        (Optional[int], "int|None"),  # noqa: UP045
+        (Union[int, str], "int|str"),  # noqa: UP007
+        (Literal["a", "b"], "Literal['a', 'b']"),
+        (Literal["a"] | None, "Literal['a']|None"),
     ],
 )
 def test_type_repr(type: Any, expected: str):
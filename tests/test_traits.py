@@ -48,6 +48,8 @@ from xdsl.irdl import (
     var_operand_def,
     var_result_def,
 )
+from xdsl.pattern_rewriter import PatternRewriter
+from xdsl.rewriter import InsertPoint
 from xdsl.traits import (
     AlwaysSpeculatable,
     ConditionallySpeculatable,
@@ -59,6 +61,8 @@ from xdsl.traits import (
     SameOperandsAndResultType,
     SymbolOpInterface,
     SymbolTable,
+    SymbolTableCollection,
+    cached_symbol_lookups,
     has_effects,
     is_speculatable,
 )
@@ -527,6 +531,91 @@ def test_insert_or_update():
     assert symbol2 in list(op.reg.ops)
 
 
+def test_symbol_table_collection():
+    @irdl_op_definition
+    class SymbolTableOp(IRDLOperation):
+        name = "test.symbol_table"
+
+        sym_name = opt_attr_def(StringAttr)
+
+        reg = region_def()
+
+        traits = traits_def(SymbolTable(), OptionalSymbolOpInterface())
+
+    symbol = SymbolOp("name")
+    nested_symbol = SymbolOp("name")
+    nested = SymbolTableOp(
+        regions=[Region(Block([nested_symbol, test.TestTermOp()]))],
+        attributes={"sym_name": StringAttr("nested")},
+    )
+    terminator = test.TestTermOp()
+    op = SymbolTableOp(regions=[Region(Block([symbol, nested, terminator]))])
+
+    symbol_tables = SymbolTableCollection()
+    assert symbol_tables.lookup_symbol(op, "name") is symbol
+    assert symbol_tables.lookup_symbol(op, StringAttr("nested")) is nested
+    assert symbol_tables.lookup_symbol(op, "other") is None
+    assert (
+        symbol_tables.lookup_symbol(terminator, SymbolRefAttr("nested", ["name"]))
+        is nested_symbol
+    )
+
+    # Modifications notified by a rewriter keep the collection up to date
+    rewriter = PatternRewriter(terminator)
+    symbol_tables.add_to_listener(rewriter)
+
+    other = SymbolOp("other")
+    rewriter.insert_op(other, InsertPoint.before(terminator))
+    assert symbol_tables.lookup_symbol(op, "other") is other
+
+    other.attributes["sym_name"] = StringAttr("renamed")
+    rewriter.notify_op_modified(other)
+    assert symbol_tables.lookup_symbol(op, "other") is None
+    assert symbol_tables.lookup_symbol(op, "renamed") is other
+
+    rewriter.erase_op(symbol)
+    assert symbol_tables.lookup_symbol(op, "name") is None
+
+    rewriter.erase_op(nested)
+    assert symbol_tables.lookup_symbol(op, "nested") is None
+
+    # Insertion or update through the collection
+    new_symbol = SymbolOp("renamed")
+    assert symbol_tables.insert_or_update(op, new_symbol) is other
+    assert symbol_tables.lookup_symbol(op, "renamed") is new_symbol
+    assert symbol_tables.get_symbols(op) == {"renamed": new_symbol}
+
+    # Other modifications require an invalidation
+    op.reg.block.insert_op_before(SymbolOp("name"), terminator)
+    assert symbol_tables.lookup_symbol(op, "name") is None
+    symbol_tables.invalidate(op)
+    assert symbol_tables.lookup_symbol(op, "name") is not None
+
+
+def test_cached_symbol_lookups():
+    @irdl_op_definition
+    class SymbolTableOp(IRDLOperation):
+        name = "test.symbol_table"
+
+        reg = region_def()
+
+        traits = traits_def(SymbolTable())
+
+    symbol = SymbolOp("name")
+    op = SymbolTableOp(regions=[Region(Block([symbol, test.TestTermOp()]))])
+
+    with cached_symbol_lookups() as symbol_tables:
+        assert SymbolTable.lookup_symbol(op, "name") is symbol
+        assert symbol_tables.get_symbols(op) == {"name": symbol}
+        # Nested contexts use the same collection
+        with cached_symbol_lookups() as nested_symbol_tables:
+            assert nested_symbol_tables is symbol_tables
+
+    # Outside of the context, the symbol table is scanned again
+    op.reg.block.insert_op_before(SymbolOp("other"), symbol)
+    assert SymbolTable.lookup_symbol(op, "other") is not None
+
+
 def nonpure():
     return TestOp.create()
 
@@ -0,0 +1,114 @@
+import pytest
+
+from xdsl.context import Context
+from xdsl.dialects import arith, func, test
+from xdsl.dialects.builtin import Builtin, IntegerAttr, ModuleOp, i32, i64
+from xdsl.parser import Parser
+from xdsl.pattern_rewriter import (
+    PatternRewriter,
+    PatternRewriteWalker,
+    RewritePattern,
+    op_type_rewrite_pattern,
+)
+from xdsl.rewriter import InsertPoint
+from xdsl.utils.exceptions import VerifyException
+from xdsl.verifier import IncrementalVerifier
+
+PROGRAM = """
+func.func @f(%a: i32) -> i32 {
+  %c = arith.constant 1 : i32
+  %x = arith.addi %a, %c : i32
+  func.return %x : i32
+}
+func.func @g(%a: i32) -> i32 {
+  %x = arith.muli %a, %a : i32
+  func.return %x : i32
+}
+"""
+
+
+def _parse() -> ModuleOp:
+    ctx = Context()
+    ctx.load_dialect(Builtin)
+    ctx.load_dialect(arith.Arith)
+    ctx.load_dialect(func.Func)
+    ctx.load_dialect(test.Test)
+    return Parser(ctx, PROGRAM).parse_module()
+
+
+def _break_unchanged_op(module: ModuleOp) -> None:
+    # Make an operation invalid without notifying any listener
+    muli = next(op for op in module.walk() if isinstance(op, arith.MuliOp))
+    muli.properties["overflowFlags"] = IntegerAttr(0, i32)
+
+
+class ConstantToTwo(RewritePattern):
+    @op_type_rewrite_pattern
+    def match_and_rewrite(self, op: arith.ConstantOp, rewriter: PatternRewriter):
+        if op.value != IntegerAttr(2, i32):
+            rewriter.replace_matched_op(arith.ConstantOp(IntegerAttr(2, i32)))
+
+
+class ConstantToI64(RewritePattern):
+    @op_type_rewrite_pattern
+    def match_and_rewrite(self, op: arith.ConstantOp, rewriter: PatternRewriter):
+        if op.result.type == i32:
+            rewriter.replace_matched_op(arith.ConstantOp(IntegerAttr(1, i64)))
+
+
+def test_only_changes_are_verified():
+    module = _parse()
+    verifier = IncrementalVerifier()
+    assert not verifier.has_changes()
+
+    _break_unchanged_op(module)
+    PatternRewriteWalker(ConstantToTwo(), listener=verifier).rewrite_module(module)
+    assert verifier.has_changes()
+
+    verifier.verify(module)
+    assert not verifier.has_changes()
+    with pytest.raises(VerifyException):
+        verifier.verify(module, incremental=False)
+
+
+def test_users_are_verified():
+    module = _parse()
+    verifier = IncrementalVerifier()
+    PatternRewriteWalker(ConstantToI64(), listener=verifier).rewrite_module(module)
+
+    # The result of the new constant does not match the type of the addition
+    with pytest.raises(VerifyException, match="arith.addi"):
+        verifier.verify(module)
+
+
+def test_terminators_are_verified():
+    module = _parse()
+    verifier = IncrementalVerifier()
+    ret = next(op for op in module.walk() if isinstance(op, func.ReturnOp))
+    rewriter = PatternRewriter(ret)
+    rewriter.extend_from_listener(verifier)
+    op = rewriter.insert_op(test.TestOp(), InsertPoint.after(ret))
+    with pytest.raises(VerifyException, match="is not a terminator"):
+        verifier.verify(module)
+
+    rewriter.erase_op(op)
+    verifier.verify(module)
+
+    # The block of a removed operation is verified
+    rewriter.erase_op(ret)
+    with pytest.raises(VerifyException, match="is not a terminator"):
+        verifier.verify(module)
+
+
+def test_detached_changes_are_ignored():
+    module = _parse()
+    verifier = IncrementalVerifier()
+    addi = next(op for op in module.walk() if isinstance(op, arith.AddiOp))
+    rewriter = PatternRewriter(addi)
+    rewriter.extend_from_listener(verifier)
+    rewriter.notify_op_modified(addi)
+
+    f = addi.parent_op()
+    assert isinstance(f, func.FuncOp)
+    module.body.block.detach_op(f)
+    verifier.verify(module)
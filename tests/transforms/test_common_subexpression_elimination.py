@@ -0,0 +1,68 @@
+from xdsl.dialects import arith, memref, scf, test
+from xdsl.dialects.builtin import IndexType, MemRefType, i32
+from xdsl.ir import Block, Region
+from xdsl.transforms.common_subexpression_elimination import (
+    KnownOps,
+    OperationInfo,
+    cse,
+)
+from xdsl.utils.test_value import create_ssa_value
+
+
+def test_known_ops():
+    a = create_ssa_value(i32)
+    b = create_ssa_value(i32)
+    add1 = arith.AddiOp(a, b)
+    add2 = arith.AddiOp(a, b)
+    sub = arith.SubiOp(a, b)
+
+    known_ops = KnownOps()
+    known_ops[add1] = add1
+    assert known_ops.get(add2) is add1
+    assert sub not in known_ops
+
+    # Scopes share the hashes of the operations
+    scope = KnownOps(known_ops)
+    scope[sub] = sub
+    assert scope[add2] is add1
+    assert sub not in known_ops
+
+    # Modified operations have to be invalidated to be looked up again
+    add2.operands = (b, b)
+    known_ops.invalidate(add2)
+    assert add2 not in known_ops
+    known_ops[add2] = add2
+    assert known_ops.pop(add2) is add2
+
+
+def test_operation_info_regions():
+    bound = create_ssa_value(IndexType())
+    body = Block([test.TestOp(), scf.YieldOp()], arg_types=(IndexType(),))
+    for1 = scf.ForOp(bound, bound, bound, [], Region(body))
+    for2 = for1.clone()
+    other = for1.clone()
+    other.body.block.insert_op_before(test.TestOp(), other.body.block.first_op)
+
+    assert OperationInfo(for1) == OperationInfo(for2)
+    assert hash(OperationInfo(for1)) == hash(OperationInfo(for2))
+    # Regions with a different structure have different hashes
+    assert hash(OperationInfo(for1)) != hash(OperationInfo(other))
+    assert OperationInfo(for1) != OperationInfo(other)
+
+
+def test_cse_reads():
+    ref = create_ssa_value(MemRefType(i32, [4]))
+    value = create_ssa_value(i32)
+    load1 = memref.LoadOp.get(ref, [])
+    load2 = memref.LoadOp.get(ref, [])
+    store = memref.StoreOp.get(value, ref, [])
+    load3 = memref.LoadOp.get(ref, [])
+    load4 = memref.LoadOp.get(ref, [])
+    user = test.TestOp((load1.res, load2.res, load3.res, load4.res))
+    block = Block([load1, load2, store, load3, load4, user])
+
+    cse(block)
+
+    # Reads are only replaced by previous reads if no write happens in between
+    assert list(block.ops) == [load1, store, load3, user]
+    assert tuple(user.operands) == (load1.res, load1.res, load3.res, load3.res)
@@ -0,0 +1,41 @@
+from xdsl.dialects.arith import AddiOp
+from xdsl.passes import get_pass_option_infos
+from xdsl.transforms.canonicalize import CanonicalizePass
+from xdsl.utils.registry_manifest import (
+    MANIFEST_PATH,
+    build_registry_manifest,
+    dump_registry_manifest,
+    get_dialect_manifest,
+    get_pass_manifest,
+    get_registry_manifest,
+)
+
+
+def test_manifest_is_up_to_date():
+    """
+    If this test fails, regenerate the manifest with
+    `python -m xdsl.utils.registry_manifest`.
+    """
+    with open(MANIFEST_PATH) as f:
+        assert f.read() == dump_registry_manifest(build_registry_manifest())
+    assert get_registry_manifest() == build_registry_manifest()
+
+
+def test_pass_manifest():
+    manifest = get_pass_manifest(CanonicalizePass.name)
+    assert manifest is not None
+    assert manifest.options == tuple(
+        tuple(info) for info in get_pass_option_infos(CanonicalizePass)
+    )
+    assert get_pass_manifest("not-a-pass") is None
+
+
+def test_dialect_manifest():
+    manifest = get_dialect_manifest("arith")
+    assert manifest is not None
+    assert AddiOp.name in manifest.operations
+    assert "arith.fastmath" in manifest.attributes
+    builtin = get_dialect_manifest("builtin")
+    assert builtin is not None
+    assert "index" in builtin.types
+    assert get_dialect_manifest("not-a-dialect") is None
@@ -11,10 +11,16 @@ from typing import IO
 import pytest
 
 from xdsl.context import Context
-from xdsl.dialects import builtin, get_all_dialects
-from xdsl.passes import ModulePass
+from xdsl.dialects import arith, builtin, get_all_dialects
+from xdsl.dialects.builtin import IntegerAttr, i32, i64
+from xdsl.passes import ModulePass, PatternRewritePass
+from xdsl.pattern_rewriter import (
+    PatternRewriter,
+    RewritePattern,
+    op_type_rewrite_pattern,
+)
 from xdsl.transforms import get_all_passes
-from xdsl.utils.exceptions import DiagnosticException, ParseError
+from xdsl.utils.exceptions import DiagnosticException, ParseError, VerifyException
 from xdsl.xdsl_opt_main import xDSLOptMain
 
 
@@ -95,6 +101,16 @@ def test_error_on_run(
             ValueError,
             "Unrecognized passes: ['wrong']",
         ),
+        (
+            [
+                "tests/xdsl_opt/empty_program.mlir",
+                "-t",
+                "bytecode",
+                "--split-input-file",
+            ],
+            ValueError,
+            "The bytecode target cannot be used with --split-input-file",
+        ),
     ],
 )
 def test_error_on_construction(
@@ -138,6 +154,29 @@ def test_print_to_file():
     assert inp.strip() == expected.strip()
 
 
+def test_print_resulting_program():
+    filename_in = "tests/xdsl_opt/simple_program.mlir"
+
+    flushed: list[str] = []
+
+    class RecordingStream(StringIO):
+        def flush(self) -> None:
+            flushed.append(self.getvalue())
+
+    opt = xDSLOptMain(args=[filename_in])
+    chunks, extension = opt.prepare_input()
+    module = opt.parse_chunk(chunks[0][0], extension)
+    assert module is not None
+
+    output = RecordingStream()
+    opt.print_resulting_program(module, output)
+
+    # The program is flushed as its top-level operations are printed
+    assert flushed
+    assert output.getvalue() == opt.output_resulting_program(module)
+    assert output.getvalue().startswith(flushed[-1])
+
+
 def test_operation_deletion():
     filename_in = "tests/xdsl_opt/simple_program.mlir"
     filename_out = "tests/xdsl_opt/empty_program.mlir"
@@ -211,6 +250,64 @@ def test_verify_diagnostics_output():
     assert f.getvalue() == "fail\n"
 
 
+def test_verify_incrementally():
+    program = """
+    %c = arith.constant 1 : i32
+    %x = arith.muli %c, %c : i32
+    "test.op"(%x) : (i32) -> ()
+    """
+
+    class BreakConstant(RewritePattern):
+        @op_type_rewrite_pattern
+        def match_and_rewrite(self, op: arith.ConstantOp, rewriter: PatternRewriter):
+            if op.value.type != i64:
+                op.properties["value"] = IntegerAttr(1, i64)
+                rewriter.notify_op_modified(op)
+
+    class BreakConstantPass(PatternRewritePass):
+        name = "break-constant"
+
+        def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+            return BreakConstant()
+
+    class BreakMuliPass(ModulePass):
+        name = "break-muli"
+
+        def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+            # Not notified to any listener
+            for muli in op.walk():
+                if isinstance(muli, arith.MuliOp):
+                    muli.properties["overflowFlags"] = IntegerAttr(0, i32)
+
+    class TestMain(xDSLOptMain):
+        def register_all_passes(self):
+            super().register_all_passes()
+            self.register_pass("break-constant", lambda: BreakConstantPass)
+            self.register_pass("break-muli", lambda: BreakMuliPass)
+
+        def get_input_stream(self) -> tuple[IO[str], str]:
+            return (StringIO(program), "mlir")
+
+    def run(*args: str) -> str:
+        opt = TestMain(args=args)
+        f = StringIO("")
+        with redirect_stdout(f):
+            opt.run()
+        return f.getvalue()
+
+    assert run("--verify-incrementally", "-p", "canonicalize") == run(
+        "-p", "canonicalize"
+    )
+
+    # The changes of pattern passes are verified
+    with pytest.raises(VerifyException):
+        run("--verify-incrementally", "-p", "break-constant")
+
+    # The whole module is verified after other passes
+    with pytest.raises(VerifyException):
+        run("--verify-incrementally", "-p", "break-muli,canonicalize")
+
+
 def test_split_input():
     filename_in = "tests/xdsl_opt/empty_program.mlir"
     filename_out = "tests/xdsl_opt/split_input_file.out"
@@ -224,3 +321,42 @@ def test_split_input():
         expected = file.read()
 
     assert inp.strip() == expected.strip()
+
+
+def test_split_input_parallel():
+    filename_in = "tests/xdsl_opt/split_input_file.mlir"
+
+    outputs: list[str] = []
+    for jobs in ("1", "3"):
+        opt = xDSLOptMain(args=[filename_in, "--split-input-file", "-j", jobs])
+        f = StringIO("")
+        with redirect_stdout(f):
+            opt.run()
+        outputs.append(f.getvalue())
+
+    assert outputs[0] == outputs[1]
+
+
+def test_split_input_parallel_diagnostics():
+    class TestMain(xDSLOptMain):
+        def get_input_stream(self) -> tuple[IO[str], str]:
+            fake_input = StringIO(
+                "builtin.module {}\n// -----\n%x = test.op\n// -----\nbuiltin.module {}"
+            )
+            return (fake_input, "mlir")
+
+    args = ["--split-input-file", "--parsing-diagnostics"]
+    outputs: list[str] = []
+    for jobs in ("1", "2"):
+        opt = TestMain(args=[*args, "-j", jobs])
+        f = StringIO("")
+        with redirect_stdout(f):
+            opt.run()
+        outputs.append(f.getvalue())
+
+    assert outputs[0] == outputs[1]
+
+    opt = TestMain(args=["--split-input-file", "-j", "2"])
+    with redirect_stdout(StringIO("")):
+        with pytest.raises(ParseError):
+            opt.run()
@@ -0,0 +1,110 @@
+import multiprocessing
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from xdsl.tools import xdsl_opt_server
+from xdsl.tools.xdsl_opt_server import default_socket_path, run_client, serve
+
+CLIENT = "from xdsl.tools.xdsl_opt_server import client_main; client_main()"
+
+
+def _run_client(socket_path: str, *args: str, input: str = ""):
+    return subprocess.run(
+        [sys.executable, "-c", CLIENT, *args],
+        input=input,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "XDSL_OPT_SOCKET": socket_path},
+    )
+
+
+def test_no_server(tmp_path: Path):
+    socket_path = str(tmp_path / "xdsl-opt.sock")
+    assert run_client([], socket_path) is None
+
+    # Without a server, the client runs xdsl-opt itself
+    result = _run_client(socket_path, input="builtin.module {}")
+    assert result.returncode == 0
+    assert result.stdout == "builtin.module {\n}\n\n"
+
+
+def test_default_socket_path(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("XDSL_OPT_SOCKET", raising=False)
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/run/user/1000")
+    assert default_socket_path() == f"/run/user/1000/xdsl-opt-{os.getuid()}.sock"
+
+    # Without a runtime directory, the socket is in a directory of the user
+    monkeypatch.delenv("XDG_RUNTIME_DIR")
+    socket_dir = os.path.dirname(default_socket_path())
+    assert os.path.basename(socket_dir) == f"xdsl-opt-{os.getuid()}"
+
+
+def test_client_refuses_other_user(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+):
+    socket_path = str(tmp_path / "xdsl-opt.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listener:
+        listener.bind(socket_path)
+        listener.listen()
+
+        uid = os.getuid()
+        monkeypatch.setattr(os, "getuid", lambda: uid + 1)
+        assert run_client([], socket_path) is None
+        assert "not a socket of the current user" in capsys.readouterr().err
+
+
+def test_server_refuses_shared_directory(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(xdsl_opt_server, "warm_up", lambda main_cls: None)
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir()
+    shared_dir.chmod(0o777)
+
+    with pytest.raises(PermissionError, match="not writable by other users"):
+        serve(str(shared_dir / "xdsl-opt.sock"))
+    assert not (shared_dir / "xdsl-opt.sock").exists()
+
+
+@pytest.mark.skipif(
+    "fork" not in multiprocessing.get_all_start_methods(), reason="requires fork"
+)
+def test_server(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    socket_path = str(tmp_path / "xdsl-opt.sock")
+    # Loading all the dialects is not needed to test the protocol
+    monkeypatch.setattr(xdsl_opt_server, "warm_up", lambda main_cls: None)
+
+    server = multiprocessing.get_context("fork").Process(
+        target=serve, args=(socket_path,)
+    )
+    server.start()
+    try:
+        deadline = time.monotonic() + 30
+        while not os.path.exists(socket_path):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        # Only the current user may connect
+        assert stat.S_IMODE(os.stat(socket_path).st_mode) == 0o600
+
+        program = "builtin.module {\n  %x = arith.constant 0 : i32\n}"
+        result = _run_client(socket_path, "-p", "dce", input=program)
+        assert result.returncode == 0
+        assert result.stdout == "builtin.module {\n}\n\n"
+
+        result = _run_client(socket_path, "-p", "dce", input="builtin.module {")
+        assert result.returncode == 1
+        assert "ParseError" in result.stderr
+
+        result = _run_client(socket_path, "--unknown-flag")
+        assert result.returncode == 2
+        assert "unrecognized arguments: --unknown-flag" in result.stderr
+    finally:
+        server.terminate()
+        server.join()
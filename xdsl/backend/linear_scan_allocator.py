@@ -0,0 +1,316 @@
+from bisect import insort
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from xdsl.backend.register_allocatable import RegisterAllocatableOperation
+from xdsl.backend.register_allocator import ValueAllocator
+from xdsl.backend.register_stack import OutOfRegisters, RegisterStack
+from xdsl.backend.register_type import RegisterType
+from xdsl.dialects.builtin import IntAttr
+from xdsl.ir import Block, BlockArgument, Operation, OpResult, SSAValue
+from xdsl.utils.exceptions import DiagnosticException
+
+
+@dataclass(eq=False)
+class LiveInterval:
+    """
+    The range of operation indices during which a group of values that must be
+    allocated to the same register is live.
+    """
+
+    values: list[SSAValue]
+    start: int
+    end: int
+    register: RegisterType | None = field(default=None)
+    """The register the values are allocated to, if known."""
+
+    spillable: bool = field(default=False)
+    """
+    Whether the value of this interval may be stored to the stack after its definition
+    and loaded back before each of its uses instead of being kept in a register.
+    """
+
+
+class LinearScanAllocator(ValueAllocator):
+    """
+    Allocates the registers of a whole function body at once with the linear scan
+    algorithm.
+
+    The operations of the body, including the ones nested in the regions of register
+    allocatable operations, are numbered in order, and the values are given live
+    intervals spanning from their definition to their last use.
+    Values defined outside of a region and used in it are live until the end of the
+    operation containing the region, as are the block arguments of the region and the
+    operands returned by `RegisterAllocatableOperation.iter_operands_live_in_regions`,
+    since loops may execute their bodies more than once.
+    Values that must be allocated to the same register, as returned by
+    `RegisterAllocatableOperation.iter_tied_values`, share a single interval.
+
+    The intervals are then visited in order of their start, assigning each a register
+    that is not used by the intervals still live.
+    When no register is available, the live interval ending last is spilled, if the
+    allocator supports spilling with `spill_value`, and the allocation restarts with
+    the spill code inserted.
+
+    See "Linear Scan Register Allocation", Poletto and Sarkar, 1999.
+    """
+
+    _op_indices: dict[Operation, tuple[int, int]]
+    """The index of each operation, and of the end of its regions."""
+
+    _unspillable: set[SSAValue]
+    """Values that were already spilled, or that were created when spilling."""
+
+    def __init__(
+        self,
+        available_registers: RegisterStack,
+        register_base_class: type[RegisterType],
+    ) -> None:
+        super().__init__(available_registers, register_base_class)
+        self._op_indices = {}
+        self._unspillable = set()
+
+    def spill_value(self, val: OpResult) -> None:
+        """
+        Store the value to the stack after its definition, and load it back before
+        each of its uses.
+        The values created to do so must be added to the unspillable values.
+        Spilling is not supported by default.
+        """
+        raise OutOfRegisters
+
+    def _number_block(self, block: Block, index: int) -> int:
+        """
+        Number the operations of the block and of their regions from the index passed
+        in, returning the next index.
+        """
+        for op in block.ops:
+            start = index
+            index += 1
+            for region in op.regions:
+                for inner in region.blocks:
+                    index = self._number_block(inner, index)
+            if op.regions:
+                # The results of operations with regions are defined after the regions
+                self._op_indices[op] = (start, index)
+                index += 1
+            else:
+                self._op_indices[op] = (start, start)
+        return index
+
+    def _collect_block(
+        self,
+        block: Block,
+        values: list[SSAValue],
+        tied: list[Sequence[SSAValue]],
+    ) -> None:
+        """
+        Collect the values to allocate and the groups of tied values of the block, and
+        of the regions of its register allocatable operations.
+        """
+        values.extend(block.args)
+        for op in block.ops:
+            values.extend(op.results)
+            if isinstance(op, RegisterAllocatableOperation):
+                tied.extend(op.iter_tied_values())
+                for region in op.regions:
+                    for inner in region.blocks:
+                        self._collect_block(inner, values, tied)
+
+    def _definition_index(self, val: SSAValue) -> int:
+        if isinstance(val, OpResult):
+            return self._op_indices[val.op][1]
+        assert isinstance(val, BlockArgument)
+        if (parent := val.block.parent_op()) in self._op_indices:
+            return self._op_indices[parent][0]
+        # Arguments of the allocated block
+        return -1
+
+    def _end_index(self, val: SSAValue, definition: int) -> int:
+        end = definition
+        if isinstance(val, BlockArgument):
+            if (parent := val.block.parent_op()) in self._op_indices:
+                # Block arguments of a region are live for the whole region
+                end = self._op_indices[parent][1]
+        for use in val.uses:
+            op = use.operation
+            start, op_end = self._op_indices[op]
+            if op.regions and (
+                not isinstance(op, RegisterAllocatableOperation)
+                or val in tuple(op.iter_operands_live_in_regions())
+            ):
+                # The operand is live until the end of the regions
+                end = max(end, op_end)
+            else:
+                end = max(end, start)
+            while (parent := op.parent_op()) in self._op_indices:
+                start, parent_end = self._op_indices[parent]
+                if definition < start:
+                    # The value is used in the region of an operation defined after
+                    # it, which may execute the use multiple times
+                    end = max(end, parent_end)
+                op = parent
+        return end
+
+    def live_intervals(self, block: Block) -> list[LiveInterval]:
+        """
+        The live intervals of the unallocated values of the block, and of the register
+        allocatable operations nested in it, sorted by start.
+        """
+        self._op_indices.clear()
+        self._number_block(block, 0)
+
+        values: list[SSAValue] = []
+        tied: list[Sequence[SSAValue]] = []
+        self._collect_block(block, values, tied)
+
+        # Union-find of the tied values, with the first value as representative
+        leaders: dict[SSAValue, SSAValue] = {}
+
+        def find(val: SSAValue) -> SSAValue:
+            while (leader := leaders.get(val, val)) is not val:
+                leaders[val] = leaders.get(leader, leader)
+                val = leader
+            return val
+
+        for group in tied:
+            first = find(group[0])
+            for val in group[1:]:
+                if (leader := find(val)) is not first:
+                    leaders[leader] = first
+
+        intervals: dict[SSAValue, LiveInterval] = {}
+        for val in values:
+            if not isinstance(val.type, self.register_base_class):
+                continue
+            definition = self._definition_index(val)
+            end = self._end_index(val, definition)
+            leader = find(val)
+            if (interval := intervals.get(leader)) is None:
+                intervals[leader] = LiveInterval([val], definition, end)
+            else:
+                interval.values.append(val)
+                interval.start = min(interval.start, definition)
+                interval.end = max(interval.end, end)
+
+        res: list[LiveInterval] = []
+        for interval in intervals.values():
+            reg_types = {
+                val.type
+                for val in interval.values
+                if isinstance(val.type, RegisterType) and val.type.is_allocated
+            }
+            if len(reg_types) > 1:
+                reg_names = sorted(f"{reg_type}" for reg_type in reg_types)
+                raise DiagnosticException(
+                    f"Cannot allocate registers to the same register {reg_names}"
+                )
+            if reg_types:
+                (interval.register,) = reg_types
+                if all(val.type == interval.register for val in interval.values):
+                    # Nothing to allocate
+                    continue
+            (val, *others) = interval.values
+            interval.spillable = (
+                not others
+                and isinstance(val, OpResult)
+                and not val.op.regions
+                and val not in self._unspillable
+            )
+            res.append(interval)
+
+        res.sort(key=lambda interval: interval.start)
+        return res
+
+    def _is_reusable(self, reg: RegisterType) -> bool:
+        """
+        Whether the register can be given to another interval, as opposed to registers
+        that are not handed out by the register stack, such as the zero register.
+        """
+        assert isinstance(reg.index, IntAttr)
+        allocatable_registers = self.available_registers.allocatable_registers
+        return reg.index.data in allocatable_registers[reg.name]
+
+    def _scan(self, intervals: Sequence[LiveInterval]) -> list[LiveInterval]:
+        """
+        Assign registers to the intervals, returning the intervals to spill.
+        """
+        active: list[LiveInterval] = []
+        spilled: list[LiveInterval] = []
+
+        for interval in intervals:
+            # Free the registers of the intervals that ended, results of an operation
+            # may be allocated to the registers of operands last used by it
+            still_active: list[LiveInterval] = []
+            for other in active:
+                if other.end < interval.start or (
+                    other.end == interval.start and other.start < interval.start
+                ):
+                    assert other.register is not None
+                    self.available_registers.push(other.register)
+                else:
+                    still_active.append(other)
+            active = still_active
+
+            if interval.register is None:
+                try:
+                    interval.register = self._new_register(interval)
+                except OutOfRegisters:
+                    reg_class = type(interval.values[0].type)
+                    candidates = [
+                        other
+                        for other in (*active, interval)
+                        if other.spillable
+                        and type(other.values[0].type) is reg_class
+                        and (
+                            other.register is None or self._is_reusable(other.register)
+                        )
+                    ]
+                    if not candidates:
+                        raise
+                    victim = max(candidates, key=lambda other: other.end)
+                    spilled.append(victim)
+                    if victim is interval:
+                        continue
+                    active.remove(victim)
+                    interval.register = victim.register
+                    victim.register = None
+
+            insort(active, interval, key=lambda other: other.end)
+
+        for interval in active:
+            assert interval.register is not None
+            self.available_registers.push(interval.register)
+
+        return spilled
+
+    def _new_register(self, interval: LiveInterval) -> RegisterType:
+        if len(interval.values) == 1:
+            reg = self.new_type_for_value(interval.values[0])
+            assert reg is not None
+            return reg
+        reg_type = interval.values[0].type
+        assert isinstance(reg_type, self.register_base_class)
+        return self.available_registers.pop(type(reg_type))
+
+    def allocate_body(self, block: Block) -> None:
+        """
+        Allocate the values of the block, which must be the single block of a function
+        body, spilling values until the remaining ones fit in the available registers.
+        """
+        while True:
+            intervals = self.live_intervals(block)
+            spilled = self._scan(intervals)
+            if not spilled:
+                break
+            for interval in spilled:
+                (val,) = interval.values
+                assert isinstance(val, OpResult)
+                self._unspillable.add(val)
+                self.spill_value(val)
+
+        for interval in intervals:
+            assert interval.register is not None
+            for val in interval.values:
+                if val.type != interval.register:
+                    self._replace_value_with_new_type(val, interval.register)
@@ -35,6 +35,23 @@ class RegisterAllocatableOperation(Operation, abc.ABC):
         Allocate registers for this operation.
         """
 
+    def iter_tied_values(self) -> Iterator[Sequence[SSAValue]]:
+        """
+        Groups of values that must be allocated to the same register, for allocators
+        that process the whole function at once instead of calling
+        `allocate_registers`.
+        By default returns no groups.
+        """
+        return iter(())
+
+    def iter_operands_live_in_regions(self) -> Iterator[SSAValue]:
+        """
+        The operands that must not be overwritten while the regions of this operation
+        execute, for allocators that process the whole function at once.
+        By default returns all the operands.
+        """
+        return iter(self.operands)
+
     @staticmethod
     def iter_all_used_registers(
         region: Region,
@@ -100,6 +117,9 @@ class HasRegisterConstraints(RegisterAllocatableOperation, abc.ABC):
         """
         raise NotImplementedError()
 
+    def iter_tied_values(self) -> Iterator[Sequence[SSAValue]]:
+        return iter(self.get_register_constraints().inouts)
+
     def allocate_registers(self, allocator: BlockAllocator) -> None:
         ins, outs, inouts = self.get_register_constraints()
 
@@ -1,12 +1,13 @@
 import abc
-from collections.abc import Sequence
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
 from typing import cast
 
 from ordered_set import OrderedSet
 
 from xdsl.backend.register_stack import RegisterStack
 from xdsl.backend.register_type import RegisterType
-from xdsl.ir import Attribute, Block, SSAValue
+from xdsl.ir import Attribute, Block, Region, SSAValue
 from xdsl.rewriter import Rewriter
 from xdsl.utils.exceptions import DiagnosticException
 
@@ -112,40 +113,153 @@ class ValueAllocator:
             self.available_registers.push(val.type)
 
 
-def _live_ins_per_block(
-    block: Block, acc: dict[Block, OrderedSet[SSAValue]]
-) -> OrderedSet[SSAValue]:
-    res = OrderedSet[SSAValue]([])
+def _to_bitset(indices: Iterable[int]) -> int:
+    """
+    Returns the int with the bits at the indices passed in set, building it in linear
+    time rather than or-ing each bit in turn.
+    """
+    indices = tuple(indices)
+    if not indices:
+        return 0
+    buffer = bytearray((max(indices) >> 3) + 1)
+    for index in indices:
+        buffer[index >> 3] |= 1 << (index & 7)
+    return int.from_bytes(buffer, "little")
+
 
-    for op in reversed(block.ops):
-        # Remove values defined in the block
-        # We are traversing backwards, so cannot use the value removed here again
-        res.difference_update(op.results)
-        # Add values used in the block
-        res.update(op.operands)
+def _iter_bits(bitset: int) -> Iterator[int]:
+    """The indices of the bits set, in increasing order."""
+    for byte_index, byte in enumerate(
+        bitset.to_bytes((bitset.bit_length() + 7) >> 3, "little")
+    ):
+        while byte:
+            low = byte & -byte
+            yield (byte_index << 3) + low.bit_length() - 1
+            byte ^= low
 
-        # Process inner blocks
-        for region in op.regions:
-            for inner in region.blocks:
-                # Add the values used in the inner block
-                res.update(_live_ins_per_block(inner, acc))
 
-    # Remove the block arguments
-    res.difference_update(block.args)
+@dataclass
+class _Liveness:
+    """
+    Dataflow liveness analysis, with the values numbered densely so that sets of values
+    are represented as int bitsets.
+    """
+
+    indices: dict[SSAValue, int] = field(default_factory=dict[SSAValue, int])
+    """The index of each value."""
+    values: list[SSAValue] = field(default_factory=list[SSAValue])
+    """The value of each index."""
+    live_ins: dict[Block, OrderedSet[SSAValue]] = field(
+        default_factory=dict[Block, OrderedSet[SSAValue]]
+    )
+    """The values used in each block but defined outside of it."""
 
-    acc[block] = res
+    def index(self, value: SSAValue) -> int:
+        if (index := self.indices.get(value)) is None:
+            index = len(self.values)
+            self.indices[value] = index
+            self.values.append(value)
+        return index
 
-    return res
+    def ordered(self, order: Iterable[SSAValue], bitset: int) -> OrderedSet[SSAValue]:
+        """
+        The values of the bitset, in the order passed in, followed by the remaining
+        values in the order of their index.
+        """
+        indices = set(_iter_bits(bitset))
+        res = OrderedSet(value for value in order if self.indices[value] in indices)
+        if len(res) != len(indices):
+            res.update(self.values[index] for index in sorted(indices))
+        return res
+
+    def block_uses(self, block: Block) -> tuple[int, int, list[SSAValue]]:
+        """
+        Returns the bitsets of the values used in the block or in its nested regions
+        and of the values defined in the block, and the values used in the order in
+        which they are first met when walking the block backwards.
+        """
+        used: dict[SSAValue, None] = {}
+        defined = [self.index(arg) for arg in block.args]
+        for op in reversed(block.ops):
+            defined.extend(self.index(result) for result in op.results)
+            used.update(dict.fromkeys(op.operands))
+            for region in op.regions:
+                used.update(dict.fromkeys(self.region_live_ins(region)))
+        uses = _to_bitset(self.index(value) for value in used)
+        return uses, _to_bitset(defined), list(used)
+
+    def block_live_ins(self, block: Block) -> OrderedSet[SSAValue]:
+        """
+        Records and returns the values used in the block but defined outside of it,
+        ignoring its successors.
+        """
+        used, defined, order = self.block_uses(block)
+        res = self.ordered(order, used & ~defined)
+        self.live_ins[block] = res
+        return res
+
+    def region_live_ins(self, region: Region) -> OrderedSet[SSAValue]:
+        """
+        Records the values live on entry of each block of the region, and returns the
+        values used in the region but defined outside of it.
+        In a region with multiple blocks, the values live on entry of a block include
+        the values live on entry of its successors that it does not define, iterating
+        to a fixpoint.
+        """
+        blocks = region.blocks
+        if len(blocks) == 1:
+            return self.block_live_ins(blocks.first)
+
+        uses = {block: self.block_uses(block) for block in blocks}
+        live = {block: used & ~defined for block, (used, defined, _) in uses.items()}
+        changed = True
+        while changed:
+            changed = False
+            for block in reversed(blocks):
+                live_out = 0
+                if (terminator := block.last_op) is not None:
+                    for successor in terminator.successors:
+                        live_out |= live.get(successor, 0)
+                defined = uses[block][1]
+                if (new_live := live[block] | (live_out & ~defined)) != live[block]:
+                    live[block] = new_live
+                    changed = True
+
+        region_live = 0
+        region_defined = 0
+        order: dict[SSAValue, None] = {}
+        for block in blocks:
+            _, defined, block_order = uses[block]
+            self.live_ins[block] = self.ordered(block_order, live[block])
+            order.update(dict.fromkeys(self.live_ins[block]))
+            region_live |= live[block]
+            region_defined |= defined
+        return self.ordered(order, region_live & ~region_defined)
 
 
 def live_ins_per_block(block: Block) -> dict[Block, OrderedSet[SSAValue]]:
     """
     Returns a mapping from a block to the set of values used in it but defined outside of
-    it.
+    it, for the block passed in and the blocks nested in it.
+    The blocks of nested regions with multiple blocks also include the values live on
+    entry of their successors.
+    """
+    liveness = _Liveness()
+    liveness.block_live_ins(block)
+    return liveness.live_ins
+
+
+def live_ins_per_region(region: Region) -> dict[Block, OrderedSet[SSAValue]]:
+    """
+    Returns a mapping from a block to the set of values live on entry of it, for the
+    blocks of the region passed in and the blocks nested in it.
+    The values live on entry of a block are the values used in it but defined outside of
+    it, and the values live on entry of its successors that are not defined in it.
     """
-    res: dict[Block, OrderedSet[SSAValue]] = {}
-    _ = _live_ins_per_block(block, res)
-    return res
+    liveness = _Liveness()
+    if region.blocks:
+        liveness.region_live_ins(region)
+    return liveness.live_ins
 
 
 class BlockAllocator(ValueAllocator, abc.ABC):
@@ -14,15 +14,13 @@ from xdsl.dialects.builtin import (
     IndexType,
     IntegerAttr,
     IntegerType,
-    ModuleOp,
     UnrealizedConversionCastOp,
 )
 from xdsl.ir import Operation
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -475,51 +473,49 @@ class LowerArithTruncFOp(RewritePattern):
         raise NotImplementedError("TruncF is not supported")
 
 
-class ConvertArithToRiscvPass(ModulePass):
+class ConvertArithToRiscvPass(PatternRewritePass):
     name = "convert-arith-to-riscv"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        walker = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LowerArithConstant(),
-                    LowerArithIndexCast(),
-                    LowerArithSIToFPOp(),
-                    LowerArithFPToSIOp(),
-                    lower_arith_addi,
-                    lower_arith_subi,
-                    lower_arith_muli,
-                    lower_arith_divui,
-                    lower_arith_divsi,
-                    LowerArithFloorDivSI(),
-                    lower_arith_remsi,
-                    LowerArithCmpi(),
-                    lower_arith_addf,
-                    lower_arith_subf,
-                    lower_arith_divf,
-                    LowerArithNegf(),
-                    lower_arith_mulf,
-                    LowerArithCmpf(),
-                    lower_arith_remui,
-                    lower_arith_andi,
-                    lower_arith_ori,
-                    lower_arith_xori,
-                    lower_arith_shli,
-                    lower_arith_shrui,
-                    lower_arith_shrsi,
-                    LowerArithCeilDivSI(),
-                    LowerArithCeilDivUI(),
-                    LowerArithMinSI(),
-                    LowerArithMaxSI(),
-                    LowerArithMinUI(),
-                    LowerArithMaxUI(),
-                    LowerArithSelect(),
-                    LowerArithExtFOp(),
-                    LowerArithTruncFOp(),
-                    lower_arith_minf,
-                    lower_arith_maxf,
-                ]
-            ),
-            apply_recursively=False,
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LowerArithConstant(),
+                LowerArithIndexCast(),
+                LowerArithSIToFPOp(),
+                LowerArithFPToSIOp(),
+                lower_arith_addi,
+                lower_arith_subi,
+                lower_arith_muli,
+                lower_arith_divui,
+                lower_arith_divsi,
+                LowerArithFloorDivSI(),
+                lower_arith_remsi,
+                LowerArithCmpi(),
+                lower_arith_addf,
+                lower_arith_subf,
+                lower_arith_divf,
+                LowerArithNegf(),
+                lower_arith_mulf,
+                LowerArithCmpf(),
+                lower_arith_remui,
+                lower_arith_andi,
+                lower_arith_ori,
+                lower_arith_xori,
+                lower_arith_shli,
+                lower_arith_shrui,
+                lower_arith_shrsi,
+                LowerArithCeilDivSI(),
+                LowerArithCeilDivUI(),
+                LowerArithMinSI(),
+                LowerArithMaxSI(),
+                LowerArithMinUI(),
+                LowerArithMaxUI(),
+                LowerArithSelect(),
+                LowerArithExtFOp(),
+                LowerArithTruncFOp(),
+                lower_arith_minf,
+                lower_arith_maxf,
+            ]
         )
-        walker.rewrite_module(op)
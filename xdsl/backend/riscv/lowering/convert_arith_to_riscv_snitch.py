@@ -8,16 +8,14 @@ from xdsl.dialects.builtin import (
     Float16Type,
     Float32Type,
     Float64Type,
-    ModuleOp,
     UnrealizedConversionCastOp,
     VectorType,
 )
 from xdsl.ir import Operation
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
 )
 
@@ -78,16 +76,14 @@ lower_arith_addf = LowerBinaryFloatVectorOp(
 )
 
 
-class ConvertArithToRiscvSnitchPass(ModulePass):
+class ConvertArithToRiscvSnitchPass(PatternRewritePass):
     name = "convert-arith-to-riscv-snitch"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        walker = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    lower_arith_addf,
-                ]
-            ),
-            apply_recursively=False,
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                lower_arith_addf,
+            ]
         )
-        walker.rewrite_module(op)
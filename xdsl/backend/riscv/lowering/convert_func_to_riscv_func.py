@@ -9,12 +9,11 @@ from xdsl.backend.riscv.lowering.utils import (
 )
 from xdsl.context import Context
 from xdsl.dialects import func, riscv_func
-from xdsl.dialects.builtin import ModuleOp, StringAttr, UnrealizedConversionCastOp
-from xdsl.passes import ModulePass
+from xdsl.dialects.builtin import StringAttr, UnrealizedConversionCastOp
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -111,17 +110,16 @@ class LowerReturnOp(RewritePattern):
         rewriter.replace_matched_op(riscv_func.ReturnOp(*moved_values))
 
 
-class ConvertFuncToRiscvFuncPass(ModulePass):
+class ConvertFuncToRiscvFuncPass(PatternRewritePass):
     name = "convert-func-to-riscv-func"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LowerFuncOp(),
-                    LowerFuncCallOp(),
-                    LowerReturnOp(),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LowerFuncOp(),
+                LowerFuncCallOp(),
+                LowerReturnOp(),
+            ]
+        )
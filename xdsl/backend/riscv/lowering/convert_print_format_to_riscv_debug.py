@@ -1,11 +1,9 @@
 from xdsl.backend.riscv.lowering.utils import cast_operands_to_regs
 from xdsl.context import Context
 from xdsl.dialects import printf, riscv_debug
-from xdsl.dialects.builtin import ModuleOp
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -23,8 +21,8 @@ class LowerPrintFormatOp(RewritePattern):
         )
 
 
-class ConvertPrintFormatToRiscvDebugPass(ModulePass):
+class ConvertPrintFormatToRiscvDebugPass(PatternRewritePass):
     name = "convert-print-format-to-riscv-debug"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(LowerPrintFormatOp()).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return LowerPrintFormatOp()
@@ -1,9 +1,8 @@
 from xdsl.context import Context
-from xdsl.dialects import builtin, riscv, riscv_cf, riscv_scf
-from xdsl.passes import ModulePass
+from xdsl.dialects import riscv, riscv_cf, riscv_scf
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -150,10 +149,10 @@ class LowerRiscvScfForPattern(RewritePattern):
         )
 
 
-class ConvertRiscvScfToRiscvCfPass(ModulePass):
+class ConvertRiscvScfToRiscvCfPass(PatternRewritePass):
     name = "convert-riscv-scf-to-riscv-cf"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            LowerRiscvScfForPattern(), walk_regions_first=True
-        ).rewrite_module(op)
+    walk_regions_first = True
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return LowerRiscvScfForPattern()
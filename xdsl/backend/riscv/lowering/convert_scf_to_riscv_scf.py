@@ -5,12 +5,11 @@ from xdsl.backend.riscv.lowering.utils import (
     move_to_unallocated_regs,
 )
 from xdsl.context import Context
-from xdsl.dialects import builtin, riscv_scf, scf
-from xdsl.passes import ModulePass
+from xdsl.dialects import riscv_scf, scf
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -39,15 +38,13 @@ class ScfYieldLowering(RewritePattern):
         rewriter.replace_matched_op(riscv_scf.YieldOp(*cast_operands_to_regs(rewriter)))
 
 
-class ConvertScfToRiscvPass(ModulePass):
+class ConvertScfToRiscvPass(PatternRewritePass):
     name = "convert-scf-to-riscv-scf"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ScfYieldLowering(),
-                    ScfForLowering(),
-                ]
-            )
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ScfYieldLowering(),
+                ScfForLowering(),
+            ]
+        )
@@ -6,10 +6,9 @@ from xdsl.dialects import (
     snitch_stream,
 )
 from xdsl.ir import Operation
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -188,13 +187,13 @@ class LowerStreamingRegionOp(RewritePattern):
         rewriter.replace_matched_op(snitch.SsrDisableOp())
 
 
-class ConvertSnitchStreamToSnitch(ModulePass):
+class ConvertSnitchStreamToSnitch(PatternRewritePass):
     name = "convert-snitch-stream-to-snitch"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
         # StridedWrite and StridePattern ops are rewritten to remove their results, so we
         # have to first lower the ops that use the results in `stream`, and then the ops
         # themselves.
-        PatternRewriteWalker(
-            LowerStreamingRegionOp(), apply_recursively=False
-        ).rewrite_module(op)
+        return LowerStreamingRegionOp()
@@ -13,6 +13,12 @@ from xdsl.dialects.riscv import (
 )
 from xdsl.passes import ModulePass
 
+STACK_SPILL_SIZE_ATTR_NAME = "riscv.stack_spill_size"
+"""
+The name of the attribute of a function recording the number of bytes at the bottom
+of its stack frame used by the register allocator to spill values.
+"""
+
 
 @dataclass(frozen=True)
 class PrologueEpilogueInsertion(ModulePass):
@@ -22,6 +28,8 @@ class PrologueEpilogueInsertion(ModulePass):
     registers.
     In RISC-V these are 's0' to 's11' and 'fs0' to `fs11'.
     The stack pointer 'sp' must also be restored to its original value.
+    The stack frame also reserves the space used by the register allocator to spill
+    values, if any, below the saved registers.
 
     This pass should be run late in the pipeline after register allocation.
     It does not itself require register allocation nor invalidate the result of the
@@ -44,7 +52,14 @@ class PrologueEpilogueInsertion(ModulePass):
             if res.type in Registers.S or res.type in Registers.FS
         )
 
-        if not used_callee_preserved_registers:
+        spill_size = 0
+        if isinstance(
+            spill_size_attr := func.attributes.get(STACK_SPILL_SIZE_ATTR_NAME),
+            builtin.IntegerAttr,
+        ):
+            spill_size = spill_size_attr.value.data
+
+        if not used_callee_preserved_registers and not spill_size:
             return
 
         def get_register_size(r: RISCVRegisterType):
@@ -55,9 +70,11 @@ class PrologueEpilogueInsertion(ModulePass):
         # Build the prologue at the beginning of the function.
         builder = Builder(InsertPoint.at_start(func.body.blocks[0]))
         sp_register = builder.insert(riscv.GetRegisterOp(Registers.SP))
-        stack_size = sum(get_register_size(r) for r in used_callee_preserved_registers)
+        stack_size = spill_size + sum(
+            get_register_size(r) for r in used_callee_preserved_registers
+        )
         builder.insert(riscv.AddiOp(sp_register, -stack_size, rd=Registers.SP))
-        offset = 0
+        offset = spill_size
         for reg in used_callee_preserved_registers:
             if isinstance(reg, IntRegisterType):
                 reg_op = builder.insert(riscv.GetRegisterOp(reg))
@@ -76,7 +93,7 @@ class PrologueEpilogueInsertion(ModulePass):
                 continue
 
             builder = Builder(InsertPoint.before(ret_op))
-            offset = 0
+            offset = spill_size
             for reg in used_callee_preserved_registers:
                 if isinstance(reg, IntRegisterType):
                     op = riscv.LwOp(rs1=sp_register, rd=reg, immediate=offset)
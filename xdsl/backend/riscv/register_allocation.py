@@ -3,13 +3,16 @@ from collections import defaultdict
 from collections.abc import Iterable
 
 from xdsl.backend.block_naive_allocator import BlockNaiveAllocator
+from xdsl.backend.linear_scan_allocator import LinearScanAllocator
 from xdsl.backend.register_allocatable import RegisterAllocatableOperation
 from xdsl.backend.register_allocator import live_ins_per_block
 from xdsl.backend.register_stack import RegisterStack
 from xdsl.backend.register_type import RegisterType
+from xdsl.backend.riscv.prologue_epilogue_insertion import STACK_SPILL_SIZE_ATTR_NAME
 from xdsl.dialects import riscv, riscv_func
+from xdsl.dialects.builtin import IntegerAttr, i32
 from xdsl.dialects.riscv import Registers, RISCVRegisterType
-from xdsl.ir import SSAValue
+from xdsl.ir import OpResult, SSAValue
 from xdsl.rewriter import InsertPoint, Rewriter
 from xdsl.transforms.canonicalization_patterns.riscv import get_constant_value
 
@@ -24,17 +27,51 @@ def reg_types_by_name(regs: Iterable[RISCVRegisterType]) -> dict[str, set[str]]:
     return res
 
 
+def _insert_regalloc_stats(
+    func: riscv_func.FuncOp, preallocated: set[RISCVRegisterType]
+) -> None:
+    """
+    Insert a comment op before the function op passed in with a json containing the
+    preallocated and allocated registers.
+    """
+    preallocated_stats = reg_types_by_name(preallocated)
+    allocated_stats = reg_types_by_name(
+        val.type
+        for op in func.body.walk()
+        for vals in (op.results, op.operands)
+        for val in vals
+        if isinstance(val.type, RISCVRegisterType)
+    )
+    stats = {
+        "preallocated_float": sorted(preallocated_stats["riscv.freg"]),
+        "preallocated_int": sorted(preallocated_stats["riscv.reg"]),
+        "allocated_float": sorted(allocated_stats["riscv.freg"]),
+        "allocated_int": sorted(allocated_stats["riscv.reg"]),
+    }
+
+    stats_str = json.dumps(stats)
+
+    Rewriter.insert_op(
+        riscv.CommentOp(f"Regalloc stats: {stats_str}"),
+        InsertPoint.before(func),
+    )
+
+
+def _is_zero_constant(reg: SSAValue) -> bool:
+    return (
+        isinstance(reg.type, RISCVRegisterType)
+        and not reg.type.is_allocated
+        and (val := get_constant_value(reg)) is not None
+        and val.value.data == 0
+    )
+
+
 class RegisterAllocatorLivenessBlockNaive(BlockNaiveAllocator):
     def __init__(self, available_registers: RegisterStack) -> None:
         super().__init__(available_registers, RISCVRegisterType)
 
     def new_type_for_value(self, reg: SSAValue) -> RegisterType | None:
-        if (
-            isinstance(reg.type, self.register_base_class)
-            and not reg.type.is_allocated
-            and (val := get_constant_value(reg)) is not None
-            and val.value.data == 0
-        ):
+        if _is_zero_constant(reg):
             return Registers.ZERO
         return super().new_type_for_value(reg)
 
@@ -74,24 +111,94 @@ class RegisterAllocatorLivenessBlockNaive(BlockNaiveAllocator):
         self.allocate_block(block)
 
         if add_regalloc_stats:
-            preallocated_stats = reg_types_by_name(preallocated)
-            allocated_stats = reg_types_by_name(
-                val.type
-                for op in block.walk()
-                for vals in (op.results, op.operands)
-                for val in vals
-                if isinstance(val.type, RISCVRegisterType)
+            _insert_regalloc_stats(func, preallocated)
+
+
+SPILL_SLOT_SIZE = 8
+"""The number of bytes of the stack reserved for each spilled value."""
+
+
+class RegisterAllocatorLinearScan(LinearScanAllocator):
+    """
+    Linear scan register allocator for RISC-V functions.
+    When running out of registers, values are spilled to the bottom of the stack
+    frame, whose size is recorded on the function for
+    `riscv-prologue-epilogue-insertion` to reserve it.
+    """
+
+    spill_size: int
+    """The number of bytes of the stack used for spilled values."""
+
+    def __init__(self, available_registers: RegisterStack) -> None:
+        super().__init__(available_registers, RISCVRegisterType)
+        self.spill_size = 0
+
+    def new_type_for_value(self, reg: SSAValue) -> RegisterType | None:
+        if _is_zero_constant(reg):
+            return Registers.ZERO
+        return super().new_type_for_value(reg)
+
+    def spill_value(self, val: OpResult) -> None:
+        offset = self.spill_size
+        self.spill_size += SPILL_SLOT_SIZE
+
+        sp = riscv.GetRegisterOp(Registers.SP)
+        if isinstance(val.type, riscv.FloatRegisterType):
+            store = riscv.FSdOp(rs1=sp, rs2=val, immediate=offset)
+        else:
+            store = riscv.SwOp(rs1=sp, rs2=val, immediate=offset)
+        Rewriter.insert_op((sp, store), InsertPoint.after(val.op))
+
+        users = dict.fromkeys(
+            use.operation for use in val.uses if use.operation is not store
+        )
+        for user in users:
+            sp = riscv.GetRegisterOp(Registers.SP)
+            if isinstance(val.type, riscv.FloatRegisterType):
+                load = riscv.FLdOp(rs1=sp, immediate=offset)
+            else:
+                load = riscv.LwOp(rs1=sp, immediate=offset)
+            Rewriter.insert_op((sp, load), InsertPoint.before(user))
+            self._unspillable.add(load.rd)
+            for index, operand in enumerate(user.operands):
+                if operand is val:
+                    user.operands[index] = load.rd
+
+    def allocate_func(
+        self, func: riscv_func.FuncOp, *, add_regalloc_stats: bool = False
+    ) -> None:
+        """
+        Allocates values in function passed in to registers, spilling values to the
+        stack if needed.
+        The whole function must have been lowered to the relevant riscv dialects
+        and it must contain no unrealized casts.
+        If `add_regalloc_stats` is set to `True`, then a comment op will be inserted
+        before the function op passed in with a json containing the relevant data.
+        """
+        if not func.body.blocks:
+            # External function declaration
+            return
+
+        if len(func.body.blocks) != 1:
+            raise NotImplementedError(
+                f"Cannot register allocate func with {len(func.body.blocks)} blocks."
             )
-            stats = {
-                "preallocated_float": sorted(preallocated_stats["riscv.freg"]),
-                "preallocated_int": sorted(preallocated_stats["riscv.reg"]),
-                "allocated_float": sorted(allocated_stats["riscv.freg"]),
-                "allocated_int": sorted(allocated_stats["riscv.reg"]),
-            }
-
-            stats_str = json.dumps(stats)
-
-            Rewriter.insert_op(
-                riscv.CommentOp(f"Regalloc stats: {stats_str}"),
-                InsertPoint.before(func),
+
+        preallocated = {
+            reg
+            for reg in RegisterAllocatableOperation.iter_all_used_registers(func.body)
+            if isinstance(reg, RISCVRegisterType)
+        }
+
+        for pa_reg in preallocated:
+            self.available_registers.exclude_register(pa_reg)
+
+        self.allocate_body(func.body.block)
+
+        if self.spill_size:
+            func.attributes[STACK_SPILL_SIZE_ATTR_NAME] = IntegerAttr(
+                self.spill_size, i32
             )
+
+        if add_regalloc_stats:
+            _insert_regalloc_stats(func, preallocated)
@@ -1,12 +1,11 @@
 from collections.abc import Iterator, Sequence
 
 from xdsl.context import Context
-from xdsl.dialects import builtin, riscv, riscv_scf
+from xdsl.dialects import riscv, riscv_scf
 from xdsl.ir import SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -99,8 +98,8 @@ class LowerRiscvScfToLabels(RewritePattern):
         self.for_idx += 1
 
 
-class LowerRiscvScfForToLabelsPass(ModulePass):
+class LowerRiscvScfForToLabelsPass(PatternRewritePass):
     name = "lower-riscv-scf-to-labels"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(LowerRiscvScfToLabels()).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return LowerRiscvScfToLabels()
@@ -8,11 +8,10 @@ from xdsl.dialects.builtin import (
     UnrealizedConversionCastOp,
 )
 from xdsl.ir import Operation
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -74,17 +73,16 @@ class ArithBinaryToX86(RewritePattern):
 
 
 @dataclass(frozen=True)
-class ConvertArithToX86Pass(ModulePass):
+class ConvertArithToX86Pass(PatternRewritePass):
     name = "convert-arith-to-x86"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
         arch = Arch.arch_for_name(None)
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ArithBinaryToX86(arch),
-                    ArithConstantToX86(),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+        return GreedyRewritePatternApplier(
+            [
+                ArithBinaryToX86(arch),
+                ArithConstantToX86(),
+            ]
+        )
@@ -1,12 +1,11 @@
 from xdsl.context import Context
 from xdsl.dialects import builtin, func, x86, x86_func
-from xdsl.dialects.builtin import ModuleOp, StringAttr
+from xdsl.dialects.builtin import StringAttr
 from xdsl.ir import Attribute, Block
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -157,16 +156,15 @@ class LowerReturnOp(RewritePattern):
         rewriter.replace_matched_op([cast_op, mov_op, ret_op])
 
 
-class ConvertFuncToX86FuncPass(ModulePass):
+class ConvertFuncToX86FuncPass(PatternRewritePass):
     name = "convert-func-to-x86-func"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LowerFuncOp(),
-                    LowerReturnOp(),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LowerFuncOp(),
+                LowerReturnOp(),
+            ]
+        )
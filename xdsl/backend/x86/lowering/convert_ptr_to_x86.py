@@ -2,17 +2,16 @@ from dataclasses import dataclass
 
 from xdsl.backend.x86.lowering.helpers import Arch
 from xdsl.context import Context
-from xdsl.dialects import builtin, ptr, x86
+from xdsl.dialects import ptr, x86
 from xdsl.dialects.builtin import (
     FixedBitwidthType,
     UnrealizedConversionCastOp,
     VectorType,
 )
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -130,20 +129,19 @@ class PtrLoadToX86(RewritePattern):
 
 
 @dataclass(frozen=True)
-class ConvertPtrToX86Pass(ModulePass):
+class ConvertPtrToX86Pass(PatternRewritePass):
     name = "convert-ptr-to-x86"
 
+    apply_recursively = False
+
     arch: str
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
         arch = Arch.arch_for_name(self.arch)
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    PtrLoadToX86(arch),
-                    PtrStoreToX86(arch),
-                    PtrAddToX86(),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+        return GreedyRewritePatternApplier(
+            [
+                PtrLoadToX86(arch),
+                PtrStoreToX86(arch),
+                PtrAddToX86(),
+            ]
+        )
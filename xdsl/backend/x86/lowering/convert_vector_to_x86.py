@@ -3,17 +3,16 @@ from typing import cast
 
 from xdsl.backend.x86.lowering.helpers import Arch
 from xdsl.context import Context
-from xdsl.dialects import builtin, vector, x86
+from xdsl.dialects import vector, x86
 from xdsl.dialects.builtin import (
     FixedBitwidthType,
     UnrealizedConversionCastOp,
     VectorType,
 )
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -103,19 +102,18 @@ class VectorFMAToX86(RewritePattern):
 
 
 @dataclass(frozen=True)
-class ConvertVectorToX86Pass(ModulePass):
+class ConvertVectorToX86Pass(PatternRewritePass):
     name = "convert-vector-to-x86"
 
+    apply_recursively = False
+
     arch: str
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
         arch = Arch.arch_for_name(self.arch)
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    VectorFMAToX86(arch),
-                    VectorBroadcastToX86(arch),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+        return GreedyRewritePatternApplier(
+            [
+                VectorFMAToX86(arch),
+                VectorBroadcastToX86(arch),
+            ]
+        )
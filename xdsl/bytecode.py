@@ -0,0 +1,446 @@
+"""
+A compact binary serialisation format for xDSL IR.
+
+The format stores a single operation, usually a `builtin.module`, and all the IR
+nested in it. It consists of:
+
+* a header, containing the `MAGIC` bytes and the format `VERSION`;
+* a string table, holding every operation name, attribute name and value name once;
+* an attribute table, holding every attribute and type once, in textual form;
+* the record of the top-level operation.
+
+All integers are unsigned LEB128 varints, and strings and attributes are referred to
+by their index in their table. Attributes are only parsed when they are first used.
+
+An operation record contains its name, operands, properties, attributes,
+successors, regions and results, in this order. SSA values are numbered in the
+order in which they are defined, so that operands only need to store the number of
+their value. Operands that refer to a value that is not defined yet also store its
+type.
+
+Operations that are isolated from above number their values separately, and store
+the size of their regions, so that they can be skipped and loaded on demand. This
+is how `BytecodeReader` lazily loads function bodies.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from io import StringIO
+from typing import IO
+
+from xdsl.context import Context
+from xdsl.dialects.builtin import UnregisteredOp
+from xdsl.ir import Attribute, Block, Operation, Region, SSAValue
+from xdsl.parser import ForwardDeclaredValue, Parser
+from xdsl.printer import Printer
+from xdsl.traits import IsolatedFromAbove
+
+MAGIC = b"xDSL\xbc"
+"""The bytes at the start of every bytecode file."""
+
+VERSION = 0
+"""The version of the bytecode format emitted by `BytecodeWriter`."""
+
+
+def _has_isolated_regions(op: Operation) -> bool:
+    return any(region.blocks for region in op.regions) and op.has_trait(
+        IsolatedFromAbove, value_if_unregistered=False
+    )
+
+
+def _op_name(op: Operation) -> str:
+    if isinstance(op, UnregisteredOp):
+        return op.op_name.data
+    return op.name
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+@dataclass
+class BytecodeWriter:
+    """
+    Serialises an operation to the bytecode format.
+    """
+
+    _strings: dict[str, int] = field(default_factory=dict[str, int])
+    _attributes: dict[str, int] = field(default_factory=dict[str, int])
+    """
+    The index of each attribute, keyed on its textual form, as attributes that compare
+    equal may print differently, such as the floats `0.0` and `-0.0`.
+    """
+    _attribute_indices: dict[int, tuple[Attribute, int]] = field(
+        default_factory=dict[int, tuple[Attribute, int]]
+    )
+    """
+    The index of each attribute object written so far, keyed on its identity, to
+    print each object only once. The attribute is kept alive to keep its identity.
+    """
+    _values: dict[SSAValue, int] = field(default_factory=dict[SSAValue, int])
+    """The number of each value in the current isolated scope."""
+    _defined: int = 0
+    """The number of values defined so far in the current isolated scope."""
+
+    def write(self, op: Operation, stream: IO[bytes]) -> None:
+        """Write `op` and all the IR nested in it to `stream`."""
+        body = bytearray()
+        self._values, self._defined = {}, 0
+        self._number_values((op,))
+        self._write_op(op, body, {})
+
+        out = bytearray(MAGIC)
+        _write_varint(out, VERSION)
+        _write_varint(out, len(self._strings))
+        for string in self._strings:
+            self._write_bytes(out, string.encode())
+        _write_varint(out, len(self._attributes))
+        for text in self._attributes:
+            self._write_bytes(out, text.encode())
+        stream.write(out)
+        stream.write(body)
+
+    @staticmethod
+    def _write_bytes(out: bytearray, data: bytes | bytearray) -> None:
+        _write_varint(out, len(data))
+        out += data
+
+    def _string(self, string: str) -> int:
+        if (index := self._strings.get(string)) is None:
+            index = self._strings[string] = len(self._strings)
+        return index
+
+    def _attribute(self, attribute: Attribute) -> int:
+        if (entry := self._attribute_indices.get(id(attribute))) is not None:
+            return entry[1]
+        text = StringIO()
+        Printer(text).print_attribute(attribute)
+        if (index := self._attributes.get(text.getvalue())) is None:
+            index = self._attributes[text.getvalue()] = len(self._attributes)
+        self._attribute_indices[id(attribute)] = (attribute, index)
+        return index
+
+    def _number_values(self, ops: Iterable[Operation]) -> None:
+        """
+        Number the values defined by `ops` and in their regions, in the order in which
+        they are written, stopping at isolated regions.
+        """
+        for op in ops:
+            if not _has_isolated_regions(op):
+                for region in op.regions:
+                    self._number_region(region)
+            for result in op.results:
+                self._values[result] = len(self._values)
+
+    def _number_region(self, region: Region) -> None:
+        for block in region.blocks:
+            for arg in block.args:
+                self._values[arg] = len(self._values)
+        for block in region.blocks:
+            self._number_values(block.ops)
+
+    def _write_isolated_regions(self, op: Operation, out: bytearray) -> None:
+        """Write the regions of `op` with a fresh numbering, prefixed by their size."""
+        outer_values, outer_defined = self._values, self._defined
+        self._values, self._defined = {}, 0
+        for region in op.regions:
+            self._number_region(region)
+        regions = bytearray()
+        for region in op.regions:
+            self._write_region(region, regions)
+        self._values, self._defined = outer_values, outer_defined
+        self._write_bytes(out, regions)
+
+    def _write_value_def(self, value: SSAValue, out: bytearray) -> None:
+        self._defined += 1
+        _write_varint(out, self._string(value.name_hint) + 1 if value.name_hint else 0)
+
+    def _write_op(
+        self, op: Operation, out: bytearray, block_indices: dict[Block, int]
+    ) -> None:
+        _write_varint(out, self._string(_op_name(op)))
+
+        _write_varint(out, len(op.operands))
+        for operand in op.operands:
+            if (index := self._values.get(operand)) is None:
+                raise ValueError(
+                    f"Operand of {_op_name(op)} is not defined in the enclosing "
+                    "region isolated from above"
+                )
+            _write_varint(out, index)
+            if index >= self._defined:
+                _write_varint(out, self._attribute(operand.type))
+
+        _write_varint(out, len(op.properties))
+        for name, value in op.properties.items():
+            _write_varint(out, self._string(name))
+            _write_varint(out, self._attribute(value))
+
+        attributes = op.attributes
+        if isinstance(op, UnregisteredOp):
+            attributes = {k: v for k, v in attributes.items() if k != "op_name__"}
+        _write_varint(out, len(attributes))
+        for name, value in attributes.items():
+            _write_varint(out, self._string(name))
+            _write_varint(out, self._attribute(value))
+
+        _write_varint(out, len(op.successors))
+        for successor in op.successors:
+            _write_varint(out, block_indices[successor])
+
+        isolated = _has_isolated_regions(op)
+        _write_varint(out, len(op.regions) << 1 | isolated)
+        if isolated:
+            self._write_isolated_regions(op, out)
+        else:
+            for region in op.regions:
+                self._write_region(region, out)
+
+        _write_varint(out, len(op.results))
+        for result in op.results:
+            _write_varint(out, self._attribute(result.type))
+            self._write_value_def(result, out)
+
+    def _write_region(self, region: Region, out: bytearray) -> None:
+        blocks = region.blocks
+        _write_varint(out, len(blocks))
+        block_indices: dict[Block, int] = {}
+        for index, block in enumerate(blocks):
+            block_indices[block] = index
+            _write_varint(out, len(block.args))
+            for arg in block.args:
+                _write_varint(out, self._attribute(arg.type))
+                self._write_value_def(arg, out)
+        for block in blocks:
+            _write_varint(out, len(block.ops))
+            for op in block.ops:
+                self._write_op(op, out, block_indices)
+
+
+@dataclass
+class _Scope:
+    """The values of an isolated scope, as they are being read."""
+
+    values: list[SSAValue] = field(default_factory=list[SSAValue])
+    forward_values: dict[int, ForwardDeclaredValue] = field(
+        default_factory=dict[int, ForwardDeclaredValue]
+    )
+
+    def define(self, value: SSAValue) -> None:
+        if (
+            forward_value := self.forward_values.pop(len(self.values), None)
+        ) is not None:
+            forward_value.replace_by(value)
+        self.values.append(value)
+
+
+class BytecodeReader:
+    """
+    Deserialises an operation from the bytecode format.
+
+    If `lazy` is set, the regions of operations isolated from above, such as function
+    bodies, are left empty when they are read, and are only loaded by `materialize`.
+    """
+
+    ctx: Context
+    lazy: bool
+    _data: bytes
+    _pos: int
+    _strings: list[str]
+    _attribute_texts: list[str]
+    _attributes: list[Attribute | None]
+    _scope: _Scope
+    _unmaterialized: dict[Operation, int]
+    """The position of the regions of each operation that has not been loaded yet."""
+
+    def __init__(self, ctx: Context, data: bytes, *, lazy: bool = False):
+        self.ctx = ctx
+        self.lazy = lazy
+        self._data = data
+        self._pos = 0
+        self._scope = _Scope()
+        self._unmaterialized = {}
+
+        if not data.startswith(MAGIC):
+            raise ValueError("Input is not in the xDSL bytecode format")
+        self._pos = len(MAGIC)
+        if (version := self._read_varint()) != VERSION:
+            raise ValueError(f"Unsupported bytecode version {version}")
+        self._strings = [
+            self._read_bytes().decode() for _ in range(self._read_varint())
+        ]
+        self._attribute_texts = [
+            self._read_bytes().decode() for _ in range(self._read_varint())
+        ]
+        self._attributes = [None] * len(self._attribute_texts)
+
+    def read(self) -> Operation:
+        """Read the top-level operation."""
+        self._scope = _Scope()
+        op = self._read_op((), lazy=False)
+        self._check_scope()
+        if self._pos != len(self._data):
+            raise ValueError("Unexpected data after the top-level operation")
+        return op
+
+    def is_materialized(self, op: Operation) -> bool:
+        """Return whether the regions of `op` have been loaded."""
+        return op not in self._unmaterialized
+
+    def materialize(self, op: Operation) -> None:
+        """
+        Load the regions of `op`, if it was lazily read.
+        Operations isolated from above in these regions are still lazily read.
+        """
+        if (pos := self._unmaterialized.pop(op, None)) is None:
+            return
+        outer_pos, outer_scope = self._pos, self._scope
+        self._pos, self._scope = pos, _Scope()
+        self._read_varint()
+        for region in op.regions:
+            self._read_region(region)
+        self._check_scope()
+        self._pos, self._scope = outer_pos, outer_scope
+
+    def materialize_all(self) -> None:
+        """Load all the regions that have not been loaded yet."""
+        while self._unmaterialized:
+            self.materialize(next(iter(self._unmaterialized)))
+
+    def _read_varint(self) -> int:
+        data = self._data
+        result = 0
+        shift = 0
+        try:
+            while True:
+                byte = data[self._pos]
+                self._pos += 1
+                result |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    return result
+                shift += 7
+        except IndexError:
+            raise ValueError("Unexpected end of bytecode") from None
+
+    def _read_bytes(self) -> bytes:
+        size = self._read_varint()
+        start = self._pos
+        self._pos += size
+        if self._pos > len(self._data):
+            raise ValueError("Unexpected end of bytecode")
+        return self._data[start : self._pos]
+
+    def _read_string(self) -> str:
+        return self._strings[self._read_varint()]
+
+    def _read_attribute(self) -> Attribute:
+        index = self._read_varint()
+        if (attribute := self._attributes[index]) is None:
+            text = self._attribute_texts[index]
+            attribute = self._attributes[index] = Parser(
+                self.ctx, text, "<bytecode>"
+            ).parse_attribute()
+        return attribute
+
+    def _read_value_def(self, value: SSAValue) -> None:
+        if name_index := self._read_varint():
+            value.name_hint = self._strings[name_index - 1]
+        self._scope.define(value)
+
+    def _check_scope(self) -> None:
+        if self._scope.forward_values:
+            raise ValueError("Operand refers to a value that is never defined")
+
+    def _read_operand(self) -> SSAValue:
+        index = self._read_varint()
+        scope = self._scope
+        if index < len(scope.values):
+            return scope.values[index]
+        value_type = self._read_attribute()
+        if (forward_value := scope.forward_values.get(index)) is None:
+            forward_value = scope.forward_values[index] = ForwardDeclaredValue(
+                value_type
+            )
+        return forward_value
+
+    def _read_op(self, blocks: Sequence[Block], *, lazy: bool = True) -> Operation:
+        op_type = self.ctx.get_op(self._read_string())
+        operands = [self._read_operand() for _ in range(self._read_varint())]
+        properties = {
+            self._read_string(): self._read_attribute()
+            for _ in range(self._read_varint())
+        }
+        attributes = {
+            self._read_string(): self._read_attribute()
+            for _ in range(self._read_varint())
+        }
+        successors = [blocks[self._read_varint()] for _ in range(self._read_varint())]
+
+        regions_header = self._read_varint()
+        regions = [Region() for _ in range(regions_header >> 1)]
+        regions_pos = self._pos
+        if regions_header & 1:
+            size = self._read_varint()
+            if lazy and self.lazy:
+                self._pos += size
+            else:
+                outer_scope, self._scope = self._scope, _Scope()
+                for region in regions:
+                    self._read_region(region)
+                self._check_scope()
+                self._scope = outer_scope
+                regions_pos = None
+        else:
+            for region in regions:
+                self._read_region(region)
+            regions_pos = None
+
+        result_types: list[Attribute] = []
+        result_names: list[int] = []
+        for _ in range(self._read_varint()):
+            result_types.append(self._read_attribute())
+            result_names.append(self._read_varint())
+
+        op = op_type.create(
+            operands=operands,
+            result_types=result_types,
+            properties=properties,
+            attributes=attributes,
+            successors=successors,
+            regions=regions,
+        )
+        for result, name_index in zip(op.results, result_names, strict=True):
+            if name_index:
+                result.name_hint = self._strings[name_index - 1]
+            self._scope.define(result)
+        if regions_pos is not None:
+            self._unmaterialized[op] = regions_pos
+        return op
+
+    def _read_region(self, region: Region) -> None:
+        blocks: list[Block] = []
+        for _ in range(self._read_varint()):
+            block = Block()
+            for _ in range(self._read_varint()):
+                self._read_value_def(
+                    block.insert_arg(self._read_attribute(), len(block.args))
+                )
+            blocks.append(block)
+        for block in blocks:
+            block.add_ops([self._read_op(blocks) for _ in range(self._read_varint())])
+        region.add_block(blocks)
+
+
+def write_bytecode(op: Operation, stream: IO[bytes]) -> None:
+    """Write `op` and all the IR nested in it to `stream` in the bytecode format."""
+    BytecodeWriter().write(op, stream)
+
+
+def read_bytecode(ctx: Context, data: bytes) -> Operation:
+    """Read an operation in the bytecode format."""
+    return BytecodeReader(ctx, data).read()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import math
 import struct
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Iterator, Mapping, Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
 from enum import Enum
@@ -1557,6 +1557,13 @@ class ContainerOf(
         if bases is not None:
             return {*bases, TensorType, VectorType}
 
+    def get_predicate(self) -> Callable[[Attribute], bool] | None:
+        if (elem_pred := self.elem_constr.get_predicate()) is None:
+            return None
+        return lambda attr: elem_pred(
+            attr.element_type if isinstance(attr, VectorType | TensorType) else attr
+        )
+
     def mapping_type_vars(
         self, type_var_mapping: Mapping[TypeVar, AttrConstraint | IntConstraint]
     ) -> ContainerOf[AttributeCovT]:
@@ -2536,6 +2543,10 @@ DenseElementCovT = TypeVar(
 DenseElementT = TypeVar("DenseElementT", bound=AnyDenseElement, default=AnyDenseElement)
 
 
+_DENSE_HEX_CHUNK_SIZE = 1 << 16
+"""The number of bytes of a dense attribute to print as hex at once."""
+
+
 @irdl_attr_definition
 class DenseIntOrFPElementsAttr(
     TypedAttribute,
@@ -2789,8 +2800,11 @@ class DenseIntOrFPElementsAttr(
         Return whether or not this dense attribute is defined entirely
         by a single value (splat).
         """
-        values = self.get_values()
-        return values.count(values[0]) == len(values)
+        # Compare the buffer to itself shifted by one element, so that the values do
+        # not need to be decoded
+        data = memoryview(self.data.data)
+        size = self.type.element_type.compile_time_size
+        return len(data) >= size and data[size:] == data[:-size]
 
     @staticmethod
     def parse_with_type(parser: AttrParser, type: Attribute) -> TypedAttribute:
@@ -2838,18 +2852,24 @@ class DenseIntOrFPElementsAttr(
     def print_without_type(self, printer: Printer):
         printer.print_string("dense")
         length = len(self)
-        data = self.get_values()
-        shape = self.get_shape() if self.shape_is_complete else (length,)
-        assert shape is not None, "If shape is complete, then it cannot be None"
         with printer.in_angle_brackets():
             if length == 0:
                 pass
             elif self.is_splat():
-                self._print_one_elem(data[0], printer)
+                element_type = self.get_element_type()
+                first = memoryview(self.data.data)[: element_type.compile_time_size]
+                self._print_one_elem(element_type.unpack(first, 1)[0], printer)
             elif length > 100:
-                printer.print_string(f'"0x{self.data.data.hex().upper()}"')
+                # Print the buffer in chunks, to avoid copying it as a whole
+                data = memoryview(self.data.data)
+                printer.print_string('"0x')
+                for start in range(0, len(data), _DENSE_HEX_CHUNK_SIZE):
+                    chunk = data[start : start + _DENSE_HEX_CHUNK_SIZE]
+                    printer.print_string(chunk.hex().upper())
+                printer.print_string('"')
             else:
-                self._print_dense_list(data, shape, printer)
+                shape = self.get_shape() if self.shape_is_complete else (length,)
+                self._print_dense_list(self.get_values(), shape, printer)
 
     def print_builtin(self, printer: Printer):
         self.print_without_type(printer)
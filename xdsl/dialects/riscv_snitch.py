@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from typing import ClassVar, Literal, TypeAlias, cast
 
 from typing_extensions import Self
@@ -444,6 +444,15 @@ class FRepOperation(RISCVInstruction):
                         f"variables types."
                     )
 
+    def iter_tied_values(self) -> Iterator[Sequence[SSAValue]]:
+        # The for op operand, block arg, yield operand, and result must have the same
+        # register
+        yield_op = self.body.block.last_op
+        assert yield_op is not None
+        return zip(
+            self.body.block.args, self.iter_args, yield_op.operands, self.results
+        )
+
     def allocate_registers(self, allocator: BlockAllocator) -> None:
         # Allocate values used inside the body but defined outside.
         # Their scope lasts for the whole body execution scope
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC
-from collections.abc import Generator, Sequence
+from collections.abc import Generator, Iterator, Sequence
 from typing import cast
 
 from typing_extensions import Self
@@ -121,6 +121,20 @@ class ForRofOperation(RegisterAllocatableOperation, IRDLOperation, ABC):
         # that these registers will have been iterated earlier in the IR.
         yield from ()
 
+    def iter_tied_values(self) -> Iterator[Sequence[SSAValue]]:
+        # The for op operand, block arg, yield operand, and result must have the same
+        # register
+        yield_op = self.body.block.last_op
+        assert yield_op is not None
+        return zip(
+            self.body.block.args[1:], self.iter_args, yield_op.operands, self.results
+        )
+
+    def iter_operands_live_in_regions(self) -> Iterator[SSAValue]:
+        # Step and ub are used throughout loop, lb only initializes the induction
+        # variable, and the loop-carried variables are tied to the block arguments
+        return iter((self.ub, self.step))
+
     def allocate_registers(self, allocator: BlockAllocator) -> None:
         # Allocate values used inside the body but defined outside.
         # Their scope lasts for the whole body execution scope
@@ -3,11 +3,10 @@ from xdsl.context import Context
 from xdsl.dialects import arith, builtin, func, printf, scf, tensor
 from xdsl.frontend.listlang.lang_types import ListLangType
 from xdsl.ir import Attribute, Block, Region
-from xdsl.passes import ModulePass
+from xdsl.passes import ModulePass, PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -209,24 +208,22 @@ class LowerRangeOp(RewritePattern):
         rewriter.replace_matched_op(for_op)
 
 
-class LowerListToTensor(ModulePass):
+class LowerListToTensor(PatternRewritePass):
     """
     Lowers list dialect to a tensor-based representation.
     """
 
     name = "lower-list-to-tensor"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LowerLengthOp(),
-                    LowerMapOp(),
-                    LowerPrintOp(),
-                    LowerRangeOp(),
-                ]
-            ),
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LowerLengthOp(),
+                LowerMapOp(),
+                LowerPrintOp(),
+                LowerRangeOp(),
+            ]
+        )
 
 
 class WrapModuleInFunc(ModulePass):
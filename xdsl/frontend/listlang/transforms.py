@@ -1,11 +1,9 @@
 from xdsl.context import Context
-from xdsl.dialects import builtin
 from xdsl.frontend.listlang import list_dialect
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -48,19 +46,17 @@ class MapOfMap(RewritePattern):
         rewriter.erase_op(op)
 
 
-class OptimizeListOps(ModulePass):
+class OptimizeListOps(PatternRewritePass):
     """
     Applies optimizations to list operations.
     """
 
     name = "optimize-lists"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LengthOfMap(),
-                    MapOfMap(),
-                ]
-            ),
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LengthOfMap(),
+                MapOfMap(),
+            ]
+        )
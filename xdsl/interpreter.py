@@ -4,6 +4,7 @@ import platform
 from collections import Counter
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
+from operator import itemgetter
 from typing import (
     IO,
     Any,
@@ -12,6 +13,7 @@ from typing import (
     NamedTuple,
     ParamSpec,
     TypeAlias,
+    cast,
 )
 
 from typing_extensions import TypeVar
@@ -30,7 +32,7 @@ from xdsl.ir import (
 from xdsl.traits import (
     CallableOpInterface,
     IsTerminator,
-    SymbolTable,
+    SymbolTableCollection,
 )
 from xdsl.utils.exceptions import InterpretationError
 from xdsl.utils.scoped_dict import ScopedDict
@@ -565,6 +567,11 @@ class _InterpreterFunctionImpls:
 
             self._callable_impl_dict[op_type] = (ft, impl)
 
+    def get_impl(
+        self, op_type: type[Operation]
+    ) -> tuple[InterpreterFunctions, OpImpl[InterpreterFunctions, Operation]] | None:
+        return self._impl_dict.get(op_type)
+
     def run(
         self, interpreter: Interpreter, op: Operation, args: tuple[Any, ...]
     ) -> OpImplResult:
@@ -623,6 +630,73 @@ class _InterpreterFunctionImpls:
         return ext_func(ft, interpreter, op, args)
 
 
+_UNDEFINED: Any = object()
+"""Marks the slots of values that have not been computed yet in a compiled frame."""
+
+
+class _FrameScope(dict[SSAValue, Any]):
+    """
+    The local scope of a compiled region, a view of the values in its frame.
+    Implementations and nested regions that look values up in the interpreter's
+    environment find them here.
+    """
+
+    __slots__ = ("slots", "frame")
+
+    slots: dict[SSAValue, int]
+    frame: list[Any]
+
+    def __init__(self, slots: dict[SSAValue, int], frame: list[Any]):
+        super().__init__()
+        self.slots = slots
+        self.frame = frame
+
+    def __contains__(self, key: object) -> bool:
+        if key not in self.slots:
+            return super().__contains__(key)
+        return self.frame[self.slots[cast(SSAValue, key)]] is not _UNDEFINED
+
+    def __getitem__(self, key: SSAValue) -> Any:
+        if (slot := self.slots.get(key)) is None:
+            return super().__getitem__(key)
+        if (value := self.frame[slot]) is _UNDEFINED:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: SSAValue, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def __setitem__(self, key: SSAValue, value: Any) -> None:
+        if (slot := self.slots.get(key)) is None:
+            super().__setitem__(key, value)
+        else:
+            self.frame[slot] = value
+
+
+_CompiledOp: TypeAlias = Callable[[list[Any]], "TerminatorValue | None"]
+"""
+Runs an operation on a frame, reading its operands from and writing its results to
+precomputed slots, and returns its terminator value, if any.
+"""
+
+
+@dataclass
+class _CompiledBlock:
+    arg_slots: tuple[int, ...]
+    ops: tuple[_CompiledOp, ...]
+    terminator: _CompiledOp | None
+
+
+@dataclass
+class _CompiledRegion:
+    slots: dict[SSAValue, int]
+    """The index in the frame of each value used in the region."""
+    captures: tuple[tuple[SSAValue, int], ...]
+    """The values defined outside the region, loaded when it is entered."""
+    blocks: dict[Block, _CompiledBlock]
+    entry: _CompiledBlock | None
+
+
 def _get_system_bitwidth() -> Literal[32, 64] | None:
     match platform.architecture()[0]:
         case "64bit":
@@ -672,12 +746,24 @@ class Interpreter:
     assigned to the current scope, but can be fetched from a parent scope.
     """
     file: IO[str] | None = field(default=None)
-    _symbol_table: dict[str, Operation] | None = None
+    _symbol_tables: SymbolTableCollection = field(default_factory=SymbolTableCollection)
+    """The symbols of the module, indexed on the first lookup."""
     _impl_data: _IMPL_DATA = field(default_factory=_IMPL_DATA)
     """
     Runtime data associated with an interpreter functions implementation.
     """
     listeners: tuple[Listener, ...] = field(default=())
+    compiled: bool = field(default=False, kw_only=True)
+    """
+    Compile each region the first time it is run into closures that read and write
+    values in a frame by precomputed indices, instead of dispatching on each
+    operation every time it is run.
+    Regions must not be modified after they were first run in this mode, and the
+    compiled code is bypassed while listeners are registered.
+    """
+    _compiled_regions: dict[Region, _CompiledRegion] = field(
+        default_factory=dict[Region, _CompiledRegion], init=False
+    )
 
     def get_values(self, values: Iterable[SSAValue]) -> tuple[Any, ...]:
         """
@@ -721,6 +807,7 @@ class Interpreter:
         set to True.
         """
         self._impls.register_from(impls, override=override)
+        self._compiled_regions.clear()
 
     def _run_op(self, op: Operation, inputs: PythonValues) -> OpImplResult:
         if (operands_count := len(op.operands)) != (inputs_count := len(inputs)):
@@ -780,6 +867,9 @@ class Interpreter:
         if not region.blocks:
             return results
 
+        if self.compiled and not self.listeners:
+            return self._run_compiled_region(region, args, name)
+
         initial_scope = self._ctx
         block = region.blocks.first
 
@@ -816,6 +906,143 @@ class Interpreter:
         self._ctx = initial_scope
         return results
 
+    def _run_compiled_region(
+        self, region: Region, args: PythonValues, name: str
+    ) -> PythonValues:
+        if (compiled := self._compiled_regions.get(region)) is None:
+            compiled = self._compile_region(region)
+            self._compiled_regions[region] = compiled
+
+        initial_scope = self._ctx
+        frame = [_UNDEFINED] * len(compiled.slots)
+        for value, slot in compiled.captures:
+            frame[slot] = initial_scope[value]
+        self._ctx = ScopedDict(
+            initial_scope, name=name, local_scope=_FrameScope(compiled.slots, frame)
+        )
+
+        results = ()
+        block = compiled.entry
+        while block is not None:
+            for slot, arg in zip(block.arg_slots, args):
+                frame[slot] = arg
+            for run_op in block.ops:
+                run_op(frame)
+            if block.terminator is None:
+                break
+            match block.terminator(frame):
+                case ReturnedValues(values):
+                    results = values
+                    break
+                case Successor(successor, args):
+                    block = compiled.blocks[successor]
+                case None:
+                    break
+
+        self._ctx = initial_scope
+        return results
+
+    def _compile_region(self, region: Region) -> _CompiledRegion:
+        slots: dict[SSAValue, int] = {}
+        for block in region.blocks:
+            for arg in block.args:
+                slots[arg] = len(slots)
+            for op in block.ops:
+                for result in op.results:
+                    slots[result] = len(slots)
+
+        captures: list[tuple[SSAValue, int]] = []
+        for block in region.blocks:
+            for op in block.ops:
+                for operand in op.operands:
+                    if operand not in slots:
+                        slots[operand] = len(slots)
+                        captures.append((operand, slots[operand]))
+
+        blocks: dict[Block, _CompiledBlock] = {}
+        for block in region.blocks:
+            ops = tuple(self._compile_op(op, slots) for op in block.ops)
+            blocks[block] = _CompiledBlock(
+                tuple(slots[arg] for arg in block.args),
+                ops[:-1],
+                ops[-1] if ops else None,
+            )
+
+        return _CompiledRegion(
+            slots, tuple(captures), blocks, next(iter(blocks.values()), None)
+        )
+
+    def _compile_op(self, op: Operation, slots: dict[SSAValue, int]) -> _CompiledOp:
+        if (bound_impl := self._impls.get_impl(type(op))) is None:
+            message = f"Could not find interpretation function for op {op.name}"
+
+            def run_missing(frame: list[Any]) -> TerminatorValue | None:
+                raise InterpretationError(message)
+
+            return run_missing
+
+        ft, impl = bound_impl
+        interpreter = self
+
+        operand_slots = tuple(slots[operand] for operand in op.operands)
+        gather: Callable[[list[Any]], PythonValues]
+        if not operand_slots:
+            gather = lambda frame: ()  # noqa: E731
+        elif len(operand_slots) == 1:
+            (operand_slot,) = operand_slots
+            gather = lambda frame: (frame[operand_slot],)  # noqa: E731
+        else:
+            gather = cast(
+                Callable[[list[Any]], PythonValues], itemgetter(*operand_slots)
+            )
+
+        result_slots = tuple(slots[result] for result in op.results)
+
+        def check_results(values: PythonValues):
+            if len(values) != len(result_slots):
+                raise InterpretationError(
+                    f"Number of operation results ({len(result_slots)}) doesn't match "
+                    f"the number of implementation results ({len(values)})."
+                )
+
+        if not result_slots:
+
+            def run_op(frame: list[Any]) -> TerminatorValue | None:
+                try:
+                    values, terminator_value = impl(ft, interpreter, op, gather(frame))
+                except Exception as e:
+                    op.emit_error("Error while interpreting op", e)
+                if values:
+                    check_results(values)
+                return terminator_value
+
+        elif len(result_slots) == 1:
+            (result_slot,) = result_slots
+
+            def run_op(frame: list[Any]) -> TerminatorValue | None:
+                try:
+                    values, terminator_value = impl(ft, interpreter, op, gather(frame))
+                except Exception as e:
+                    op.emit_error("Error while interpreting op", e)
+                if len(values) != 1:
+                    check_results(values)
+                frame[result_slot] = values[0]
+                return terminator_value
+
+        else:
+
+            def run_op(frame: list[Any]) -> TerminatorValue | None:
+                try:
+                    values, terminator_value = impl(ft, interpreter, op, gather(frame))
+                except Exception as e:
+                    op.emit_error("Error while interpreting op", e)
+                check_results(values)
+                for slot, value in zip(result_slots, values):
+                    frame[slot] = value
+                return terminator_value
+
+        return run_op
+
     def cast_value(self, o: Attribute, r: Attribute, value: Any) -> Any:
         """
         If the type of the operand and result are not the same, then look up the
@@ -830,7 +1057,7 @@ class Interpreter:
         return self._impls.attr_value(self, attr, type_attr)
 
     def get_op_for_symbol(self, symbol: str | SymbolRefAttr) -> Operation:
-        op = SymbolTable.lookup_symbol(self.module, symbol)
+        op = self._symbol_tables.lookup_symbol(self.module, symbol)
         if op is not None:
             return op
         raise InterpretationError(f"Could not find symbol {symbol}")
@@ -108,6 +108,7 @@ class EqsatPDLInterpFunctions(PDLInterpFunctions):
         Whenever an operation is modified, for example when its operands are updated to a different eclass value,
         the operation is added to the hashcons `known_ops`.
         """
+        self.known_ops.invalidate(op)
         if op not in self.known_ops:
             self.known_ops[op] = op
 
@@ -0,0 +1,330 @@
+from itertools import product
+from typing import Any, cast
+
+import numpy as np
+from numpy.typing import NDArray
+
+from xdsl.dialects import arith, linalg
+from xdsl.dialects.builtin import (
+    AnyFloat,
+    Float16Type,
+    Float32Type,
+    Float64Type,
+    FloatAttr,
+    TensorType,
+)
+from xdsl.interpreter import (
+    Interpreter,
+    PythonValues,
+    impl,
+    register_impls,
+)
+from xdsl.interpreters.linalg import LinalgFunctions
+from xdsl.interpreters.shaped_array import ShapedArray
+from xdsl.ir import Operation, SSAValue
+from xdsl.ir.affine import AffineDimExpr, AffineMap
+
+_BODY_UFUNCS: dict[type[Operation], np.ufunc] = {
+    arith.AddfOp: np.add,
+    arith.SubfOp: np.subtract,
+    arith.MulfOp: np.multiply,
+}
+"""The operations that can be evaluated on whole arrays in a `linalg.generic` body."""
+
+
+def _float_array(value: Any) -> NDArray[Any] | None:
+    """
+    Returns a view of `value` if it is a shaped array of IEEE floats, `None` otherwise.
+    """
+    if not isinstance(value, ShapedArray):
+        return None
+    value = cast(ShapedArray[Any], value)
+    if not isinstance(value.element_type, Float16Type | Float32Type | Float64Type):
+        return None
+    return value.as_ndarray()
+
+
+def _is_vectorizable_body(op: linalg.GenericOp) -> bool:
+    body = op.body.block
+    for body_op in body.ops:
+        if type(body_op) in _BODY_UFUNCS or isinstance(body_op, linalg.YieldOp):
+            continue
+        if isinstance(body_op, arith.ConstantOp) and isinstance(
+            body_op.value, FloatAttr
+        ):
+            continue
+        return False
+    return True
+
+
+def _index(
+    indexing_map: AffineMap,
+    dims: dict[int, NDArray[Any] | int],
+) -> tuple[NDArray[Any] | int, ...]:
+    return tuple(
+        dims[expr.position] if isinstance(expr, AffineDimExpr) else 0
+        for expr in indexing_map.results
+    )
+
+
+@register_impls
+class NumPyLinalgFunctions(LinalgFunctions):
+    """
+    Implementations of `linalg` operations that compute on NumPy views of the
+    interpreted arrays, instead of one element at a time.
+
+    Operations on floats compute in double precision and store their results in
+    the same order as `LinalgFunctions`, so both produce the same values.
+    Other operations fall back to the implementations in `LinalgFunctions`.
+    Requires NumPy to be installed.
+    """
+
+    @impl(linalg.GenericOp)
+    def run_generic(
+        self, interpreter: Interpreter, op: linalg.GenericOp, args: tuple[Any, ...]
+    ) -> PythonValues:
+        fallback = super().run_generic
+        indexing_maps = op.get_indexing_maps()
+        if (
+            op.library_call is not None
+            or not all(
+                indexing_map.is_projected_permutation(allow_zero_in_results=True)
+                for indexing_map in indexing_maps
+            )
+            or not _is_vectorizable_body(op)
+        ):
+            return fallback(interpreter, op, args).values
+
+        inputs_count = len(op.inputs)
+        output_indexing_maps = indexing_maps[inputs_count:]
+        output_dims = [
+            {
+                expr.position
+                for expr in indexing_map.results
+                if isinstance(expr, AffineDimExpr)
+            }
+            for indexing_map in output_indexing_maps
+        ]
+        # Each output must be written exactly once per iteration of the reduction
+        # dimensions, which are then run in order.
+        if any(dims != output_dims[0] for dims in output_dims):
+            return fallback(interpreter, op, args).values
+
+        input_args = args[:inputs_count]
+        output_args = cast(tuple[ShapedArray[float], ...], args[inputs_count:])
+        if any(
+            isinstance(arg, ShapedArray) and _float_array(arg) is None
+            for arg in input_args
+        ) or any(_float_array(arg) is None for arg in output_args):
+            return fallback(interpreter, op, args).values
+
+        if op.results:
+            outputs = tuple(arg.copy() for arg in output_args)
+        else:
+            outputs = output_args
+
+        loop_ranges = op.get_static_loop_ranges()
+        parallel_dims = sorted(output_dims[0])
+        reduction_dims = [
+            dim for dim in range(len(loop_ranges)) if dim not in output_dims[0]
+        ]
+        grid = np.indices(tuple(loop_ranges[dim] for dim in parallel_dims), sparse=True)
+        dims: dict[int, NDArray[Any] | int] = dict(
+            zip(parallel_dims, grid, strict=True)
+        )
+
+        operands: list[Any] = [
+            _float_array(arg) if isinstance(arg, ShapedArray) else arg
+            for arg in input_args
+        ]
+        operands.extend(_float_array(output) for output in outputs)
+
+        body = op.body.block
+        for reduction_indices in product(
+            *(range(loop_ranges[dim]) for dim in reduction_dims)
+        ):
+            dims.update(zip(reduction_dims, reduction_indices))
+            indices = [_index(indexing_map, dims) for indexing_map in indexing_maps]
+            values: dict[SSAValue, Any] = {
+                arg: (
+                    operand[index].astype(np.float64)
+                    if isinstance(operand, np.ndarray)
+                    else operand
+                )
+                for arg, operand, index in zip(
+                    body.args, operands, indices, strict=True
+                )
+            }
+            for body_op in body.ops:
+                if isinstance(body_op, linalg.YieldOp):
+                    for output, index, result in zip(
+                        operands[inputs_count:],
+                        indices[inputs_count:],
+                        body_op.operands,
+                        strict=True,
+                    ):
+                        output[index] = values[result]
+                elif isinstance(body_op, arith.ConstantOp):
+                    values[body_op.result] = cast(
+                        FloatAttr[AnyFloat], body_op.value
+                    ).value.data
+                else:
+                    lhs, rhs = body_op.operands
+                    values[body_op.results[0]] = _BODY_UFUNCS[type(body_op)](
+                        values[lhs], values[rhs]
+                    )
+
+        return outputs if op.results else ()
+
+    @impl(linalg.AddOp)
+    def run_add(
+        self, interpreter: Interpreter, op: linalg.AddOp, args: tuple[Any, ...]
+    ) -> tuple[Any, ...]:
+        lhs, rhs, res = (_float_array(arg) for arg in args[:3])
+        if lhs is None or rhs is None or res is None:
+            return super().run_add(interpreter, op, args).values
+        if res.any():
+            raise NotImplementedError()
+        assert lhs.shape == rhs.shape == res.shape
+        res[...] = lhs.astype(np.float64) + rhs
+        if len(op.results) > 0:
+            return (args[2],)
+        return ()
+
+    @impl(linalg.FillOp)
+    def run_fill(
+        self, interpreter: Interpreter, op: linalg.FillOp, args: tuple[Any, ...]
+    ) -> tuple[Any, ...]:
+        operand, res = (_float_array(arg) for arg in args[:2])
+        if operand is None or res is None:
+            return super().run_fill(interpreter, op, args).values
+        if res.any():
+            raise NotImplementedError()
+        res[...] = operand.flat[0]
+        if len(op.results) > 0:
+            return (args[1],)
+        return ()
+
+    @impl(linalg.MulOp)
+    def run_mul(
+        self, interpreter: Interpreter, op: linalg.MulOp, args: tuple[Any, ...]
+    ) -> tuple[Any, ...]:
+        lhs, rhs, res = (_float_array(arg) for arg in args[:3])
+        if lhs is None or rhs is None or res is None:
+            return super().run_mul(interpreter, op, args).values
+        if res.any():
+            raise NotImplementedError()
+        assert lhs.shape == rhs.shape == res.shape
+        res[...] = lhs.astype(np.float64) * rhs
+        if len(op.results) > 0:
+            return (args[2],)
+        return ()
+
+    @impl(linalg.TransposeOp)
+    def run_transpose(
+        self, interpreter: Interpreter, op: linalg.TransposeOp, args: tuple[Any, ...]
+    ) -> tuple[Any, ...]:
+        operand, res = (_float_array(arg) for arg in args[:2])
+        if operand is None or res is None:
+            return super().run_transpose(interpreter, op, args).values
+        if res.any():
+            raise NotImplementedError()
+        assert operand.ndim == 2
+        assert res.ndim == 2
+        res.reshape(-1)[:] = operand.T.reshape(-1)
+        if len(op.results) > 0:
+            return (args[1],)
+        return ()
+
+    @impl(linalg.MatmulOp)
+    def run_mat_mul(
+        self, interpreter: Interpreter, op: linalg.MatmulOp, args: tuple[Any, ...]
+    ) -> tuple[Any, ...]:
+        lhs, rhs, res = (_float_array(arg) for arg in args[:3])
+        if lhs is None or rhs is None or res is None:
+            return super().run_mat_mul(interpreter, op, args).values
+        if res.any():
+            raise NotImplementedError()
+        rows = lhs.shape[0]
+        cols = rhs.shape[1]
+        assert rows == cols
+        # Accumulate in the same order as a scalar sum, for the same rounding
+        lhs = lhs.astype(np.float64)
+        acc = np.zeros((rows, cols))
+        for k in range(lhs.shape[1]):
+            acc += lhs[:, k, None] * rhs[None, k, :]
+        res.reshape(-1)[: rows * cols] = acc.reshape(-1)
+        if len(op.results) > 0:
+            return (args[2],)
+        return ()
+
+    @impl(linalg.PoolingNchwMaxOp)
+    def run_pooling_nchw_max(
+        self,
+        interpreter: Interpreter,
+        op: linalg.PoolingNchwMaxOp,
+        args: tuple[Any, ...],
+    ) -> tuple[Any, ...]:
+        input, res = _float_array(args[0]), _float_array(args[2])
+        kernel_filter = cast(ShapedArray[float], args[1])
+        strides_type = op.strides.type
+        assert isinstance(strides_type, TensorType)
+        (strides_shape,) = strides_type.get_shape()
+        if input is None or res is None or strides_shape != 2:
+            return super().run_pooling_nchw_max(interpreter, op, args).values
+        if res.any():
+            raise NotImplementedError()
+        stride = op.strides.get_values()[0]
+
+        m_height, m_width = input.shape[2:]
+        ky, kx = kernel_filter.shape[0], kernel_filter.shape[1]
+        image = input.reshape(-1)[: m_height * m_width].reshape(m_height, m_width)
+        out_height = len(range(0, m_height - ky + 1, stride))
+        out_width = len(range(0, m_width - kx + 1, stride))
+
+        output = np.full((out_height, out_width), -np.inf)
+        for i in range(ky):
+            for j in range(kx):
+                window = image[
+                    i : i + out_height * stride : stride,
+                    j : j + out_width * stride : stride,
+                ]
+                np.fmax(output, window, out=output)
+        res.reshape(-1)[: output.size] = output.reshape(-1)
+        if len(op.results) > 0:
+            return (args[2],)
+        return ()
+
+    @impl(linalg.Conv2DNchwFchwOp)
+    def run_conv_2d_nchw_fchw(
+        self,
+        interpreter: Interpreter,
+        op: linalg.Conv2DNchwFchwOp,
+        args: tuple[Any, ...],
+    ) -> tuple[Any, ...]:
+        input, kernel_filter, res = (_float_array(arg) for arg in args[:3])
+        if input is None or kernel_filter is None or res is None:
+            return super().run_conv_2d_nchw_fchw(interpreter, op, args).values
+        if res.any():
+            raise NotImplementedError()
+        m_height, m_width = input.shape[2:]
+        ky, kx = kernel_filter.shape[2], kernel_filter.shape[3]
+        stride = op.strides.get_values()[0]
+        image = input.reshape(-1)[: m_height * m_width].reshape(m_height, m_width)
+        kernel = kernel_filter.reshape(-1)[: ky * kx].reshape(ky, kx)
+        out_height = len(range(0, m_height - ky + 1, stride))
+        out_width = len(range(0, m_width - kx + 1, stride))
+
+        # Accumulate in the same order as a scalar sum, for the same rounding
+        output = np.zeros((out_height, out_width))
+        for i in range(ky):
+            for j in range(kx):
+                window = image[
+                    i : i + out_height * stride : stride,
+                    j : j + out_width * stride : stride,
+                ]
+                output += window.astype(np.float64) * kernel[i, j]
+        res.reshape(-1)[: output.size] = output.reshape(-1)
+        if len(op.results) > 0:
+            return (args[2],)
+        return ()
@@ -0,0 +1,471 @@
+"""
+Compilation of `pdl_interp` functions to Python closures.
+
+The compiled functions have the same semantics as running the functions with
+`PDLInterpFunctions`, but resolve operands, properties, successors, and symbols once,
+when compiling, instead of dispatching through the `Interpreter` for every operation.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any, cast
+
+from xdsl.context import Context
+from xdsl.dialects import pdl_interp
+from xdsl.dialects.builtin import StringAttr
+from xdsl.dialects.pdl import RangeType, ValueType
+from xdsl.ir import Attribute, Block, Operation, OpResult, SSAValue
+from xdsl.irdl import IRDLOperation
+from xdsl.pattern_rewriter import PatternRewriter
+from xdsl.traits import SymbolTable
+from xdsl.utils.exceptions import InterpretationError
+from xdsl.utils.hints import isa
+
+CompiledPDLInterpFunction = Callable[[PatternRewriter, Sequence[Any]], None]
+"""
+A compiled `pdl_interp.func`, taking the rewriter and the arguments of the function.
+"""
+
+_Env = list[Any]
+"""The values of a compiled function, indexed by the slot of their SSA value."""
+
+_CompiledOp = Callable[[_Env, PatternRewriter], None]
+_CompiledTerminator = Callable[[_Env, PatternRewriter], "_CompiledBlock | None"]
+
+
+@dataclass
+class _CompiledBlock:
+    ops: tuple[_CompiledOp, ...] = ()
+    terminator: _CompiledTerminator | None = None
+
+
+def _result_group(op: Operation, index: int) -> tuple[SSAValue, ...] | None:
+    """
+    Get the results of the `index`-th result definition of an operation, or `None` if
+    it has fewer definitions. Each result of an operation that is not defined with
+    IRDL is in its own group.
+    """
+    if not isinstance(op, IRDLOperation):
+        return (op.results[index],) if index < len(op.results) else None
+    result_defs = op.get_irdl_definition().results
+    if index >= len(result_defs):
+        return None
+    group: SSAValue | Sequence[SSAValue] | None = getattr(op, result_defs[index][0])
+    if group is None:
+        return ()
+    if isinstance(group, SSAValue):
+        return (group,)
+    return tuple(group)
+
+
+@dataclass
+class PDLInterpCompiler:
+    """
+    Compiles `pdl_interp` functions, such as the matcher and rewriters produced by
+    `convert-pdl-to-pdl-interp`, to Python functions that can be called directly from
+    a `RewritePattern`.
+    """
+
+    ctx: Context
+
+    native_constraints: dict[str, Callable[..., tuple[bool, tuple[Any, ...]]]] = field(
+        default_factory=lambda: {}
+    )
+    """
+    The functions that can be used in `pdl_interp.apply_constraint`. Note that we do
+    not verify that the functions are used with the correct types.
+    """
+
+    _functions: dict[pdl_interp.FuncOp, CompiledPDLInterpFunction] = field(
+        default_factory=dict[pdl_interp.FuncOp, CompiledPDLInterpFunction],
+        init=False,
+    )
+    """The compiled functions, compiled rewriters are shared between matchers."""
+
+    def compile(self, func: pdl_interp.FuncOp) -> CompiledPDLInterpFunction:
+        """Compile `func`, and the rewriters it records matches for."""
+        if (compiled := self._functions.get(func)) is not None:
+            return compiled
+
+        slots: dict[SSAValue, int] = {}
+        for block in func.body.blocks:
+            for arg in block.args:
+                slots[arg] = len(slots)
+            for op in block.ops:
+                for result in op.results:
+                    slots[result] = len(slots)
+        num_slots = len(slots)
+
+        blocks = {block: _CompiledBlock() for block in func.body.blocks}
+        for block, compiled_block in blocks.items():
+            ops = list(block.ops)
+            if not ops:
+                raise InterpretationError("Expected a terminated block")
+            compiled_block.ops = tuple(self._compile_op(op, slots) for op in ops[:-1])
+            compiled_block.terminator = self._compile_terminator(ops[-1], slots, blocks)
+
+        entry = blocks[func.body.blocks[0]]
+        num_args = len(func.body.blocks[0].args)
+        is_matcher = func.sym_name.data == "matcher"
+
+        def run(rewriter: PatternRewriter, args: Sequence[Any]) -> None:
+            if is_matcher:
+                root_op = args[0]
+                assert isinstance(root_op, Operation)
+                rewriter.current_operation = root_op
+            env: _Env = [None] * num_slots
+            env[:num_args] = args
+            block: _CompiledBlock | None = entry
+            while block is not None:
+                for compiled_op in block.ops:
+                    compiled_op(env, rewriter)
+                assert block.terminator is not None
+                block = block.terminator(env, rewriter)
+
+        self._functions[func] = run
+        return run
+
+    def _compile_op(self, op: Operation, slots: dict[SSAValue, int]) -> _CompiledOp:
+        """Compile a non-terminator operation to a closure writing its results."""
+        match op:
+            case pdl_interp.GetOperandOp():
+                index = op.index.value.data
+                src = slots[op.input_op]
+                dst = slots[op.value]
+
+                def get_operand(env: _Env, rewriter: PatternRewriter) -> None:
+                    operands = env[src].operands
+                    env[dst] = operands[index] if index < len(operands) else None
+
+                return get_operand
+            case pdl_interp.GetResultOp():
+                index = op.index.value.data
+                src = slots[op.input_op]
+                dst = slots[op.value]
+
+                def get_result(env: _Env, rewriter: PatternRewriter) -> None:
+                    results = env[src].results
+                    env[dst] = results[index] if index < len(results) else None
+
+                return get_result
+            case pdl_interp.GetResultsOp():
+                single = isinstance(op.result_types[0], ValueType)
+                src = slots[op.input_op]
+                dst = slots[op.value]
+
+                if op.index is None:
+
+                    def get_results(env: _Env, rewriter: PatternRewriter) -> None:
+                        results = env[src].results
+                        env[dst] = None if single and len(results) != 1 else results
+
+                    return get_results
+
+                group_index = op.index.value.data
+
+                def get_result_group(env: _Env, rewriter: PatternRewriter) -> None:
+                    group = _result_group(env[src], group_index)
+                    if group is None or (single and len(group) != 1):
+                        env[dst] = None
+                    else:
+                        env[dst] = group[0] if single else group
+
+                return get_result_group
+            case pdl_interp.GetAttributeOp():
+                name = op.constraint_name.data
+                src = slots[op.input_op]
+                dst = slots[op.value]
+
+                def get_attribute(env: _Env, rewriter: PatternRewriter) -> None:
+                    input_op: Operation = env[src]
+                    if name in input_op.attributes:
+                        env[dst] = input_op.attributes[name]
+                    else:
+                        env[dst] = input_op.properties.get(name)
+
+                return get_attribute
+            case pdl_interp.GetValueTypeOp():
+                src = slots[op.value]
+                dst = slots[op.result]
+
+                def get_value_type(env: _Env, rewriter: PatternRewriter) -> None:
+                    env[dst] = env[src].type
+
+                return get_value_type
+            case pdl_interp.GetDefiningOpOp():
+                src = slots[op.value]
+                dst = slots[op.input_op]
+
+                def get_defining_op(env: _Env, rewriter: PatternRewriter) -> None:
+                    value = env[src]
+                    env[dst] = value.owner if isinstance(value, OpResult) else None
+
+                return get_defining_op
+            case pdl_interp.CreateAttributeOp():
+                return _constant(op.value, slots[op.attribute])
+            case pdl_interp.CreateTypeOp():
+                return _constant(op.value, slots[op.result])
+            case pdl_interp.CreateTypesOp():
+                types = op.value.data
+                dst = slots[op.result]
+
+                def create_types(env: _Env, rewriter: PatternRewriter) -> None:
+                    env[dst] = list(types)
+
+                return create_types
+            case pdl_interp.CreateOperationOp():
+                return self._compile_create_operation(op, slots)
+            case pdl_interp.ReplaceOp():
+                src = slots[op.input_op]
+                repl_values = tuple(
+                    (slots[value], isa(value.type, RangeType[ValueType]))
+                    for value in op.repl_values
+                )
+
+                def replace(env: _Env, rewriter: PatternRewriter) -> None:
+                    input_op: Operation = env[src]
+                    new_results: list[SSAValue] = []
+                    for slot, is_range in repl_values:
+                        if is_range:
+                            new_results.extend(env[slot])
+                        else:
+                            new_results.append(env[slot])
+                    if len(input_op.results) != len(new_results):
+                        raise InterpretationError(
+                            "Number of replacement values should match number of "
+                            "results"
+                        )
+                    rewriter.replace_op(input_op, new_ops=[], new_results=new_results)
+
+                return replace
+            case _:
+                raise InterpretationError(
+                    f"Cannot compile operation {op.name} in a pdl_interp function"
+                )
+
+    def _compile_create_operation(
+        self, op: pdl_interp.CreateOperationOp, slots: dict[SSAValue, int]
+    ) -> _CompiledOp:
+        op_name = op.constraint_name.data
+        op_type = self.ctx.get_optional_op(op_name)
+        dst = slots[op.result_op]
+
+        if op_type is None:
+
+            def unknown_operation(env: _Env, rewriter: PatternRewriter) -> None:
+                raise InterpretationError(
+                    f"Could not find op type for name {op_name} in context"
+                )
+
+            return unknown_operation
+
+        assert issubclass(op_type, IRDLOperation)
+        existing_properties = op_type.get_irdl_definition().properties.keys()
+        attr_names = tuple(
+            cast(StringAttr, name).data for name in op.input_attribute_names.data
+        )
+        operands = tuple(slots[operand] for operand in op.input_operands)
+        attributes = tuple(
+            (name, slots[attr], name in existing_properties)
+            for name, attr in zip(attr_names, op.input_attributes)
+        )
+        result_types = tuple(slots[result] for result in op.input_result_types)
+
+        def create_operation(env: _Env, rewriter: PatternRewriter) -> None:
+            new_attributes: dict[str, Attribute] = {}
+            new_properties: dict[str, Attribute] = {}
+            for name, slot, is_property in attributes:
+                if is_property:
+                    new_properties[name] = env[slot]
+                else:
+                    new_attributes[name] = env[slot]
+            result_op = op_type.create(
+                operands=[env[slot] for slot in operands],
+                result_types=[env[slot] for slot in result_types],
+                attributes=new_attributes,
+                properties=new_properties,
+            )
+            rewriter.insert_op_before_matched_op(result_op)
+            env[dst] = result_op
+
+        return create_operation
+
+    def _compile_terminator(
+        self,
+        op: Operation,
+        slots: dict[SSAValue, int],
+        blocks: dict[Block, _CompiledBlock],
+    ) -> _CompiledTerminator:
+        """
+        Compile a terminator to a closure returning the next block, or `None` if the
+        function returns.
+        """
+        match op:
+            case pdl_interp.FinalizeOp():
+
+                def finalize(env: _Env, rewriter: PatternRewriter) -> None:
+                    return None
+
+                return finalize
+            case pdl_interp.CheckOperationNameOp():
+                name = op.operation_name.data
+                src = slots[op.input_op]
+                true_dest = blocks[op.true_dest]
+                false_dest = blocks[op.false_dest]
+
+                def check_operation_name(
+                    env: _Env, rewriter: PatternRewriter
+                ) -> _CompiledBlock:
+                    return true_dest if env[src].name == name else false_dest
+
+                return check_operation_name
+            case pdl_interp.CheckOperandCountOp() | pdl_interp.CheckResultCountOp():
+                count = op.count.value.data
+                at_least = "compareAtLeast" in op.properties
+                uses_operands = isinstance(op, pdl_interp.CheckOperandCountOp)
+                src = slots[op.input_op]
+                true_dest = blocks[op.true_dest]
+                false_dest = blocks[op.false_dest]
+
+                def check_count(env: _Env, rewriter: PatternRewriter) -> _CompiledBlock:
+                    input_op: Operation = env[src]
+                    actual = len(
+                        input_op.operands if uses_operands else input_op.results
+                    )
+                    cond = actual >= count if at_least else actual == count
+                    return true_dest if cond else false_dest
+
+                return check_count
+            case pdl_interp.SwitchOperationNameOp():
+                src = slots[op.input_op]
+                # The first case of a name is the one that is taken
+                cases = {
+                    name.data: blocks[block]
+                    for name, block in reversed(tuple(zip(op.case_values, op.cases)))
+                }
+                default_dest = blocks[op.default_dest]
+
+                def switch_operation_name(
+                    env: _Env, rewriter: PatternRewriter
+                ) -> _CompiledBlock:
+                    return cases.get(env[src].name, default_dest)
+
+                return switch_operation_name
+            case pdl_interp.SwitchAttributeOp():
+                src = slots[op.attribute]
+                attr_cases = tuple(
+                    (value, blocks[block])
+                    for value, block in zip(op.caseValues.data, op.cases)
+                )
+                default_dest = blocks[op.defaultDest]
+
+                def switch_attribute(
+                    env: _Env, rewriter: PatternRewriter
+                ) -> _CompiledBlock:
+                    attribute = env[src]
+                    for value, block in attr_cases:
+                        if attribute == value:
+                            return block
+                    return default_dest
+
+                return switch_attribute
+            case pdl_interp.CheckAttributeOp():
+                return _compare_constant(
+                    slots[op.attribute],
+                    op.constantValue,
+                    blocks[op.true_dest],
+                    blocks[op.false_dest],
+                )
+            case pdl_interp.CheckTypeOp():
+                return _compare_constant(
+                    slots[op.value],
+                    op.type,
+                    blocks[op.true_dest],
+                    blocks[op.false_dest],
+                )
+            case pdl_interp.IsNotNullOp():
+                src = slots[op.value]
+                true_dest = blocks[op.true_dest]
+                false_dest = blocks[op.false_dest]
+
+                def is_not_null(env: _Env, rewriter: PatternRewriter) -> _CompiledBlock:
+                    return true_dest if env[src] is not None else false_dest
+
+                return is_not_null
+            case pdl_interp.AreEqualOp():
+                lhs = slots[op.lhs]
+                rhs = slots[op.rhs]
+                true_dest = blocks[op.true_dest]
+                false_dest = blocks[op.false_dest]
+
+                def are_equal(env: _Env, rewriter: PatternRewriter) -> _CompiledBlock:
+                    return true_dest if env[lhs] == env[rhs] else false_dest
+
+                return are_equal
+            case pdl_interp.ApplyConstraintOp():
+                return self._compile_apply_constraint(op, slots, blocks)
+            case pdl_interp.RecordMatchOp():
+                rewriter_func = SymbolTable.lookup_symbol(op, op.rewriter)
+                if not isinstance(rewriter_func, pdl_interp.FuncOp):
+                    raise InterpretationError(
+                        f"Could not find rewriter function {op.rewriter}"
+                    )
+                compiled_rewriter = self.compile(rewriter_func)
+                args = tuple(slots[arg] for arg in op.operands)
+                dest = blocks[op.dest]
+
+                def record_match(
+                    env: _Env, rewriter: PatternRewriter
+                ) -> _CompiledBlock:
+                    compiled_rewriter(rewriter, [env[slot] for slot in args])
+                    return dest
+
+                return record_match
+            case _:
+                raise InterpretationError(
+                    f"Cannot compile operation {op.name} in a pdl_interp function"
+                )
+
+    def _compile_apply_constraint(
+        self,
+        op: pdl_interp.ApplyConstraintOp,
+        slots: dict[SSAValue, int],
+        blocks: dict[Block, _CompiledBlock],
+    ) -> _CompiledTerminator:
+        constraint_name = op.constraint_name.data
+        native_constraints = self.native_constraints
+        is_negated = bool(op.is_negated)
+        args = tuple(slots[arg] for arg in op.args)
+        results = tuple(slots[result] for result in op.results_)
+        true_dest = blocks[op.true_dest]
+        false_dest = blocks[op.false_dest]
+
+        def apply_constraint(env: _Env, rewriter: PatternRewriter) -> _CompiledBlock:
+            if constraint_name not in native_constraints:
+                raise InterpretationError(
+                    f"Unknown constraint function: {constraint_name}"
+                )
+            passed, values = native_constraints[constraint_name](
+                *(env[slot] for slot in args)
+            )
+            for slot, value in zip(results, values, strict=True):
+                env[slot] = value
+            return true_dest if passed != is_negated else false_dest
+
+        return apply_constraint
+
+
+def _constant(value: Any, dst: int) -> _CompiledOp:
+    def constant(env: _Env, rewriter: PatternRewriter) -> None:
+        env[dst] = value
+
+    return constant
+
+
+def _compare_constant(
+    src: int, value: Attribute, true_dest: _CompiledBlock, false_dest: _CompiledBlock
+) -> _CompiledTerminator:
+    def compare_constant(env: _Env, rewriter: PatternRewriter) -> _CompiledBlock:
+        return true_dest if env[src] == value else false_dest
+
+    return compare_constant
@@ -5,13 +5,16 @@ from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 from itertools import accumulate, product
 from math import prod
-from typing import Generic
+from typing import TYPE_CHECKING, Any, Generic
 
 from typing_extensions import Self, TypeVar
 
-from xdsl.dialects.builtin import PackableType, ShapedType
+from xdsl.dialects.builtin import PackableType, ShapedType, StructPackableType
 from xdsl.interpreters.utils.ptr import TypedPtr
 
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
 _T = TypeVar("_T")
 
 
@@ -47,6 +50,22 @@ class ShapedArray(Generic[_T]):
     def with_shape(self, new_shape: Sequence[int]) -> Self:
         return type(self)(self._data.copy(), list(new_shape))
 
+    def as_ndarray(self) -> NDArray[Any]:
+        """
+        Returns a NumPy array of this shape viewing the same memory, so that stores to
+        either are visible in both.
+        Requires NumPy to be installed.
+        """
+        import numpy as np
+
+        xtype = self.element_type
+        if not isinstance(xtype, StructPackableType):
+            raise NotImplementedError(f"Cannot view {xtype} elements as a NumPy array")
+        raw = self._data.raw
+        return np.frombuffer(
+            raw.memory, dtype=xtype.format, count=self.size, offset=raw.offset
+        ).reshape(self.shape)
+
     def offset(self, index: Sequence[int]) -> int:
         """
         Returns the index of the element in `self.data` for a given tuple of indices
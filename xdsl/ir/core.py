@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 import re
 from abc import ABC, abstractmethod
 from collections.abc import (
@@ -11,6 +12,7 @@ from collections.abc import (
     Reversible,
     Sequence,
 )
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from io import StringIO
 from itertools import chain
@@ -31,7 +33,13 @@ from typing import (
 from typing_extensions import Self, TypeVar
 
 from xdsl.dialect_interfaces import DialectInterface
-from xdsl.traits import IsTerminator, NoTerminator, OpTrait, OpTraitInvT
+from xdsl.traits import (
+    IsTerminator,
+    NoTerminator,
+    OpTrait,
+    OpTraitInvT,
+    cached_symbol_lookups,
+)
 from xdsl.utils.exceptions import VerifyException
 from xdsl.utils.str_enum import StrEnum
 
@@ -215,7 +223,17 @@ class Data(Attribute, ABC, Generic[DataElement]):
         This function should be preferred over `__init__` when instantiating
         attributes in a generic way (i.e., without knowing their concrete type
         statically).
+
+        If an `AttributeUniquer` is active, an existing structurally identical
+        attribute is returned instead of a new one.
         """
+        if _attribute_uniquer is not None:
+            return _attribute_uniquer.get_or_create(cls, params)
+        return cls._create(params)
+
+    @classmethod
+    def _create(cls: type[Self], params: Any) -> Self:
+        """Create a new `Data` given its parameter, bypassing attribute uniquing."""
         # Create the new attribute object, without calling its __init__.
         # We do this to allow users to redefine their own __init__.
         attr = cls.__new__(cls)
@@ -454,6 +472,19 @@ class ParametrizedAttribute(Attribute):
         This function should be preferred over `__init__` when instantiating
         attributes in a generic way (i.e., without knowing their concrete type
         statically).
+
+        If an `AttributeUniquer` is active, an existing structurally identical
+        attribute is returned instead of a new one.
+        """
+        if _attribute_uniquer is not None:
+            return _attribute_uniquer.get_or_create(cls, tuple(params))
+        return cls._create(params)
+
+    @classmethod
+    def _create(cls: type[Self], params: Sequence[Attribute]) -> Self:
+        """
+        Create a new `ParametrizedAttribute` given its parameters, bypassing
+        attribute uniquing.
         """
         # Create the new attribute object, without calling its __init__.
         # We do this to allow users to redefine their own __init__.
@@ -515,6 +546,152 @@ class TypedAttribute(ParametrizedAttribute, ABC):
     def print_without_type(self, printer: Printer): ...
 
 
+class AttributeUniquer:
+    """
+    A uniquing table for attributes, keyed on their class and parameters.
+
+    While a uniquer is active (see `uniqued_attributes`), `Data.new`,
+    `ParametrizedAttribute.new` and the `AttrParser` return a single shared
+    instance for structurally identical attributes. Each distinct attribute is
+    then only constructed and verified once, and equality checks between uniqued
+    attributes reduce to identity checks on their parameters.
+
+    Attributes created through their `__init__` are not uniqued automatically,
+    but can be added to the table with `unique`.
+    """
+
+    _attributes: dict[Hashable, Attribute]
+    """Uniqued attributes, keyed on their class and canonical parameters."""
+
+    _uniqued_ids: set[int]
+    """
+    Ids of the attributes in the table.
+    The table keeps these attributes alive, so their ids are stable.
+    """
+
+    def __init__(self) -> None:
+        self._attributes = {}
+        self._uniqued_ids = set()
+
+    def __len__(self) -> int:
+        return len(self._attributes)
+
+    def __contains__(self, attr: Attribute) -> bool:
+        return id(attr) in self._uniqued_ids
+
+    def clear(self) -> None:
+        """Remove all attributes from the table."""
+        self._attributes.clear()
+        self._uniqued_ids.clear()
+
+    def _canonicalize(self, param: Any) -> tuple[Hashable, Any]:
+        """
+        Return a uniquing key for an attribute parameter, along with the
+        parameter where all nested attributes are replaced by their uniqued
+        instance.
+        Nested attributes are keyed on their identity, so that attributes that
+        compare equal without being identical (e.g. `0.0` and `-0.0`) are not
+        merged.
+        """
+        if isinstance(param, Attribute):
+            param = self.unique(param)
+            return id(param), param
+        if isinstance(param, float):
+            # `0.0 == -0.0`, so the sign has to be part of the key
+            return (float, param, math.copysign(1.0, param)), param
+        if type(param) is tuple:
+            items = tuple(self._canonicalize(p) for p in cast(tuple[Any, ...], param))
+            return (tuple, *(k for k, _ in items)), tuple(v for _, v in items)
+        if isinstance(param, Mapping):
+            mapping = cast(Mapping[Any, Any], param)
+            mapping_type = cast(
+                Callable[[Iterable[tuple[Any, Any]]], Any], type(mapping)
+            )
+            items = tuple((k, *self._canonicalize(v)) for k, v in mapping.items())
+            return (
+                (mapping_type, *((k, key) for k, key, _ in items)),
+                mapping_type((k, v) for k, _, v in items),
+            )
+        return (cast(type[Any], type(param)), param), param
+
+    def _insert(self, key: Hashable, attr: Attribute) -> None:
+        self._attributes[key] = attr
+        self._uniqued_ids.add(id(attr))
+
+    def get_or_create(self, cls: type[AttributeInvT], params: Any) -> AttributeInvT:
+        """
+        Return the uniqued attribute of class `cls` with the given parameters,
+        creating and verifying it if it is not in the table yet.
+        `params` is the parameter of a `Data`, or the tuple of parameters of a
+        `ParametrizedAttribute`.
+        """
+        attr_cls = cast(type[Data[Any]] | type[ParametrizedAttribute], cls)
+        create = cast(
+            Callable[[Any], AttributeInvT],
+            attr_cls._create,  # pyright: ignore[reportPrivateUsage]
+        )
+        try:
+            param_key, params = self._canonicalize(params)
+            key: Hashable = (cls, param_key)
+            if (attr := self._attributes.get(key)) is not None:
+                return cast(AttributeInvT, attr)
+        except TypeError:
+            # Unhashable parameters cannot be uniqued.
+            return create(params)
+        attr = create(params)
+        self._insert(key, attr)
+        return attr
+
+    def unique(self, attr: AttributeInvT) -> AttributeInvT:
+        """
+        Return the uniqued attribute structurally identical to `attr`, adding
+        `attr` to the table if there is none yet.
+        """
+        if id(attr) in self._uniqued_ids:
+            return attr
+        if isinstance(attr, ParametrizedAttribute):
+            params = attr.parameters
+        else:
+            params = cast(Data[Any], attr).data
+        try:
+            key = (type(attr), self._canonicalize(params)[0])
+        except TypeError:
+            # Unhashable parameters cannot be uniqued.
+            return attr
+        if (existing := self._attributes.get(key)) is not None:
+            return cast(AttributeInvT, existing)
+        self._insert(key, attr)
+        return attr
+
+
+_attribute_uniquer: AttributeUniquer | None = None
+"""The currently active attribute uniquer, if any."""
+
+
+def get_attribute_uniquer() -> AttributeUniquer | None:
+    """Return the currently active attribute uniquer, if any."""
+    return _attribute_uniquer
+
+
+@contextmanager
+def uniqued_attributes(
+    uniquer: AttributeUniquer | None = None,
+) -> Iterator[AttributeUniquer]:
+    """
+    Activate an attribute uniquer for the duration of the context.
+    A new uniquer is created if none is given.
+    """
+    global _attribute_uniquer
+    if uniquer is None:
+        uniquer = AttributeUniquer()
+    previous = _attribute_uniquer
+    _attribute_uniquer = uniquer
+    try:
+        yield uniquer
+    finally:
+        _attribute_uniquer = previous
+
+
 @dataclass
 class Use:
     """The use of a SSA value."""
@@ -1001,6 +1178,13 @@ class OpTraits(Iterable[OpTrait]):
         return isinstance(value, OpTraits) and self.traits == value.traits
 
 
+_OP_ORDER_STRIDE = 5
+"""The gap left between the order indices of consecutive operations in a block."""
+
+_INVALID_OP_ORDER_INDEX = -1
+"""The order index of an operation whose position in its block is not numbered."""
+
+
 @dataclass(eq=False, unsafe_hash=False)
 class Operation(_IRNode):
     """A generic operation. Operation definitions inherit this class."""
@@ -1056,6 +1240,15 @@ class Operation(_IRNode):
     _prev_op: Operation | None = field(default=None, repr=False)
     """Previous operation in block containing this operation."""
 
+    _order_index: int = field(default=_INVALID_OP_ORDER_INDEX, repr=False)
+    """
+    The sparse index of this operation in its parent block.
+    Indices increase along the block, but are not contiguous, so that operations
+    inserted between two numbered operations can usually be numbered without
+    renumbering the whole block.
+    Only meaningful if the parent block order is valid.
+    """
+
     traits: ClassVar[OpTraits]
     """
     Traits attached to an operation definition.
@@ -1301,24 +1494,69 @@ class Operation(_IRNode):
             return self.attributes[name]
         return None
 
+    def _get_order_index(self) -> int:
+        """
+        Return the order index of this operation in its parent block, numbering
+        it from its neighbours, or renumbering the whole block, if necessary.
+        The operation should be attached to a block.
+        """
+        block = self.parent
+        assert block is not None
+        if not block._is_op_order_valid:  # pyright: ignore[reportPrivateUsage]
+            block._recompute_op_order()  # pyright: ignore[reportPrivateUsage]
+            return self._order_index
+        if self._order_index != _INVALID_OP_ORDER_INDEX:
+            return self._order_index
+
+        prev_op = self._prev_op
+        next_op = self._next_op
+        if prev_op is None and next_op is None:
+            # Only operation in the block
+            self._order_index = _OP_ORDER_STRIDE
+            return self._order_index
+
+        prev_index = 0 if prev_op is None else prev_op._order_index
+        if next_op is None:
+            if prev_index != _INVALID_OP_ORDER_INDEX:
+                self._order_index = prev_index + _OP_ORDER_STRIDE
+                return self._order_index
+        else:
+            next_index = next_op._order_index
+            if (
+                prev_index != _INVALID_OP_ORDER_INDEX
+                and next_index != _INVALID_OP_ORDER_INDEX
+                and prev_index + 1 < next_index
+            ):
+                self._order_index = prev_index + (next_index - prev_index) // 2
+                return self._order_index
+
+        # There is no free index between the neighbours, renumber the block.
+        block._recompute_op_order()  # pyright: ignore[reportPrivateUsage]
+        return self._order_index
+
     def is_before_in_block(self, other_op: Operation) -> bool:
         """
         Return true if the current operation is located strictly before other_op.
         False otherwise.
+        This is amortised O(1), using the order indices maintained by the block.
         """
         if (
             parent_block := self.parent_block()
         ) is None or other_op.parent_block() is not parent_block:
             return False
 
-        op = self.next_op
-        while op is not None:
-            if op is other_op:
-                return True
-            op = op.next_op
-        return False
+        return self._get_order_index() < other_op._get_order_index()
 
     def verify(self, verify_nested_ops: bool = True) -> None:
+        if verify_nested_ops and self.parent is None:
+            # The IR is not modified during verification, so the symbols looked up
+            # by the nested operations can be cached
+            with cached_symbol_lookups():
+                self._verify_op(verify_nested_ops)
+        else:
+            self._verify_op(verify_nested_ops)
+
+    def _verify_op(self, verify_nested_ops: bool) -> None:
         for operand in self.operands:
             if isinstance(operand, ErasedSSAValue):
                 raise ValueError("Erased SSA value is used by the operation")
@@ -1691,6 +1929,20 @@ class Block(_IRNode, IRWithUses, IRWithName):
     parent: Region | None = field(default=None, repr=False)
     """Parent region containing the block."""
 
+    _is_op_order_valid: bool = field(default=False, repr=False)
+    """
+    Whether the order indices of the numbered operations in the block are
+    increasing along the block.
+    Operations inserted since the last renumbering may still be unnumbered.
+    """
+
+    _is_op_order_dense: bool = field(default=False, repr=False)
+    """
+    Whether the block has not been modified since its operations were last
+    renumbered, in which case the position of an operation can be derived from
+    its order index.
+    """
+
     @staticmethod
     def is_default_block_name(name: str) -> bool:
         """Check if a name matches the default block naming pattern (bb followed by digits)."""
@@ -1709,6 +1961,8 @@ class Block(_IRNode, IRWithUses, IRWithName):
         )
         self._first_op = None
         self._last_op = None
+        self._is_op_order_valid = False
+        self._is_op_order_dense = False
 
         self.add_ops(ops)
 
@@ -1797,6 +2051,19 @@ class Block(_IRNode, IRWithUses, IRWithName):
                 "Can't add an operation to a block contained in the operation."
             )
         operation.parent = self
+        operation._order_index = _INVALID_OP_ORDER_INDEX  # pyright: ignore[reportPrivateUsage]
+        self._is_op_order_dense = False
+
+    def _recompute_op_order(self) -> None:
+        """Renumber all operations in the block with evenly spaced order indices."""
+        index = 0
+        op = self._first_op
+        while op is not None:
+            index += _OP_ORDER_STRIDE
+            op._order_index = index  # pyright: ignore[reportPrivateUsage]
+            op = op._next_op  # pyright: ignore[reportPrivateUsage]
+        self._is_op_order_valid = True
+        self._is_op_order_dense = True
 
     @property
     def is_empty(self) -> bool:
@@ -1924,6 +2191,7 @@ class Block(_IRNode, IRWithUses, IRWithName):
         # Update first and last ops of self
         self._first_op = a_first
         self._last_op = a_last
+        self._is_op_order_dense = False
 
         b = Block(arg_types=arg_types)
         a_index = parent.get_block_index(self)
@@ -1948,10 +2216,16 @@ class Block(_IRNode, IRWithUses, IRWithName):
         return b
 
     def get_operation_index(self, op: Operation) -> int:
-        """Get the operation position in a block."""
+        """
+        Get the operation position in a block.
+        This is O(1) if the block was not modified since the last call, and O(n)
+        otherwise.
+        """
         if op.parent is not self:
             raise ValueError("Operation is not a child of the block.")
-        return next(idx for idx, block_op in enumerate(self.ops) if block_op is op)
+        if not self._is_op_order_dense:
+            self._recompute_op_order()
+        return op._order_index // _OP_ORDER_STRIDE - 1  # pyright: ignore[reportPrivateUsage]
 
     def detach_op(self, op: Operation) -> Operation:
         """
@@ -1961,6 +2235,7 @@ class Block(_IRNode, IRWithUses, IRWithName):
         if op.parent is not self:
             raise ValueError("Cannot detach operation from a different block.")
         op.parent = None
+        self._is_op_order_dense = False
 
         prev_op = op.prev_op
         next_op = op.next_op
@@ -2020,13 +2295,14 @@ class Block(_IRNode, IRWithUses, IRWithName):
         if reverse:
             yield self
 
-    def verify(self) -> None:
+    def verify(self, verify_nested_ops: bool = True) -> None:
         for operation in self.ops:
             if operation.parent != self:
                 raise ValueError(
                     "Parent pointer of operation does not refer to containing region"
                 )
-            operation.verify()
+            if verify_nested_ops:
+                operation.verify()
 
         if len(self.ops) == 0:
             if (region_parent := self.parent) is not None and (
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Mapping, Sequence
+from collections.abc import Callable, Mapping, Sequence
 from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
 from typing import (
@@ -158,6 +158,15 @@ class AttrConstraint(ABC, Generic[AttributeCovT]):
         """
         return None
 
+    def get_predicate(self) -> Callable[[Attribute], bool] | None:
+        """
+        Get a function returning whether an attribute satisfies this constraint, if
+        the constraint can be checked without constraint variables, or None
+        otherwise.
+        This is used to build verifiers specialised to an operation definition.
+        """
+        return None
+
     def __or__(
         self, value: AttrConstraint[_AttributeCovT], /
     ) -> AttrConstraint[AttributeCovT | _AttributeCovT]:
@@ -351,6 +360,10 @@ class EqAttrConstraint(AttrConstraint[AttributeCovT], Generic[AttributeCovT]):
     def get_bases(self) -> set[type[Attribute]] | None:
         return {type(self.attr)}
 
+    def get_predicate(self) -> Callable[[Attribute], bool] | None:
+        expected = self.attr
+        return lambda attr: attr is expected or attr == expected
+
     def mapping_type_vars(
         self, type_var_mapping: Mapping[TypeVar, AttrConstraint | IntConstraint]
     ) -> AttrConstraint[AttributeCovT]:
@@ -394,6 +407,10 @@ class BaseAttr(AttrConstraint[AttributeCovT], Generic[AttributeCovT]):
             return {self.attr}
         return None
 
+    def get_predicate(self) -> Callable[[Attribute], bool] | None:
+        base = self.attr
+        return lambda attr: isinstance(attr, base)
+
     def mapping_type_vars(
         self, type_var_mapping: Mapping[TypeVar, AttrConstraint | IntConstraint]
     ) -> AttrConstraint[AttributeCovT]:
@@ -424,6 +441,9 @@ class AnyAttr(AttrConstraint):
     ) -> None:
         pass
 
+    def get_predicate(self) -> Callable[[Attribute], bool] | None:
+        return lambda attr: True
+
     def mapping_type_vars(
         self, type_var_mapping: Mapping[TypeVar, AttrConstraint | IntConstraint]
     ) -> AnyAttr:
@@ -555,6 +575,19 @@ class AnyOf(AttrConstraint[AttributeCovT], Generic[AttributeCovT]):
             return
         raise VerifyException(f"Unexpected attribute {attr}")
 
+    def get_predicate(self) -> Callable[[Attribute], bool] | None:
+        if all(isinstance(c, BaseAttr) for c in self.attr_constrs):
+            bases = tuple(cast(BaseAttr, c).attr for c in self.attr_constrs)
+            return lambda attr: isinstance(attr, bases)
+        # The constraints are disjoint, so checking all of them is equivalent to
+        # dispatching on the attribute
+        preds: list[Callable[[Attribute], bool]] = []
+        for constr in self.attr_constrs:
+            if (pred := constr.get_predicate()) is None:
+                return None
+            preds.append(pred)
+        return lambda attr: any(pred(attr) for pred in preds)
+
     def __or__(
         self, value: AttrConstraint[_AttributeCovT], /
     ) -> AnyOf[AttributeCovT | _AttributeCovT]:
@@ -629,6 +662,14 @@ class AllOf(AttrConstraint[AttributeCovT]):
                 return constr.infer(context)
         raise ValueError("Cannot infer attribute from constraint")
 
+    def get_predicate(self) -> Callable[[Attribute], bool] | None:
+        preds: list[Callable[[Attribute], bool]] = []
+        for constr in self.attr_constrs:
+            if (pred := constr.get_predicate()) is None:
+                return None
+            preds.append(pred)
+        return lambda attr: all(pred(attr) for pred in preds)
+
     def get_bases(self) -> set[type[Attribute]] | None:
         bases: set[type[Attribute]] | None = None
         for constr in self.attr_constrs:
@@ -729,6 +770,22 @@ class ParamAttrConstraint(
             return {self.base_attr}
         return None
 
+    def get_predicate(self) -> Callable[[Attribute], bool] | None:
+        base_attr = self.base_attr
+        num_params = len(self.param_constrs)
+        param_preds: list[tuple[int, Callable[[Attribute], bool]]] = []
+        for i, constr in enumerate(self.param_constrs):
+            if isinstance(constr, AnyAttr):
+                continue
+            if (pred := constr.get_predicate()) is None:
+                return None
+            param_preds.append((i, pred))
+        return lambda attr: (
+            isinstance(attr, base_attr)
+            and len(attr.parameters) == num_params
+            and all(pred(attr.parameters[i]) for i, pred in param_preds)
+        )
+
     def mapping_type_vars(
         self, type_var_mapping: Mapping[TypeVar, AttrConstraint | IntConstraint]
     ) -> ParamAttrConstraint[ParametrizedAttributeCovT]:
@@ -791,6 +848,9 @@ class MessageConstraint(AttrConstraint[AttributeCovT]):
     def get_bases(self) -> set[type[Attribute]] | None:
         return self.constr.get_bases()
 
+    def get_predicate(self) -> Callable[[Attribute], bool] | None:
+        return self.constr.get_predicate()
+
     def can_infer(self, var_constraint_names: AbstractSet[str]) -> bool:
         return self.constr.can_infer(var_constraint_names)
 
@@ -1,14 +1,53 @@
+from collections.abc import Sequence
+
 from xdsl.ir import Block, Region
 
 
+def _block_successors(block: Block) -> Sequence[Block]:
+    """The control-flow successors of a block."""
+    if (last_op := block.last_op) is None:
+        return ()
+    return last_op.successors
+
+
 class DominanceInfo:
     """
-    Computes and exposes the dominance relation amongst blocks of a region.
+    Computes and exposes the dominance relation amongst blocks of a region, as a
+    dominator tree.
+
+    The tree is computed with the Cooper-Harvey-Kennedy iterative algorithm over a
+    reverse post-order of the control-flow graph. Dominance queries are answered in
+    O(1) using a depth-first numbering of the tree.
+
+    Blocks that are unreachable from the entry block are grouped into their own
+    trees, rooted at the first unreachable block in region order. A block in one
+    tree never dominates a block in another.
 
     See external [documentation](https://en.wikipedia.org/w/index.php?title=Dominator_(graph_theory)&oldid=1189814332).
     """
 
-    _dominance: dict[Block, set[Block]]
+    _region: Region
+
+    _idom: dict[Block, Block | None]
+    """The immediate dominator of each block, `None` for the roots of the trees."""
+
+    _children: dict[Block | None, list[Block]]
+    """The children of each block in the tree, the roots being children of `None`."""
+
+    _tree_index: dict[Block, int]
+    """The index of the tree each block belongs to, `0` being the entry block tree."""
+
+    _level: dict[Block, int]
+    """The depth of each block in the tree, roots being at depth `1`."""
+
+    _dfs_in: dict[Block, int]
+    """The pre-order number of each block in a depth-first walk of the tree."""
+
+    _dfs_out: dict[Block, int]
+    """The post-order number of each block in a depth-first walk of the tree."""
+
+    _frontiers: dict[Block, set[Block]] | None
+    """The dominance frontiers, computed lazily."""
 
     def __init__(self, region: Region):
         """
@@ -16,46 +55,148 @@ class DominanceInfo:
 
         See external [documentation](https://en.wikipedia.org/w/index.php?title=Dominator_(graph_theory)&oldid=1189814332).
         """
+        self._region = region
+        self.recompute()
 
-        self._dominance = {}
+    # Control-flow graph, overridden to compute post-dominance
 
-        # No block, no work
-        if not (region.blocks):
-            return
+    def _successors(self, block: Block) -> Sequence[Block]:
+        """The successors of a block in the graph the tree is computed on."""
+        return _block_successors(block)
+
+    def _predecessors(self, block: Block) -> Sequence[Block]:
+        """The predecessors of a block in the graph the tree is computed on."""
+        return block.predecessors()
+
+    def _roots(self) -> Sequence[Block]:
+        """The blocks from which the first tree is computed."""
+        first = self._region.blocks.first
+        return () if first is None else (first,)
+
+    def _unreachable_candidates(self) -> Sequence[Block]:
+        """The order in which blocks are picked as roots of additional trees."""
+        return self._region.blocks
+
+    # Construction
+
+    def recompute(self) -> None:
+        """Recompute the tree from scratch."""
+        self._idom = {}
+        self._children = {None: []}
+        self._tree_index = {}
+        self._frontiers = None
 
-        # Build the preceding relationship
-        pred: dict[Block, set[Block]] = {}
-        for b in region.blocks:
-            pred[b] = set()
-        for b in region.blocks:
-            if b.last_op is not None:
-                for s in b.last_op.successors:
-                    pred[s].add(b)
+        # Post-order of the graph, built with one depth-first search per tree.
+        post_order: list[Block] = []
+        tree_roots: list[list[Block]] = []
+        visited: set[Block] = set()
 
-        # Get entry and other blocks
-        entry, *blocks = region.blocks
+        def visit(roots: Sequence[Block]) -> None:
+            tree = len(tree_roots)
+            tree_roots.append([])
+            for root in roots:
+                if root in visited:
+                    continue
+                tree_roots[tree].append(root)
+                visited.add(root)
+                self._tree_index[root] = tree
+                stack = [(root, iter(self._successors(root)))]
+                while stack:
+                    block, successors = stack[-1]
+                    for successor in successors:
+                        if successor not in visited:
+                            visited.add(successor)
+                            self._tree_index[successor] = tree
+                            stack.append((successor, iter(self._successors(successor))))
+                            break
+                    else:
+                        stack.pop()
+                        post_order.append(block)
 
-        # The entry block is only dominated by itself
-        self._dominance[entry] = {entry}
+        visit(self._roots())
+        for block in self._unreachable_candidates():
+            if block not in visited:
+                visit((block,))
 
-        # Instantiate other blocks dominators to all blocks
-        for b in blocks:
-            self._dominance[b] = set(region.blocks)
+        # Iterate over the reverse post-order until convergence, using integer
+        # indices, where the virtual root that dominates all trees is `len(blocks)`.
+        index = {block: i for i, block in enumerate(post_order)}
+        root = len(post_order)
+        idom = [-1] * (root + 1)
+        idom[root] = root
+        roots = {block for tree in tree_roots for block in tree}
+        for block in roots:
+            idom[index[block]] = root
+
+        preds = [
+            [
+                index[pred]
+                for pred in self._predecessors(block)
+                if pred in index and self._tree_index[pred] == self._tree_index[block]
+            ]
+            for block in post_order
+        ]
 
-        # Iteratively filter out dominators until it converges
         changed = True
         while changed:
             changed = False
-            for b in blocks:
-                old = self._dominance[b].copy()
-                self._dominance[b] = {b} | (
-                    set[Block].intersection(*(self._dominance[p] for p in pred[b]))
-                    if pred[b]
-                    else set()
-                )
-                if old != self._dominance[b]:
+            for i in range(root - 1, -1, -1):
+                if post_order[i] in roots:
+                    continue
+                new_idom = -1
+                for pred in preds[i]:
+                    if idom[pred] == -1:
+                        continue
+                    if new_idom == -1:
+                        new_idom = pred
+                        continue
+                    # Intersect the two dominator chains
+                    finger = pred
+                    while finger != new_idom:
+                        while finger < new_idom:
+                            finger = idom[finger]
+                        while new_idom < finger:
+                            new_idom = idom[new_idom]
+                if idom[i] != new_idom:
+                    idom[i] = new_idom
                     changed = True
 
+        # Children are inserted in reverse post-order, for a deterministic tree walk
+        for i in range(root - 1, -1, -1):
+            block = post_order[i]
+            parent = None if idom[i] == root else post_order[idom[i]]
+            self._idom[block] = parent
+            self._children.setdefault(block, [])
+            self._children[parent].append(block)
+
+        self._number_tree()
+
+    def _number_tree(self) -> None:
+        """Compute the depth and depth-first numbering of all blocks in the tree."""
+        self._level = {}
+        self._dfs_in = {}
+        self._dfs_out = {}
+        counter = 0
+        stack: list[tuple[Block, int, bool]] = [
+            (root, 1, False) for root in reversed(self._children[None])
+        ]
+        while stack:
+            block, level, exiting = stack.pop()
+            if exiting:
+                self._dfs_out[block] = counter
+                counter += 1
+                continue
+            self._level[block] = level
+            self._dfs_in[block] = counter
+            counter += 1
+            stack.append((block, level, True))
+            stack.extend(
+                (child, level + 1, False)
+                for child in reversed(self._children.get(block, ()))
+            )
+
+    # Queries
+
     def strictly_dominates(self, a: Block, b: Block) -> bool:
         """
         Return if `a` *strictly* dominates `b`.
@@ -69,7 +210,221 @@ class DominanceInfo:
         """
         Return if `a` dominates `b`.
         """
-        return a in self._dominance[b]
+        if a is b:
+            return True
+        return self._dfs_in[a] < self._dfs_in[b] and self._dfs_out[b] < self._dfs_out[a]
+
+    def immediate_dominator(self, block: Block) -> Block | None:
+        """
+        Return the immediate dominator of `block`, or `None` if it is the root of
+        its tree.
+        """
+        return self._idom[block]
+
+    def children(self, block: Block) -> Sequence[Block]:
+        """Return the blocks immediately dominated by `block`."""
+        return self._children.get(block, ())
+
+    def is_reachable(self, block: Block) -> bool:
+        """Return if `block` is in the tree of the entry block."""
+        return self._tree_index.get(block) == 0
+
+    def nearest_common_dominator(self, a: Block, b: Block) -> Block | None:
+        """
+        Return the nearest block dominating both `a` and `b`, or `None` if they are
+        in different trees.
+        """
+        if self._tree_index[a] != self._tree_index[b]:
+            return None
+        while a is not b:
+            if self._level[a] < self._level[b]:
+                a, b = b, a
+            if (idom := self._idom[a]) is None:
+                # Both blocks are only dominated by the virtual root of the tree
+                return None
+            a = idom
+        return a
+
+    def dominance_frontier(self, block: Block) -> set[Block]:
+        """
+        Return the dominance frontier of `block`, i.e. the blocks that `block` does
+        not strictly dominate, but that have a predecessor dominated by `block`.
+        """
+        if self._frontiers is None:
+            self._frontiers = self._compute_frontiers()
+        return self._frontiers.get(block, set())
+
+    def _compute_frontiers(self) -> dict[Block, set[Block]]:
+        frontiers: dict[Block, set[Block]] = {}
+        for block, idom in self._idom.items():
+            preds = [
+                pred
+                for pred in self._predecessors(block)
+                if self._tree_index.get(pred) == self._tree_index[block]
+            ]
+            if idom is None:
+                # Roots also have the virtual root as a predecessor
+                if not preds:
+                    continue
+            elif len(preds) < 2:
+                continue
+            for pred in preds:
+                runner: Block | None = pred
+                while runner is not None and runner is not idom:
+                    frontiers.setdefault(runner, set()).add(block)
+                    runner = self._idom[runner]
+        return frontiers
+
+    # Incremental updates
+
+    def _insert_edge(self, src: Block, dst: Block) -> None:
+        """Update the tree after adding an edge to the graph it is computed on."""
+        if src not in self._idom or dst not in self._idom:
+            return self.recompute()
+        src_tree = self._tree_index[src]
+        dst_tree = self._tree_index[dst]
+        if src_tree > dst_tree:
+            # `dst` was reached before `src`, this edge does not change the trees.
+            return
+        if src_tree < dst_tree:
+            # `dst` is now reached from an earlier tree.
+            return self.recompute()
+
+        self._frontiers = None
+        nca = self.nearest_common_dominator(src, dst)
+        nca_level = 0 if nca is None else self._level[nca]
+        if nca_level + 1 >= self._level[dst]:
+            return
+
+        # A block `v` is affected iff depth(nca) + 1 < depth(v), and there is a path
+        # from `dst` to `v` on which all blocks are at least as deep as `v`.
+        # All affected blocks are now immediately dominated by `nca`.
+        affected: list[Block] = []
+        visited = {dst}
+        buckets: dict[int, list[Block]] = {self._level[dst]: [dst]}
+        while buckets:
+            level = max(buckets)
+            bucket = buckets[level]
+            block = bucket.pop()
+            if not bucket:
+                del buckets[level]
+            affected.append(block)
+            unaffected: list[Block] = []
+            while True:
+                for successor in self._successors(block):
+                    if (
+                        successor in visited
+                        or self._tree_index.get(successor) != src_tree
+                    ):
+                        continue
+                    visited.add(successor)
+                    successor_level = self._level[successor]
+                    if successor_level <= nca_level + 1:
+                        continue
+                    if successor_level > level:
+                        unaffected.append(successor)
+                    else:
+                        buckets.setdefault(successor_level, []).append(successor)
+                if not unaffected:
+                    break
+                block = unaffected.pop()
+
+        for block in affected:
+            self._children[self._idom[block]].remove(block)
+            self._children[nca].append(block)
+            self._idom[block] = nca
+        self._number_tree()
+
+    def _insert_below(self, block: Block, new_block: Block) -> None:
+        """
+        Insert `new_block` as the only child of `block`, adopting its children.
+        """
+        self._frontiers = None
+        children = self._children.get(block, [])
+        for child in children:
+            self._idom[child] = new_block
+        self._children[new_block] = children
+        self._children[block] = [new_block]
+        self._idom[new_block] = block
+        self._tree_index[new_block] = self._tree_index[block]
+        self._number_tree()
+
+    def _insert_above(self, block: Block, new_block: Block) -> None:
+        """
+        Insert `new_block` in place of `block` in the tree, as its only parent.
+        """
+        self._frontiers = None
+        parent = self._idom[block]
+        siblings = self._children[parent]
+        siblings[siblings.index(block)] = new_block
+        self._idom[new_block] = parent
+        self._children[new_block] = [block]
+        self._idom[block] = new_block
+        self._tree_index[new_block] = self._tree_index[block]
+        self._number_tree()
+
+    def insert_edge(self, src: Block, dst: Block) -> None:
+        """
+        Update the analysis after a control-flow edge from `src` to `dst` was added.
+        """
+        self._insert_edge(src, dst)
+
+    def delete_edge(self, src: Block, dst: Block) -> None:
+        """
+        Update the analysis after a control-flow edge from `src` to `dst` was
+        removed. This recomputes the tree.
+        """
+        self.recompute()
+
+    def split_block(self, block: Block, new_block: Block) -> None:
+        """
+        Update the analysis after `block` was split in two, `new_block` taking over
+        its successors, and `block` branching only to `new_block`, as done by
+        `Block.split_before` followed by the insertion of a branch.
+        """
+        self._insert_below(block, new_block)
+
+
+class PostDominanceInfo(DominanceInfo):
+    """
+    Computes and exposes the post-dominance relation amongst blocks of a region, as a
+    post-dominator tree.
+
+    The tree is rooted at the blocks without successors. Blocks from which no such
+    block can be reached are grouped into their own trees, rooted at the last such
+    block in region order.
+    """
+
+    def _successors(self, block: Block) -> Sequence[Block]:
+        return block.predecessors()
+
+    def _predecessors(self, block: Block) -> Sequence[Block]:
+        return _block_successors(block)
+
+    def _roots(self) -> Sequence[Block]:
+        return tuple(
+            block for block in self._region.blocks if not _block_successors(block)
+        )
+
+    def _unreachable_candidates(self) -> Sequence[Block]:
+        return tuple(reversed(self._region.blocks))
+
+    def post_dominates(self, a: Block, b: Block) -> bool:
+        """Return if `a` post-dominates `b`."""
+        return self.dominates(a, b)
+
+    def strictly_post_dominates(self, a: Block, b: Block) -> bool:
+        """Return if `a` post-dominates `b` and is not `b`."""
+        return self.strictly_dominates(a, b)
+
+    def insert_edge(self, src: Block, dst: Block) -> None:
+        if self._tree_index.get(src) == 0 and self._idom[src] is None:
+            # `src` may have been an exit block, the roots of the tree changed.
+            return self.recompute()
+        self._insert_edge(dst, src)
+
+    def split_block(self, block: Block, new_block: Block) -> None:
+        self._insert_above(block, new_block)
 
 
 def _strictly_dominates_block(a: Block, b: Block) -> bool:
@@ -58,6 +58,8 @@ from .constraints import (  # noqa: TID251
     IntConstraint,
     RangeConstraint,
     RangeOf,
+    SingleOf,
+    VarConstraint,
 )
 
 if TYPE_CHECKING:
@@ -910,6 +912,13 @@ class OpDef:
     custom_directives: dict[str, type[CustomDirective]] = field(
         default_factory=lambda: {}
     )
+    _fast_verifier: Callable[[Operation], bool] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """
+    The verifier specialised for this definition, built on the first verification.
+    It returns whether the operation satisfies all the invariants except the traits.
+    """
 
     @staticmethod
     def from_pyrdl(pyrdl_def: type[IRDLOperationInvT]) -> OpDef:
@@ -1167,6 +1176,27 @@ class OpDef:
     def verify(self, op: Operation):
         """Given an IRDL definition, verify that an operation satisfies its invariants."""
 
+        fast_verifier = self._fast_verifier
+        if fast_verifier is None:
+            fast_verifier = _build_fast_verifier(self)
+            self._fast_verifier = fast_verifier
+
+        if not fast_verifier(op):
+            # Either the definition has no specialised verifier, or the operation is
+            # invalid, in which case the generic verifier reports the error.
+            self.verify_generic(op)
+            return
+
+        # Verify traits.
+        for trait in self.traits:
+            trait.verify(op)
+
+    def verify_generic(self, op: Operation):
+        """
+        Verify that an operation satisfies its invariants by interpreting the
+        constraints of the definition.
+        """
+
         # Mapping from type variables to their concrete types.
         constraint_context = ConstraintContext()
 
@@ -1215,6 +1245,146 @@ class OpDef:
             trait.verify(op)
 
 
+def _never_verified(op: Operation) -> bool:
+    return False
+
+
+def _build_fast_verifier(op_def: OpDef) -> Callable[[Operation], bool]:
+    """
+    Build a verifier specialised for an operation definition.
+
+    The specialised verifier only handles definitions without variadic definitions
+    or segment sizes, and whose only constraint variables directly constrain operand
+    and result types. It returns `False` instead of raising an exception, so that
+    the generic verifier can report the error.
+    """
+    if any(isinstance(option, AttrSizedSegments) for option in op_def.options):
+        return _never_verified
+
+    constructs = (op_def.operands, op_def.results, op_def.regions, op_def.successors)
+    if any(isinstance(d, VariadicDef) for defs in constructs for _, d in defs):
+        return _never_verified
+
+    # Operand and result indices constrained by each constraint variable
+    var_indices: dict[str, tuple[list[int], list[int]]] = {}
+
+    def arg_predicates(
+        defs: Sequence[tuple[str, OperandDef]] | Sequence[tuple[str, ResultDef]],
+        is_result: bool,
+    ) -> list[tuple[int, Callable[[Attribute], bool]]] | None:
+        preds: list[tuple[int, Callable[[Attribute], bool]]] = []
+        for i, (_, arg_def) in enumerate(defs):
+            constr = arg_def.constr
+            if not isinstance(constr, SingleOf):
+                return None
+            constr = cast(SingleOf[Attribute], constr).constr
+            if isinstance(constr, VarConstraint):
+                var_constr = cast(VarConstraint[Attribute], constr)
+                var_indices.setdefault(var_constr.name, ([], []))[is_result].append(i)
+                constr = var_constr.constraint
+            if isinstance(constr, AnyAttr):
+                continue
+            if (pred := constr.get_predicate()) is None:
+                return None
+            preds.append((i, pred))
+        return preds
+
+    operand_preds = arg_predicates(op_def.operands, False)
+    result_preds = arg_predicates(op_def.results, True)
+    if operand_preds is None or result_preds is None:
+        return _never_verified
+    # All the values constrained by a variable must have the same type
+    var_groups = [
+        (tuple(operand_indices), tuple(result_indices))
+        for operand_indices, result_indices in var_indices.values()
+        if len(operand_indices) + len(result_indices) > 1
+    ]
+
+    region_preds: list[tuple[int, bool, Callable[[Attribute], bool] | None]] = []
+    for i, (_, region_def) in enumerate(op_def.regions):
+        entry_args = region_def.entry_args
+        if not isinstance(entry_args, RangeOf):
+            return _never_verified
+        entry_constr = cast(RangeOf[Attribute], entry_args).constr
+        if isinstance(entry_constr, AnyAttr):
+            pred = None
+        elif (pred := entry_constr.get_predicate()) is None:
+            return _never_verified
+        is_single_block = isinstance(region_def, SingleBlockRegionDef)
+        if is_single_block or pred is not None:
+            region_preds.append((i, is_single_block, pred))
+
+    def attr_predicates(
+        defs: Mapping[str, AttrOrPropDef],
+    ) -> list[tuple[str, bool, Callable[[Attribute], bool]]] | None:
+        preds: list[tuple[str, bool, Callable[[Attribute], bool]]] = []
+        for name, attr_def in defs.items():
+            if (pred := attr_def.constr.get_predicate()) is None:
+                return None
+            preds.append((name, not isinstance(attr_def, OptionalDef), pred))
+        return preds
+
+    prop_preds = attr_predicates(op_def.properties)
+    attr_preds = attr_predicates(op_def.attributes)
+    if prop_preds is None or attr_preds is None:
+        return _never_verified
+
+    num_operands = len(op_def.operands)
+    num_results = len(op_def.results)
+    num_regions = len(op_def.regions)
+    num_successors = len(op_def.successors)
+    prop_names = frozenset(op_def.properties)
+
+    def fast_verifier(op: Operation) -> bool:
+        operands = op._operands  # pyright: ignore[reportPrivateUsage]
+        results = op.results
+        regions = op.regions
+        if (
+            len(operands) != num_operands
+            or len(results) != num_results
+            or len(regions) != num_regions
+            or len(op.successors) != num_successors
+        ):
+            return False
+        for i, pred in operand_preds:
+            if not pred(operands[i].type):
+                return False
+        for i, pred in result_preds:
+            if not pred(results[i].type):
+                return False
+        for operand_indices, result_indices in var_groups:
+            types = [operands[i].type for i in operand_indices]
+            types.extend(results[i].type for i in result_indices)
+            if any(t != types[0] for t in types):
+                return False
+        for i, is_single_block, pred in region_preds:
+            blocks = regions[i].blocks
+            if is_single_block and len(blocks) != 1:
+                return False
+            if pred is not None and (first_block := blocks.first) is not None:
+                if not all(pred(arg.type) for arg in first_block.args):
+                    return False
+        properties = op.properties
+        if not properties.keys() <= prop_names:
+            return False
+        for name, is_required, pred in prop_preds:
+            if (attr := properties.get(name)) is None:
+                if is_required:
+                    return False
+            elif not pred(attr):
+                return False
+        attributes = op.attributes
+        for name, is_required, pred in attr_preds:
+            if (attr := attributes.get(name)) is None:
+                if is_required:
+                    return False
+            elif not pred(attr):
+                return False
+        return True
+
+    return fast_verifier
+
+
 class VarIRConstruct(Enum):
     """
     An enum representing the part of an IR that may be variadic.
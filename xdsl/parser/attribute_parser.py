@@ -64,7 +64,13 @@ from xdsl.dialects.builtin import (
     f64,
     i64,
 )
-from xdsl.ir import Attribute, Data, ParametrizedAttribute, TypeAttribute
+from xdsl.ir import (
+    Attribute,
+    Data,
+    ParametrizedAttribute,
+    TypeAttribute,
+    get_attribute_uniquer,
+)
 from xdsl.ir.affine import AffineMap, AffineSet
 from xdsl.irdl import base
 from xdsl.utils.bitwise_casts import (
@@ -131,8 +137,12 @@ class AttrParser(BaseParser):
         if (
             token := self._parse_optional_token(MLIRTokenKind.EXCLAMATION_IDENT)
         ) is not None:
-            return self._parse_extended_type_or_attribute(token.text[1:], True)
-        return self._parse_optional_builtin_type()
+            attr = self._parse_extended_type_or_attribute(token.text[1:], True)
+        else:
+            attr = self._parse_optional_builtin_type()
+        if attr is not None and (uniquer := get_attribute_uniquer()) is not None:
+            attr = uniquer.unique(attr)
+        return attr
 
     def parse_type(self) -> TypeAttribute:
         """
@@ -167,8 +177,12 @@ class AttrParser(BaseParser):
                             | [^[]<>(){}\0]+
         """
         if (token := self._parse_optional_token(MLIRTokenKind.HASH_IDENT)) is not None:
-            return self._parse_extended_type_or_attribute(token.text[1:], False)
-        return self._parse_optional_builtin_attr()
+            attr = self._parse_extended_type_or_attribute(token.text[1:], False)
+        else:
+            attr = self._parse_optional_builtin_attr()
+        if attr is not None and (uniquer := get_attribute_uniquer()) is not None:
+            attr = uniquer.unique(attr)
+        return attr
 
     def parse_attribute(self) -> Attribute:
         """
@@ -808,12 +822,14 @@ class AttrParser(BaseParser):
         self, type: RankedStructure[AnyDenseElement] | None
     ) -> DenseIntOrFPElementsAttr:
         dense_contents: (
-            tuple[list[AttrParser._TensorLiteralElement], list[int]] | str | None
+            tuple[list[AttrParser._TensorLiteralElement], list[int]]
+            | StringLiteral
+            | None
         )
         """
         If `None`, then the contents are empty.
-        If `str`, then this is a hex-encoded string containing the data, which doesn't
-        carry shape information.
+        If `StringLiteral`, then this is a hex-encoded string containing the data, which
+        doesn't carry shape information.
         Otherwise, a tuple of `elements` and `shape`.
         If `shape` is `[]`, then this is a splat attribute, meaning it has the same value
         everywhere.
@@ -824,8 +840,10 @@ class AttrParser(BaseParser):
             # Empty case
             dense_contents = None
         else:
-            if (hex_string := self.parse_optional_str_literal()) is not None:
-                dense_contents, shape = hex_string, None
+            if (
+                hex_token := self._parse_optional_token(MLIRTokenKind.STRING_LIT)
+            ) is not None:
+                dense_contents = StringLiteral.from_span(hex_token.span)
             else:
                 # Expect a tensor literal instead
                 dense_contents = self._parse_tensor_literal()
@@ -845,10 +863,10 @@ class AttrParser(BaseParser):
                     "Expected at least one element in the dense literal, but got None"
                 )
             data_values = []
-        elif isinstance(dense_contents, str):
+        elif isinstance(dense_contents, StringLiteral):
             # Hex-encoded string case: convert straight to bytes (without the 0x prefix)
             try:
-                bytes_values = bytes.fromhex(dense_contents[2:])
+                bytes_values = _bytes_from_hex_literal(dense_contents)
             except ValueError:
                 self.raise_error("Hex string in denseAttr is invalid")
 
@@ -1544,3 +1562,15 @@ class AttrParser(BaseParser):
     def parse_affine_set(self) -> AffineSet:
         affp = affine_parser.AffineParser(self._parser_state)
         return affp.parse_affine_set()
+
+
+def _bytes_from_hex_literal(literal: StringLiteral) -> bytes:
+    """
+    Decode a hex-encoded string literal of the form `"0x..."` into bytes.
+    Without escape sequences, the hex digits are decoded straight from the input, to
+    avoid copying large literals.
+    """
+    content = literal.input.content
+    if content.find("\\", literal.start, literal.end) == -1:
+        return bytes.fromhex(content[literal.start + 3 : literal.end - 1])
+    return bytes.fromhex(literal.string_contents[2:])
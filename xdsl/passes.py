@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import dataclasses
+import multiprocessing
 from abc import ABC, abstractmethod
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import Field, dataclass, field
+from io import StringIO
 from types import NoneType, UnionType
 from typing import (
     Any,
     ClassVar,
     NamedTuple,
+    TypeGuard,
     Union,
     get_args,
     get_origin,
@@ -19,6 +23,14 @@ from typing_extensions import Self, TypeVar
 
 from xdsl.context import Context
 from xdsl.dialects import builtin
+from xdsl.ir import Block, Operation, Region
+from xdsl.pattern_rewriter import (
+    GreedyRewritePatternApplier,
+    PatternRewriterListener,
+    PatternRewriteWalker,
+    RewritePattern,
+)
+from xdsl.traits import IsolatedFromAbove
 from xdsl.utils.hints import isa, type_repr
 from xdsl.utils.parse_pipeline import (
     PassArgElementType,
@@ -28,6 +40,88 @@ from xdsl.utils.parse_pipeline import (
 )
 
 ModulePassT = TypeVar("ModulePassT", bound="ModulePass")
+AnalysisT = TypeVar("AnalysisT")
+_IRNodeT = TypeVar("_IRNodeT", bound=Operation | Region | Block)
+
+
+@dataclass(frozen=True)
+class PreservedAnalyses:
+    """The set of analyses that remain valid after a pass was applied."""
+
+    analyses: frozenset[Callable[..., Any]] = frozenset()
+    """The preserved analyses."""
+
+    preserve_all: bool = False
+    """Whether all analyses are preserved, for example if the IR was not modified."""
+
+    @staticmethod
+    def all() -> PreservedAnalyses:
+        """All analyses are preserved."""
+        return PreservedAnalyses(preserve_all=True)
+
+    @staticmethod
+    def none() -> PreservedAnalyses:
+        """No analysis is preserved."""
+        return PreservedAnalyses()
+
+    def is_preserved(self, analysis: Callable[..., Any]) -> bool:
+        return self.preserve_all or analysis in self.analyses
+
+
+@dataclass
+class AnalysisManager:
+    """
+    Caches analyses of operations, regions, or blocks across the passes of a
+    pipeline.
+
+    An analysis is any callable taking the analysed IR node, typically a class
+    such as `DominanceInfo`, or a function such as `live_ins_per_block`. It is
+    computed on the first request, and returned from the cache until a pass that
+    does not preserve it is applied.
+    """
+
+    _analyses: dict[tuple[Callable[[Any], Any], Operation | Region | Block], Any] = (
+        field(
+            default_factory=dict[
+                tuple[Callable[[Any], Any], Operation | Region | Block], Any
+            ],
+            init=False,
+        )
+    )
+    """The cached analyses, keyed on the analysis and the analysed IR node."""
+
+    def get_analysis(
+        self, analysis: Callable[[_IRNodeT], AnalysisT], ir: _IRNodeT
+    ) -> AnalysisT:
+        """Return the analysis of `ir`, computing it if it is not cached."""
+        key = (analysis, ir)
+        if key in self._analyses:
+            return self._analyses[key]
+        result = analysis(ir)
+        self._analyses[key] = result
+        return result
+
+    def get_cached_analysis(
+        self, analysis: Callable[[_IRNodeT], AnalysisT], ir: _IRNodeT
+    ) -> AnalysisT | None:
+        """Return the analysis of `ir` if it is cached, and `None` otherwise."""
+        return self._analyses.get((analysis, ir))
+
+    def invalidate(self, preserved: PreservedAnalyses | None = None) -> None:
+        """Discard all cached analyses that are not preserved."""
+        if preserved is None:
+            self._analyses.clear()
+            return
+        if preserved.preserve_all:
+            return
+        self._analyses = {
+            key: result
+            for key, result in self._analyses.items()
+            if preserved.is_preserved(key[0])
+        }
+
+    def __len__(self) -> int:
+        return len(self._analyses)
 
 
 @dataclass(frozen=True)
@@ -61,9 +155,26 @@ class ModulePass(ABC):
 
     name: ClassVar[str]
 
+    preserved_analyses: ClassVar[tuple[Callable[..., Any], ...]] = ()
+    """The analyses that remain valid after any application of this pass."""
+
     @abstractmethod
     def apply(self, ctx: Context, op: builtin.ModuleOp) -> None: ...
 
+    def apply_with_analyses(
+        self, ctx: Context, op: builtin.ModuleOp, analyses: AnalysisManager
+    ) -> PreservedAnalyses:
+        """
+        Apply the pass, getting the analyses it needs from `analyses`, and return
+        the analyses that remain valid.
+
+        The default implementation calls `apply`, and preserves
+        `preserved_analyses`. Passes that use cached analyses should override this
+        method, and implement `apply` by calling it with a new `AnalysisManager`.
+        """
+        self.apply(ctx, op)
+        return PreservedAnalyses(frozenset(self.preserved_analyses))
+
     def apply_to_clone(
         self, ctx: Context, op: builtin.ModuleOp
     ) -> tuple[Context, builtin.ModuleOp]:
@@ -220,10 +331,12 @@ def get_pass_option_infos(
     for the given pass.
     """
 
+    # Resolve the annotations of passes defined with `from __future__ import annotations`
+    field_types = get_type_hints(arg)
     return tuple(
         PassOptionInfo(
             field.name,
-            type_repr(field.type),
+            type_repr(field_types.get(field.name, field.type)),
             str(getattr(arg, field.name)).lower() if hasattr(arg, field.name) else None,
         )
         for field in dataclasses.fields(arg)
@@ -248,19 +361,49 @@ class PassPipeline:
     Function called in between every pass, taking the pass that just ran, the module,
     and the next pass.
     """
+    rewrite_listener: PatternRewriterListener | None = field(default=None)
+    """
+    Listener notified of the rewrites of the pattern passes, which are the only
+    passes whose changes can be tracked.
+    """
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+    def apply(
+        self,
+        ctx: Context,
+        op: builtin.ModuleOp,
+        analyses: AnalysisManager | None = None,
+    ) -> None:
+        """
+        Apply the passes in order.
+        Analyses are shared between the passes through `analyses`, or through a new
+        `AnalysisManager` if none is given, and invalidated after each pass that
+        does not preserve them.
+        """
         if not self.passes:
             # Early exit to avoid fetching a non-existing last pass.
             return
         callback = self.callback
+        if analyses is None:
+            analyses = AnalysisManager()
 
         for prev, next in zip(self.passes[:-1], self.passes[1:]):
-            prev.apply(ctx, op)
+            analyses.invalidate(self._apply_pass(prev, ctx, op, analyses))
             if callback is not None:
                 callback(prev, op, next)
 
-        self.passes[-1].apply(ctx, op)
+        analyses.invalidate(self._apply_pass(self.passes[-1], ctx, op, analyses))
+
+    def _apply_pass(
+        self,
+        p: ModulePass,
+        ctx: Context,
+        op: builtin.ModuleOp,
+        analyses: AnalysisManager,
+    ) -> PreservedAnalyses:
+        if self.rewrite_listener is not None and is_tracked_pass(p):
+            p.apply_with_listener(ctx, op, self.rewrite_listener)
+            return PreservedAnalyses(frozenset(p.preserved_analyses))
+        return p.apply_with_analyses(ctx, op, analyses)
 
     @staticmethod
     def parse_spec(
@@ -280,6 +423,307 @@ class PassPipeline:
 
         return PassPipeline(passes, callback)
 
+    def fuse_pattern_passes(self) -> PassPipeline:
+        """
+        Return a pipeline in which each sequence of consecutive pattern passes that
+        walk the IR in the same way is replaced by a `FusedPatternRewritePass`.
+
+        The patterns of fused passes are applied in a single fixpoint, so this is
+        only valid if the result does not depend on the order in which the patterns
+        of the different passes are applied.
+        """
+        passes: list[ModulePass] = []
+        group: list[PatternRewritePass] = []
+
+        def flush_group():
+            if len(group) == 1:
+                passes.append(group[0])
+            elif group:
+                passes.append(FusedPatternRewritePass(tuple(group)))
+            group.clear()
+
+        for p in self.passes:
+            if not isinstance(p, PatternRewritePass):
+                flush_group()
+                passes.append(p)
+                continue
+            if group and not group[0].can_fuse_with(p):
+                flush_group()
+            group.append(p)
+        flush_group()
+
+        return PassPipeline(tuple(passes), self.callback, self.rewrite_listener)
+
+
+@dataclass(frozen=True)
+class PatternRewritePass(ModulePass, ABC):
+    """
+    A pass that applies a rewrite pattern with a `PatternRewriteWalker` until no
+    more rewrites apply.
+
+    Pattern passes that walk the IR in the same way can be fused with
+    `FusedPatternRewritePass`, so that their patterns are applied in a single walk.
+    """
+
+    walk_regions_first: ClassVar[bool] = False
+    """Whether the walker walks the regions of an operation before the operation."""
+
+    walk_reverse: ClassVar[bool] = False
+    """Whether the walker walks the regions and blocks in reverse order."""
+
+    apply_recursively: ClassVar[bool] = True
+    """Whether the walker applies the pattern on the operations it creates."""
+
+    worklist_driven: ClassVar[bool] = False
+    """
+    Whether the walker relies on its worklist to reach a fixed point, rather than
+    walking the IR again after each round that modified it.
+    """
+
+    @abstractmethod
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        """Get the pattern applied by this pass."""
+        ...
+
+    def post_walk(self, region: Region, listener: PatternRewriterListener) -> bool:
+        """
+        Called after each walk of the region, returns whether the IR was modified.
+        """
+        return False
+
+    def can_fuse_with(self, other: PatternRewritePass) -> bool:
+        """Whether the patterns of both passes can be applied in the same walk."""
+        return (
+            self.walk_regions_first == other.walk_regions_first
+            and self.walk_reverse == other.walk_reverse
+            and self.apply_recursively == other.apply_recursively
+        )
+
+    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+        self.apply_with_listener(ctx, op, PatternRewriterListener())
+
+    def apply_with_listener(
+        self, ctx: Context, op: builtin.ModuleOp, listener: PatternRewriterListener
+    ) -> None:
+        """Apply the pass, notifying `listener` of all the rewrites."""
+        PatternRewriteWalker(
+            self.get_rewrite_pattern(ctx),
+            walk_regions_first=self.walk_regions_first,
+            apply_recursively=self.apply_recursively,
+            walk_reverse=self.walk_reverse,
+            post_walk_func=self.post_walk,
+            listener=listener,
+            worklist_driven=self.worklist_driven,
+        ).rewrite_module(op)
+
+
+@dataclass(frozen=True)
+class FusedPatternRewritePass(ModulePass):
+    """
+    Applies the patterns of several pattern passes in a single walk of the IR.
+
+    Each operation is visited once per change rather than once per pass, and all the
+    passes share the same worklist. On each operation, the patterns of the passes
+    are tried in order, until one of them rewrites the operation.
+    """
+
+    name = "fused-patterns"
+
+    passes: tuple[PatternRewritePass, ...]
+    """The passes to fuse, which must walk the IR in the same way."""
+
+    def __post_init__(self):
+        if not self.passes:
+            raise ValueError("Expected at least one pass to fuse")
+        first = self.passes[0]
+        for p in self.passes[1:]:
+            if not first.can_fuse_with(p):
+                raise ValueError(f"Cannot fuse pass {p.name} with pass {first.name}")
+
+    def pipeline_pass_spec(self, *, include_default: bool = False) -> PipelinePassSpec:
+        """
+        The spec of the fused pass, whose `passes` argument lists the specs of the
+        fused passes.
+        """
+        return PipelinePassSpec(
+            self.name,
+            {
+                "passes": tuple(
+                    str(p.pipeline_pass_spec(include_default=include_default))
+                    for p in self.passes
+                )
+            },
+        )
+
+    def __str__(self) -> str:
+        # The pipeline of the fused passes, which applies the same rewrites
+        return ",".join(str(p) for p in self.passes)
+
+    def post_walk(self, region: Region, listener: PatternRewriterListener) -> bool:
+        modified = False
+        for p in self.passes:
+            modified |= p.post_walk(region, listener)
+        return modified
+
+    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+        self.apply_with_listener(ctx, op, PatternRewriterListener())
+
+    def apply_with_listener(
+        self, ctx: Context, op: builtin.ModuleOp, listener: PatternRewriterListener
+    ) -> None:
+        """Apply the fused passes, notifying `listener` of all the rewrites."""
+        first = self.passes[0]
+        PatternRewriteWalker(
+            GreedyRewritePatternApplier(
+                [p.get_rewrite_pattern(ctx) for p in self.passes]
+            ),
+            walk_regions_first=first.walk_regions_first,
+            apply_recursively=first.apply_recursively,
+            walk_reverse=first.walk_reverse,
+            post_walk_func=self.post_walk,
+            listener=listener,
+            # The patterns of the other passes may rely on the IR being walked again
+            worklist_driven=all(p.worklist_driven for p in self.passes),
+        ).rewrite_module(op)
+
+
+def is_tracked_pass(
+    p: ModulePass,
+) -> TypeGuard[PatternRewritePass | FusedPatternRewritePass]:
+    """
+    Whether all the changes of the pass go through a rewriter, so that a listener can
+    track them with `apply_with_listener`.
+    """
+    return isinstance(p, PatternRewritePass | FusedPatternRewritePass)
+
+
+@dataclass(frozen=True)
+class NestedPassPipeline(ModulePass):
+    """
+    Applies a pipeline of passes independently to each operation that is
+    `IsolatedFromAbove` and nested directly in the module, such as each
+    `func.func`.
+
+    Each nested operation is moved to a module of its own, the passes are applied to
+    that module, and the resulting operations are spliced back in place of the
+    nested operation. The passes must therefore only rewrite the nested operation,
+    and not depend on or modify the rest of the module.
+
+    If `num_workers` is greater than one, the nested operations are processed on a
+    pool of processes. Each operation is printed, parsed and rewritten in a worker,
+    and the result is printed and parsed back. The workers are forked from the
+    current process, and the operations are processed sequentially on platforms that
+    do not support forking.
+    """
+
+    name = "nested-pipeline"
+
+    passes: tuple[ModulePass, ...]
+    """The passes to apply to each nested operation."""
+
+    op_name: str | None = None
+    """
+    The name of the operations to apply the passes to, or `None` to apply them to
+    all nested operations that are `IsolatedFromAbove`.
+    """
+
+    num_workers: int = 1
+    """The number of processes to apply the passes in."""
+
+    def nested_ops(self, op: builtin.ModuleOp) -> list[Operation]:
+        """The operations of the module that the passes are applied to."""
+        return [
+            nested
+            for nested in op.ops
+            if (self.op_name is None or nested.name == self.op_name)
+            and nested.has_trait(IsolatedFromAbove)
+        ]
+
+    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+        nested_ops = self.nested_ops(op)
+        if not nested_ops or not self.passes:
+            return
+        if (
+            self.num_workers > 1
+            and len(nested_ops) > 1
+            and "fork" in multiprocessing.get_all_start_methods()
+        ):
+            self._apply_in_workers(ctx, op, nested_ops)
+            return
+        pipeline = PassPipeline(self.passes)
+        block = op.body.block
+        for nested in nested_ops:
+            next_op = nested.next_op
+            block.detach_op(nested)
+            module = builtin.ModuleOp([nested])
+            pipeline.apply(ctx, module)
+            results = list(module.ops)
+            for result in results:
+                result.detach()
+            if next_op is None:
+                block.add_ops(results)
+            else:
+                block.insert_ops_before(results, next_op)
+
+    def _apply_in_workers(
+        self, ctx: Context, op: builtin.ModuleOp, nested_ops: list[Operation]
+    ) -> None:
+        from xdsl.parser import Parser
+
+        # The context and passes are inherited by the forked workers, so they do
+        # not need to be picklable.
+        with ProcessPoolExecutor(
+            self.num_workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_nested_pipeline_worker,
+            initargs=(ctx, self.passes),
+        ) as executor:
+            chunksize = max(1, len(nested_ops) // (4 * self.num_workers))
+            results = executor.map(
+                _apply_nested_pipeline,
+                (_print_generic(nested) for nested in nested_ops),
+                chunksize=chunksize,
+            )
+            block = op.body.block
+            for nested, result in zip(nested_ops, results, strict=True):
+                module = Parser(ctx, result).parse_module(allow_implicit_module=False)
+                new_ops = list(module.ops)
+                for new_op in new_ops:
+                    new_op.detach()
+                block.insert_ops_before(new_ops, nested)
+                block.erase_op(nested)
+
+
+_nested_pipeline_worker: tuple[Context, PassPipeline] | None = None
+"""The context and pipeline of a `NestedPassPipeline` worker process."""
+
+
+def _init_nested_pipeline_worker(ctx: Context, passes: tuple[ModulePass, ...]):
+    global _nested_pipeline_worker
+    _nested_pipeline_worker = (ctx, PassPipeline(passes))
+
+
+def _apply_nested_pipeline(source: str) -> str:
+    """
+    Parse the operation printed in `source` in a module, apply the worker's pipeline
+    to the module, and return the printed result.
+    """
+    from xdsl.parser import Parser
+
+    assert _nested_pipeline_worker is not None
+    ctx, pipeline = _nested_pipeline_worker
+    module = builtin.ModuleOp([Parser(ctx, source).parse_op()])
+    pipeline.apply(ctx, module)
+    return _print_generic(module)
+
+
+def _print_generic(op: Operation) -> str:
+    from xdsl.printer import Printer
+
+    stream = StringIO()
+    Printer(stream, print_generic_format=True).print_op(op)
+    return stream.getvalue()
+
 
 def _convert_pass_arg_to_type(
     value: PassArgListType, dest_type: Any
@@ -315,6 +315,22 @@ class RewritePattern(ABC):
         """
         ...
 
+    def matched_op_types(self) -> tuple[type[Operation], ...] | None:
+        """
+        Return the operation types this pattern can match, or `None` if it may
+        match any operation.
+        Operations that are not instances of one of these types are assumed to
+        never be rewritten by this pattern.
+        By default, this is inferred from `op_type_rewrite_pattern`.
+        """
+        return getattr(type(self).match_and_rewrite, _MATCHED_OP_TYPES_ATTR, None)
+
+
+_MATCHED_OP_TYPES_ATTR = "__matched_op_types__"
+"""
+The function attribute in which `op_type_rewrite_pattern` stores the operation
+types matched by the decorated method.
+"""
 
 _RewritePatternT = TypeVar("_RewritePatternT", bound=RewritePattern)
 _OperationT = TypeVar("_OperationT", bound=Operation)
@@ -367,6 +383,7 @@ def op_type_rewrite_pattern(
         if isinstance(op, expected_type):
             func(self, op, rewriter)
 
+    setattr(impl, _MATCHED_OP_TYPES_ATTR, expected_types)
     return impl
 
 
@@ -533,13 +550,52 @@ class GreedyRewritePatternApplier(RewritePattern):
     """
     Apply a list of patterns in order until one pattern matches,
     and then use this rewrite.
+
+    The patterns are indexed by the operation types they match (see
+    `RewritePattern.matched_op_types`), so that only the patterns that can match
+    a given operation type are tried on it.
     """
 
     rewrite_patterns: list[RewritePattern]
-    """The list of rewrites to apply in order."""
+    """
+    The list of rewrites to apply in order.
+    It should not be modified once the applier has been used.
+    """
 
-    def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter) -> None:
+    _patterns_by_op_type: dict[type[Operation], tuple[RewritePattern, ...]] = field(
+        default_factory=dict[type[Operation], tuple[RewritePattern, ...]],
+        init=False,
+    )
+    """
+    The patterns that can match each operation type encountered so far, in the
+    order of `rewrite_patterns`.
+    """
+
+    def _get_patterns_for_op_type(
+        self, op_type: type[Operation]
+    ) -> tuple[RewritePattern, ...]:
+        """Return the patterns that can match operations of the given type."""
+        patterns = self._patterns_by_op_type.get(op_type)
+        if patterns is None:
+            patterns = tuple(
+                pattern
+                for pattern in self.rewrite_patterns
+                if (op_types := pattern.matched_op_types()) is None
+                or issubclass(op_type, op_types)
+            )
+            self._patterns_by_op_type[op_type] = patterns
+        return patterns
+
+    def matched_op_types(self) -> tuple[type[Operation], ...] | None:
+        op_types: list[type[Operation]] = []
         for pattern in self.rewrite_patterns:
+            if (pattern_op_types := pattern.matched_op_types()) is None:
+                return None
+            op_types.extend(pattern_op_types)
+        return tuple(op_types)
+
+    def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter) -> None:
+        for pattern in self._get_patterns_for_op_type(type(op)):
             pattern.match_and_rewrite(op, rewriter)
             if rewriter.has_done_action:
                 return
@@ -599,6 +655,11 @@ class Worklist:
             self._op_stack[index] = None
             del self._map[op]
 
+    def clear(self):
+        """Remove all operations from the worklist."""
+        self._op_stack.clear()
+        self._map.clear()
+
 
 @dataclass(eq=False, repr=False)
 class PatternRewriteWalker:
@@ -637,6 +698,37 @@ class PatternRewriteWalker:
     listener: PatternRewriterListener = field(default_factory=PatternRewriterListener)
     """The listener that will be called when an operation or block is modified."""
 
+    worklist_driven: bool = field(default=False)
+    """
+    Only walk the whole IR once, and then rely on the worklist to find the
+    operations to rewrite until a fixed point is reached.
+    Operations are added to the worklist when they are inserted or modified, when
+    the results of an operation they use are replaced, when they define a value
+    that has a single use left after an erasure, or when they branch to a successor
+    of an erased operation.
+    Otherwise, the IR is walked again after each round that modified it.
+    """
+
+    max_iterations: int | None = field(default=None)
+    """
+    The maximum number of rounds of processing the worklist, or `None` for no
+    limit. The rewrite stops after this many rounds, even if the IR may still be
+    rewritten.
+    """
+
+    max_rewrites: int | None = field(default=None)
+    """
+    The maximum number of successful pattern applications, or `None` for no limit.
+    The rewrite stops after this many rewrites, even if the IR may still be
+    rewritten.
+    """
+
+    num_rounds: int = field(default=0, init=False)
+    """The number of rounds of processing the worklist during the last rewrite."""
+
+    num_rewrites: int = field(default=0, init=False)
+    """The number of successful pattern applications during the last rewrite."""
+
     _worklist: Worklist = field(default_factory=Worklist, init=False)
     """The worklist of operations to walk over."""
 
@@ -663,6 +755,13 @@ class PatternRewriteWalker:
         """Handle removal of an operation."""
         if self.apply_recursively:
             self._add_operands_to_worklist(op.operands)
+            # The successors of the operation lose a predecessor, which may allow
+            # the remaining branches to them to be simplified. Erased terminators
+            # keep their uses of their successors, so only attached ones are added.
+            for successor in op.successors:
+                for use in successor.uses:
+                    if use.operation is not op and use.operation.parent is not None:
+                        self._worklist.push(use.operation)
         if op.regions:
             for sub_op in op.walk():
                 self._worklist.remove(sub_op)
@@ -722,25 +821,48 @@ class PatternRewriteWalker:
         pattern. Returns `True` if the IR was mutated.
         """
         pattern_listener = self._get_rewriter_listener()
+        self.num_rounds = 0
+        self.num_rewrites = 0
 
         self._populate_worklist(region)
-        op_was_modified = self._process_worklist(pattern_listener)
-        if self.post_walk_func is not None:
-            op_was_modified |= self.post_walk_func(region, pattern_listener)
+        op_was_modified = self._run_round(region, pattern_listener)
 
         if not self.apply_recursively:
+            self._worklist.clear()
             return op_was_modified
 
         result = op_was_modified
 
-        while op_was_modified:
-            self._populate_worklist(region)
-            op_was_modified = self._process_worklist(pattern_listener)
-            if self.post_walk_func is not None:
-                op_was_modified |= self.post_walk_func(region, pattern_listener)
-
+        while op_was_modified and not self._budget_exhausted():
+            if self.worklist_driven:
+                if self._worklist.is_empty():
+                    break
+            else:
+                self._populate_worklist(region)
+            op_was_modified = self._run_round(region, pattern_listener)
+            result |= op_was_modified
+
+        # Operations left over when the budget is exhausted are not rewritten
+        self._worklist.clear()
         return result
 
+    def _budget_exhausted(self) -> bool:
+        """Check if the maximum number of rounds or rewrites was reached."""
+        return (
+            self.max_iterations is not None and self.num_rounds >= self.max_iterations
+        ) or (self.max_rewrites is not None and self.num_rewrites >= self.max_rewrites)
+
+    def _run_round(self, region: Region, listener: PatternRewriterListener) -> bool:
+        """
+        Process the worklist, and then call the post walk function.
+        Returns true if any modification was done.
+        """
+        self.num_rounds += 1
+        op_was_modified = self._process_worklist(listener)
+        if self.post_walk_func is not None:
+            op_was_modified |= self.post_walk_func(region, listener)
+        return op_was_modified
+
     def _populate_worklist(self, op: Operation | Region | Block) -> None:
         """Populate the worklist with all nested operations."""
         # We walk in reverse order since we use a stack for our worklist.
@@ -781,7 +903,14 @@ class PatternRewriteWalker:
                     f"Error while applying pattern: {err}",
                     underlying_error=err,
                 )
-            rewriter_has_done_action |= rewriter.has_done_action
+            if rewriter.has_done_action:
+                rewriter_has_done_action = True
+                self.num_rewrites += 1
+                if (
+                    self.max_rewrites is not None
+                    and self.num_rewrites >= self.max_rewrites
+                ):
+                    return rewriter_has_done_action
 
             # If the worklist is empty, we are done
             op = self._worklist.pop()
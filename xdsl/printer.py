@@ -58,6 +58,12 @@ class Printer(BasePrinter):
     print_properties_as_attributes: bool = field(default=False)
     print_debuginfo: bool = field(default=False)
     diagnostic: Diagnostic = field(default_factory=Diagnostic)
+    flush_top_level_ops: bool = field(default=False, kw_only=True)
+    """
+    Flush the output stream after each operation nested directly in the printed
+    operation, so that readers of the stream can consume a large module while it is
+    still being printed.
+    """
 
     _ssa_values: dict[SSAValue, str] = field(
         default_factory=dict[SSAValue, str], init=False
@@ -231,6 +237,8 @@ class Printer(BasePrinter):
                     continue
                 self._print_new_line()
                 self.print_op(op)
+                if self.flush_top_level_ops and self._indent == 1:
+                    self.flush()
 
     def print_block_argument(self, arg: BlockArgument, print_type: bool = True) -> None:
         """
@@ -97,6 +97,20 @@ class CommandLineTool:
                 self.get_input_name(),
             ).parse_module(not self.args.no_implicit_module)
 
+        def parse_bytecode(io: IO[str]):
+            from xdsl.bytecode import read_bytecode
+
+            buffer: IO[bytes] | None = getattr(io, "buffer", None)
+            if buffer is None:
+                raise ValueError("The bytecode frontend can only read from a file")
+            op = read_bytecode(self.ctx, buffer.read())
+            if isinstance(op, ModuleOp):
+                return op
+            if self.args.no_implicit_module:
+                raise ValueError("builtin.module operation expected")
+            return ModuleOp([op])
+
+        self.available_frontends["bytecode"] = parse_bytecode
         self.available_frontends["mlir"] = parse_mlir
 
     def parse_chunk(
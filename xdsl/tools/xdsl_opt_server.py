@@ -0,0 +1,289 @@
+"""
+A persistent xdsl-opt server, and the thin client that forwards invocations to it.
+
+Starting xdsl-opt is dominated by the Python startup and by importing and
+registering the dialects and passes. The server pays this cost once, and forks a
+warmed copy of itself for each invocation. The client sends its arguments, working
+directory, and standard streams over a Unix socket, so that the forked process reads
+and writes them directly, and exits with the exit code of the invocation.
+
+Anyone who can connect to the socket can run xdsl-opt as the user of the server,
+and the client hands its streams to whoever listens on it. The socket is therefore
+only readable and writable by its owner, in a directory that only its owner can
+write to, and both sides check that the other runs as the same user.
+
+This module only imports xDSL lazily, so that the client starts quickly.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import stat
+import struct
+import sys
+import tempfile
+import traceback
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from xdsl.xdsl_opt_main import xDSLOptMain
+
+_MAX_REQUEST_SIZE = 1 << 20
+_EXIT_CODE_FORMAT = "!i"
+_PEER_CREDENTIALS_FORMAT = "3i"
+
+
+def default_socket_path() -> str:
+    """
+    Get the path of the socket used when none is given, which can be set with the
+    `XDSL_OPT_SOCKET` environment variable.
+
+    The socket is in the runtime directory of the user if there is one, and in a
+    directory of the user in the temporary directory otherwise.
+    """
+    if (path := os.environ.get("XDSL_OPT_SOCKET")) is not None:
+        return path
+    if (runtime_dir := os.environ.get("XDG_RUNTIME_DIR")) is not None:
+        return os.path.join(runtime_dir, f"xdsl-opt-{os.getuid()}.sock")
+    return os.path.join(
+        tempfile.gettempdir(), f"xdsl-opt-{os.getuid()}", "xdsl-opt.sock"
+    )
+
+
+def _peer_uid(conn: socket.socket) -> int | None:
+    """
+    Get the user id of the process at the other end of the connection, or None if
+    the platform does not report it.
+    """
+    if not hasattr(socket, "SO_PEERCRED"):
+        return None
+    credentials = conn.getsockopt(
+        socket.SOL_SOCKET,
+        socket.SO_PEERCRED,
+        struct.calcsize(_PEER_CREDENTIALS_FORMAT),
+    )
+    _, uid, _ = struct.unpack(_PEER_CREDENTIALS_FORMAT, credentials)
+    return uid
+
+
+def _prepare_socket_dir(socket_path: str) -> None:
+    """
+    Create the directory of the socket, only accessible by the current user, if it
+    does not exist, and check that no other user can replace the socket otherwise.
+    """
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    try:
+        os.mkdir(socket_dir, 0o700)
+    except FileExistsError:
+        pass
+    dir_stat = os.lstat(socket_dir)
+    if (
+        not stat.S_ISDIR(dir_stat.st_mode)
+        or dir_stat.st_uid != os.getuid()
+        or dir_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    ):
+        raise PermissionError(
+            f"The directory of the socket {socket_path} must be owned by the current "
+            "user, and not writable by other users"
+        )
+    if os.path.lexists(socket_path):
+        socket_stat = os.lstat(socket_path)
+        if not stat.S_ISSOCK(socket_stat.st_mode):
+            raise FileExistsError(f"{socket_path} exists and is not a socket")
+        os.unlink(socket_path)
+
+
+def warm_up(main_cls: "type[xDSLOptMain]") -> None:
+    """
+    Import and load all the dialects and passes available to the driver, so that
+    the forked processes do not have to.
+    """
+    main = main_cls(args=[])
+    for name in tuple(main.ctx.registered_dialect_names):
+        try:
+            main.ctx.load_registered_dialect(name)
+        except ImportError:
+            # Dialects with missing optional dependencies are loaded on use
+            pass
+    for pass_factory in main.available_passes.values():
+        try:
+            pass_factory()
+        except ImportError:
+            pass
+
+
+def serve(socket_path: str, main_cls: "type[xDSLOptMain] | None" = None) -> None:
+    """
+    Serve xdsl-opt invocations on a Unix socket until interrupted.
+
+    Each invocation runs in a forked process, so that the state of the server is
+    not modified by the invocations.
+    """
+    if main_cls is None:
+        from xdsl.xdsl_opt_main import xDSLOptMain
+
+        main_cls = xDSLOptMain
+
+    warm_up(main_cls)
+
+    _prepare_socket_dir(socket_path)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Only let the current user connect, from the moment the socket is created
+    umask = os.umask(0o177)
+    try:
+        server.bind(socket_path)
+    finally:
+        os.umask(umask)
+    os.chmod(socket_path, 0o600)
+    server.listen()
+
+    # Let the kernel reap the forked processes
+    signal.signal(signal.SIGCHLD, signal.SIG_IGN)
+    try:
+        while True:
+            conn, _ = server.accept()
+            if (uid := _peer_uid(conn)) is not None and uid != os.getuid():
+                print(
+                    f"xdsl-opt-server: refusing connection from user {uid}",
+                    file=sys.stderr,
+                )
+                conn.close()
+                continue
+            if os.fork() == 0:
+                server.close()
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                exit_code = _handle_request(conn, main_cls)
+                os._exit(exit_code)
+            conn.close()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        os.unlink(socket_path)
+
+
+def _handle_request(conn: socket.socket, main_cls: "type[xDSLOptMain]") -> int:
+    """
+    Run the invocation sent on the connection with the standard streams of the
+    client, and send back its exit code.
+    """
+    message, fds, _, _ = socket.recv_fds(conn, _MAX_REQUEST_SIZE, 3)
+    if len(fds) != 3:
+        return 1
+    request = json.loads(message)
+
+    for fd, target in zip(fds, (0, 1, 2)):
+        os.dup2(fd, target)
+        os.close(fd)
+    # The streams of the server may have been replaced, so use the new descriptors
+    sys.stdin = open(0, closefd=False)
+    sys.stdout = open(1, "w", closefd=False)
+    sys.stderr = open(2, "w", closefd=False)
+
+    exit_code = 0
+    try:
+        os.chdir(request["cwd"])
+        sys.argv = ["xdsl-opt", *request["argv"]]
+        main_cls(args=request["argv"]).run()
+    except SystemExit as e:
+        if e.code is None:
+            exit_code = 0
+        elif isinstance(e.code, int):
+            exit_code = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            exit_code = 1
+    except BaseException:
+        traceback.print_exc()
+        exit_code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+    conn.sendall(struct.pack(_EXIT_CODE_FORMAT, exit_code))
+    conn.close()
+    return exit_code
+
+
+def run_client(argv: Sequence[str], socket_path: str) -> int | None:
+    """
+    Forward an xdsl-opt invocation to the server, and return its exit code, or
+    None if no server of the current user is listening on the socket.
+    """
+    try:
+        socket_stat = os.lstat(socket_path)
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISSOCK(socket_stat.st_mode) or socket_stat.st_uid != os.getuid():
+        print(
+            f"xdsl-opt: ignoring {socket_path}, which is not a socket of the current "
+            "user",
+            file=sys.stderr,
+        )
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(socket_path)
+    except (FileNotFoundError, ConnectionRefusedError):
+        client.close()
+        return None
+
+    with client:
+        # The socket may have been replaced since it was checked
+        if (uid := _peer_uid(client)) is not None and uid != os.getuid():
+            print(
+                f"xdsl-opt: ignoring {socket_path}, which is served by user {uid}",
+                file=sys.stderr,
+            )
+            return None
+
+        request = json.dumps({"argv": list(argv), "cwd": os.getcwd()}).encode()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        socket.send_fds(client, [request], [0, 1, 2])
+
+        response = b""
+        size = struct.calcsize(_EXIT_CODE_FORMAT)
+        while len(response) < size:
+            data = client.recv(size - len(response))
+            if not data:
+                # The forked process died without reporting its exit code
+                return 1
+            response += data
+    return struct.unpack(_EXIT_CODE_FORMAT, response)[0]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(
+        description="Serve xdsl-opt invocations from a warmed process"
+    )
+    arg_parser.add_argument(
+        "--socket",
+        type=str,
+        default=None,
+        help="path to the Unix socket to listen on",
+    )
+    args = arg_parser.parse_args()
+    serve(args.socket or default_socket_path())
+
+
+def client_main():
+    """
+    Run xdsl-opt through the server, or in this process if no server is running.
+    """
+    argv = sys.argv[1:]
+    exit_code = run_client(argv, default_socket_path())
+    if exit_code is None:
+        from xdsl.xdsl_opt_main import xDSLOptMain
+
+        xDSLOptMain(args=argv).run()
+        exit_code = 0
+    sys.exit(exit_code)
+
+
+if "__main__" == __name__:
+    main()
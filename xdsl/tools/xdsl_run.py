@@ -56,6 +56,20 @@ class xDSLRunMain(CommandLineTool):
             nargs="?",
             help="Bitwidth of the index type representation.",
         )
+        arg_parser.add_argument(
+            "--compiled",
+            default=False,
+            action="store_true",
+            help="Compile each region to closures the first time it is run, instead "
+            "of dispatching on each operation every time it is run.",
+        )
+        arg_parser.add_argument(
+            "--numpy",
+            default=False,
+            action="store_true",
+            help="Interpret linalg operations on floats with NumPy, which must be "
+            "installed.",
+        )
         arg_parser.add_argument(
             "--args",
             default="",
@@ -67,6 +81,10 @@ class xDSLRunMain(CommandLineTool):
 
     def register_implementations(self, interpreter: Interpreter):
         register_implementations(interpreter, self.ctx)
+        if self.args.numpy:
+            from xdsl.interpreters.linalg_numpy import NumPyLinalgFunctions
+
+            interpreter.register_implementations(NumPyLinalgFunctions(), override=True)
 
     def run(self):
         input, file_extension = self.get_input_stream()
@@ -75,7 +93,9 @@ class xDSLRunMain(CommandLineTool):
             if module is not None:
                 module.verify()
                 interpreter = Interpreter(
-                    module, index_bitwidth=self.args.index_bitwidth
+                    module,
+                    index_bitwidth=self.args.index_bitwidth,
+                    compiled=self.args.compiled,
                 )
                 self.register_implementations(interpreter)
                 symbol = self.args.symbol
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import abc
 from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import TYPE_CHECKING
@@ -13,7 +15,7 @@ from xdsl.utils.exceptions import VerifyException
 if TYPE_CHECKING:
     from xdsl.dialects.builtin import StringAttr, SymbolRefAttr
     from xdsl.ir import Attribute, Operation, Region, SSAValue
-    from xdsl.pattern_rewriter import RewritePattern
+    from xdsl.pattern_rewriter import PatternRewriterListener, RewritePattern
 
 
 @dataclass(frozen=True)
@@ -332,6 +334,9 @@ class SymbolTable(OpTrait):
         # import builtin here to avoid circular import
         from xdsl.dialects.builtin import StringAttr, SymbolRefAttr
 
+        if (symbol_tables := _cached_symbol_tables.get()) is not None:
+            return symbol_tables.lookup_symbol(op, name)
+
         anchor: Operation | None = op
         while anchor is not None and not anchor.has_trait(SymbolTable):
             anchor = anchor.parent_op()
@@ -393,6 +398,192 @@ class SymbolTable(OpTrait):
             return defined_symbol
 
 
+_cached_symbol_tables = ContextVar["SymbolTableCollection | None"](
+    "cached_symbol_tables", default=None
+)
+"""The collection used by `SymbolTable.lookup_symbol`, if any."""
+
+
+@contextmanager
+def cached_symbol_lookups(
+    symbol_tables: SymbolTableCollection | None = None,
+) -> Iterator[SymbolTableCollection]:
+    """
+    Make `SymbolTable.lookup_symbol` go through a `SymbolTableCollection` in this
+    context, instead of scanning the symbol table on each lookup.
+
+    The IR should not be modified in this context, unless the modifications are
+    notified to the collection. If a collection is already in use, it is kept.
+    """
+    if (current := _cached_symbol_tables.get()) is not None:
+        yield current
+        return
+    if symbol_tables is None:
+        symbol_tables = SymbolTableCollection()
+    token = _cached_symbol_tables.set(symbol_tables)
+    try:
+        yield symbol_tables
+    finally:
+        _cached_symbol_tables.reset(token)
+
+
+@dataclass(eq=False)
+class SymbolTableCollection:
+    """
+    A cache of the symbols defined in symbol table operations, mapping their names to
+    the operations defining them. This makes lookups constant time, instead of
+    linear in the number of operations in the symbol table.
+
+    The symbols of a symbol table operation are indexed on the first lookup. The
+    index is then kept up to date by the `handle_operation_*` methods, which should
+    be called when the IR is modified, for instance by adding them to a rewriter
+    listener with `add_to_listener`. Other modifications of the IR, such as moving
+    blocks, require a call to `invalidate`.
+
+    See external [documentation](https://mlir.llvm.org/doxygen/classmlir_1_1SymbolTableCollection.html).
+    """
+
+    _symbol_tables: dict[Operation, dict[str, Operation]] = field(
+        default_factory=dict["Operation", dict[str, "Operation"]], init=False
+    )
+    """The symbols of each indexed symbol table operation."""
+
+    @staticmethod
+    def _get_symbol_name(op: Operation) -> str | None:
+        if (sym_interface := op.get_trait(SymbolOpInterface)) is None:
+            return None
+        try:
+            sym_name = sym_interface.get_sym_attr_name(op)
+        except VerifyException:
+            return None
+        return None if sym_name is None else sym_name.data
+
+    def get_symbols(self, symbol_table_op: Operation) -> dict[str, Operation]:
+        """
+        Get the symbols defined in a symbol table operation, indexing them if they
+        are not already.
+        """
+        if (symbols := self._symbol_tables.get(symbol_table_op)) is None:
+            symbols = {}
+            for o in symbol_table_op.regions[0].block.ops:
+                if (sym_name := self._get_symbol_name(o)) is not None:
+                    symbols.setdefault(sym_name, o)
+            self._symbol_tables[symbol_table_op] = symbols
+        return symbols
+
+    def lookup_symbol_in(
+        self, symbol_table_op: Operation, name: str | StringAttr | SymbolRefAttr
+    ) -> Operation | None:
+        """Lookup a symbol by reference, in the given symbol table operation."""
+        # import builtin here to avoid circular import
+        from xdsl.dialects.builtin import StringAttr, SymbolRefAttr
+
+        if isinstance(name, str):
+            return self.get_symbols(symbol_table_op).get(name)
+        if isinstance(name, StringAttr):
+            return self.get_symbols(symbol_table_op).get(name.data)
+        o = self.get_symbols(symbol_table_op).get(name.root_reference.data)
+        if o is None or not name.nested_references:
+            return o
+        nested_root, *nested_references = name.nested_references.data
+        return self.lookup_symbol(o, SymbolRefAttr(nested_root, nested_references))
+
+    def lookup_symbol(
+        self, op: Operation, name: str | StringAttr | SymbolRefAttr
+    ) -> Operation | None:
+        """
+        Lookup a symbol by reference, starting from a specific operation's closest
+        SymbolTable parent.
+        """
+        anchor: Operation | None = op
+        while anchor is not None and not anchor.has_trait(SymbolTable):
+            anchor = anchor.parent_op()
+        if anchor is None:
+            raise ValueError(f"Operation {op} has no SymbolTable ancestor")
+        return self.lookup_symbol_in(anchor, name)
+
+    def insert_or_update(
+        self, symbol_table_op: Operation, symbol_op: Operation
+    ) -> Operation | None:
+        """
+        Same as `SymbolTable.insert_or_update`, keeping the index of the symbol
+        table up to date.
+        """
+        if (sym_name := self._get_symbol_name(symbol_op)) is None:
+            raise ValueError("Passed symbol_op does not have a symbol attribute name")
+        if not symbol_table_op.has_trait(SymbolTable):
+            raise ValueError("Passed symbol_table_op does not have a SymbolTable trait")
+
+        symbols = self.get_symbols(symbol_table_op)
+        defined_symbol = symbols.get(sym_name)
+        if defined_symbol is None:
+            symbol_table_op.regions[0].blocks[0].add_op(symbol_op)
+        else:
+            self.handle_operation_removal(defined_symbol)
+            parent = defined_symbol.parent
+            assert parent is not None
+            parent.insert_op_after(symbol_op, defined_symbol)
+            parent.detach_op(defined_symbol)
+        symbols[sym_name] = symbol_op
+        return defined_symbol
+
+    def invalidate(self, symbol_table_op: Operation | None = None) -> None:
+        """
+        Drop the index of a symbol table operation, or of all of them if None is
+        given.
+        """
+        if symbol_table_op is None:
+            self._symbol_tables.clear()
+        else:
+            self._symbol_tables.pop(symbol_table_op, None)
+
+    def _get_parent_symbols(self, op: Operation) -> dict[str, Operation] | None:
+        """Get the index of the parent symbol table of an operation, if any."""
+        if (parent := op.parent_op()) is None:
+            return None
+        return self._symbol_tables.get(parent)
+
+    def handle_operation_insertion(self, op: Operation) -> None:
+        """Update the index after an operation was inserted."""
+        if (symbols := self._get_parent_symbols(op)) is None:
+            return
+        if (sym_name := self._get_symbol_name(op)) is not None:
+            # The first definition of a symbol is the one that is looked up
+            if sym_name in symbols and symbols[sym_name] is not op:
+                self.invalidate(op.parent_op())
+            else:
+                symbols[sym_name] = op
+
+    def handle_operation_removal(self, op: Operation) -> None:
+        """Update the index before an operation is removed."""
+        if (symbols := self._get_parent_symbols(op)) is not None:
+            if (sym_name := self._get_symbol_name(op)) is not None:
+                if symbols.get(sym_name) is op:
+                    del symbols[sym_name]
+        if op.regions:
+            for nested_op in op.walk():
+                self._symbol_tables.pop(nested_op, None)
+
+    def handle_operation_modification(self, op: Operation) -> None:
+        """Update the index after an operation was modified, possibly renaming it."""
+        if (symbols := self._get_parent_symbols(op)) is None:
+            return
+        sym_name = self._get_symbol_name(op)
+        if sym_name is None and op.get_trait(SymbolOpInterface) is None:
+            return
+        if sym_name is None or symbols.get(sym_name) is not op:
+            # The symbol may have been renamed
+            self.invalidate(op.parent_op())
+
+    def add_to_listener(self, listener: PatternRewriterListener) -> None:
+        """Keep the index up to date with the modifications notified to a listener."""
+        listener.operation_insertion_handler.append(self.handle_operation_insertion)
+        listener.operation_removal_handler.append(self.handle_operation_removal)
+        listener.operation_modification_handler.append(
+            self.handle_operation_modification
+        )
+
+
 class SymbolOpInterface(OpTrait):
     """
     A `Symbol` is a named operation that resides immediately within a region that defines
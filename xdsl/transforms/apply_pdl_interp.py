@@ -6,6 +6,10 @@ from xdsl.dialects import builtin, pdl_interp
 from xdsl.dialects.builtin import ModuleOp
 from xdsl.interpreter import Interpreter
 from xdsl.interpreters.pdl_interp import PDLInterpFunctions
+from xdsl.interpreters.pdl_interp_compiler import (
+    CompiledPDLInterpFunction,
+    PDLInterpCompiler,
+)
 from xdsl.ir import Operation
 from xdsl.parser import Parser
 from xdsl.passes import ModulePass
@@ -47,12 +51,32 @@ class PDLInterpRewritePattern(RewritePattern):
         self.interpreter.call_op(self.matcher, (xdsl_op,))
 
 
+@dataclass
+class CompiledPDLInterpRewritePattern(RewritePattern):
+    """
+    A rewrite pattern that calls a pdl_interp matcher compiled by
+    `PDLInterpCompiler`, instead of interpreting it.
+    """
+
+    matcher: CompiledPDLInterpFunction
+    name: None | str = None
+
+    def match_and_rewrite(self, xdsl_op: Operation, rewriter: PatternRewriter) -> None:
+        self.matcher(rewriter, (xdsl_op,))
+
+
 @dataclass(frozen=True)
 class ApplyPDLInterpPass(ModulePass):
     name = "apply-pdl-interp"
 
     pdl_interp_file: str | None = None
 
+    compiled: bool = False
+    """
+    Whether to compile the matcher and rewriters to Python functions, instead of
+    interpreting them.
+    """
+
     def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
         if self.pdl_interp_file is not None:
             assert os.path.exists(self.pdl_interp_file)
@@ -68,8 +92,15 @@ class ApplyPDLInterpPass(ModulePass):
                 matcher = cur
                 break
         assert matcher is not None, "matcher function not found"
-        interpreter = Interpreter(pdl_interp_module)
-        implementations = PDLInterpFunctions(ctx)
-        interpreter.register_implementations(implementations)
-        rewrite_pattern = PDLInterpRewritePattern(matcher, interpreter, implementations)
+        rewrite_pattern: RewritePattern
+        if self.compiled:
+            compiled_matcher = PDLInterpCompiler(ctx).compile(matcher)
+            rewrite_pattern = CompiledPDLInterpRewritePattern(compiled_matcher)
+        else:
+            interpreter = Interpreter(pdl_interp_module)
+            implementations = PDLInterpFunctions(ctx)
+            interpreter.register_implementations(implementations)
+            rewrite_pattern = PDLInterpRewritePattern(
+                matcher, interpreter, implementations
+            )
         PatternRewriteWalker(rewrite_pattern).rewrite_module(op)
@@ -23,11 +23,16 @@ class RehoistConstInLoops(RewritePattern):
 
     @op_type_rewrite_pattern
     def match_and_rewrite(self, op: scf.ForOp, rewriter: PatternRewriter) -> None:
+        hoisted = False
         for child_op in op.body.ops:
             if child_op.has_trait(ConstantLike):
                 # we only rehoist consts that are not embeded in another region inside the loop
                 rewriter.insert_op_before_matched_op((new_const := child_op.clone(),))
                 rewriter.replace_op(child_op, (), new_const.results)
+                hoisted = True
+        # The constants may now be hoisted out of an enclosing loop
+        if hoisted and isinstance(parent := op.parent_op(), scf.ForOp):
+            rewriter.notify_op_modified(parent)
 
 
 class SimplifyTrivialLoops(RewritePattern):
@@ -9,6 +9,7 @@ from xdsl.pattern_rewriter import (
 )
 from xdsl.rewriter import InsertPoint
 from xdsl.transforms.common_subexpression_elimination import cse
+from xdsl.transforms.dead_code_elimination import region_dce
 
 
 class ApplyRedundantOperands(RewritePattern):
@@ -21,27 +22,31 @@ class ApplyRedundantOperands(RewritePattern):
         unique_operands = list[SSAValue]()
         rbargs = list[int]()
 
-        found_duplicate: bool = False
-
         for i, o in enumerate(op.args):
             try:
                 ui = unique_operands.index(o)
                 rbargs.append(ui)
-                found_duplicate = True
             except ValueError:
                 unique_operands.append(o)
                 rbargs.append(i)
 
-        if not found_duplicate:
+        bbargs = op.region.block.args
+        # Duplicate block arguments that are already unused are left to
+        # `ApplyUnusedOperands`
+        duplicates = [
+            (a, bbargs[rbargs[i]])
+            for i, a in enumerate(bbargs)
+            if rbargs[i] != i and a.uses
+        ]
+        if not duplicates:
             return
 
-        bbargs = op.region.block.args
-        for i, a in enumerate(bbargs):
-            if rbargs[i] == i:
-                continue
-            a.replace_by(bbargs[rbargs[i]])
+        for a, unique in duplicates:
+            rewriter.replace_all_uses_with(a, unique)
 
         cse(op.region.block, rewriter)
+        # The duplicate block arguments are now unused
+        rewriter.notify_op_modified(op)
 
 
 class ApplyUnusedOperands(RewritePattern):
@@ -109,6 +114,9 @@ class ApplyUnusedResults(RewritePattern):
 
         rewriter.replace_op(old_return, stencil.ReturnOp.get(return_args))
         rewriter.replace_matched_op(new, replace_results)
+        # Erase the computations of the removed results, so that the block
+        # arguments they used are removed when `new` is rewritten
+        region_dce(new.region, rewriter)
 
 
 class RemoveCastWithNoEffect(RewritePattern):
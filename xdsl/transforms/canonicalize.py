@@ -1,42 +1,66 @@
+from dataclasses import dataclass, field
+
 from xdsl.context import Context
-from xdsl.dialects import builtin
-from xdsl.ir import Operation
-from xdsl.passes import ModulePass
+from xdsl.ir import Operation, Region
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
+    PatternRewriterListener,
     RewritePattern,
 )
 from xdsl.traits import HasCanonicalizationPatternsTrait
 from xdsl.transforms.dead_code_elimination import RemoveUnusedOperations, region_dce
 
 
+@dataclass(eq=False)
 class CanonicalizationRewritePattern(RewritePattern):
     """Rewrite pattern that applies a canonicalization pattern."""
 
-    def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter, /):
+    _patterns_by_op_type: dict[type[Operation], RewritePattern | None] = field(
+        default_factory=dict[type[Operation], RewritePattern | None], init=False
+    )
+    """
+    The canonicalization patterns of each operation type encountered so far, or
+    `None` if the operation type has none.
+    """
+
+    def _get_pattern(self, op: Operation) -> RewritePattern | None:
+        op_type = type(op)
+        if op_type in self._patterns_by_op_type:
+            return self._patterns_by_op_type[op_type]
         traits = op.get_traits_of_type(HasCanonicalizationPatternsTrait)
-        if not traits:
-            return
         patterns = tuple(
-            pattern for trait in traits for pattern in trait.get_patterns(type(op))
+            pattern for trait in traits for pattern in trait.get_patterns(op_type)
         )
-        if len(patterns) == 1:
-            patterns[0].match_and_rewrite(op, rewriter)
-            return
-        GreedyRewritePatternApplier(list(patterns)).match_and_rewrite(op, rewriter)
+        pattern: RewritePattern | None
+        if not patterns:
+            pattern = None
+        elif len(patterns) == 1:
+            pattern = patterns[0]
+        else:
+            pattern = GreedyRewritePatternApplier(list(patterns))
+        self._patterns_by_op_type[op_type] = pattern
+        return pattern
+
+    def match_and_rewrite(self, op: Operation, rewriter: PatternRewriter, /):
+        if (pattern := self._get_pattern(op)) is not None:
+            pattern.match_and_rewrite(op, rewriter)
 
 
-class CanonicalizePass(ModulePass):
+class CanonicalizePass(PatternRewritePass):
     """
     Applies all canonicalization patterns.
     """
 
     name = "canonicalize"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        pattern = GreedyRewritePatternApplier(
+    worklist_driven = True
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
             [RemoveUnusedOperations(), CanonicalizationRewritePattern()]
         )
-        PatternRewriteWalker(pattern, post_walk_func=region_dce).rewrite_module(op)
+
+    def post_walk(self, region: Region, listener: PatternRewriterListener) -> bool:
+        return region_dce(region, listener)
@@ -1,9 +1,8 @@
 from xdsl.dialects import builtin, stencil
 from xdsl.dialects.experimental import dmp
-from xdsl.passes import Context, ModulePass
+from xdsl.passes import Context, PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -27,8 +26,8 @@ class CanonicalizeDmpSwap(RewritePattern):
             op.swaps = builtin.ArrayAttr(keeps)
 
 
-class CanonicalizeDmpPass(ModulePass):
+class CanonicalizeDmpPass(PatternRewritePass):
     name = "canonicalize-dmp"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(CanonicalizeDmpSwap()).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return CanonicalizeDmpSwap()
@@ -5,7 +5,8 @@ from typing_extensions import TypeVar
 from xdsl.context import Context
 from xdsl.dialects.builtin import ModuleOp, UnregisteredOp
 from xdsl.ir import Block, Operation, Region, Use
-from xdsl.passes import ModulePass
+from xdsl.irdl.dominance import DominanceInfo, PostDominanceInfo
+from xdsl.passes import AnalysisManager, ModulePass, PreservedAnalyses
 from xdsl.pattern_rewriter import PatternRewriter
 from xdsl.rewriter import Rewriter
 from xdsl.traits import (
@@ -19,6 +20,35 @@ from xdsl.traits import (
 from xdsl.transforms.dead_code_elimination import is_trivially_dead
 
 
+def _region_hash(region: Region) -> int:
+    """
+    Hash the structure of a region, such that structurally equivalent regions have
+    the same hash. Operands are not hashed, as they may be defined in the region.
+    """
+    return hash(
+        tuple(
+            (
+                tuple(arg.type for arg in block.args),
+                tuple(
+                    hash(
+                        (
+                            op.name,
+                            sum(hash(i) for i in op.attributes.items()),
+                            sum(hash(i) for i in op.properties.items()),
+                            len(op.operands),
+                            len(op.results),
+                            len(op.successors),
+                            tuple(_region_hash(r) for r in op.regions),
+                        )
+                    )
+                    for op in block.ops
+                ),
+            )
+            for block in region.blocks
+        )
+    )
+
+
 @dataclass
 class OperationInfo:
     """
@@ -30,6 +60,9 @@ class OperationInfo:
 
     op: Operation
 
+    _hash: int | None = field(default=None, repr=False)
+    """The hash of the operation, computed on first use if not given."""
+
     @property
     def name(self):
         return (
@@ -39,20 +72,26 @@ class OperationInfo:
         )
 
     def __hash__(self):
-        return hash(
-            (
-                self.name,
-                sum(hash(i) for i in self.op.attributes.items()),
-                sum(hash(i) for i in self.op.properties.items()),
-                hash(self.op.result_types),
-                hash(self.op.operands),
+        if self._hash is None:
+            self._hash = hash(
+                (
+                    self.name,
+                    sum(hash(i) for i in self.op.attributes.items()),
+                    sum(hash(i) for i in self.op.properties.items()),
+                    hash(self.op.result_types),
+                    hash(self.op.operands),
+                    tuple(_region_hash(r) for r in self.op.regions),
+                )
             )
-        )
+        return self._hash
 
     def __eq__(self, other: object):
+        if not isinstance(other, OperationInfo):
+            return False
+        if self.op is other.op:
+            return True
         return (
-            isinstance(other, OperationInfo)
-            and hash(self) == hash(other)
+            hash(self) == hash(other)
             and self.name == other.name
             and self.op.attributes == other.op.attributes
             and self.op.properties == other.op.properties
@@ -73,48 +112,64 @@ class KnownOps:
     Cache dictionary for known operations used in CSE.
     It quacks like a dict[Operation, Operation], but uses OperationInfo of an Operation
     as the actual key.
+
+    The hash of each operation is computed once, and shared with the copies of this
+    cache. Operations that are modified after being hashed should be passed to
+    `invalidate`, for instance by registering it as an operation modification
+    handler.
     """
 
     _known_ops: dict[OperationInfo, Operation]
+    _hashes: dict[Operation, int]
 
     def __init__(self, known_ops: "KnownOps | None" = None):
         if known_ops is None:
             self._known_ops = {}
+            self._hashes = {}
         else:
             self._known_ops = dict(known_ops._known_ops)
+            self._hashes = known_ops._hashes
+
+    def _info(self, op: Operation) -> OperationInfo:
+        if (op_hash := self._hashes.get(op)) is None:
+            info = OperationInfo(op)
+            self._hashes[op] = hash(info)
+            return info
+        return OperationInfo(op, op_hash)
+
+    def invalidate(self, op: Operation):
+        """Drop the hash of an operation, which must be called when it is modified."""
+        self._hashes.pop(op, None)
+
+    def is_key(self, op: Operation) -> bool:
+        """
+        Returns if the operation itself is a key of the cache, without hashing it if
+        it was never hashed before.
+        """
+        if (op_hash := self._hashes.get(op)) is None:
+            return False
+        return self._known_ops.get(OperationInfo(op, op_hash)) is op
 
     def __getitem__(self, k: Operation):
-        return self._known_ops[OperationInfo(k)]
+        return self._known_ops[self._info(k)]
 
     def __setitem__(self, k: Operation, v: Operation):
-        self._known_ops[OperationInfo(k)] = v
+        self._known_ops[self._info(k)] = v
 
     def __contains__(self, k: Operation):
-        return OperationInfo(k) in self._known_ops
+        return self._info(k) in self._known_ops
 
     def get(self, k: Operation, default: _D = None) -> Operation | _D:
-        return self._known_ops.get(OperationInfo(k), default)
+        return self._known_ops.get(self._info(k), default)
 
     def pop(self, k: Operation):
-        return self._known_ops.pop(OperationInfo(k))
+        return self._known_ops.pop(self._info(k))
 
 
-def has_other_side_effecting_op_in_between(
-    from_op: Operation, to_op: Operation
-) -> bool:
-    """
-    Returns if there *may* be a 'write' effecting operation between `from_op` and
-    `to_op`.
-    """
-    assert from_op.parent is to_op.parent
-    next_op = from_op
-    while next_op is not to_op:
-        effects = get_effects(next_op)
-        if effects is None or any(e.kind is MemoryEffectKind.WRITE for e in effects):
-            return True
-        next_op = next_op.next_op
-        assert next_op is not None, "Incorrect order of ops in side-effect search"
-    return False
+def _may_write(op: Operation) -> bool:
+    """Returns if the operation *may* have a 'write' effect."""
+    effects = get_effects(op)
+    return effects is None or any(e.kind is MemoryEffectKind.WRITE for e in effects)
 
 
 @dataclass
@@ -124,8 +179,19 @@ class CSEDriver:
     """
 
     _rewriter: Rewriter | PatternRewriter = field(default_factory=Rewriter)
+    _analyses: AnalysisManager = field(default_factory=AnalysisManager)
+    """The analysis manager from which the dominance of regions is taken."""
     _to_erase: set[Operation] = field(default_factory=set[Operation])
     _known_ops: KnownOps = field(default_factory=KnownOps)
+    _memory_generation: int = field(default=0)
+    """
+    The number of operations that may write to memory met so far in the current
+    block.
+    """
+    _read_generations: dict[Operation, int] = field(
+        default_factory=dict[Operation, int]
+    )
+    """The memory generation of the known read-only operations."""
 
     def _mark_erasure(self, op: Operation):
         self._to_erase.add(op)
@@ -142,10 +208,14 @@ class CSEDriver:
 
         # Just replace results
         def wasVisited(use: Use):
-            return use.operation not in self._known_ops
+            # A user that is not a key itself but equal to a key also uses the
+            # result through that key, so only the users themselves are checked
+            return not self._known_ops.is_key(use.operation)
 
         for o, n in zip(op.results, existing.results, strict=True):
             if all(wasVisited(u) for u in o.uses):
+                for use in o.uses:
+                    self._known_ops.invalidate(use.operation)
                 o.replace_by(n)
 
         # If no uses remain, we can mark this operation for erasure
@@ -184,7 +254,7 @@ class CSEDriver:
                     op.parent_block() is existing.parent_block()
                     # We then ensure there are no 'write' side-effecting operations
                     # in between the two, that could change the result of the operation
-                    and not has_other_side_effecting_op_in_between(existing, op)
+                    and self._read_generations.get(existing) == self._memory_generation
                 ):
                     self._replace_and_delete(op, existing)
                     return
@@ -192,6 +262,7 @@ class CSEDriver:
             # The operation is a CSE candidate, but we did not find a replacement
             # Mark it for any later occurence
             self._known_ops[op] = op
+            self._read_generations[op] = self._memory_generation
             return
 
         # If we know the operation is side-effect free, we can just replace it
@@ -204,6 +275,8 @@ class CSEDriver:
         self._known_ops[op] = op
 
     def _simplify_block(self, block: Block):
+        old_generation = self._memory_generation
+        self._memory_generation = 0
         for op in block.ops:
             if op.regions:
                 might_be_isolated = isinstance(op, UnregisteredOp) or (
@@ -223,6 +296,9 @@ class CSEDriver:
                         self._simplify_region(region)
 
             self._simplify_operation(op)
+            if _may_write(op):
+                self._memory_generation += 1
+        self._memory_generation = old_generation
 
     def _simplify_region(self, region: Region):
         if not region.blocks:
@@ -235,6 +311,25 @@ class CSEDriver:
             self._simplify_block(region.block)
 
             self._known_ops = old_scope
+            return
+
+        # Walk the dominator tree of the blocks reachable from the entry block, so
+        # that the operations of a block can be replaced by the operations of the
+        # blocks dominating it.
+        dominance = self._analyses.get_analysis(DominanceInfo, region)
+        old_scope = self._known_ops
+        entry = region.blocks.first
+        assert entry is not None
+        worklist = [(entry, old_scope)]
+        while worklist:
+            block, scope = worklist.pop()
+            self._known_ops = KnownOps(scope)
+            self._simplify_block(block)
+            block_scope = self._known_ops
+            worklist.extend(
+                (child, block_scope) for child in reversed(dominance.children(block))
+            )
+        self._known_ops = old_scope
 
     def simplify(self, thing: Operation | Block | Region):
         match thing:
@@ -251,15 +346,28 @@ class CSEDriver:
 def cse(
     thing: Operation | Block | Region,
     rewriter: Rewriter | PatternRewriter | None = None,
+    analyses: AnalysisManager | None = None,
 ):
+    if analyses is None:
+        analyses = AnalysisManager()
     if rewriter is not None:
-        CSEDriver(_rewriter=rewriter).simplify(thing)
+        CSEDriver(_rewriter=rewriter, _analyses=analyses).simplify(thing)
     else:
-        CSEDriver().simplify(thing)
+        CSEDriver(_analyses=analyses).simplify(thing)
 
 
 class CommonSubexpressionElimination(ModulePass):
     name = "cse"
 
+    # Only operations that are not terminators are erased, so the blocks of the
+    # remaining regions and their successors are unchanged
+    preserved_analyses = (DominanceInfo, PostDominanceInfo)
+
     def apply(self, ctx: Context, op: ModuleOp) -> None:
-        cse(op)
+        self.apply_with_analyses(ctx, op, AnalysisManager())
+
+    def apply_with_analyses(
+        self, ctx: Context, op: ModuleOp, analyses: AnalysisManager
+    ) -> PreservedAnalyses:
+        cse(op, analyses=analyses)
+        return PreservedAnalyses(frozenset(self.preserved_analyses))
@@ -3,13 +3,11 @@ from itertools import chain
 
 from xdsl.context import Context
 from xdsl.dialects import affine, scf
-from xdsl.dialects.builtin import ModuleOp
 from xdsl.ir import Operation, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -87,20 +85,19 @@ class SCFIfHoistPattern(RewritePattern):
             cse(block, rewriter)
 
 
-class ControlFlowHoistPass(ModulePass):
+class ControlFlowHoistPass(PatternRewritePass):
     """
     Hoist all hoistable ops from control flow ops.
     """
 
     name = "control-flow-hoist"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    AffineIfHoistPattern(),
-                    SCFIfHoistPattern(),
-                ]
-            ),
-            walk_regions_first=True,
-        ).rewrite_module(op)
+    walk_regions_first = True
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                AffineIfHoistPattern(),
+                SCFIfHoistPattern(),
+            ]
+        )
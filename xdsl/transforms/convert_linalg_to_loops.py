@@ -2,13 +2,12 @@ from collections.abc import Sequence
 
 from xdsl.context import Context
 from xdsl.dialects import linalg, memref
-from xdsl.dialects.builtin import MemRefType, ModuleOp
+from xdsl.dialects.builtin import MemRefType
 from xdsl.ir import SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -80,15 +79,14 @@ class LowerGenericOpPattern(RewritePattern):
         )
 
 
-class ConvertLinalgToLoopsPass(ModulePass):
+class ConvertLinalgToLoopsPass(PatternRewritePass):
     """
     Converts a linalg generic to perfectly nested loops.
     """
 
     name = "convert-linalg-to-loops"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier([LowerGenericOpPattern()]),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier([LowerGenericOpPattern()])
@@ -1,11 +1,10 @@
 from xdsl.context import Context
 from xdsl.dialects import linalg, memref_stream
-from xdsl.dialects.builtin import ArrayAttr, IndexType, IntAttr, IntegerAttr, ModuleOp
-from xdsl.passes import ModulePass
+from xdsl.dialects.builtin import ArrayAttr, IndexType, IntAttr, IntegerAttr
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -63,13 +62,12 @@ class ConvertYieldOpPattern(RewritePattern):
         rewriter.replace_matched_op(memref_stream.YieldOp(*op.operands))
 
 
-class ConvertLinalgToMemRefStreamPass(ModulePass):
+class ConvertLinalgToMemRefStreamPass(PatternRewritePass):
     name = "convert-linalg-to-memref-stream"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [ConvertGenericOpPattern(), ConvertYieldOpPattern()]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [ConvertGenericOpPattern(), ConvertYieldOpPattern()]
+        )
@@ -2,13 +2,12 @@ from collections.abc import Sequence
 
 from xdsl.context import Context
 from xdsl.dialects import arith, memref, memref_stream
-from xdsl.dialects.builtin import AffineMapAttr, IntegerAttr, ModuleOp, UnitAttr
+from xdsl.dialects.builtin import AffineMapAttr, IntegerAttr, UnitAttr
 from xdsl.ir import Operation, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -202,15 +201,14 @@ class LowerGenericOpPattern(RewritePattern):
             )
 
 
-class ConvertMemRefStreamToLoopsPass(ModulePass):
+class ConvertMemRefStreamToLoopsPass(PatternRewritePass):
     """
     Converts a memref_stream generic to loop.
     """
 
     name = "convert-memref-stream-to-loops"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier([LowerGenericOpPattern()]),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier([LowerGenericOpPattern()])
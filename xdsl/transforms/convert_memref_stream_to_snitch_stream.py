@@ -21,17 +21,15 @@ from xdsl.dialects.builtin import (
     Float64Type,
     IntAttr,
     MemRefType,
-    ModuleOp,
     UnrealizedConversionCastOp,
     VectorType,
 )
 from xdsl.ir import Attribute, AttributeCovT, Operation
 from xdsl.ir.affine import AffineMap
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -228,7 +226,7 @@ def strides_for_affine_map(
     return result
 
 
-class ConvertMemRefStreamToSnitchStreamPass(ModulePass):
+class ConvertMemRefStreamToSnitchStreamPass(PatternRewritePass):
     """
     Converts memref_stream `read` and `write` operations to the snitch_stream equivalents.
 
@@ -245,15 +243,14 @@ class ConvertMemRefStreamToSnitchStreamPass(ModulePass):
 
     name = "convert-memref-stream-to-snitch-stream"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ReadOpLowering(),
-                    WriteOpLowering(),
-                    StreamOpLowering(),
-                ]
-            ),
-            apply_recursively=False,
-            walk_reverse=True,
-        ).rewrite_module(op)
+    apply_recursively = False
+    walk_reverse = True
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ReadOpLowering(),
+                WriteOpLowering(),
+                StreamOpLowering(),
+            ]
+        )
@@ -3,15 +3,13 @@ from typing import Any, cast
 from xdsl.context import Context
 from xdsl.dialects import bufferization, memref, ml_program
 from xdsl.dialects.builtin import (
-    ModuleOp,
     TensorType,
     UnitAttr,
 )
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -58,7 +56,7 @@ class ConvertGlobalLoadConst(RewritePattern):
         )
 
 
-class ConvertMlProgramToMemRefPass(ModulePass):
+class ConvertMlProgramToMemRefPass(PatternRewritePass):
     """
     Converts operations in the `ml_program` dialect to `memref`.
     `ml_program` operations are at the `tensor` level of abstraction, so some of the
@@ -68,13 +66,12 @@ class ConvertMlProgramToMemRefPass(ModulePass):
 
     name = "convert-ml-program-to-memref"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ConvertGlobalPattern(),
-                    ConvertGlobalLoadConst(),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ConvertGlobalPattern(),
+                ConvertGlobalLoadConst(),
+            ]
+        )
@@ -2,11 +2,10 @@ from dataclasses import dataclass
 
 from xdsl.context import Context
 from xdsl.dialects import arith, builtin, llvm, ptr
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     TypeConversionPattern,
     attr_type_rewrite_pattern,
@@ -91,19 +90,17 @@ class RewritePtrTypes(TypeConversionPattern):
         return llvm.LLVMPointerType.opaque()
 
 
-class ConvertPtrToLLVMPass(ModulePass):
+class ConvertPtrToLLVMPass(PatternRewritePass):
     name = "convert-ptr-to-llvm"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ConvertStoreOp(),
-                    ConvertLoadOp(),
-                    ConvertPtrAddOp(),
-                    ConvertToPtrOp(),
-                    ConvertFromPtrOp(),
-                    RewritePtrTypes(recursive=True),
-                ]
-            )
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ConvertStoreOp(),
+                ConvertLoadOp(),
+                ConvertPtrAddOp(),
+                ConvertToPtrOp(),
+                ConvertFromPtrOp(),
+                RewritePtrTypes(recursive=True),
+            ]
+        )
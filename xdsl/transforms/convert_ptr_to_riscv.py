@@ -11,14 +11,12 @@ from xdsl.dialects.builtin import (
     AnyFloat,
     Float32Type,
     Float64Type,
-    ModuleOp,
     UnrealizedConversionCastOp,
 )
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     TypeConversionPattern,
     attr_type_rewrite_pattern,
@@ -118,18 +116,16 @@ class ConvertMemRefToPtrOp(RewritePattern):
         )
 
 
-class ConvertPtrToRiscvPass(ModulePass):
+class ConvertPtrToRiscvPass(PatternRewritePass):
     name = "convert-ptr-to-riscv"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    PtrTypeConversion(),
-                    ConvertPtrAddOp(),
-                    ConvertStoreOp(),
-                    ConvertLoadOp(),
-                    ConvertMemRefToPtrOp(),
-                ]
-            ),
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                PtrTypeConversion(),
+                ConvertPtrAddOp(),
+                ConvertStoreOp(),
+                ConvertLoadOp(),
+                ConvertMemRefToPtrOp(),
+            ]
+        )
@@ -3,11 +3,10 @@ from typing import cast
 
 from xdsl.context import Context
 from xdsl.dialects import arith, ptr
-from xdsl.dialects.builtin import FixedBitwidthType, IndexType, ModuleOp
-from xdsl.passes import ModulePass
+from xdsl.dialects.builtin import FixedBitwidthType, IndexType
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -28,10 +27,8 @@ class ConvertTypeOffsetOp(RewritePattern):
         )
 
 
-class ConvertPtrTypeOffsetsPass(ModulePass):
+class ConvertPtrTypeOffsetsPass(PatternRewritePass):
     name = "convert-ptr-type-offsets"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            ConvertTypeOffsetOp(),
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return ConvertTypeOffsetOp()
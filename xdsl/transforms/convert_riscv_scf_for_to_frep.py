@@ -2,11 +2,10 @@ from itertools import chain
 
 from xdsl.context import Context
 from xdsl.dialects import builtin, riscv, riscv_scf, riscv_snitch, snitch
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -81,7 +80,7 @@ class ScfYieldLowering(RewritePattern):
             rewriter.replace_matched_op(riscv_snitch.FrepYieldOp(*op.operands))
 
 
-class ConvertRiscvScfForToFrepPass(ModulePass):
+class ConvertRiscvScfForToFrepPass(PatternRewritePass):
     """
     Converts all riscv_scf.for loops to riscv_snitch.frep_outer loops, if the loops pass
     the riscv_snitch.frep_outer verification criteria:
@@ -98,13 +97,12 @@ class ConvertRiscvScfForToFrepPass(ModulePass):
 
     name = "convert-riscv-scf-for-to-frep"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ScfYieldLowering(),
-                    ScfForLowering(),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ScfYieldLowering(),
+                ScfForLowering(),
+            ]
+        )
@@ -6,10 +6,9 @@ from xdsl.dialects.builtin import IntAttr, IntegerAttr, UnrealizedConversionCast
 from xdsl.dialects.llvm import InlineAsmOp
 from xdsl.dialects.riscv import IntRegisterType, RISCVInstruction
 from xdsl.ir import Operation, OpResult, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -128,7 +127,7 @@ class RiscvToLLVMPattern(RewritePattern):
         )
 
 
-class ConvertRiscvToLLVMPass(ModulePass):
+class ConvertRiscvToLLVMPass(PatternRewritePass):
     """
     Convert RISC-V instructions to LLVM inline assembly. This allows for the use
     of an LLVM backend instead of direct RISC-V assembly generation. Additionally,
@@ -151,5 +150,5 @@ class ConvertRiscvToLLVMPass(ModulePass):
 
     xlen: int = 32
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(RiscvToLLVMPattern(self.xlen)).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return RiscvToLLVMPattern(self.xlen)
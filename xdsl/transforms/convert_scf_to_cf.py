@@ -1,5 +1,4 @@
 from xdsl.context import Context
-from xdsl.dialects import builtin
 from xdsl.dialects.arith import AddiOp, CmpiOp, IndexCastOp
 from xdsl.dialects.builtin import (
     DenseIntElementsAttr,
@@ -9,11 +8,10 @@ from xdsl.dialects.builtin import (
 from xdsl.dialects.cf import BranchOp, ConditionalBranchOp, SwitchOp
 from xdsl.dialects.scf import ForOp, IfOp, IndexSwitchOp, YieldOp
 from xdsl.ir import Block, Region
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -222,7 +220,7 @@ class SwitchLowering(RewritePattern):
         rewriter.replace_matched_op((), continue_block.args)
 
 
-class ConvertScfToCf(ModulePass):
+class ConvertScfToCf(PatternRewritePass):
     """
     Lower `scf.for` and `scf.if` to unstructured control flow.
     Implementations are direct translations of the mlir versions found at
@@ -231,13 +229,11 @@ class ConvertScfToCf(ModulePass):
 
     name = "convert-scf-to-cf"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    SwitchLowering(),
-                    IfLowering(),
-                    ForLowering(),
-                ]
-            )
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                SwitchLowering(),
+                IfLowering(),
+                ForLowering(),
+            ]
+        )
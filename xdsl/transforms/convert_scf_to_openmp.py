@@ -4,13 +4,12 @@ from typing import Literal
 from xdsl.builder import ImplicitBuilder
 from xdsl.context import Context
 from xdsl.dialects import arith, memref, omp, scf
-from xdsl.dialects.builtin import IndexType, ModuleOp
+from xdsl.dialects.builtin import IndexType
 from xdsl.ir import Block, Region
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -116,7 +115,7 @@ class ConvertParallel(RewritePattern):
 
 
 @dataclass(frozen=True)
-class ConvertScfToOpenMPPass(ModulePass):
+class ConvertScfToOpenMPPass(PatternRewritePass):
     """
     Convert `scf.parallel` loops to `omp.wsloop` constructs for parallel execution.
     It currently does not support reduction.
@@ -142,19 +141,16 @@ class ConvertScfToOpenMPPass(ModulePass):
 
     name = "convert-scf-to-openmp"
 
+    apply_recursively = False
+
     collapse: int | None = None
     nested: bool = False
     schedule: Literal["static", "dynamic", "auto"] | None = None
     chunk: int | None = None
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ConvertParallel(
-                        self.collapse, self.nested, self.schedule, self.chunk
-                    ),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ConvertParallel(self.collapse, self.nested, self.schedule, self.chunk),
+            ]
+        )
@@ -5,11 +5,10 @@ from xdsl.backend.x86.lowering.helpers import Arch
 from xdsl.context import Context
 from xdsl.dialects import builtin, scf, x86_scf
 from xdsl.ir import Block
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -82,18 +81,16 @@ class ScfYieldLowering(RewritePattern):
 
 
 @dataclass(frozen=True)
-class ConvertScfToX86ScfPass(ModulePass):
+class ConvertScfToX86ScfPass(PatternRewritePass):
     name = "convert-scf-to-x86-scf"
 
     arch: str = field(default="unknown")
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
         arch = Arch.arch_for_name(self.arch)
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ScfYieldLowering(arch),
-                    ScfForLowering(arch),
-                ]
-            )
-        ).rewrite_module(op)
+        return GreedyRewritePatternApplier(
+            [
+                ScfYieldLowering(arch),
+                ScfForLowering(arch),
+            ]
+        )
@@ -1,12 +1,11 @@
 from dataclasses import dataclass
 
 from xdsl.context import Context
-from xdsl.dialects import builtin, memref, ptr, vector
-from xdsl.passes import ModulePass
+from xdsl.dialects import memref, ptr, vector
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -33,16 +32,15 @@ class VectorLoadToPtr(RewritePattern):
 
 
 @dataclass(frozen=True)
-class ConvertVectorToPtrPass(ModulePass):
+class ConvertVectorToPtrPass(PatternRewritePass):
     name = "convert-vector-to-ptr"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    VectorLoadToPtr(),
-                    VectorStoreToPtr(),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                VectorLoadToPtr(),
+                VectorStoreToPtr(),
+            ]
+        )
@@ -1,13 +1,12 @@
 from typing import cast
 
 from xdsl.context import Context
-from xdsl.dialects import builtin, x86, x86_scf
+from xdsl.dialects import x86, x86_scf
 from xdsl.dialects.x86.registers import RFLAGS, GeneralRegisterType
 from xdsl.ir import SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -156,10 +155,10 @@ class LowerX86ScfForPattern(RewritePattern):
         )
 
 
-class ConvertX86ScfToX86Pass(ModulePass):
+class ConvertX86ScfToX86Pass(PatternRewritePass):
     name = "convert-x86-scf-to-x86"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            LowerX86ScfForPattern(), walk_regions_first=True
-        ).rewrite_module(op)
+    walk_regions_first = True
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return LowerX86ScfForPattern()
@@ -2,14 +2,12 @@ from dataclasses import dataclass
 
 from xdsl.context import Context
 from xdsl.dialects import memref, scf
-from xdsl.dialects.builtin import ModuleOp
 from xdsl.dialects.csl import csl_stencil, csl_wrapper
 from xdsl.ir import Block, Operation, Region, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -138,7 +136,7 @@ class DisableComputeInBorderRegion(RewritePattern):
 
 
 @dataclass(frozen=True)
-class CslStencilMaterializeStores(ModulePass):
+class CslStencilMaterializeStores(PatternRewritePass):
     """
     This pass creates stores for values yielded from `csl_stencil.apply.done_exchange.yield`
     to the buffers in `apply.dest`.
@@ -149,13 +147,12 @@ class CslStencilMaterializeStores(ModulePass):
 
     name = "csl-stencil-materialize-stores"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    MaterializeInApplyDest(),
-                    DisableComputeInBorderRegion(),
-                ]
-            ),
-            walk_regions_first=True,
-        ).rewrite_module(op)
+    walk_regions_first = True
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                MaterializeInApplyDest(),
+                DisableComputeInBorderRegion(),
+            ]
+        )
@@ -2,13 +2,12 @@ from dataclasses import dataclass
 
 from xdsl.context import Context
 from xdsl.dialects import arith, memref, stencil
-from xdsl.dialects.builtin import DenseIntOrFPElementsAttr, IntegerAttr, ModuleOp, f32
+from xdsl.dialects.builtin import DenseIntOrFPElementsAttr, IntegerAttr, f32
 from xdsl.dialects.csl import csl, csl_stencil, csl_wrapper
 from xdsl.ir import Operation
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -172,7 +171,7 @@ class GenerateCoeffAPICalls(RewritePattern):
 
 
 @dataclass(frozen=True)
-class CslStencilSetGlobalCoeffs(ModulePass):
+class CslStencilSetGlobalCoeffs(PatternRewritePass):
     """
     Generates a single coeff api call - only works if all csl_stencil.apply ops use the same coeffs.
     `csl_stencil.apply` ops must be in a main csl.func inside a module wrapper.
@@ -180,8 +179,7 @@ class CslStencilSetGlobalCoeffs(ModulePass):
 
     name = "csl-stencil-set-global-coeffs"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GenerateCoeffAPICalls(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GenerateCoeffAPICalls()
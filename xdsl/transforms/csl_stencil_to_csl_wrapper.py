@@ -18,11 +18,10 @@ from xdsl.dialects.builtin import (
 )
 from xdsl.dialects.csl import csl, csl_stencil, csl_wrapper
 from xdsl.ir import Attribute, BlockArgument, Operation, OpResult, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -437,7 +436,7 @@ class LowerTimerFuncCall(RewritePattern):
 
 
 @dataclass(frozen=True)
-class CslStencilToCslWrapperPass(ModulePass):
+class CslStencilToCslWrapperPass(PatternRewritePass):
     """
     Wraps program in the csl_stencil dialect in a csl_wrapper by translating each
     top-level function to one module wrapper.
@@ -445,19 +444,17 @@ class CslStencilToCslWrapperPass(ModulePass):
 
     name = "csl-stencil-to-csl-wrapper"
 
+    apply_recursively = False
+
     target: csl.Target
     """
     Specifies the target architecture.
     """
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        module_pass = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ConvertStencilFuncToModuleWrappedPattern(self.target),
-                    LowerTimerFuncCall(),
-                ]
-            ),
-            apply_recursively=False,
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ConvertStencilFuncToModuleWrappedPattern(self.target),
+                LowerTimerFuncCall(),
+            ]
         )
-        module_pass.rewrite_module(op)
@@ -2,12 +2,10 @@ from dataclasses import dataclass
 
 from xdsl.context import Context
 from xdsl.dialects import memref
-from xdsl.dialects.builtin import ModuleOp
 from xdsl.dialects.csl import csl, csl_wrapper
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -64,13 +62,12 @@ class HoistBuffers(RewritePattern):
 
 
 @dataclass(frozen=True)
-class CslWrapperHoistBuffers(ModulePass):
+class CslWrapperHoistBuffers(PatternRewritePass):
     """
     Hoists buffers to the `csl_wrapper.program_module`-level.
     """
 
     name = "csl-wrapper-hoist-buffers"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        module_pass = PatternRewriteWalker(HoistBuffers())
-        module_pass.rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return HoistBuffers()
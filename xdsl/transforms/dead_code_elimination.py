@@ -136,6 +136,9 @@ class LiveSet:
             if not any(self.is_live(op) for op in block.ops) and block != first:
                 # If block is not the entry block and has no live ops then delete it
                 self.changed = True
+                if listener is not None:
+                    for operation in block.ops:
+                        listener.handle_operation_removal(operation)
                 region.erase_block(block, safe_erase=False)
                 continue
 
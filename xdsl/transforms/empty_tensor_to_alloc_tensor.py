@@ -1,9 +1,8 @@
 from xdsl.context import Context
-from xdsl.dialects import bufferization, builtin, tensor
-from xdsl.passes import ModulePass
+from xdsl.dialects import bufferization, tensor
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -20,7 +19,7 @@ class EmptyTensorLoweringPattern(RewritePattern):
         )
 
 
-class EmptyTensorToAllocTensorPass(ModulePass):
+class EmptyTensorToAllocTensorPass(PatternRewritePass):
     """
     tensor.empty ops return a tensor of unspecified contents whose only purpose
     is to carry the tensor shape. This pass converts such ops to
@@ -29,8 +28,7 @@ class EmptyTensorToAllocTensorPass(ModulePass):
 
     name = "empty-tensor-to-alloc-tensor"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            EmptyTensorLoweringPattern(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return EmptyTensorLoweringPattern()
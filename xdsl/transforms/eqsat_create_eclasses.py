@@ -1,11 +1,10 @@
 from xdsl.context import Context
-from xdsl.dialects import builtin, eqsat, func
+from xdsl.dialects import eqsat, func
 from xdsl.ir import Block
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -52,7 +51,7 @@ class InsertEclassOps(RewritePattern):
         insert_eclass_ops(op.body.block)
 
 
-class EqsatCreateEclassesPass(ModulePass):
+class EqsatCreateEclassesPass(PatternRewritePass):
     """
     Create initial eclasses from an MLIR program.
 
@@ -77,8 +76,7 @@ class EqsatCreateEclassesPass(ModulePass):
 
     name = "eqsat-create-eclasses"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier([InsertEclassOps()]),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier([InsertEclassOps()])
@@ -6,13 +6,12 @@ inputs are constant, replacing the computation with a constant value.
 from dataclasses import dataclass
 
 from xdsl.context import Context
-from xdsl.dialects import builtin, func, pdl, test
+from xdsl.dialects import func, pdl, test
 from xdsl.ir import Block, Region
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -50,20 +49,17 @@ class ReturnOpToPdlRewritePattern(RewritePattern):
         rewriter.erase_matched_op()
 
 
-class FuncToPdlRewrite(ModulePass):
+class FuncToPdlRewrite(PatternRewritePass):
     """
     A pass that transforms a function into a PDL rewrite operation.
     """
 
     name = "func-to-pdl-rewrite"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        """Apply the pass."""
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    FuncOpToPdlRewritePattern(),
-                    ReturnOpToPdlRewritePattern(),
-                ]
-            )
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                FuncOpToPdlRewritePattern(),
+                ReturnOpToPdlRewritePattern(),
+            ]
+        )
@@ -11,10 +11,9 @@ from xdsl.dialects.builtin import (
     StringAttr,
 )
 from xdsl.ir import Block, Operation, Region
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -236,7 +235,7 @@ def unique_pinned_name(module: builtin.ModuleOp, name: str, hint: str) -> str:
     return proposed_name
 
 
-class FunctionConstantPinningPass(ModulePass):
+class FunctionConstantPinningPass(PatternRewritePass):
     """
     This pass consumes IR annotated with special hints to generate new functions that have certain SSA values pinned
     to a constant, usually to enable further optimization options on this pinned function.
@@ -296,5 +295,5 @@ class FunctionConstantPinningPass(ModulePass):
 
     name = "function-constant-pinning"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(FunctionConstantPinning()).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return FunctionConstantPinning()
@@ -1,12 +1,10 @@
 from xdsl.context import Context
-from xdsl.dialects import builtin
 from xdsl.dialects.stencil import ApplyOp, BufferOp, CombineOp, StoreOp
 from xdsl.ir import OpResult, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -46,7 +44,7 @@ class ApplyOpMaterialization(RewritePattern):
             clone.erase()
 
 
-class StencilStorageMaterializationPass(ModulePass):
+class StencilStorageMaterializationPass(PatternRewritePass):
     """
     Pass adding stencil.buffer whenever necessary to lower a stencil dialect IR,
     by adding stencil.buffer on any used stencil.apply output not otherwise mapped
@@ -55,11 +53,9 @@ class StencilStorageMaterializationPass(ModulePass):
 
     name = "stencil-storage-materialization"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ApplyOpMaterialization(),
-                ]
-            )
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ApplyOpMaterialization(),
+            ]
+        )
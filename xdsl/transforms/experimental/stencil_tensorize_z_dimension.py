@@ -2,7 +2,7 @@ from dataclasses import dataclass
 from typing import Any, TypeGuard
 
 from xdsl.context import Context
-from xdsl.dialects import builtin, varith
+from xdsl.dialects import varith
 from xdsl.dialects.arith import (
     ConstantOp,
     FloatingPointLikeBinaryOperation,
@@ -44,7 +44,7 @@ from xdsl.ir import (
     SSAValue,
 )
 from xdsl.irdl import Operand
-from xdsl.passes import ModulePass
+from xdsl.passes import ModulePass, PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
@@ -428,7 +428,7 @@ class ConstOpUpdateShape(RewritePattern):
 
 
 @dataclass(frozen=True)
-class BackpropagateStencilShapes(ModulePass):
+class BackpropagateStencilShapes(PatternRewritePass):
     """
     Greedily back-propagates the result types of tensorized ops.
     Use after creating/modifying tensorization.
@@ -436,23 +436,21 @@ class BackpropagateStencilShapes(ModulePass):
 
     name = "backpropagate-stencil-shapes"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        backpropagate_stencil_shapes = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    CslStencilAccessOpUpdateShape(),
-                    ExtractSliceOpUpdateShape(),
-                    EmptyOpUpdateShape(),
-                    FillOpUpdateShape(),
-                    ArithOpUpdateShape(),
-                    VarithOpUpdateShape(),
-                    ConstOpUpdateShape(),
-                ]
-            ),
-            walk_reverse=True,
-            apply_recursively=False,
+    walk_reverse = True
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                CslStencilAccessOpUpdateShape(),
+                ExtractSliceOpUpdateShape(),
+                EmptyOpUpdateShape(),
+                FillOpUpdateShape(),
+                ArithOpUpdateShape(),
+                VarithOpUpdateShape(),
+                ConstOpUpdateShape(),
+            ]
         )
-        backpropagate_stencil_shapes.rewrite_module(op)
 
 
 @dataclass(frozen=True)
@@ -4,7 +4,7 @@ from xdsl.context import Context
 from xdsl.dialects import builtin, func, llvm
 from xdsl.dialects.builtin import ArrayAttr, DictionaryAttr, StringAttr
 from xdsl.ir import Region
-from xdsl.passes import ModulePass
+from xdsl.passes import ModulePass, PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
     PatternRewriteWalker,
@@ -106,7 +106,7 @@ class TestAddBenchTimersToTopLevelFunctions(ModulePass):
         SymbolTable.insert_or_update(op, end_func)
 
 
-class FunctionPersistArgNamesPass(ModulePass):
+class FunctionPersistArgNamesPass(PatternRewritePass):
     """
     Persists func.func arg name hints to arg_attrs.
 
@@ -118,7 +118,7 @@ class FunctionPersistArgNamesPass(ModulePass):
 
     name = "function-persist-arg-names"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            ArgNamesToArgAttrsPass(), apply_recursively=False
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return ArgNamesToArgAttrsPass()
@@ -1,11 +1,9 @@
 from xdsl.context import Context
 from xdsl.dialects import gpu, memref
-from xdsl.dialects.builtin import ModuleOp
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -28,16 +26,13 @@ class GpuDellocPattern(RewritePattern):
         rewriter.replace_matched_op(gpu.DeallocOp(op.memref))
 
 
-class MemRefToGPUPass(ModulePass):
+class MemRefToGPUPass(PatternRewritePass):
     name = "memref-to-gpu"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        walker = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    GpuAllocPattern(),
-                    GpuDellocPattern(),
-                ]
-            )
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                GpuAllocPattern(),
+                GpuDellocPattern(),
+            ]
         )
-        walker.rewrite_module(op)
@@ -1,14 +1,13 @@
 from xdsl.context import Context
-from xdsl.dialects.builtin import AffineMapAttr, ArrayAttr, ModuleOp
+from xdsl.dialects.builtin import AffineMapAttr, ArrayAttr
 from xdsl.dialects.gpu import LoopDimMapAttr, ProcessorAttr, ProcessorEnum
 from xdsl.dialects.scf import ParallelOp
 from xdsl.ir import Operation
 from xdsl.ir.affine import AffineMap
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -98,11 +97,8 @@ class GpuMapParallelLoopsPattern(RewritePattern):
         mapParallelOp(op)
 
 
-class GpuMapParallelLoopsPass(ModulePass):
+class GpuMapParallelLoopsPass(PatternRewritePass):
     name = "gpu-map-parallel-loops"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        walker = PatternRewriteWalker(
-            GreedyRewritePatternApplier([GpuMapParallelLoopsPattern()])
-        )
-        walker.rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier([GpuMapParallelLoopsPattern()])
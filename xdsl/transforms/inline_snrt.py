@@ -6,11 +6,10 @@ from xdsl.context import Context
 from xdsl.dialects import arith, builtin, riscv, riscv_snitch, snitch_runtime
 from xdsl.dialects.builtin import IntegerAttr
 from xdsl.ir import Operation, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -666,7 +665,7 @@ class LowerClusterIdx(RewritePattern):
 
 
 @dataclass(frozen=True)
-class InlineSnrtPass(SnrtConstants, ModulePass):
+class InlineSnrtPass(SnrtConstants, PatternRewritePass):
     """
     Inline operations of the snrt dialect to their definitions.
 
@@ -675,28 +674,26 @@ class InlineSnrtPass(SnrtConstants, ModulePass):
 
     name = "inline-snrt"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LowerClusterHWBarrier(),
-                    LowerSSRDisable(),
-                    LowerDMAStart1D(),
-                    LowerDMAStart1DWidePtr(),
-                    LowerDMAStart2D(),
-                    LowerDMAStart2DWideptr(),
-                    # information getting ops:
-                    LowerClusterIdx(),
-                    LowerClusterNum(self),
-                    LowerClusterCoreIdx(),
-                    LowerClusterCoreNum(self),
-                    LowerClusterDmCoreNum(self),
-                    LowerClusterComputeCoreNum(self),
-                    LowerGlobalCoreNum(self),
-                    LowerGlobalCoreIdx(self),
-                    LowerGlobalCoreBaseHartid(self),
-                    LowerIsComputeCore(),
-                    LowerIsDmCore(),
-                ]
-            )
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LowerClusterHWBarrier(),
+                LowerSSRDisable(),
+                LowerDMAStart1D(),
+                LowerDMAStart1DWidePtr(),
+                LowerDMAStart2D(),
+                LowerDMAStart2DWideptr(),
+                # information getting ops:
+                LowerClusterIdx(),
+                LowerClusterNum(self),
+                LowerClusterCoreIdx(),
+                LowerClusterCoreNum(self),
+                LowerClusterDmCoreNum(self),
+                LowerClusterComputeCoreNum(self),
+                LowerGlobalCoreNum(self),
+                LowerGlobalCoreIdx(self),
+                LowerGlobalCoreBaseHartid(self),
+                LowerIsComputeCore(),
+                LowerIsDmCore(),
+            ]
+        )
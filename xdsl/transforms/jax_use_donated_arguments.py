@@ -4,15 +4,13 @@ from collections.abc import Sequence
 from dataclasses import dataclass
 
 from xdsl.context import Context
-from xdsl.dialects import builtin
 from xdsl.dialects.bufferization import MaterializeInDestinationOp
 from xdsl.dialects.builtin import ArrayAttr, DictionaryAttr, FunctionType, TensorType
 from xdsl.dialects.func import FuncOp, ReturnOp
 from xdsl.ir import Attribute, BlockArgument, Operation, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -122,15 +120,14 @@ class SubstituteDonatedTensors(RewritePattern):
 
 
 @dataclass(frozen=True)
-class JaxUseDonatedArguments(ModulePass):
+class JaxUseDonatedArguments(PatternRewritePass):
     name = "jax-use-donated-arguments"
 
+    apply_recursively = False
+    walk_reverse = True
+    walk_regions_first = True
+
     remove_matched_outputs: bool = False
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            SubstituteDonatedTensors(self.remove_matched_outputs),
-            apply_recursively=False,
-            walk_reverse=True,
-            walk_regions_first=True,
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return SubstituteDonatedTensors(self.remove_matched_outputs)
@@ -2,13 +2,12 @@ from dataclasses import dataclass
 
 from xdsl.context import Context
 from xdsl.dialects import arith, linalg
-from xdsl.dialects.builtin import ModuleOp, TensorType
+from xdsl.dialects.builtin import TensorType
 from xdsl.ir import Attribute
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -43,23 +42,20 @@ class LiftMulfPass(RewritePattern):
 
 
 @dataclass(frozen=True)
-class LiftArithToLinalg(ModulePass):
+class LiftArithToLinalg(PatternRewritePass):
     """
     Pass that lifts arith ops to linalg in order to make use of destination-passing style and bufferization.
     """
 
     name = "lift-arith-to-linalg"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        module_pass = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LiftAddfPass(),
-                    LiftSubfPass(),
-                    LiftMulfPass(),
-                ]
-            ),
-            walk_reverse=False,
-            apply_recursively=False,
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LiftAddfPass(),
+                LiftSubfPass(),
+                LiftMulfPass(),
+            ]
         )
-        module_pass.rewrite_module(op)
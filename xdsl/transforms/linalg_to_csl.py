@@ -7,15 +7,13 @@ from xdsl.dialects.builtin import (
     FloatAttr,
     IntegerAttr,
     MemRefType,
-    ModuleOp,
 )
 from xdsl.dialects.csl import csl
 from xdsl.ir import Attribute, OpResult, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -187,7 +185,7 @@ class ConvertLinalgMaxPass(RewritePattern):
 
 
 @dataclass(frozen=True)
-class LinalgToCsl(ModulePass):
+class LinalgToCsl(PatternRewritePass):
     """
     Convert linalg ops to csl ops.
 
@@ -196,17 +194,14 @@ class LinalgToCsl(ModulePass):
 
     name = "linalg-to-csl"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        module_pass = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ConvertLinalgGenericFMAPass(),
-                    ConvertLinalgAddPass(),
-                    ConvertLinalgSubPass(),
-                    ConvertLinalgMulPass(),
-                    ConvertLinalgMaxPass(),
-                    ConvertLinalgMinPass(),
-                ]
-            ),
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ConvertLinalgGenericFMAPass(),
+                ConvertLinalgAddPass(),
+                ConvertLinalgSubPass(),
+                ConvertLinalgMulPass(),
+                ConvertLinalgMaxPass(),
+                ConvertLinalgMinPass(),
+            ]
         )
-        module_pass.rewrite_module(op)
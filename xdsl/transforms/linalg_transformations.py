@@ -3,13 +3,12 @@ from dataclasses import dataclass
 from xdsl.builder import Builder
 from xdsl.context import Context
 from xdsl.dialects import arith, linalg
-from xdsl.dialects.builtin import AffineMapAttr, DenseIntOrFPElementsAttr, ModuleOp
+from xdsl.dialects.builtin import AffineMapAttr, DenseIntOrFPElementsAttr
 from xdsl.ir import BlockArgument, OpResult, SSAValue
 from xdsl.ir.affine import AffineMap
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -99,22 +98,22 @@ class FuseMultiplyAddPass(RewritePattern):
 
 
 @dataclass(frozen=True)
-class LinalgFuseMultiplyAddPass(ModulePass):
+class LinalgFuseMultiplyAddPass(PatternRewritePass):
     """
     Pass that fuses linalg multiply and add ops into a `generic` fma.
     """
 
     name = "linalg-fuse-multiply-add"
 
+    apply_recursively = False
+
     require_scalar_factor: bool = False
     """Set to require one of the mul factors to be a scalar constant"""
 
     require_erasable_mul: bool = False
     """Set to only fuse ops if the multiply has no other use and can be erased"""
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        module_pass = PatternRewriteWalker(
-            FuseMultiplyAddPass(self.require_scalar_factor, self.require_erasable_mul),
-            apply_recursively=False,
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return FuseMultiplyAddPass(
+            self.require_scalar_factor, self.require_erasable_mul
         )
-        module_pass.rewrite_module(op)
@@ -1,13 +1,12 @@
 from dataclasses import dataclass
 
-from xdsl.dialects import builtin, memref, scf
+from xdsl.dialects import memref, scf
 from xdsl.ir import Block, Operation, Region, SSAValue
 from xdsl.irdl import Operand
-from xdsl.passes import Context, ModulePass
+from xdsl.passes import Context, PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -190,16 +189,14 @@ class LoopHoistMemRef(RewritePattern):
 
 
 @dataclass(frozen=True)
-class LoopHoistMemRefPass(ModulePass):
+class LoopHoistMemRefPass(PatternRewritePass):
     name = "loop-hoist-memref"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LoopHoistMemRef(),
-                ]
-            ),
-            walk_regions_first=True,
-            apply_recursively=True,
-        ).rewrite_module(op)
+    walk_regions_first = True
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LoopHoistMemRef(),
+            ]
+        )
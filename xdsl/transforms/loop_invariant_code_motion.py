@@ -12,12 +12,12 @@ from collections import deque
 
 from xdsl.builder import Builder
 from xdsl.context import Context
-from xdsl.dialects import builtin, scf
+from xdsl.dialects import scf
 from xdsl.ir import Operation, Region
-from xdsl.passes import ModulePass
+from xdsl.irdl.dominance import DominanceInfo, PostDominanceInfo
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -89,7 +89,7 @@ class LoopInvariantCodeMotion(RewritePattern):
         move_loop_invariant_code(op)
 
 
-class LoopInvariantCodeMotionPass(ModulePass):
+class LoopInvariantCodeMotionPass(PatternRewritePass):
     """
     Moves operations without side effects out of loops, provided they do not depend on
     values defined in the loops.
@@ -97,9 +97,12 @@ class LoopInvariantCodeMotionPass(ModulePass):
 
     name = "licm"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            LoopInvariantCodeMotion(),
-            apply_recursively=False,
-            walk_regions_first=True,
-        ).rewrite_module(op)
+    apply_recursively = False
+    walk_regions_first = True
+
+    # Only operations that are not terminators are moved, so the blocks of the
+    # regions and their successors are unchanged
+    preserved_analyses = (DominanceInfo, PostDominanceInfo)
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return LoopInvariantCodeMotion()
@@ -10,11 +10,10 @@ from xdsl.ir.affine import (
     AffineDimExpr,
     AffineSymExpr,
 )
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -155,18 +154,16 @@ class LowerAffineApply(RewritePattern):
         rewriter.replace_matched_op(new_ops, new_results)
 
 
-class LowerAffinePass(ModulePass):
+class LowerAffinePass(PatternRewritePass):
     name = "lower-affine"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LowerAffineStore(),
-                    LowerAffineLoad(),
-                    LowerAffineFor(),
-                    LowerAffineYield(),
-                    LowerAffineApply(),
-                ]
-            )
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LowerAffineStore(),
+                LowerAffineLoad(),
+                LowerAffineFor(),
+                LowerAffineYield(),
+                LowerAffineApply(),
+            ]
+        )
@@ -6,11 +6,10 @@ from xdsl.context import Context
 from xdsl.dialects import arith, builtin, scf
 from xdsl.dialects.csl import csl, csl_wrapper
 from xdsl.ir import Block, Operation, Region, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -312,11 +311,13 @@ class LowerImport(RewritePattern):
 
 
 @dataclass(frozen=True)
-class LowerCslWrapperPass(ModulePass):
+class LowerCslWrapperPass(PatternRewritePass):
     """Unwraps the `csl_wrappermodule` into two `csl.module`s."""
 
     name = "lower-csl-wrapper"
 
+    apply_recursively = False
+
     params_as_consts: bool = False
     """
     Set to lower numerical module wrapper params that have a default value to constants,
@@ -325,13 +326,10 @@ class LowerCslWrapperPass(ModulePass):
     (hint: consider removing default values in cases where this is desired).
     """
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ExtractCslModules(params_as_consts=self.params_as_consts),
-                    LowerImport(),
-                ]
-            ),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ExtractCslModules(params_as_consts=self.params_as_consts),
+                LowerImport(),
+            ]
+        )
@@ -6,15 +6,14 @@ from collections.abc import Iterable
 from dataclasses import dataclass
 
 from xdsl.context import Context
-from xdsl.dialects import builtin, riscv, riscv_snitch, snitch
+from xdsl.dialects import riscv, riscv_snitch, snitch
 from xdsl.dialects.builtin import IntegerAttr, i32
 from xdsl.ir import Operation
 from xdsl.irdl import Operand
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -250,22 +249,20 @@ class LowerSsrDisable(RewritePattern):
 
 
 @dataclass(frozen=True)
-class LowerSnitchPass(ModulePass):
+class LowerSnitchPass(PatternRewritePass):
     name = "lower-snitch"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        walker = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    LowerSsrSetDimensionBoundOp(),
-                    LowerSsrSetDimensionStrideOp(),
-                    LowerSsrSetDimensionSourceOp(),
-                    LowerSsrSetDimensionDestinationOp(),
-                    LowerSsrSetStreamRepetitionOp(),
-                    LowerSsrEnable(),
-                    LowerSsrDisable(),
-                ]
-            ),
-            apply_recursively=False,
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                LowerSsrSetDimensionBoundOp(),
+                LowerSsrSetDimensionStrideOp(),
+                LowerSsrSetDimensionSourceOp(),
+                LowerSsrSetDimensionDestinationOp(),
+                LowerSsrSetStreamRepetitionOp(),
+                LowerSsrEnable(),
+                LowerSsrDisable(),
+            ]
         )
-        walker.rewrite_module(op)
@@ -10,14 +10,12 @@ from xdsl.dialects.builtin import (
     IndexType,
     IntegerAttr,
     MemRefType,
-    ModuleOp,
 )
 from xdsl.ir import Block, Region
 from xdsl.ir.affine import AffineMap
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -61,15 +59,14 @@ class GeneralizeFillPattern(RewritePattern):
 
 
 @dataclass(frozen=True)
-class MemRefStreamGeneralizeFillPass(ModulePass):
+class MemRefStreamGeneralizeFillPass(PatternRewritePass):
     """
     Generalizes memref_stream.fill ops.
     """
 
     name = "memref-stream-generalize-fill"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GeneralizeFillPattern(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GeneralizeFillPattern()
@@ -3,11 +3,9 @@ from typing import cast
 
 from xdsl.context import Context
 from xdsl.dialects import memref, memref_stream
-from xdsl.dialects.builtin import ModuleOp
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -69,7 +67,7 @@ class InferFillPattern(RewritePattern):
 
 
 @dataclass(frozen=True)
-class MemRefStreamInferFillPass(ModulePass):
+class MemRefStreamInferFillPass(PatternRewritePass):
     """
     Detects memref_stream.generic operations that can be represented as
     `memref_stream.fill` ops.
@@ -77,8 +75,7 @@ class MemRefStreamInferFillPass(ModulePass):
 
     name = "memref-stream-infer-fill"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            InferFillPattern(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return InferFillPattern()
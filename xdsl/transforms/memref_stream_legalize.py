@@ -10,7 +10,6 @@ from xdsl.dialects.builtin import (
     Float32Type,
     Float64Type,
     IntegerAttr,
-    ModuleOp,
     VectorType,
     f16,
     f32,
@@ -18,11 +17,10 @@ from xdsl.dialects.builtin import (
 from xdsl.dialects.linalg import IteratorType
 from xdsl.ir import Attribute, Block, Operation
 from xdsl.ir.affine import AffineExpr
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -191,15 +189,14 @@ class MemRefStreamGenericLegalize(RewritePattern):
 
 
 @dataclass(frozen=True)
-class MemRefStreamLegalizePass(ModulePass):
+class MemRefStreamLegalizePass(PatternRewritePass):
     """
     Legalize memref_stream.generic payload and bounds for streaming.
     """
 
     name = "memref-stream-legalize"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier([MemRefStreamGenericLegalize()]),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier([MemRefStreamGenericLegalize()])
@@ -10,16 +10,14 @@ from xdsl.dialects.builtin import (
     IndexType,
     IntegerAttr,
     MemRefType,
-    ModuleOp,
     NoneAttr,
     StridedLayoutAttr,
 )
 from xdsl.ir import Block, Operation, Region, SSAValue
 from xdsl.ir.affine import AffineMap
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -220,7 +218,7 @@ class TileGenericPattern(RewritePattern):
 
 
 @dataclass(frozen=True)
-class MemRefStreamTileOuterLoopsPass(ModulePass):
+class MemRefStreamTileOuterLoopsPass(PatternRewritePass):
     """
     Materializes loops around memref_stream.generic operations that have greater than
     specified number of non-1 upper bounds.
@@ -230,7 +228,5 @@ class MemRefStreamTileOuterLoopsPass(ModulePass):
 
     target_rank: int = field()
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            TileGenericPattern(self.target_rank),
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return TileGenericPattern(self.target_rank)
@@ -5,12 +5,10 @@ from xdsl.dialects import memref_stream
 from xdsl.dialects.builtin import (
     AffineMapAttr,
     ArrayAttr,
-    ModuleOp,
 )
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -54,7 +52,7 @@ class UnnestOutParametersPattern(RewritePattern):
 
 
 @dataclass(frozen=True)
-class MemRefStreamUnnestOutParametersPass(ModulePass):
+class MemRefStreamUnnestOutParametersPass(PatternRewritePass):
     """
     Converts the affine maps of memref_stream.generic out parameters from taking all the
     indices to only taking "parallel" ones.
@@ -62,8 +60,7 @@ class MemRefStreamUnnestOutParametersPass(ModulePass):
 
     name = "memref-stream-unnest-out-parameters"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            UnnestOutParametersPattern(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return UnnestOutParametersPattern()
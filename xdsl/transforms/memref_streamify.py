@@ -2,12 +2,11 @@ from dataclasses import dataclass, field
 
 from xdsl.context import Context
 from xdsl.dialects import memref, memref_stream
-from xdsl.dialects.builtin import ArrayAttr, ModuleOp
+from xdsl.dialects.builtin import ArrayAttr
 from xdsl.ir import Block, Region
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -133,7 +132,7 @@ class StreamifyGenericOpPattern(RewritePattern):
 
 
 @dataclass(frozen=True)
-class MemRefStreamifyPass(ModulePass):
+class MemRefStreamifyPass(PatternRewritePass):
     """
     Converts a memref generic on memrefs to a memref generic on streams, by moving it
     into a streaming region.
@@ -141,10 +140,9 @@ class MemRefStreamifyPass(ModulePass):
 
     name = "memref-streamify"
 
+    apply_recursively = False
+
     streams: int = field(default=3)
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            StreamifyGenericOpPattern(self.streams),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return StreamifyGenericOpPattern(self.streams)
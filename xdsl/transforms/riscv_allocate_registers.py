@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
-from xdsl.backend.riscv.register_allocation import RegisterAllocatorLivenessBlockNaive
+from xdsl.backend.riscv.register_allocation import (
+    RegisterAllocatorLinearScan,
+    RegisterAllocatorLivenessBlockNaive,
+)
 from xdsl.backend.riscv.register_stack import RiscvRegisterStack
 from xdsl.context import Context
 from xdsl.dialects import riscv_func
@@ -17,6 +20,11 @@ class RISCVAllocateRegistersPass(ModulePass):
     name = "riscv-allocate-registers"
 
     allocation_strategy: str = "LivenessBlockNaive"
+    """
+    The register allocator to use, either `LivenessBlockNaive`, or `LinearScan` which
+    spills values to the stack when running out of registers, and must then be followed
+    by `riscv-prologue-epilogue-insertion`.
+    """
 
     add_regalloc_stats: bool = False
     """
@@ -31,6 +39,7 @@ class RISCVAllocateRegistersPass(ModulePass):
     def apply(self, ctx: Context, op: ModuleOp) -> None:
         allocator_strategies = {
             "LivenessBlockNaive": RegisterAllocatorLivenessBlockNaive,
+            "LinearScan": RegisterAllocatorLinearScan,
         }
 
         if self.allocation_strategy not in allocator_strategies:
@@ -1,9 +1,8 @@
 from xdsl.context import Context
-from xdsl.dialects import builtin, riscv, riscv_scf
-from xdsl.passes import ModulePass
+from xdsl.dialects import riscv, riscv_scf
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -64,7 +63,7 @@ class HoistIndexTimesConstantOp(RewritePattern):
             rewriter.replace_op(user, [], [index])
 
 
-class RiscvScfLoopRangeFoldingPass(ModulePass):
+class RiscvScfLoopRangeFoldingPass(PatternRewritePass):
     """
     Similar to scf-loop-range-folding in MLIR, folds multiplication operations into the
     loop range computation when possible.
@@ -72,8 +71,7 @@ class RiscvScfLoopRangeFoldingPass(ModulePass):
 
     name = "riscv-scf-loop-range-folding"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            HoistIndexTimesConstantOp(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return HoistIndexTimesConstantOp()
@@ -2,10 +2,9 @@ from typing import cast
 
 from xdsl.context import Context
 from xdsl.dialects import arith, builtin, scf
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -144,7 +143,7 @@ class FlattenNestedLoopsPattern(RewritePattern):
         )
 
 
-class ScfForLoopFlattenPass(ModulePass):
+class ScfForLoopFlattenPass(PatternRewritePass):
     """
     Folds perfect loop nests if they can be represented with a single loop.
     Currently does this by matching the inner loop range with the outer loop step.
@@ -158,5 +157,5 @@ class ScfForLoopFlattenPass(ModulePass):
 
     name = "scf-for-loop-flatten"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(FlattenNestedLoopsPattern()).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return FlattenNestedLoopsPattern()
@@ -1,10 +1,9 @@
 from xdsl.context import Context
-from xdsl.dialects import arith, builtin, scf
+from xdsl.dialects import arith, scf
 from xdsl.ir import SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -64,14 +63,15 @@ class ScfForLoopRangeFolding(RewritePattern):
             rewriter.replace_op(user, [], [index])
 
 
-class ScfForLoopRangeFoldingPass(ModulePass):
+class ScfForLoopRangeFoldingPass(PatternRewritePass):
     """
     xdsl implementation of the pass with the same name
     """
 
     name = "scf-for-loop-range-folding"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            ScfForLoopRangeFolding(), apply_recursively=False, walk_regions_first=True
-        ).rewrite_module(op)
+    apply_recursively = False
+    walk_regions_first = True
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return ScfForLoopRangeFolding()
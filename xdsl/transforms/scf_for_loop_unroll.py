@@ -1,10 +1,9 @@
 from xdsl.context import Context
 from xdsl.dialects import arith, builtin, scf
 from xdsl.ir import SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -54,12 +53,12 @@ class UnrollLoopPattern(RewritePattern):
         rewriter.replace_matched_op((), iter_args)
 
 
-class ScfForLoopUnrollPass(ModulePass):
+class ScfForLoopUnrollPass(PatternRewritePass):
     """
     Fully unrolls all loops where the lb, ub, and step are constants.
     """
 
     name = "scf-for-loop-unroll"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(UnrollLoopPattern()).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return UnrollLoopPattern()
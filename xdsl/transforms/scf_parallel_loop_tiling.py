@@ -2,14 +2,13 @@ from dataclasses import dataclass
 
 from xdsl.context import Context
 from xdsl.dialects import affine, arith
-from xdsl.dialects.builtin import IndexType, IntegerAttr, ModuleOp
+from xdsl.dialects.builtin import IndexType, IntegerAttr
 from xdsl.dialects.scf import ParallelOp, ReduceOp
 from xdsl.ir import Block, Operation, Region, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -135,17 +134,15 @@ class ScfParallelLoopTilingPattern(RewritePattern):
 
 
 @dataclass(frozen=True)
-class ScfParallelLoopTilingPass(ModulePass):
+class ScfParallelLoopTilingPass(PatternRewritePass):
     name = "scf-parallel-loop-tiling"
 
+    walk_regions_first = True
+    apply_recursively = False
+
     parallel_loop_tile_sizes: tuple[int, ...]
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        walker = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [ScfParallelLoopTilingPattern(tuple(self.parallel_loop_tile_sizes))]
-            ),
-            walk_regions_first=True,
-            apply_recursively=False,
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [ScfParallelLoopTilingPattern(tuple(self.parallel_loop_tile_sizes))]
         )
-        walker.rewrite_module(op)
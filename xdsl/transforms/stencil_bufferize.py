@@ -6,7 +6,6 @@ from typing import Any, cast
 from typing_extensions import TypeVar
 
 from xdsl.context import Context
-from xdsl.dialects import builtin
 from xdsl.dialects.experimental.dmp import SwapOp
 from xdsl.dialects.stencil import (
     AccessOp,
@@ -30,11 +29,10 @@ from xdsl.ir import (
     Region,
     SSAValue,
 )
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -567,7 +565,7 @@ class SwapBufferize(RewritePattern):
 
 
 @dataclass(frozen=True)
-class StencilBufferize(ModulePass):
+class StencilBufferize(PatternRewritePass):
     """
     Bufferize the stencil dialect, i.e., try to fold all loads, sotres, buffer and
     combines, and to output stencils working directly on buffers (fields) with
@@ -576,21 +574,17 @@ class StencilBufferize(ModulePass):
 
     name = "stencil-bufferize"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        walker = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    UpdateApplyArgs(),
-                    ApplyBufferizePattern(),
-                    BufferAlloc(),
-                    CombineStoreFold(),
-                    LoadBufferFoldPattern(),
-                    ApplyStoreFoldPattern(),
-                    RemoveUnusedOperations(),
-                    ApplyUnusedResults(),
-                    SwapBufferize(),
-                ]
-            ),
-            apply_recursively=True,
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                UpdateApplyArgs(),
+                ApplyBufferizePattern(),
+                BufferAlloc(),
+                CombineStoreFold(),
+                LoadBufferFoldPattern(),
+                ApplyStoreFoldPattern(),
+                RemoveUnusedOperations(),
+                ApplyUnusedResults(),
+                SwapBufferize(),
+            ]
         )
-        walker.rewrite_module(op)
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from typing import cast
 
 from xdsl.context import Context
-from xdsl.dialects import builtin, scf
+from xdsl.dialects import scf
 from xdsl.dialects.stencil import (
     AccessOp,
     ApplyOp,
@@ -21,7 +21,7 @@ from xdsl.ir import (
     Operation,
     OpResult,
 )
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
@@ -348,19 +348,16 @@ class StencilInliningPattern(RewritePattern):
 
 
 @dataclass(frozen=True)
-class StencilInliningPass(ModulePass):
+class StencilInliningPass(PatternRewritePass):
     name = "stencil-inlining"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        walker = PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    StencilReroutingPattern(),
-                    StencilInliningPattern(),
-                    ApplyUnusedResults(),
-                    ApplyUnusedOperands(),
-                    ApplyRedundantOperands(),
-                ]
-            )
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                StencilReroutingPattern(),
+                StencilInliningPattern(),
+                ApplyUnusedResults(),
+                ApplyUnusedOperands(),
+                ApplyRedundantOperands(),
+            ]
         )
-        walker.rewrite_module(op)
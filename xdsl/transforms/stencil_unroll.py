@@ -5,7 +5,6 @@ from math import prod
 from typing import cast
 
 from xdsl.context import Context
-from xdsl.dialects import builtin
 from xdsl.dialects.stencil import (
     AccessOp,
     ApplyOp,
@@ -16,11 +15,10 @@ from xdsl.dialects.stencil import (
     TempType,
 )
 from xdsl.ir import Attribute
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -122,13 +120,10 @@ class StencilUnrollPattern(RewritePattern):
 
 
 @dataclass(frozen=True)
-class StencilUnrollPass(ModulePass):
+class StencilUnrollPass(PatternRewritePass):
     name = "stencil-unroll"
 
     unroll_factor: tuple[int, ...]
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        walker = PatternRewriteWalker(
-            GreedyRewritePatternApplier([StencilUnrollPattern(self.unroll_factor)])
-        )
-        walker.rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier([StencilUnrollPattern(self.unroll_factor)])
@@ -10,10 +10,9 @@ from xdsl.dialects.arith import AddiOp, ConstantOp
 from xdsl.dialects.builtin import IntAttr, IntegerAttr, ModuleOp
 from xdsl.ir import ErasedSSAValue, Operation, OpResult
 from xdsl.irdl import SSAValues
-from xdsl.passes import ModulePass
+from xdsl.passes import ModulePass, PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
 )
 from xdsl.traits import ConstantLike
@@ -45,17 +44,16 @@ class TestConstantFoldingIntegerAdditionPattern(RewritePattern):
         rewriter.replace_matched_op(folded_op, [folded_op.results[0]])
 
 
-class TestConstantFoldingPass(ModulePass):
+class TestConstantFoldingPass(PatternRewritePass):
     """
     A pass that applies applies simple constant folding.
     """
 
     name = "test-constant-folding"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        """Apply the pass."""
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
         pattern = TestConstantFoldingIntegerAdditionPattern()
-        PatternRewriteWalker(pattern).rewrite_module(op)
+        return pattern
 
 
 class TestSpecialisedConstantFoldingPass(ModulePass):
@@ -157,6 +155,8 @@ class TestSpecialisedConstantFoldingPass(ModulePass):
                     new_op._next_op = old_op  # pyright: ignore[reportPrivateUsage]
                     # update self
                     old_op._prev_op = new_op  # pyright: ignore[reportPrivateUsage]
+                    # take over the position of the replaced op in the block order
+                    new_op._order_index = old_op._order_index  # pyright: ignore[reportPrivateUsage]
 
                     if prev_op is None:
                         # No `prev_op`, means `next_op` is the first op in the block.
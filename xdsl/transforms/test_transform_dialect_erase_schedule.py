@@ -2,11 +2,9 @@ from dataclasses import dataclass
 
 from xdsl.context import Context
 from xdsl.dialects import transform
-from xdsl.dialects.builtin import ModuleOp
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -21,15 +19,14 @@ class EraseTransformNamedSequenceOps(RewritePattern):
 
 
 @dataclass(frozen=True)
-class TestTransformDialectEraseSchedulePass(ModulePass):
+class TestTransformDialectEraseSchedulePass(PatternRewritePass):
     """
     Erases transform named sequence operations.
     """
 
     name = "test-transform-dialect-erase-schedule"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            EraseTransformNamedSequenceOps(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return EraseTransformNamedSequenceOps()
@@ -3,10 +3,9 @@ from dataclasses import dataclass
 from xdsl.builder import ImplicitBuilder
 from xdsl.context import Context
 from xdsl.dialects import arith, builtin, linalg, memref, vector
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -99,14 +98,14 @@ class VectorizeMatmulOp(RewritePattern):
 
 
 @dataclass(frozen=True)
-class TestVectorizeMatmulPass(ModulePass):
+class TestVectorizeMatmulPass(PatternRewritePass):
     """
     A test pass vectorizing linalg.matmul with a specific vectorization strategy.
     """
 
     name = "test-vectorize-matmul"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            VectorizeMatmulOp(), apply_recursively=False
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return VectorizeMatmulOp()
@@ -5,11 +5,10 @@ from typing import Literal, cast
 from xdsl.context import Context
 from xdsl.dialects import arith, builtin, varith
 from xdsl.ir import Attribute, Operation, SSAValue
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     GreedyRewritePatternApplier,
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -226,7 +225,7 @@ class FuseRepeatedAddArgsPattern(RewritePattern):
         return c, f(c, arg)
 
 
-class ConvertArithToVarithPass(ModulePass):
+class ConvertArithToVarithPass(PatternRewritePass):
     """
     Convert chains of arith.{add|mul}{i,f} operations into a single long variadic add or mul operation.
 
@@ -236,19 +235,18 @@ class ConvertArithToVarithPass(ModulePass):
 
     name = "convert-arith-to-varith"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            GreedyRewritePatternApplier(
-                [
-                    ArithToVarithPattern(),
-                    MergeVarithOpsPattern(),
-                ]
-            ),
-            walk_reverse=True,
-        ).rewrite_module(op)
+    walk_reverse = True
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return GreedyRewritePatternApplier(
+            [
+                ArithToVarithPattern(),
+                MergeVarithOpsPattern(),
+            ]
+        )
 
 
-class ConvertVarithToArithPass(ModulePass):
+class ConvertVarithToArithPass(PatternRewritePass):
     """
     Convert a single long variadic add or mul operation into a chain of arith.{add|mul}{i,f} operations.
     Reverses ConvertArithToVarithPass.
@@ -257,25 +255,23 @@ class ConvertVarithToArithPass(ModulePass):
 
     name = "convert-varith-to-arith"
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            VarithToArithPattern(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
 
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return VarithToArithPattern()
 
-class VarithFuseRepeatedOperandsPass(ModulePass):
+
+class VarithFuseRepeatedOperandsPass(PatternRewritePass):
     """
     Fuses several occurrences of the same operand into one.
     """
 
     name = "varith-fuse-repeated-operands"
 
+    apply_recursively = False
+
     min_reps: int = 2
     """The minimum number of times an operand needs to be repeated before being fused."""
 
-    def apply(self, ctx: Context, op: builtin.ModuleOp) -> None:
-        PatternRewriteWalker(
-            FuseRepeatedAddArgsPattern(self.min_reps),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return FuseRepeatedAddArgsPattern(self.min_reps)
@@ -7,13 +7,11 @@ from xdsl.dialects.builtin import (
     CompileTimeFixedBitwidthType,
     IndexType,
     IntegerAttr,
-    ModuleOp,
     VectorType,
 )
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -64,15 +62,14 @@ class VectorSplitLoadExtract(RewritePattern):
 
 
 @dataclass(frozen=True)
-class VectorSplitLoadExtractPass(ModulePass):
+class VectorSplitLoadExtractPass(PatternRewritePass):
     """
     Rewrites a vector load followed only by extracts with scalar loads.
     """
 
     name = "vector-split-load-extract"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            VectorSplitLoadExtract(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return VectorSplitLoadExtract()
@@ -1,6 +1,9 @@
 from dataclasses import dataclass
 
-from xdsl.backend.x86.register_allocation import X86RegisterAllocator
+from xdsl.backend.x86.register_allocation import (
+    X86LinearScanRegisterAllocator,
+    X86RegisterAllocator,
+)
 from xdsl.backend.x86.register_stack import X86RegisterStack
 from xdsl.context import Context
 from xdsl.dialects import x86_func
@@ -16,9 +19,24 @@ class X86AllocateRegisters(ModulePass):
 
     name = "x86-allocate-registers"
 
+    allocation_strategy: str = "BlockNaive"
+
     def apply(self, ctx: Context, op: ModuleOp) -> None:
+        allocator_strategies = {
+            "BlockNaive": X86RegisterAllocator,
+            "LinearScan": X86LinearScanRegisterAllocator,
+        }
+
+        if self.allocation_strategy not in allocator_strategies:
+            raise ValueError(
+                f"Unknown register allocation strategy {self.allocation_strategy}. "
+                f"Available allocation types: {allocator_strategies.keys()}"
+            )
+
         for inner_op in op.walk():
             if isinstance(inner_op, x86_func.FuncOp):
                 available_registers = X86RegisterStack.get()
-                allocator = X86RegisterAllocator(available_registers)
+                allocator = allocator_strategies[self.allocation_strategy](
+                    available_registers
+                )
                 allocator.allocate_func(inner_op)
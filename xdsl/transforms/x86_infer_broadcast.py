@@ -2,11 +2,9 @@ from dataclasses import dataclass
 
 from xdsl.context import Context
 from xdsl.dialects import x86
-from xdsl.dialects.builtin import ModuleOp
-from xdsl.passes import ModulePass
+from xdsl.passes import PatternRewritePass
 from xdsl.pattern_rewriter import (
     PatternRewriter,
-    PatternRewriteWalker,
     RewritePattern,
     op_type_rewrite_pattern,
 )
@@ -26,15 +24,14 @@ class DS_VpbroadcastqOpScalarLoad(RewritePattern):
 
 
 @dataclass(frozen=True)
-class X86InferBroadcast(ModulePass):
+class X86InferBroadcast(PatternRewritePass):
     """
     Rewrites a scalar load + broadcast to a broadcast load operation.
     """
 
     name = "x86-infer-broadcast"
 
-    def apply(self, ctx: Context, op: ModuleOp) -> None:
-        PatternRewriteWalker(
-            DS_VpbroadcastqOpScalarLoad(),
-            apply_recursively=False,
-        ).rewrite_module(op)
+    apply_recursively = False
+
+    def get_rewrite_pattern(self, ctx: Context) -> RewritePattern:
+        return DS_VpbroadcastqOpScalarLoad()
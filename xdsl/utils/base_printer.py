@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from collections.abc import Callable, Iterable
 from contextlib import contextmanager
 from dataclasses import dataclass, field
@@ -58,6 +59,13 @@ class BasePrinter:
             print(line, end="", file=self.stream)
             self._current_column += len(line)
 
+    def flush(self) -> None:
+        """
+        Flushes the printer's output stream, so that everything printed so far is
+        visible to readers of the stream.
+        """
+        (sys.stdout if self.stream is None else self.stream).flush()
+
     T = TypeVar("T")
 
     def print_list(
@@ -211,9 +211,13 @@ def type_repr(obj: Any) -> str:
         origin = get_origin(obj)
         args = get_args(obj)
         return f"{type_repr(origin)}[{', '.join(type_repr(arg) for arg in args)}]"
-    if isinstance(obj, types.UnionType):
+    if isinstance(obj, types.UnionType) or get_origin(obj) is Union:
+        # `Optional[T]` and `Union[T, U]` are printed like `T | U`, as their repr
+        # differs between Python versions.
         args = get_args(obj)
         return f"{'|'.join(type_repr(arg) for arg in args)}"
+    if get_origin(obj) is Literal:
+        return f"Literal[{', '.join(repr(arg) for arg in get_args(obj))}]"
     if obj is type(None):
         return "None"
     if obj is ...:
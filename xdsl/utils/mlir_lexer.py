@@ -1,13 +1,14 @@
 from __future__ import annotations
 
 import re
+from array import array
 from dataclasses import dataclass
 from enum import Enum
 from string import hexdigits
-from typing import Literal, TypeAlias, TypeGuard, cast, overload
+from typing import ClassVar, Literal, NamedTuple, TypeAlias, TypeGuard, cast, overload
 
 from xdsl.utils.exceptions import ParseError
-from xdsl.utils.lexer import Lexer, Position, Span, Token
+from xdsl.utils.lexer import Input, Lexer, Position, Span, Token
 
 PunctuationSpelling: TypeAlias = Literal[
     "->",
@@ -36,7 +37,8 @@ PunctuationSpelling: TypeAlias = Literal[
 @dataclass(frozen=True, repr=False)
 class StringLiteral(Span):
     def __post_init__(self):
-        if len(self) < 2 or self.text[0] != '"' or self.text[-1] != '"':
+        content = self.input.content
+        if len(self) < 2 or content[self.start] != '"' or content[self.end - 1] != '"':
             raise ParseError(self, "Invalid string literal!")
 
     @overload
@@ -60,6 +62,9 @@ class StringLiteral(Span):
 
     @property
     def string_contents(self):
+        if self.input.content.find("\\", self.start, self.end) == -1:
+            # Without escape sequences, the contents can be sliced out of the input
+            return self.input.content[self.start + 1 : self.end - 1]
         return self.bytes_contents.decode()
 
     @property
@@ -249,9 +254,92 @@ KIND_BY_PUNCTUATION_SPELLING = {
 
 MLIRToken = Token[MLIRTokenKind]
 
+_PREFIXED_IDENT_KINDS = {
+    "#": MLIRTokenKind.HASH_IDENT,
+    "!": MLIRTokenKind.EXCLAMATION_IDENT,
+    "^": MLIRTokenKind.CARET_IDENT,
+    "%": MLIRTokenKind.PERCENT_IDENT,
+}
+
+# The indices of the groups of `MLIRLexer._token_regex`
+_BARE_IDENT_GROUP = 1
+_PUNCTUATION_GROUP = 2
+_PREFIXED_IDENT_GROUP = 3
+_AT_IDENT_GROUP = 4
+_STRING_LIT_GROUP = 5
+_HEX_INTEGER_LIT_GROUP = 6
+_FLOAT_LIT_GROUP = 7
+_INTEGER_LIT_GROUP = 8
+
+_TOKEN_KIND_BY_GROUP: tuple[MLIRTokenKind | None, ...] = (
+    None,
+    MLIRTokenKind.BARE_IDENT,
+    None,
+    None,
+    MLIRTokenKind.AT_IDENT,
+    MLIRTokenKind.STRING_LIT,
+    MLIRTokenKind.INTEGER_LIT,
+    MLIRTokenKind.FLOAT_LIT,
+    MLIRTokenKind.INTEGER_LIT,
+)
+"""The kind of the tokens matched by each group, if it does not depend on the text."""
+
+
+class MLIRTokenArrays(NamedTuple):
+    """
+    The tokens of an input, stored as their kinds and the offsets of their spans.
+    Spans are only created on request.
+    """
+
+    input: Input
+    kinds: list[MLIRTokenKind]
+    starts: array[int]
+    ends: array[int]
+
+    def __len__(self) -> int:
+        return len(self.kinds)
+
+    def span(self, index: int) -> Span:
+        return Span(self.starts[index], self.ends[index], self.input)
+
+    def token(self, index: int) -> MLIRToken:
+        return MLIRToken(self.kinds[index], self.span(index))
+
 
 @dataclass
 class MLIRLexer(Lexer[MLIRTokenKind]):
+    _token_regex: ClassVar[re.Pattern[str]]
+    """
+    Matches whitespace and comments followed by a token, in one of the groups indexed
+    by `_TOKEN_KIND_BY_GROUP`. It does not match the end of the input, nor tokens
+    that are invalid or need more processing, which are lexed by
+    `_lex_char_by_char` instead.
+    """
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        # Subclasses may lex bare identifiers differently
+        cls._token_regex = cls._compile_token_regex()
+
+    @classmethod
+    def _compile_token_regex(cls) -> re.Pattern[str]:
+        bare_ident = r"[a-zA-Z_]" + cls.bare_identifier_suffix_regex.pattern
+        string_lit = cls._unescaped_characters_regex.pattern
+        return re.compile(
+            # Comments are matched up to the end of the line, so that the regex does
+            # not backtrack to lex their contents
+            r"(?:\s|//[^\n]*(?![^\n]))*"
+            rf"(?:({bare_ident})"
+            r"|(->|\.\.\.|\{-#|#-\}|[:,()\[\]{}<>=+*?|-])"
+            r"|([#!^%](?:[0-9]+|[a-zA-Z$._-][a-zA-Z0-9$._-]*))"
+            rf"|(@(?:{bare_ident}|{string_lit}))"
+            rf"|({string_lit})"
+            r"|(0x[0-9a-fA-F]+)"
+            r"|([0-9]+\.[0-9]*(?:[eE][+-]?[0-9]+)?)"
+            r"|([0-9]+))",
+            re.ASCII,
+        )
+
     def _is_in_bounds(self, size: Position = 1) -> bool:
         """
         Check if the current position is within the bounds of the input.
@@ -309,6 +397,59 @@ class MLIRLexer(Lexer[MLIRTokenKind]):
         """
         Lex a token from the input, and returns it.
         """
+        if (lexed := self._lex_kind()) is None:
+            return self._lex_char_by_char()
+        kind, start_pos = lexed
+        return MLIRToken(kind, Span(start_pos, self.pos, self.input))
+
+    def lex_all(self) -> MLIRTokenArrays:
+        """
+        Lex all remaining tokens of the input, up to and including the end of file
+        token, without creating a span for each token.
+        """
+        kinds: list[MLIRTokenKind] = []
+        starts = array("q")
+        ends = array("q")
+        while True:
+            if (lexed := self._lex_kind()) is None:
+                token = self._lex_char_by_char()
+                kind, start_pos = token.kind, token.span.start
+            else:
+                kind, start_pos = lexed
+            kinds.append(kind)
+            starts.append(start_pos)
+            ends.append(self.pos)
+            if kind is MLIRTokenKind.EOF:
+                return MLIRTokenArrays(self.input, kinds, starts, ends)
+
+    def _lex_kind(self) -> tuple[MLIRTokenKind, Position] | None:
+        """
+        Lex a token with a single match of `_token_regex`, and return its kind and
+        start position.
+        Return None without advancing the lexer if the token should be lexed by
+        `_lex_char_by_char`.
+        """
+        match = self._token_regex.match(self.input.content, self.pos)
+        if match is None:
+            return None
+        group = cast(int, match.lastindex)
+        kind = _TOKEN_KIND_BY_GROUP[group]
+        if group == _PUNCTUATION_GROUP:
+            kind = KIND_BY_PUNCTUATION_SPELLING[match.group(group)]
+        elif group == _PREFIXED_IDENT_GROUP:
+            kind = _PREFIXED_IDENT_KINDS[match.group(group)[0]]
+        elif group == _STRING_LIT_GROUP and "\\" in match.group(group):
+            # String literals with escape sequences may be bytes literals
+            return None
+        assert kind is not None
+        self.pos = match.end()
+        return kind, match.start(group)
+
+    def _lex_char_by_char(self) -> MLIRToken:
+        """
+        Lex a token from the input by inspecting it one character at a time, and
+        return it.
+        """
         # First, skip whitespaces
         self._consume_whitespace()
 
@@ -545,3 +686,6 @@ class MLIRLexer(Lexer[MLIRTokenKind]):
         if match is not None:
             return self._form_token(MLIRTokenKind.FLOAT_LIT, start_pos)
         return self._form_token(MLIRTokenKind.INTEGER_LIT, start_pos)
+
+
+MLIRLexer._token_regex = MLIRLexer._compile_token_regex()  # pyright: ignore[reportPrivateUsage]
@@ -0,0 +1,187 @@
+"""
+A static manifest of the passes and dialects registered in xDSL.
+
+Reading the name and options of a pass, or the names of the operations and
+attributes of a dialect, requires importing the module that defines it. The manifest
+records this metadata in a JSON file shipped with xDSL, so that it can be queried
+without importing any pass or dialect.
+
+Nothing in xDSL reads the manifest yet: `xdsl-opt` only imports the passes of the
+pipeline it runs, and the interactive app applies every pass to list the ones that
+change the IR, which requires importing them.
+
+The manifest is generated from the code, and checked against it in the tests. To
+regenerate it, run:
+
+```
+python -m xdsl.utils.registry_manifest
+```
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import os
+from dataclasses import dataclass
+from functools import cache
+from typing import Any
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "registry_manifest.json")
+"""The path of the manifest shipped with xDSL."""
+
+
+@dataclass(frozen=True)
+class PassManifest:
+    """The metadata of a pass."""
+
+    name: str
+    summary: str
+    """The first paragraph of the documentation of the pass."""
+    options: tuple[tuple[str, str, str | None], ...]
+    """
+    The name, expected type, and default value of each option of the pass, as
+    returned by `get_pass_option_infos`.
+    """
+
+
+@dataclass(frozen=True)
+class DialectManifest:
+    """The metadata of a dialect."""
+
+    name: str
+    operations: tuple[str, ...]
+    attributes: tuple[str, ...]
+    types: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class RegistryManifest:
+    """The metadata of all the passes and dialects registered in xDSL."""
+
+    passes: dict[str, PassManifest]
+    dialects: dict[str, DialectManifest]
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "passes": {
+                name: {
+                    "summary": p.summary,
+                    "options": [list(option) for option in p.options],
+                }
+                for name, p in sorted(self.passes.items())
+            },
+            "dialects": {
+                name: {
+                    "operations": list(d.operations),
+                    "attributes": list(d.attributes),
+                    "types": list(d.types),
+                }
+                for name, d in sorted(self.dialects.items())
+            },
+        }
+
+    @staticmethod
+    def from_json(data: dict[str, Any]) -> RegistryManifest:
+        return RegistryManifest(
+            {
+                name: PassManifest(
+                    name,
+                    p["summary"],
+                    tuple((option[0], option[1], option[2]) for option in p["options"]),
+                )
+                for name, p in data["passes"].items()
+            },
+            {
+                name: DialectManifest(
+                    name,
+                    tuple(d["operations"]),
+                    tuple(d["attributes"]),
+                    tuple(d["types"]),
+                )
+                for name, d in data["dialects"].items()
+            },
+        )
+
+
+@cache
+def get_registry_manifest() -> RegistryManifest:
+    """Load the manifest shipped with xDSL."""
+    with open(MANIFEST_PATH) as f:
+        return RegistryManifest.from_json(json.load(f))
+
+
+def get_pass_manifest(name: str) -> PassManifest | None:
+    """Get the metadata of a pass from its name, if it is registered in xDSL."""
+    return get_registry_manifest().passes.get(name)
+
+
+def get_dialect_manifest(name: str) -> DialectManifest | None:
+    """Get the metadata of a dialect from its name, if it is registered in xDSL."""
+    return get_registry_manifest().dialects.get(name)
+
+
+def _summary(cls: type) -> str:
+    doc = cls.__dict__.get("__doc__")
+    if doc is None or doc.startswith(f"{cls.__name__}("):
+        # The docstring generated by `dataclass`
+        return ""
+    return inspect.cleandoc(doc).split("\n\n")[0].replace("\n", " ")
+
+
+def build_registry_manifest() -> RegistryManifest:
+    """Build the manifest by importing all the passes and dialects of xDSL."""
+    from xdsl.dialects import get_all_dialects
+    from xdsl.ir import TypeAttribute
+    from xdsl.passes import get_pass_option_infos
+    from xdsl.transforms import get_all_passes
+
+    passes: dict[str, PassManifest] = {}
+    for name, pass_factory in get_all_passes().items():
+        pass_type = pass_factory()
+        passes[name] = PassManifest(
+            name,
+            _summary(pass_type),
+            tuple(
+                (info.name, info.expected_type, info.default_value)
+                for info in get_pass_option_infos(pass_type)
+            ),
+        )
+
+    dialects: dict[str, DialectManifest] = {}
+    for name, dialect_factory in get_all_dialects().items():
+        dialect = dialect_factory()
+        dialects[name] = DialectManifest(
+            name,
+            tuple(sorted(op.name for op in dialect.operations)),
+            tuple(
+                sorted(
+                    attr.name
+                    for attr in dialect.attributes
+                    if not issubclass(attr, TypeAttribute)
+                )
+            ),
+            tuple(
+                sorted(
+                    attr.name
+                    for attr in dialect.attributes
+                    if issubclass(attr, TypeAttribute)
+                )
+            ),
+        )
+
+    return RegistryManifest(passes, dialects)
+
+
+def dump_registry_manifest(manifest: RegistryManifest) -> str:
+    """Serialize the manifest, in the format of the file shipped with xDSL."""
+    return json.dumps(manifest.to_json(), indent=2) + "\n"
+
+
+def main():
+    with open(MANIFEST_PATH, "w") as f:
+        f.write(dump_registry_manifest(build_registry_manifest()))
+
+
+if "__main__" == __name__:
+    main()
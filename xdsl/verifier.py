@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from xdsl.ir import Block, Operation, SSAValue
+from xdsl.pattern_rewriter import PatternRewriterListener
+
+
+@dataclass(eq=False)
+class IncrementalVerifier(PatternRewriterListener):
+    """
+    A listener that records the operations that were changed by rewrites, so that
+    only these are verified again.
+
+    Pass it as the listener of a `PatternRewriteWalker`, or extend a rewriter with it,
+    then call `verify` after the rewrites.
+    Changes that are made without notifying the listener are not tracked, and are
+    only checked by a full verification.
+    """
+
+    _changed_ops: dict[Operation, None] = field(
+        default_factory=dict[Operation, None], init=False
+    )
+    """Operations to verify together with their regions."""
+
+    _touched_ops: dict[Operation, None] = field(
+        default_factory=dict[Operation, None], init=False
+    )
+    """Operations to verify without their regions."""
+
+    _touched_blocks: dict[Block, None] = field(
+        default_factory=dict[Block, None], init=False
+    )
+    """Blocks in which operations were inserted or removed."""
+
+    def __post_init__(self):
+        self.operation_insertion_handler.append(self._handle_operation_insertion)
+        self.operation_removal_handler.append(self._handle_operation_removal)
+        self.operation_modification_handler.append(self._handle_operation_modification)
+        self.operation_replacement_handler.append(self._handle_operation_replacement)
+        self.block_creation_handler.append(self._handle_block_creation)
+
+    def _handle_operation_insertion(self, op: Operation) -> None:
+        self._changed_ops[op] = None
+        if (block := op.parent) is not None:
+            self._touched_blocks[block] = None
+        # An operation with successors must terminate its block
+        if (prev_op := op.prev_op) is not None:
+            self._touched_ops[prev_op] = None
+
+    def _handle_operation_removal(self, op: Operation) -> None:
+        if (block := op.parent) is not None:
+            self._touched_blocks[block] = None
+
+    def _handle_operation_modification(self, op: Operation) -> None:
+        self._touched_ops[op] = None
+        self._touch_users(op.results)
+
+    def _handle_operation_replacement(
+        self, op: Operation, new_results: Sequence[SSAValue | None]
+    ) -> None:
+        self._touch_users(op.results)
+
+    def _handle_block_creation(self, block: Block) -> None:
+        self._touched_blocks[block] = None
+
+    def _touch_users(self, values: Sequence[SSAValue]) -> None:
+        for value in values:
+            for use in value.uses:
+                self._touched_ops[use.operation] = None
+
+    def has_changes(self) -> bool:
+        """Return whether any change was recorded since the last verification."""
+        return bool(self._changed_ops or self._touched_ops or self._touched_blocks)
+
+    def clear(self) -> None:
+        """Forget all the changes recorded since the last verification."""
+        self._changed_ops.clear()
+        self._touched_ops.clear()
+        self._touched_blocks.clear()
+
+    def verify(self, root: Operation, *, incremental: bool = True) -> None:
+        """
+        Verify `root`.
+
+        If `incremental` is set, only verify the operations changed since the last
+        verification, the operations using their results, and their parents.
+        Otherwise, verify all the operations nested in `root`.
+        """
+        if not incremental:
+            root.verify()
+            self.clear()
+            return
+
+        # The operations to verify without their regions, including all the parents
+        # of the changed operations
+        touched_ops: dict[Operation, None] = {}
+        # The changed operations that are not nested in another changed operation
+        changed_ops: list[Operation] = []
+
+        for op in self._changed_ops:
+            ancestors = self._ancestors(op, root)
+            if ancestors is None:
+                continue
+            if any(ancestor in self._changed_ops for ancestor in ancestors):
+                continue
+            changed_ops.append(op)
+            touched_ops.update(dict.fromkeys(ancestors))
+
+        for op in self._touched_ops:
+            ancestors = self._ancestors(op, root)
+            if ancestors is not None:
+                touched_ops[op] = None
+                touched_ops.update(dict.fromkeys(ancestors))
+
+        touched_blocks: list[Block] = []
+        for block in self._touched_blocks:
+            if (parent_op := block.parent_op()) is None:
+                continue
+            ancestors = self._ancestors(parent_op, root)
+            if ancestors is None:
+                continue
+            touched_blocks.append(block)
+            touched_ops[parent_op] = None
+            touched_ops.update(dict.fromkeys(ancestors))
+            # The last operation of a block must be a terminator
+            if (last_op := block.last_op) is not None:
+                touched_ops[last_op] = None
+
+        for block in touched_blocks:
+            block.verify(verify_nested_ops=False)
+        for op in changed_ops:
+            op.verify()
+        for op in touched_ops:
+            if op not in self._changed_ops:
+                op.verify(verify_nested_ops=False)
+
+        self.clear()
+
+    @staticmethod
+    def _ancestors(op: Operation, root: Operation) -> list[Operation] | None:
+        """
+        Return the operations containing `op` up to `root`, or `None` if `op` is not
+        nested in `root`.
+        """
+        ancestors: list[Operation] = []
+        while op is not root:
+            if (parent := op.parent_op()) is None:
+                return None
+            ancestors.append(parent)
+            op = parent
+        return ancestors
@@ -1,7 +1,9 @@
 import argparse
+import multiprocessing
 import sys
 from collections.abc import Callable, Sequence
 from contextlib import redirect_stdout
+from dataclasses import replace
 from importlib.metadata import version
 from io import StringIO
 from itertools import accumulate
@@ -10,12 +12,13 @@ from typing import IO, Any
 from xdsl.context import Context
 from xdsl.dialects.builtin import ModuleOp
 from xdsl.ir import Attribute
-from xdsl.passes import ModulePass, PassPipeline
+from xdsl.passes import ModulePass, PassPipeline, is_tracked_pass
 from xdsl.printer import Printer
 from xdsl.tools.command_line_tool import CommandLineTool
 from xdsl.universe import Universe
 from xdsl.utils.exceptions import DiagnosticException, ParseError, ShrinkException
 from xdsl.utils.lexer import Span
+from xdsl.verifier import IncrementalVerifier
 
 
 def _empty_post_init(self: Attribute):
@@ -41,6 +44,12 @@ class xDSLOptMain(CommandLineTool):
     pipeline: PassPipeline
     """ The pass-pipeline to be applied. """
 
+    verifier: IncrementalVerifier | None = None
+    """
+    The verifier tracking the changes of the pattern passes, if the module is
+    verified incrementally.
+    """
+
     def __init__(
         self,
         description: str = "xDSL modular optimizer driver",
@@ -66,6 +75,12 @@ class xDSLOptMain(CommandLineTool):
         if self.args.disable_verify:
             Attribute.__post_init__ = _empty_post_init
 
+        if self.args.split_input_file and self.args.target == "bytecode":
+            # The bytecode of several modules cannot be separated by `// -----`
+            raise ValueError(
+                "The bytecode target cannot be used with --split-input-file"
+            )
+
         self.setup_pipeline()
 
     def run(self):
@@ -75,34 +90,13 @@ class xDSLOptMain(CommandLineTool):
         chunks, file_extension = self.prepare_input()
         output_stream = self.prepare_output()
         try:
-            for i, (chunk, offset) in enumerate(chunks):
-                try:
+            if self.args.jobs > 1 and len(chunks) > 1 and _can_fork():
+                self.run_chunks_in_parallel(chunks, file_extension, output_stream)
+            else:
+                for i, (chunk, offset) in enumerate(chunks):
                     if i > 0:
                         output_stream.write("// -----\n")
-                    module = self.parse_chunk(chunk, file_extension, offset)
-
-                    if module is not None:
-                        if self.apply_passes(module):
-                            output_stream.write(self.output_resulting_program(module))
-                    output_stream.flush()
-                except ParseError as e:
-                    s = e.span
-                    e.span = Span(s.start, s.end, s.input, offset)
-                    if self.args.parsing_diagnostics:
-                        print(e)
-                    else:
-                        raise
-                except DiagnosticException as e:
-                    if self.args.verify_diagnostics:
-                        print(e)
-                        # __notes__ only in Python 3.11 and above
-                        if hasattr(e, "__notes__"):
-                            for e in getattr(e, "__notes__"):
-                                print(e)
-                    else:
-                        raise
-                finally:
-                    chunk.close()
+                    self.process_chunk(chunk, file_extension, offset, output_stream)
         except ShrinkException:
             assert self.args.shrink
             print("Success, can shrink")
@@ -116,6 +110,91 @@ class xDSLOptMain(CommandLineTool):
             # Exit with non-0 value to let shrinkray know that it cannot shrink
             exit(1)
 
+    def process_chunk(
+        self, chunk: IO[str], file_extension: str, offset: int, output_stream: IO[str]
+    ) -> None:
+        """
+        Parse, transform and print a single chunk of the input, reporting the
+        diagnostics that were requested on the command line.
+        """
+        try:
+            module = self.parse_chunk(chunk, file_extension, offset)
+
+            if module is not None:
+                if self.apply_passes(module):
+                    self.print_resulting_program(module, output_stream)
+            output_stream.flush()
+        except ParseError as e:
+            s = e.span
+            e.span = Span(s.start, s.end, s.input, offset)
+            if self.args.parsing_diagnostics:
+                print(e)
+            else:
+                raise
+        except DiagnosticException as e:
+            if self.args.verify_diagnostics:
+                print(e)
+                # __notes__ only in Python 3.11 and above
+                if hasattr(e, "__notes__"):
+                    for e in getattr(e, "__notes__"):
+                        print(e)
+            else:
+                raise
+        finally:
+            chunk.close()
+
+    def run_chunks_in_parallel(
+        self,
+        chunks: list[tuple[IO[str], int]],
+        file_extension: str,
+        output_stream: IO[str],
+    ) -> None:
+        """
+        Process the chunks on a pool of `--jobs` forked worker processes, and write
+        their outputs in the order of the input.
+
+        Each worker keeps the context it inherited, so that dialects are only loaded
+        once per worker. If a chunk raises an exception that is not reported as a
+        diagnostic, it and the following chunks are processed again in this process,
+        so that the exception is raised as in a sequential run.
+        """
+        global _parallel_main, _parallel_chunks
+        _parallel_main = self
+        _parallel_chunks = chunks, file_extension
+
+        jobs = min(self.args.jobs, len(chunks))
+        chunksize = max(1, len(chunks) // (jobs * 8))
+        # The index of the first chunk that failed in a worker, if any
+        failed_index: int | None = None
+        try:
+            with multiprocessing.get_context("fork").Pool(jobs) as pool:
+                results = pool.imap(
+                    _process_chunk_in_worker, range(len(chunks)), chunksize
+                )
+                for i, result in enumerate(results):
+                    if result is None:
+                        failed_index = i
+                        break
+                    if i > 0:
+                        output_stream.write("// -----\n")
+                    output, diagnostics = result
+                    if diagnostics:
+                        output_stream.flush()
+                        sys.stdout.write(diagnostics)
+                    output_stream.write(output)
+                    output_stream.flush()
+                    chunks[i][0].close()
+
+            if failed_index is not None:
+                for i in range(failed_index, len(chunks)):
+                    if i > 0:
+                        output_stream.write("// -----\n")
+                    chunk, offset = chunks[i]
+                    self.process_chunk(chunk, file_extension, offset, output_stream)
+        finally:
+            _parallel_main = None
+            _parallel_chunks = None
+
     def register_all_arguments(self, arg_parser: argparse.ArgumentParser):
         """
         Registers all the command line arguments that are used by this tool.
@@ -149,6 +228,21 @@ class xDSLOptMain(CommandLineTool):
             default="",
         )
 
+        arg_parser.add_argument(
+            "--fuse-pattern-passes",
+            default=False,
+            action="store_true",
+            help="Apply consecutive pattern passes together in a single walk of the IR",
+        )
+
+        arg_parser.add_argument(
+            "--verify-incrementally",
+            default=False,
+            action="store_true",
+            help="After pattern passes, only verify the operations changed by their "
+            "rewrites instead of the whole module",
+        )
+
         arg_parser.add_argument(
             "--print-between-passes",
             default=False,
@@ -180,6 +274,15 @@ class xDSLOptMain(CommandLineTool):
             "independently by using `// -----`",
         )
 
+        arg_parser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of worker processes used to process the chunks of a split "
+            "input file",
+        )
+
         arg_parser.add_argument(
             "--print-op-generic",
             default=False,
@@ -241,12 +344,23 @@ class xDSLOptMain(CommandLineTool):
 
             print_assembly(prog, output)
 
+        def _output_bytecode(prog: ModuleOp, output: IO[str]):
+            from xdsl.bytecode import write_bytecode
+
+            buffer: IO[bytes] | None = getattr(output, "buffer", None)
+            if buffer is None:
+                raise ValueError("The bytecode target can only write to a file")
+            output.flush()
+            write_bytecode(prog, buffer)
+            buffer.flush()
+
         def _output_mlir(prog: ModuleOp, output: IO[str]):
             printer = Printer(
                 stream=output,
                 print_generic_format=self.args.print_op_generic,
                 print_properties_as_attributes=self.args.print_no_properties,
                 print_debuginfo=self.args.print_debuginfo,
+                flush_top_level_ops=True,
             )
             printer.print_op(prog)
             printer.print_metadata(self.ctx.loaded_dialects)
@@ -301,6 +415,7 @@ class xDSLOptMain(CommandLineTool):
                     printer.print(op)
 
         self.available_targets["arm-asm"] = _output_arm_asm
+        self.available_targets["bytecode"] = _output_bytecode
         self.available_targets["csl"] = _output_csl
         self.available_targets["mlir"] = _output_mlir
         self.available_targets["riscemu"] = _emulate_riscv
@@ -320,7 +435,7 @@ class xDSLOptMain(CommandLineTool):
             previous_pass: ModulePass, module: ModuleOp, next_pass: ModulePass
         ) -> None:
             if not self.args.disable_verify:
-                module.verify()
+                self.verify_after_pass(previous_pass, module)
             if self.args.print_between_passes:
                 print(f"IR after {previous_pass.name}:")
                 printer = Printer(stream=sys.stdout)
@@ -332,6 +447,11 @@ class xDSLOptMain(CommandLineTool):
             self.args.passes,
             callback,
         )
+        if self.args.fuse_pattern_passes:
+            self.pipeline = self.pipeline.fuse_pattern_passes()
+        if self.args.verify_incrementally and not self.args.disable_verify:
+            self.verifier = IncrementalVerifier()
+            self.pipeline = replace(self.pipeline, rewrite_listener=self.verifier)
 
     def prepare_input(self) -> tuple[list[tuple[IO[str], int]], str]:
         """
@@ -375,17 +495,71 @@ class xDSLOptMain(CommandLineTool):
         """Apply passes in order."""
         if not self.args.disable_verify:
             prog.verify()
+            if self.verifier is not None:
+                self.verifier.clear()
         self.pipeline.apply(self.ctx, prog)
-        if not self.args.disable_verify:
-            prog.verify()
+        if not self.args.disable_verify and self.pipeline.passes:
+            self.verify_after_pass(self.pipeline.passes[-1], prog)
         return True
 
+    def verify_after_pass(self, p: ModulePass, prog: ModuleOp) -> None:
+        """
+        Verify the module after a pass. When verifying incrementally, only the
+        changes of pattern passes are verified, and the whole module is verified
+        after other passes.
+        """
+        if self.verifier is None:
+            prog.verify()
+        else:
+            self.verifier.verify(prog, incremental=is_tracked_pass(p))
+
     def output_resulting_program(self, prog: ModuleOp) -> str:
         """Get the resulting program."""
         output = StringIO()
-        self.available_targets[self.args.target](prog, output)
+        self.print_resulting_program(prog, output)
         return output.getvalue()
 
+    def print_resulting_program(self, prog: ModuleOp, output: IO[str]) -> None:
+        """
+        Print the resulting program to the output stream as it is being generated,
+        without first building it in memory.
+        """
+        self.available_targets[self.args.target](prog, output)
+
+
+_parallel_main: xDSLOptMain | None = None
+"""The driver whose chunks are processed by the forked workers."""
+
+_parallel_chunks: tuple[list[tuple[IO[str], int]], str] | None = None
+"""The chunks processed by the forked workers, and their file extension."""
+
+
+def _can_fork() -> bool:
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _process_chunk_in_worker(index: int) -> tuple[str, str] | None:
+    """
+    Process a chunk in a forked worker, and return its output and the diagnostics
+    printed while processing it, or None if processing it raised an exception.
+    """
+    assert _parallel_main is not None
+    assert _parallel_chunks is not None
+    chunks, file_extension = _parallel_chunks
+    chunk, offset = chunks[index]
+
+    output = StringIO()
+    # Diagnostics are interleaved with the output if both are printed to stdout
+    diagnostics = output if _parallel_main.args.output_file is None else StringIO()
+    try:
+        with redirect_stdout(diagnostics):
+            _parallel_main.process_chunk(chunk, file_extension, offset, output)
+    except Exception:
+        return None
+    if diagnostics is output:
+        return output.getvalue(), ""
+    return output.getvalue(), diagnostics.getvalue()
+
 
 class VersionAction(argparse.Action):
     def __init__(self, *args: Any, **kwargs: Any):